@@ -4,11 +4,92 @@ Input-related CDP commands
 Encapsulates CDP commands for the Input domain.
 """
 
+import time
 from typing import Any
 
 from ..logger import get_logger
 from ..session import CDPSession
 
+# Typing strategies for InputCommands.type()
+TYPE_AUTO = "auto"            # insertText for plain runs, key events for Enter/Tab/Backspace
+TYPE_INSERT = "insert"        # Input.insertText only: one input event per chunk
+TYPE_KEYS = "keys"            # keyDown/keyUp per character, pipelined
+TYPE_KEYSTROKE = "keystroke"  # keyDown/keyUp per character, each awaited (optionally paced)
+TYPE_MODES = (TYPE_AUTO, TYPE_INSERT, TYPE_KEYS, TYPE_KEYSTROKE)
+
+# Characters per Input.insertText call; keeps each WebSocket frame modest.
+INSERT_CHUNK_CHARS = 4096
+
+# Unanswered key events allowed in flight when pipelining.
+KEY_EVENT_WINDOW = 64
+
+# Characters that mean a key press rather than text: (key, code, keyCode, text)
+_SPECIAL_KEYS: dict[str, tuple[str, str, int, str | None]] = {
+    "\n": ("Enter", "Enter", 13, "\r"),
+    "\r": ("Enter", "Enter", 13, "\r"),
+    "\t": ("Tab", "Tab", 9, None),
+    "\b": ("Backspace", "Backspace", 8, None),
+}
+
+
+def _key_events(char: str) -> list[tuple[str, dict[str, Any]]]:
+    """keyDown + keyUp for one character, as a real keyboard would send them."""
+    special = _SPECIAL_KEYS.get(char)
+    if special is None:
+        return [
+            ("Input.dispatchKeyEvent",
+             {"type": "keyDown", "key": char, "text": char, "unmodifiedText": char}),
+            ("Input.dispatchKeyEvent", {"type": "keyUp", "key": char}),
+        ]
+    key, code, key_code, text = special
+    common = {"key": key, "code": code,
+              "windowsVirtualKeyCode": key_code, "nativeVirtualKeyCode": key_code}
+    # A key without text (Tab, Backspace) is a rawKeyDown: no keypress, no input.
+    down = {"type": "keyDown" if text else "rawKeyDown", **common}
+    if text:
+        down.update(text=text, unmodifiedText=text)
+    return [
+        ("Input.dispatchKeyEvent", down),
+        ("Input.dispatchKeyEvent", {"type": "keyUp", **common}),
+    ]
+
+
+def _insert_commands(text: str) -> list[tuple[str, dict[str, Any]]]:
+    return [
+        ("Input.insertText", {"text": text[i:i + INSERT_CHUNK_CHARS]})
+        for i in range(0, len(text), INSERT_CHUNK_CHARS)
+    ]
+
+
+def plan_typing(text: str, mode: str = TYPE_AUTO) -> list[tuple[str, dict[str, Any]]]:
+    """
+    The CDP commands that type ``text`` with the given strategy
+
+    Args:
+        text: Text to type
+        mode: One of TYPE_MODES
+
+    Returns:
+        list of (method, params) pairs, in order
+    """
+    if mode not in TYPE_MODES:
+        raise ValueError(f"Unknown typing mode: {mode} (expected one of {', '.join(TYPE_MODES)})")
+    if mode == TYPE_INSERT:
+        return _insert_commands(text)
+    text = text.replace("\r\n", "\n")  # one Enter, not two
+    if mode in (TYPE_KEYS, TYPE_KEYSTROKE):
+        return [event for char in text for event in _key_events(char)]
+
+    commands: list[tuple[str, dict[str, Any]]] = []
+    run_start = 0
+    for i, char in enumerate(text):
+        if char in _SPECIAL_KEYS:
+            commands.extend(_insert_commands(text[run_start:i]))
+            commands.extend(_key_events(char))
+            run_start = i + 1
+    commands.extend(_insert_commands(text[run_start:]))
+    return commands
+
 
 class InputCommands:
     """Input commands class — CDP Input domain wrappers.
@@ -17,7 +98,7 @@ class InputCommands:
     - click() [dispatchMouseEvent]: NOT compatible — does not generate DOM events.
       Use CDPSession.click() (JS-first) for element clicks; this method is only
       called by CDPSession.click_precise() as a fallback or explicit override.
-    - type() [dispatchKeyEvent]: Compatible — keyboard events work normally.
+    - type() [insertText / dispatchKeyEvent]: Compatible — keyboard events work normally.
     - scroll() [dispatchMouseEvent mouseWheel]: Unverified — mouseWheel may behave
       differently from mouseMoved/mousePressed. CDPSession.scroll() uses JS
       window.scrollBy() as a platform-independent alternative.
@@ -87,32 +168,58 @@ class InputCommands:
         self.logger.debug("Click completed")
         return result
 
-    def type(self, text: str) -> dict[str, Any]:
+    def type(self, text: str, mode: str = TYPE_AUTO, delay: float = 0.0) -> dict[str, Any]:
         """
-        Type text via Input.dispatchKeyEvent.
+        Type text into the focused element.
+
+        Strategies (``mode``):
+        - ``auto``: Input.insertText for plain text, real key events only for
+          Enter / Tab / Backspace, all pipelined. A 5 KB field is a couple of
+          round-trips instead of thousands.
+        - ``insert``: Input.insertText only. Fires beforeinput/input but no
+          keydown/keypress/keyup.
+        - ``keys``: keyDown/keyUp for every character, pipelined in windows of
+          KEY_EVENT_WINDOW without waiting for each reply.
+        - ``keystroke``: keyDown/keyUp for every character, each awaited, with
+          an optional ``delay`` between characters — for pages that react to
+          each key (autocomplete, key-by-key validation).
 
         Wayland Native: Compatible — keyboard events work normally.
 
         Args:
             text: Text to type
+            mode: Typing strategy (see above)
+            delay: Seconds to pause between characters (keystroke mode only)
 
         Returns:
-            Dict[str, Any]: Type result
+            Dict[str, Any]: Type result with mode, character and command counts
         """
-        self.logger.info(f"Typing text: {text[:50]}{'...' if len(text) > 50 else ''}")
-
-        # Send keyboard events character by character
-        for char in text:
-            self.session.send_command(
-                "Input.dispatchKeyEvent",
-                {
-                    "type": "char",
-                    "text": char
-                }
-            )
-
-        self.logger.debug("Typing completed")
-        return {"status": "completed"}
+        self.logger.info(
+            f"Typing text ({mode}): {text[:50]}{'...' if len(text) > 50 else ''}"
+        )
+        commands = plan_typing(text, mode)
+        started = time.perf_counter()
+
+        if mode == TYPE_KEYSTROKE:
+            for method, params in commands:
+                self.session.send_command(method, params)
+                if delay > 0 and params.get("type") == "keyUp":
+                    time.sleep(delay)
+        elif commands:
+            self.session.send_commands(commands, window=KEY_EVENT_WINDOW)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.logger.debug(
+            f"Typing completed: {len(text)} chars, {len(commands)} commands "
+            f"in {elapsed_ms:.1f}ms"
+        )
+        return {
+            "status": "completed",
+            "mode": mode,
+            "chars": len(text),
+            "commands": len(commands),
+            "elapsed_ms": round(elapsed_ms, 1),
+        }
 
     def scroll(self, x: int, y: int, delta_x: int, delta_y: int) -> dict[str, Any]:
         """
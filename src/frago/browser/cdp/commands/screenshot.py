@@ -2,13 +2,32 @@
 Screenshot-related CDP commands
 
 Encapsulates CDP commands for screenshot functionality.
+
+A full-page shot of a tall page used to be one ``Page.captureScreenshot`` with
+``captureBeyondViewport``: the whole image arrived as a single base64 string
+in one WebSocket frame and was decoded in memory before being written out —
+hundreds of MB for a long feed. Full-page shots written to a file are now
+captured as horizontal tiles (clip rectangles) and stitched to disk as they
+arrive, so memory is bounded by one tile. ``screencast()`` covers repeated
+captures with ``Page.startScreencast``.
 """
 
 import base64
 import os
+import time
+from pathlib import Path
 from typing import Any
 
+from ..exceptions import CDPError
 from ..logger import get_logger
+from ..png_stream import PNGStitcher, PNGStitchError
+
+# Tile height in CSS pixels. At a typical 1280px width and 2x device scale a
+# tile is ~20 MB of pixels before compression.
+TILE_HEIGHT = 2048
+
+# Tallest page captured; beyond this Chrome's own raster limits apply anyway.
+MAX_CAPTURE_HEIGHT = 100_000
 
 
 class ScreenshotCommands:
@@ -29,7 +48,9 @@ class ScreenshotCommands:
         output_file: str | None = None,
         full_page: bool = False,
         format: str = "png",
-        quality: int = 80
+        quality: int = 80,
+        tiled: bool | None = None,
+        tile_height: int = TILE_HEIGHT,
     ) -> dict[str, Any]:
         """
         Capture page screenshot
@@ -39,12 +60,20 @@ class ScreenshotCommands:
             full_page: Whether to capture full page
             format: Image format ("png" or "jpeg")
             quality: JPEG quality (0-100), only valid for JPEG format
+            tiled: Capture a full page in tiles. None = whenever the page is
+                taller than one tile and the result goes to a file
+            tile_height: Tile height in CSS pixels
 
         Returns:
-            Dict[str, Any]: Screenshot result
+            Dict[str, Any]: Screenshot result; tiled captures report ``tiles``
         """
         self.logger.info(f"Taking screenshot (full_page={full_page}, format={format}, quality={quality})")
 
+        if full_page and output_file and tiled is not False:
+            size = self._content_size()
+            if size is not None and (tiled or size[1] > tile_height):
+                return self._capture_tiled(output_file, size, format, quality, tile_height)
+
         params = {
             "format": format,
             "captureBeyondViewport": full_page
@@ -69,3 +98,188 @@ class ScreenshotCommands:
             result["file"] = output_file
 
         return result
+
+    def _content_size(self) -> tuple[int, int] | None:
+        """Full page size in CSS pixels, or None if Chrome did not say."""
+        response = self.session.send_command("Page.getLayoutMetrics")
+        metrics = response.get("result", {}) if isinstance(response, dict) else {}
+        size = metrics.get("cssContentSize") or metrics.get("contentSize")
+        if not size:
+            return None
+        width = int(size.get("width", 0))
+        height = int(size.get("height", 0))
+        if width <= 0 or height <= 0:
+            return None
+        return width, height
+
+    def _capture_tile(self, y: int, width: int, height: int, format: str, quality: int) -> bytes:
+        params: dict[str, Any] = {
+            "format": format,
+            "captureBeyondViewport": True,
+            "clip": {"x": 0, "y": y, "width": width, "height": height, "scale": 1},
+        }
+        if format == "jpeg":
+            params["quality"] = quality
+        response = self.session.send_command("Page.captureScreenshot", params)
+        result = response.get("result", {}) if isinstance(response, dict) else {}
+        data = result.get("data")
+        if not data:
+            raise CDPError(f"No image data for screenshot tile at y={y}")
+        return base64.b64decode(data)
+
+    def _capture_tiled(
+        self,
+        output_file: str,
+        size: tuple[int, int],
+        format: str,
+        quality: int,
+        tile_height: int,
+    ) -> dict[str, Any]:
+        """
+        Capture the full page tile by tile
+
+        PNG tiles are stitched into ``output_file`` as each arrives. JPEG cannot
+        be joined without re-encoding, so its tiles are written side by side as
+        ``<stem>.tile-NNN.jpg`` and listed in the result; ``file`` is then absent.
+        A page taller than ``MAX_CAPTURE_HEIGHT`` is cut off there and the
+        result carries ``truncated`` and the full ``page_height``.
+        """
+        width, page_height = size
+        height = min(page_height, MAX_CAPTURE_HEIGHT)
+        if height < page_height:
+            self.logger.warning(
+                f"Page is {page_height}px tall; capturing only the first {height}px"
+            )
+        output = Path(output_file)
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        tiles: list[dict[str, Any]] = []
+        started = time.perf_counter()
+
+        def each_tile():
+            for index, y in enumerate(range(0, height, tile_height)):
+                tile_started = time.perf_counter()
+                clip_height = min(tile_height, height - y)
+                image = self._capture_tile(y, width, clip_height, format, quality)
+                tile: dict[str, Any] = {"index": index, "y": y, "height": clip_height,
+                                        "bytes": len(image)}
+                yield tile, image
+                tile["ms"] = round((time.perf_counter() - tile_started) * 1000, 1)
+                tiles.append(tile)
+                self.logger.debug(
+                    f"Tile {index} (y={y}, {clip_height}px): {tile['bytes']} bytes in {tile['ms']}ms"
+                )
+
+        if format == "png":
+            tmp = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+            try:
+                with open(tmp, "wb") as out:
+                    stitcher = PNGStitcher(out)
+                    for tile, image in each_tile():
+                        tile["pixels"] = list(stitcher.add(image))
+                    stitcher.finish()
+                os.replace(tmp, output)
+            except PNGStitchError as e:
+                tmp.unlink(missing_ok=True)
+                raise CDPError(f"Cannot stitch screenshot tiles: {e}") from e
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+        else:
+            for tile, image in each_tile():
+                tile_file = output.with_name(f"{output.stem}.tile-{tile['index']:03d}{output.suffix}")
+                tile_file.write_bytes(image)
+                tile["file"] = str(tile_file)
+
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        saved_to = output_file if format == "png" else f"{output.stem}.tile-*{output.suffix}"
+        self.logger.info(f"Screenshot saved to: {saved_to} ({len(tiles)} tiles, {elapsed_ms}ms)")
+        result: dict[str, Any] = {
+            "tiles": tiles,
+            "width": width,
+            "height": height,
+            "elapsed_ms": elapsed_ms,
+        }
+        if height < page_height:
+            result["truncated"] = True
+            result["page_height"] = page_height
+        if format == "png":
+            result["file"] = output_file
+        return result
+
+    def screencast(
+        self,
+        output_dir: str,
+        max_frames: int = 10,
+        duration: float = 5.0,
+        format: str = "jpeg",
+        quality: int = 80,
+        every_nth_frame: int = 1,
+        max_width: int | None = None,
+        max_height: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Capture repeated frames with Page.startScreencast
+
+        Chrome pushes a frame whenever the page repaints; each is written to
+        ``output_dir`` as it arrives and acknowledged so the next one comes.
+        A page that does not repaint yields few frames — the capture ends after
+        ``max_frames`` frames or ``duration`` seconds, whichever comes first.
+
+        Args:
+            output_dir: Directory for frame files (frame-NNN.<format>)
+            max_frames: Stop after this many frames
+            duration: Stop after this many seconds
+            format: "jpeg" or "png"
+            quality: JPEG quality (0-100)
+            every_nth_frame: Only send every n-th repaint
+            max_width: Maximum frame width (scaled down by Chrome)
+            max_height: Maximum frame height (scaled down by Chrome)
+
+        Returns:
+            Dict[str, Any]: ``frames``, one entry per written frame
+        """
+        directory = Path(output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = "jpg" if format == "jpeg" else format
+        frames: list[dict[str, Any]] = []
+        acks: list[int] = []
+
+        @self.session.on_event("Page.screencastFrame")
+        def on_frame(params: dict[str, Any]) -> None:
+            acks.append(params.get("sessionId"))
+            if len(frames) >= max_frames:
+                return
+            image = base64.b64decode(params.get("data", ""))
+            path = directory / f"frame-{len(frames):03d}.{suffix}"
+            path.write_bytes(image)
+            metadata = params.get("metadata", {})
+            frames.append({
+                "index": len(frames),
+                "file": str(path),
+                "bytes": len(image),
+                "timestamp": metadata.get("timestamp"),
+            })
+
+        params: dict[str, Any] = {"format": format, "everyNthFrame": every_nth_frame}
+        if format == "jpeg":
+            params["quality"] = quality
+        if max_width:
+            params["maxWidth"] = max_width
+        if max_height:
+            params["maxHeight"] = max_height
+
+        started = time.monotonic()
+        self.session.send_command("Page.startScreencast", params)
+        try:
+            while len(frames) < max_frames and (remaining := duration - (time.monotonic() - started)) > 0:
+                self.session.poll_events(min(remaining, 0.5))
+                while acks:
+                    # The next frame is only sent once this one is acknowledged.
+                    self.session.send_command("Page.screencastFrameAck", {"sessionId": acks.pop(0)})
+        finally:
+            self.session.send_command("Page.stopScreencast")
+            self.session.on_event("Page.screencastFrame")(lambda _params: None)
+
+        self.logger.info(f"Screencast captured {len(frames)} frames to {directory}")
+        return {"frames": frames, "elapsed_ms": round((time.monotonic() - started) * 1000, 1)}
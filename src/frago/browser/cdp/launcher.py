@@ -4,15 +4,26 @@ Chrome CDP Launcher - Chromium-based browser launch management
 
 Provides browser launch, stop, and management functionality for Chrome, Edge, and Chromium.
 Supports headless and void modes.
+
+Readiness is read from Chrome's own stderr announcement (``DevTools listening
+on ws://...``) instead of sleeping a fixed 2 s and polling ``/json/version``;
+the post-launch steps that do not depend on each other run concurrently, and
+each phase's duration is kept in ``ChromeLauncher.timings``.
 """
 
 import os
 import platform
+import re
 import shutil
 import subprocess
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from pathlib import Path
+from typing import IO
+from urllib.parse import urlsplit
 
 from frago.browser.cdp.browser_detection import (
     BrowserType,
@@ -22,6 +33,7 @@ from frago.browser.cdp.browser_detection import (
 from frago.browser.cdp.landing import LANDING_PAGE_SERVER_PORT as _LANDING_PORT
 from frago.browser.cdp.landing import LANDING_PAGE_URL as _LANDING_URL
 from frago.browser.cdp.landing import is_landing_page
+from frago.browser.cdp.logger import get_logger
 from frago.browser.cdp.process import kill_existing_chrome
 from frago.browser.cdp.transport import cdp_get, cdp_ws_connect
 from frago.browser.profile_seed import seed_profile_from_system, system_profile_dir
@@ -44,6 +56,57 @@ DEFAULT_CDP_PORT = 9222
 # Cross-platform migration lock lives at the layout root.
 _MIGRATE_LOCK = NEW_PROFILE_ROOT / ".migrate.lock"
 
+# Chrome prints this line to stderr once its DevTools endpoint accepts connections.
+_DEVTOOLS_LISTENING = re.compile(rb"DevTools listening on (ws://\S+)")
+
+# Upper bound of the interval between HTTP readiness / port probes (seconds).
+_MAX_PROBE_INTERVAL = 0.5
+
+
+def _probe_intervals(first: float = 0.05):
+    """Sleep intervals for polling loops: start short, back off to the cap."""
+    delay = first
+    while True:
+        yield delay
+        delay = min(delay * 2, _MAX_PROBE_INTERVAL)
+
+
+class DevToolsReadiness:
+    """
+    Watch a browser's stderr for the DevTools announcement
+
+    A daemon thread reads the stream line by line. ``ready`` is set when the
+    ``DevTools listening on ws://...`` line appears (``ws_url`` holds the
+    browser endpoint) or when the stream closes without it. The thread keeps
+    draining stderr afterwards, so a chatty browser never blocks on a full pipe.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self.ws_url: str | None = None
+        self.ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._read, args=(stream,), name="frago-devtools-stderr", daemon=True
+        )
+        self._thread.start()
+
+    def _read(self, stream: IO[bytes]) -> None:
+        try:
+            for line in iter(stream.readline, b""):
+                if self.ws_url is None and (match := _DEVTOOLS_LISTENING.search(line)):
+                    self.ws_url = match.group(1).decode("ascii", "replace")
+                    self.ready.set()
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.ready.set()
+            with suppress(Exception):
+                stream.close()
+
+    def wait(self, timeout: float) -> str | None:
+        """Wait up to ``timeout`` seconds; return the ws URL once announced."""
+        self.ready.wait(timeout)
+        return self.ws_url
+
 
 class ChromeLauncher:
     """Chromium-based browser CDP launcher (supports Chrome, Edge, Chromium)"""
@@ -79,6 +142,12 @@ class ChromeLauncher:
         self.kiosk_mode = kiosk_mode
         self.app_url = app_url
         self.browser_process: subprocess.Popen | None = None
+        # Browser-level DevTools endpoint, as announced on stderr
+        self.browser_ws_url: str | None = None
+        # Duration of each launch phase in ms (see launch())
+        self.timings: dict[str, float] = {}
+        self._readiness: DevToolsReadiness | None = None
+        self.logger = get_logger()
 
         # Validate app/kiosk mode parameters
         if (self.app_mode or self.kiosk_mode) and not self.app_url:
@@ -282,11 +351,14 @@ class ChromeLauncher:
         the timeout (migration then skips via its own port guard).
         """
         deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
+        for delay in _probe_intervals():
             if not cls._port_in_use(port):
                 return True
-            time.sleep(0.5)
-        return not cls._port_in_use(port)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+        return False
 
     @staticmethod
     def _port_in_use(port: int) -> bool:
@@ -358,23 +430,89 @@ class ChromeLauncher:
             # Non-critical, Chrome will use defaults
             pass
 
-    def wait_for_cdp(self, timeout: int = 10) -> bool:
+    def wait_for_cdp(self, timeout: float = 10) -> bool:
         """Wait for CDP interface to be ready"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                response = cdp_get(
-                    f"http://localhost:{self.debugging_port}/json/version", timeout=1
-                )
-                if response.status_code == 200:
+        deadline = time.monotonic() + timeout
+        for delay in _probe_intervals():
+            if self._cdp_responds():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+        return False
+
+    def _cdp_responds(self) -> bool:
+        """One probe of the HTTP endpoint."""
+        try:
+            response = cdp_get(
+                f"http://localhost:{self.debugging_port}/json/version", timeout=1
+            )
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def _wait_until_ready(self, timeout: float = 10) -> bool:
+        """Wait for the DevTools endpoint, returning as soon as Chrome announces it.
+
+        The stderr announcement normally ends the wait. The HTTP endpoint is
+        still probed about once a second for wrappers that swallow stderr, and
+        polled when stderr closes without the line — a second launch on a
+        profile that is already open hands off to the running browser and exits.
+        """
+        deadline = time.monotonic() + timeout
+        next_probe = time.monotonic() + 1.0
+        while (remaining := deadline - time.monotonic()) > 0:
+            ws_url = self._readiness.wait(min(remaining, 0.1)) if self._readiness else None
+            if ws_url:
+                self._adopt_ws_url(ws_url)
+                return True
+            if self._readiness is None or self._readiness.ready.is_set():
+                # stderr closed without the line. If the process is gone it
+                # handed off to a running browser (or crashed): one probe tells.
+                if self.chrome_process is not None:
+                    with suppress(subprocess.TimeoutExpired):
+                        self.chrome_process.wait(timeout=min(remaining, 0.5))
+                    if self.chrome_process.poll() is not None:
+                        return self._cdp_responds()
+                return self.wait_for_cdp(timeout=max(remaining, 0.1))
+            if time.monotonic() >= next_probe:
+                if self._cdp_responds():
                     return True
-            except Exception:
-                pass
-            time.sleep(0.5)
+                next_probe = time.monotonic() + 1.0
         return False
 
-    def inject_stealth_scripts(self) -> bool:
-        """Inject anti-detection scripts to all new pages"""
+    def _adopt_ws_url(self, ws_url: str) -> None:
+        """Record the announced endpoint; resolves the port when launched on port 0."""
+        self.browser_ws_url = ws_url
+        if not self.debugging_port:
+            with suppress(ValueError):
+                self.debugging_port = urlsplit(ws_url).port or 0
+
+    @contextmanager
+    def _phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    def _page_targets(self) -> list[dict]:
+        """Open page targets, or [] when the list cannot be fetched."""
+        try:
+            resp = cdp_get(
+                f"http://localhost:{self.debugging_port}/json/list", timeout=5
+            )
+            return [t for t in resp.json() if t.get("type") == "page"]
+        except Exception:
+            return []
+
+    def inject_stealth_scripts(self, target: dict | None = None) -> bool:
+        """Inject anti-detection scripts to all new pages
+
+        Args:
+            target: Target to register the scripts on (default: the first one)
+        """
         try:
             # Find stealth.js file
             stealth_js_path = (
@@ -386,16 +524,18 @@ class ChromeLauncher:
             with open(stealth_js_path, encoding="utf-8") as f:
                 stealth_script = f.read()
 
-            # Get first tab
-            response = cdp_get(
-                f"http://localhost:{self.debugging_port}/json", timeout=2
-            )
-            targets = response.json()
+            if target is None:
+                # Get first tab
+                response = cdp_get(
+                    f"http://localhost:{self.debugging_port}/json", timeout=2
+                )
+                targets = response.json()
 
-            if not targets:
-                return False
+                if not targets:
+                    return False
+                target = targets[0]
 
-            ws_url = targets[0]["webSocketDebuggerUrl"]
+            ws_url = target["webSocketDebuggerUrl"]
 
             import json
 
@@ -478,9 +618,23 @@ class ChromeLauncher:
 
         Returns:
             bool: Whether successfully launched and ready
+
+        Phase durations (kill, profile, spawn, ready, post_launch, total) are
+        recorded in ``self.timings``; ``total`` is the time until the browser
+        accepts its first command.
         """
-        if kill_existing:
-            kill_existing_chrome(self.debugging_port)
+        self.timings = {}
+        started = time.perf_counter()
+        try:
+            return self._launch(kill_existing)
+        finally:
+            self.timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+            self.logger.debug(f"Browser launch timings (ms): {self.timings}")
+
+    def _launch(self, kill_existing: bool) -> bool:
+        if kill_existing and self.debugging_port:
+            with self._phase("kill"):
+                kill_existing_chrome(self.debugging_port)
 
         if not self.chrome_path:
             return False
@@ -492,14 +646,15 @@ class ChromeLauncher:
         # — otherwise the guard skips migration and _init_profile_dir would
         # build a fresh profile, silently forfeiting the legacy login state.
         # User-supplied --profile-dir bypasses the layout and never migrates.
-        if self._default_layout:
-            self._wait_port_free(self.debugging_port, timeout=15.0)
-            self._migrate_legacy_profile(
-                self.browser_type, self.debugging_port, self.profile_dir
-            )
+        with self._phase("profile"):
+            if self._default_layout:
+                self._wait_port_free(self.debugging_port, timeout=15.0)
+                self._migrate_legacy_profile(
+                    self.browser_type, self.debugging_port, self.profile_dir
+                )
 
-        # Initialize profile directory
-        self._init_profile_dir()
+            # Initialize profile directory
+            self._init_profile_dir()
 
         # Chrome launch arguments
         # Note: profile_dir is a Path object, needs explicit string conversion to avoid Windows path issues
@@ -571,35 +726,64 @@ class ChromeLauncher:
             cmd.append("--window-position=-32000,-32000")
 
         # Launch Chrome
-        # stdin=DEVNULL prevents subprocess from waiting for input, which causes blocking on Windows
-        self.chrome_process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            stdin=subprocess.DEVNULL,
-        )
-
-        # Wait for launch
-        time.sleep(2)
+        # stdin=DEVNULL prevents subprocess from waiting for input, which causes blocking on Windows.
+        # stderr is read for the DevTools announcement (and drained after it);
+        # stdout is never read, so it must not be a pipe that can fill up.
+        with self._phase("spawn"):
+            self.chrome_process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+            )
+            self._readiness = DevToolsReadiness(self.chrome_process.stderr)
 
         # Wait for CDP ready
-        if self.wait_for_cdp():
-            # Inject stealth scripts
-            self.inject_stealth_scripts()
+        with self._phase("ready"):
+            ready = self._wait_until_ready()
+        if not ready:
+            return False
 
-            # Initialize tabs: clean slate for new session (not in app/kiosk mode)
-            if not self.app_mode and not self.kiosk_mode:
-                self._initialize_tabs()
-                # Reconcile stale tab groups after cleanup
-                self._reconcile_tab_groups()
+        with self._phase("post_launch"):
+            self._post_launch()
+        return True
 
-            # Force window size for app mode (Chrome ignores --window-size for remembered windows)
-            if self.app_mode:
-                self._set_window_bounds()
+    def _post_launch(self) -> None:
+        """Prepare the fresh browser, overlapping the steps that are independent.
 
-            return True
+        The stealth scripts must be registered on the kept tab before it
+        navigates to the landing page, so tab initialization closes the extra
+        tabs and probes the landing server while they are being injected and
+        only then waits for them. Tab-group reconciliation needs the cleaned-up
+        tab list; app-mode window bounds depend on nothing else.
+        """
+        manage_tabs = not self.app_mode and not self.kiosk_mode
+        pages = self._page_targets()
+        kept = pages[0] if pages and pages[0].get("webSocketDebuggerUrl") else None
+        stealth_done = threading.Event()
 
-        return False
+        def stealth() -> None:
+            try:
+                self.inject_stealth_scripts(kept)
+            finally:
+                stealth_done.set()
+
+        def tabs() -> None:
+            # Initialize tabs: clean slate for new session
+            self._initialize_tabs(pages, before_navigate=stealth_done.wait)
+            # Reconcile stale tab groups after cleanup
+            self._reconcile_tab_groups()
+
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="frago-launch") as pool:
+            steps = [pool.submit(stealth)]
+            if manage_tabs:
+                steps.append(pool.submit(tabs))
+            # Force window size for app mode (Chrome ignores --window-size for remembered windows)
+            if self.app_mode:
+                steps.append(pool.submit(self._set_window_bounds))
+            for step in steps:
+                with suppress(Exception):
+                    step.result()
 
     def _set_window_bounds(self) -> bool:
         """Set window bounds via CDP to enforce size for app mode windows.
@@ -692,20 +876,25 @@ class ChromeLauncher:
     LANDING_PAGE_SERVER_PORT = _LANDING_PORT
     LANDING_PAGE_URL = _LANDING_URL
 
-    def _initialize_tabs(self) -> None:
+    def _initialize_tabs(
+        self,
+        page_tabs: list[dict] | None = None,
+        before_navigate: Callable[[], object] | None = None,
+    ) -> None:
         """Close all existing tabs except one and navigate it to the landing page.
 
         Assumes a new task session is starting — gives a clean browser state.
         After this method, only 1 tab remains with the landing page loaded.
+
+        Args:
+            page_tabs: Page targets already fetched by the caller
+            before_navigate: Called right before the kept tab navigates
         """
         try:
             import json as _json
 
-            resp = cdp_get(
-                f"http://localhost:{self.debugging_port}/json/list", timeout=5
-            )
-            all_targets = resp.json()
-            page_tabs = [t for t in all_targets if t.get("type") == "page"]
+            if page_tabs is None:
+                page_tabs = self._page_targets()
 
             if not page_tabs:
                 return
@@ -730,6 +919,9 @@ class ChromeLauncher:
             except Exception:
                 return  # Server not running, leave tab as-is
 
+            if before_navigate is not None:
+                before_navigate()
+
             ws = cdp_ws_connect(ws_url, timeout=5)
             ws.send(_json.dumps({
                 "id": 1,
@@ -0,0 +1,204 @@
+"""
+Streaming PNG stitcher
+
+Joins PNG tiles of equal width top to bottom into one PNG on disk without
+holding the whole image: each tile's IDAT stream is inflated row by row and
+deflated straight into the output file. Peak memory is one tile.
+
+Rows are copied still filtered. Only the first row of each tile needs work —
+its filter was computed against an all-zero row above, which is not what sits
+above it in the stitched image — and that row is rewritten with a filter that
+ignores the row above (None or Sub).
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import BinaryIO
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Channels per color type (grayscale, RGB, palette, gray+alpha, RGBA)
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# Compressed bytes gathered before an IDAT chunk is written
+_IDAT_CHUNK = 256 * 1024
+
+
+class PNGStitchError(ValueError):
+    """Tiles cannot be stitched (not a PNG, interlaced, or mismatched format)"""
+
+
+def _chunks(data: bytes):
+    if not data.startswith(PNG_SIGNATURE):
+        raise PNGStitchError("not a PNG image")
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        start = pos + 8
+        yield kind, data[start:start + length]
+        pos = start + length + 4  # skip CRC
+        if kind == b"IEND":
+            return
+
+
+def _write_chunk(out: BinaryIO, kind: bytes, payload: bytes) -> None:
+    out.write(struct.pack(">I", len(payload)))
+    out.write(kind)
+    out.write(payload)
+    out.write(struct.pack(">I", zlib.crc32(kind + payload) & 0xFFFFFFFF))
+
+
+def _detach_first_row(row: bytearray, bpp: int) -> None:
+    """Re-express a row filtered against a zero row so it no longer needs one.
+
+    With nothing above, Up is None and Paeth is Sub; Average has to be undone.
+    """
+    kind = row[0]
+    if kind == 2:
+        row[0] = 0
+    elif kind == 4:
+        row[0] = 1
+    elif kind == 3:
+        for i in range(1, len(row)):
+            left = row[i - bpp] if i - 1 >= bpp else 0
+            row[i] = (row[i] + (left >> 1)) & 0xFF
+        row[0] = 0
+
+
+class PNGStitcher:
+    """
+    Append PNG tiles to one output PNG
+
+    Usage::
+
+        with open(path, "wb") as out:
+            stitcher = PNGStitcher(out)
+            for tile in tiles:
+                stitcher.add(tile)
+            stitcher.finish()
+    """
+
+    def __init__(self, out: BinaryIO, level: int = 6):
+        self.out = out
+        self.width = 0
+        self.height = 0
+        self._header: tuple | None = None
+        self._palette: bytes | None = None
+        self._stride = 0
+        self._bpp = 0
+        self._ihdr_offset = 0
+        self._started_data = False
+        self._compressor = zlib.compressobj(level)
+        self._pending = bytearray()
+
+    def add(self, png: bytes) -> tuple[int, int]:
+        """
+        Append one tile below the previous ones
+
+        Args:
+            png: A complete PNG image
+
+        Returns:
+            (width, height) of the tile
+        """
+        header = None
+        palette = None
+        inflater = zlib.decompressobj()
+        buffer = bytearray()
+        rows = 0
+        first = True
+
+        for kind, payload in _chunks(png):
+            if kind == b"IHDR":
+                header = struct.unpack(">IIBBBBB", payload)
+                if header[6] != 0:
+                    raise PNGStitchError("interlaced PNG tiles are not supported")
+                if self._header is None:
+                    self._start(header)
+                elif header[0] != self._header[0] or header[2:] != self._header[2:]:
+                    raise PNGStitchError("tiles differ in width or pixel format")
+            elif kind == b"PLTE":
+                palette = payload
+            elif kind == b"IDAT":
+                if header is None:
+                    raise PNGStitchError("IDAT before IHDR")
+                if not self._started_data:
+                    self._copy_ancillary(png)
+                    self._started_data = True
+                if self._palette is None:
+                    self._palette = palette
+                elif palette is not None and palette != self._palette:
+                    raise PNGStitchError("tiles use different palettes")
+                buffer += inflater.decompress(payload)
+                rows, first = self._drain(buffer, rows, first)
+        if header is None:
+            raise PNGStitchError("PNG without IHDR")
+        buffer += inflater.flush()
+        rows, _ = self._drain(buffer, rows, first)
+        if buffer:
+            raise PNGStitchError("truncated image data")
+        if rows != header[1]:
+            raise PNGStitchError(f"expected {header[1]} rows, got {rows}")
+        self.height += rows
+        return header[0], rows
+
+    def finish(self) -> None:
+        """Write the remaining data and the final header"""
+        if self._header is None:
+            raise PNGStitchError("no tiles were added")
+        self._pending += self._compressor.flush()
+        self._flush_idat(force=True)
+        _write_chunk(self.out, b"IEND", b"")
+        end = self.out.tell()
+        self.out.seek(self._ihdr_offset)
+        _write_chunk(self.out, b"IHDR", struct.pack(">II", self.width, self.height)
+                     + bytes(self._header[2:]))
+        self.out.seek(end)
+
+    # ── internals ─────────────────────────────────────────────────────────
+
+    def _start(self, header: tuple) -> None:
+        width, _, depth, color = header[:4]
+        if color not in _CHANNELS:
+            raise PNGStitchError(f"unknown PNG color type {color}")
+        bits = _CHANNELS[color] * depth
+        self._header = header
+        self.width = width
+        self._bpp = max(1, bits // 8)
+        self._stride = (width * bits + 7) // 8 + 1
+        self.out.write(PNG_SIGNATURE)
+        self._ihdr_offset = self.out.tell()
+        # Placeholder: the height is only known once every tile is in.
+        _write_chunk(self.out, b"IHDR", struct.pack(">IIBBBBB", width, 0, *header[2:]))
+
+    def _copy_ancillary(self, png: bytes) -> None:
+        """Carry the first tile's pre-IDAT chunks (PLTE, sRGB, gAMA, pHYs ...) over."""
+        for kind, payload in _chunks(png):
+            if kind == b"IDAT":
+                return
+            if kind != b"IHDR":
+                _write_chunk(self.out, kind, payload)
+
+    def _drain(self, buffer: bytearray, rows: int, first: bool) -> tuple[int, bool]:
+        stride = self._stride
+        whole = len(buffer) // stride * stride
+        if not whole:
+            return rows, first
+        block = buffer[:whole]
+        del buffer[:whole]
+        if first:
+            row = bytearray(block[:stride])
+            _detach_first_row(row, self._bpp)
+            block[:stride] = row
+            first = False
+        self._pending += self._compressor.compress(bytes(block))
+        self._flush_idat()
+        return rows + whole // stride, first
+
+    def _flush_idat(self, force: bool = False) -> None:
+        while len(self._pending) >= _IDAT_CHUNK or (force and self._pending):
+            piece = bytes(self._pending[:_IDAT_CHUNK])
+            del self._pending[:_IDAT_CHUNK]
+            _write_chunk(self.out, b"IDAT", piece)
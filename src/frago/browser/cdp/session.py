@@ -93,10 +93,22 @@ class CDPSession(CDPClient):
         """Send CDP command (delegated to transport)"""
         return self._transport.send_command(method, params)
 
+    def send_commands(
+        self,
+        commands: list[tuple[str, dict[str, Any] | None]],
+        window: int = 64,
+    ) -> list[dict[str, Any]]:
+        """Send CDP commands pipelined (delegated to transport)"""
+        return self._transport.send_commands(commands, window)
+
     def on_event(self, event_name: str) -> Callable:
         """Register a CDP event handler (delegated to transport)"""
         return self._transport.on_event(event_name)
 
+    def poll_events(self, timeout: float) -> int:
+        """Dispatch pending CDP events (delegated to transport)"""
+        return self._transport.poll_events(timeout)
+
     def health_check(self) -> bool:
         """
         Perform connection health check
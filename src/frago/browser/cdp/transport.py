@@ -265,6 +265,98 @@ class CDPTransport:
         # Wait for response
         return self._wait_for_response(request_id)
 
+    def send_commands(
+        self,
+        commands: list[tuple[str, dict[str, Any] | None]],
+        window: int = 64,
+    ) -> list[dict[str, Any]]:
+        """
+        Send a sequence of CDP commands pipelined over the one WebSocket
+
+        Up to ``window`` commands are in flight at once: the next ones go out
+        as soon as replies come back, instead of one full round-trip per
+        command. Chrome handles the commands of one session in the order they
+        were sent, so ordering is the same as sending them one by one. On an
+        error reply nothing further is sent; commands already in flight still
+        run.
+
+        Args:
+            commands: (method, params) pairs, in order
+            window: Maximum number of unanswered commands
+
+        Returns:
+            list[Dict[str, Any]]: Responses, in the order of ``commands``
+
+        Raises:
+            CDPError: A command failed (the first failure is raised)
+            TimeoutError: No reply arrived within command_timeout
+        """
+        if not self.connected:
+            raise ConnectionError("CDP not connected")
+        if not commands:
+            return []
+
+        with self._lock:
+            first_id = self._request_id
+            self._request_id += len(commands)
+            for offset in range(len(commands)):
+                self._pending_requests[first_id + offset] = {
+                    "start_time": time.time(),
+                    "timeout": self.config.command_timeout,
+                }
+
+        responses: dict[int, dict[str, Any]] = {}
+        failure: dict[str, Any] | None = None
+        sent = 0
+        timeout = self.config.command_timeout
+        try:
+            while len(responses) < sent or (sent < len(commands) and failure is None):
+                # Refill the window
+                while failure is None and sent < len(commands) and sent - len(responses) < window:
+                    method, params = commands[sent]
+                    request: CDPRequest = {
+                        "id": first_id + sent,
+                        "method": method,
+                        "params": params or {},
+                    }
+                    try:
+                        self.ws.send(json.dumps(request))
+                    except Exception as e:
+                        raise CDPError(f"Failed to send CDP command: {e}") from e
+                    sent += 1
+
+                # Block for the next reply rather than polling: the listener
+                # thread hands frames over as soon as they arrive.
+                try:
+                    message = self._message_queue.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"Command timeout after {timeout} seconds") from None
+                try:
+                    response = json.loads(message)
+                except ValueError as e:
+                    self.logger.error(f"Error processing message: {e}")
+                    continue
+
+                offset = response["id"] - first_id if "id" in response else -1
+                if 0 <= offset < sent:
+                    responses[offset] = response
+                    if failure is None and "error" in response:
+                        failure = response
+                elif "method" in response:
+                    self._handle_event(response)
+
+            self.logger.debug(
+                f"Sent {sent} pipelined CDP commands (ids {first_id}-{first_id + sent - 1})"
+            )
+            if failure is not None:
+                self._validate_response(failure)
+            return [responses[offset] for offset in range(len(commands))]
+
+        finally:
+            with self._lock:
+                for offset in range(len(commands)):
+                    self._pending_requests.pop(first_id + offset, None)
+
     def _validate_response(self, response: dict[str, Any]) -> dict[str, Any]:
         """
         Validate CDP response
@@ -309,11 +401,12 @@ class CDPTransport:
             }
 
         try:
-            while time.time() - start_time < timeout:
+            while (remaining := timeout - (time.time() - start_time)) > 0:
                 # Check if our response is in message queue
                 try:
-                    # Non-blocking get
-                    message = self._message_queue.get_nowait()
+                    # Block until the listener hands a frame over; a sleep-poll
+                    # here added up to 10ms to every command.
+                    message = self._message_queue.get(timeout=min(remaining, 0.5))
                     response = json.loads(message)
 
                     # If this is the response we're waiting for
@@ -325,8 +418,6 @@ class CDPTransport:
                         self._handle_event(response)
 
                 except queue.Empty:
-                    # Queue empty, sleep briefly and continue
-                    time.sleep(0.01)
                     continue
                 except Exception as e:
                     self.logger.error(f"Error processing message: {e}")
@@ -339,6 +430,40 @@ class CDPTransport:
             with self._lock:
                 self._pending_requests.pop(request_id, None)
 
+    def poll_events(self, timeout: float) -> int:
+        """
+        Dispatch incoming events for up to ``timeout`` seconds
+
+        Events are otherwise only dispatched while a command waits for its
+        reply; a consumer of a stream of events with no command to send (a
+        screencast) pumps them with this.
+
+        Args:
+            timeout: Seconds to wait for the first message
+
+        Returns:
+            int: Number of events dispatched
+        """
+        dispatched = 0
+        deadline = time.time() + timeout
+        while (remaining := deadline - time.time()) > 0:
+            try:
+                message = self._message_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            try:
+                response = json.loads(message)
+            except ValueError as e:
+                self.logger.error(f"Error processing message: {e}")
+                continue
+            if "method" in response:
+                self._handle_event(response)
+                dispatched += 1
+                # Hand control back as soon as something happened; the caller
+                # decides whether to keep waiting.
+                deadline = min(deadline, time.time())
+        return dispatched
+
     def _start_message_listener(self) -> None:
         """Start message listener thread"""
         self._listener_thread = threading.Thread(
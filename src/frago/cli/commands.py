@@ -950,10 +950,18 @@ def group_option(fn):
 
 
 def _print_dom_features(features: dict) -> None:
-    """Print DOM features summary"""
+    """Print DOM features summary (or, after the first perception, what changed)"""
     if not features:
         return
 
+    mode = features.get('perception')
+    if mode == perception.UNCHANGED:
+        _print_msg("success", f"Page unchanged: {features.get('title', '(none)')}")
+        return
+    if mode == perception.DELTA:
+        _print_dom_delta(features)
+        return
+
     # Build feature summary
     body_attrs = []
     if features.get('body_class'):
@@ -976,6 +984,31 @@ def _print_dom_features(features: dict) -> None:
         _print_msg("success", f"Visible content: {features['visible_content']}")
 
 
+def _print_dom_delta(features: dict) -> None:
+    """Print what changed since the previous perception"""
+    _print_msg("success", f"Page title: {features.get('title', '(none)')}")
+
+    changed = features.get('changed') or {}
+    if changed:
+        counts = ', '.join(f"{k} {before}→{after}" for k, (before, after) in changed.items())
+        _print_msg("success", f"Element stats changed: {counts}")
+
+    for change in features.get('changes') or []:
+        line = f"{change.get('kind')} {change.get('node')}"
+        if change.get('before'):
+            line += f": \"{change['before']}\" → \"{change.get('text', '')}\""
+        elif change.get('text'):
+            line += f": {change['text']}"
+        _print_msg("success", f"Changed: {line}")
+    if features.get('more_changes'):
+        _print_msg("success", f"Changed: ... and {features['more_changes']} more")
+
+    if 'visible_content' in features:
+        _print_msg("success", f"Scroll position: scrollY={features.get('scroll_y', 0)}px")
+        if features['visible_content']:
+            _print_msg("success", f"Visible content: {features['visible_content']}")
+
+
 # Post-action perception lives in run/perception.py; the CLI only injects
 # its output renderer.  Call sites keep using _do_perception(session, desc).
 _do_perception = functools.partial(perception.do_perception, printer=_print_dom_features)
@@ -1332,8 +1365,27 @@ def screenshot(ctx, output_file: str, full_page: bool, quality: int, group: str
         with create_session(ctx, group=group) as session:
             _check_landing_page_protection(session, ctx)
             _touch_active_tab(session, ctx.obj['HOST'], ctx.obj['PORT'])
-            session.screenshot.capture(actual_output_file, full_page=full_page, quality=quality)
-            _print_msg("success", f"Screenshot saved to: {actual_output_file}", "screenshot", {"file": actual_output_file, "full_page": full_page})
+            result = session.screenshot.capture(actual_output_file, full_page=full_page, quality=quality)
+            data = {"file": actual_output_file, "full_page": full_page}
+            saved_to = actual_output_file
+            if isinstance(result, dict) and result.get("tiles"):
+                data["tiles"] = len(result["tiles"])
+                if "file" not in result:
+                    # Tiles that could not be stitched are separate files
+                    files = [tile["file"] for tile in result["tiles"]]
+                    data["file"] = None
+                    data["files"] = files
+                    saved_to = ", ".join(files)
+            if isinstance(result, dict) and result.get("truncated"):
+                data["truncated"] = True
+                data["page_height"] = result["page_height"]
+                _print_msg(
+                    "warning",
+                    f"Page is {result['page_height']}px tall; only the first {result['height']}px were captured",
+                    "screenshot",
+                    data,
+                )
+            _print_msg("success", f"Screenshot saved to: {saved_to}", "screenshot", data)
     except ChromeCommandError as e:
         _handle_chrome_command_error(e)
     except CDPError as e:
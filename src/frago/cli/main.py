@@ -12,50 +12,65 @@ import click
 
 from frago import __version__
 
-from .agent_command import agent, agent_status
 from .agent_friendly import AgentFriendlyGroup, validate_cdp_port
-from .apps_commands import apps_group
-from .autostart_command import autostart_group
-from .book_commands import book_command
-from .browser_commands import browser_group
-from .channel_commands import channel_group
-from .client_commands import client_group
-from .cloud_commands import (
-    config_group,
-    install_group,
-    login_cmd,
-    logout_cmd,
-    market_group,
-    whoami_cmd,
-)
-from .commands import (
-    init as init_dirs,  # Legacy directory init command, kept as init-dirs
-)
-from .commands import (
-    status,
-)
-from .context_commands import context_command
-from .daemon_commands import daemon_group
-from .def_commands import def_group
-from .desktop_commands import desktop_group
-from .extension_commands import extension_group
-from .hook_rules_commands import hook_rules_group
-from .init_command import init  # New environment init command
-from .profile_commands import profile_group
-from .recipe_commands import recipe_group
-from .remote_commands import remote_group
-from .reply_command import reply_cmd
-from .schedule_commands import schedule_group
-from .serve_command import serve
-from .server_command import server_group
-from .session_commands import session_group
-from .skill_commands import skill_group
-from .start_command import start
-from .todo_commands import todo_group
-from .update_command import update
-from .user_commands import user_group
-from .view_command import view
-from .workspace_commands import workspace_group
+
+# Every top-level command, as (name, module, attribute). Nothing here is imported
+# until the command is actually resolved: importing all of them up front pulled in
+# the CDP stack, the server's services and the recipe installer — most of a second
+# — on every invocation, including the `frago browser exec-js` and `frago recipe
+# run` calls agents make hundreds of times a session. Those now import one module.
+#
+# A list rather than a dict literal on purpose: a dict literal with a repeated
+# key keeps the last one without a word, which is exactly how `frago recipe
+# publish` was once lost (see tests/unit/cli/test_no_command_shadowing.py).
+LAZY_COMMAND_SPECS: list[tuple[str, str, str]] = [
+    ("start", ".start_command", "start"),  # User-friendly entry point: starts server + opens browser
+    ("init", ".init_command", "init"),  # New environment init command
+    ("init-dirs", ".commands", "init"),  # Legacy directory init command
+    ("status", ".commands", "status"),  # CDP connection status (kept at top level for quick checks)
+    ("update", ".update_command", "update"),  # Self-update command
+    # Command groups
+    ("browser", ".browser_commands", "browser_group"),  # browser automation command group
+    ("desktop", ".desktop_commands", "desktop_group"),  # virtual desktop stage (forwards to the agent_os recipe)
+    ("extension", ".extension_commands", "extension_group"),  # Browser extension bridge (P1 MVP)
+    ("recipe", ".recipe_commands", "recipe_group"),  # Recipe management command group
+    ("skill", ".skill_commands", "skill_group"),  # Skill management command group
+    ("apps", ".apps_commands", "apps_group"),  # Apps command group - built-in delivery capabilities
+    # Agent commands
+    ("agent", ".agent_command", "agent"),
+    ("agent-status", ".agent_command", "agent_status"),
+    ("session", ".session_commands", "session_group"),  # Session management command group
+    # Context command - resolve a keyword into a stored context (data:<keyword>)
+    ("context", ".context_commands", "context_command"),
+    ("view", ".view_command", "view"),  # View command - universal content viewer
+    ("serve", ".serve_command", "serve"),  # Web service GUI (deprecated, use 'server' instead)
+    ("server", ".server_command", "server_group"),  # Background web service management
+    ("client", ".client_commands", "client_group"),  # Desktop client management
+    ("autostart", ".autostart_command", "autostart_group"),  # Manage server autostart on boot
+    ("workspace", ".workspace_commands", "workspace_group"),  # Agent resource management
+    ("reply", ".reply_command", "reply_cmd"),  # Send replies through ingestion channels
+    ("channel", ".channel_commands", "channel_group"),  # Manage task ingestion channels
+    ("remote", ".remote_commands", "remote_group"),  # Drive another frago (server deployment) through its PA intake
+    ("daemon", ".daemon_commands", "daemon_group"),  # Supervise long-lived recipe daemons
+    # User command group - accounts that sign in to this server's published pages.
+    # Their login sessions live under `frago user session`, NEVER under the top-level
+    # `frago session`: that group is the agent transcript store, and click replaces a
+    # same-named command without warning, so adding one there deletes an existing one.
+    ("user", ".user_commands", "user_group"),
+    ("book", ".book_commands", "book_command"),  # Built-in knowledge query
+    ("def", ".def_commands", "def_group"),  # Structured knowledge domain management
+    ("todo", ".todo_commands", "todo_group"),  # Standardized CRUD over ~/.frago/todo/ (one JSON per todo)
+    ("hook-rules", ".hook_rules_commands", "hook_rules_group"),  # frago-core's data-driven routing rules
+    ("schedule", ".schedule_commands", "schedule_group"),  # Manage scheduled tasks
+    # Cloud commands - frago Cloud authentication, config, and market
+    ("login", ".cloud_commands", "login_cmd"),
+    ("logout", ".cloud_commands", "logout_cmd"),
+    ("whoami", ".cloud_commands", "whoami_cmd"),
+    ("profile", ".profile_commands", "profile_group"),
+    ("config", ".cloud_commands", "config_group"),
+    ("market", ".cloud_commands", "market_group"),
+    ("install", ".cloud_commands", "install_group"),
+]
 
 # Command group definitions (by user role)
 COMMAND_GROUPS = OrderedDict([
@@ -94,10 +109,30 @@ class AgentFriendlyGroupedGroup(AgentFriendlyGroup):
     - Grouped display: Organize commands by category
     - Subcommand expansion: Show subcommands of command groups in help
     - Dynamic domain commands: registered def domains become top-level commands
+    - Lazy loading: built-in commands are imported on first resolution
     """
 
+    def __init__(self, *args, lazy_commands: list[tuple[str, str, str]] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, tuple[str, str]] = {
+            name: (module, attr) for name, module, attr in (lazy_commands or [])
+        }
+
+    def _builtin_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """A registered command, importing its module the first time it is asked for."""
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in self.lazy_commands:
+            return cmd
+        import importlib
+
+        module_name, attr = self.lazy_commands[cmd_name]
+        module = importlib.import_module(module_name, package=__package__)
+        cmd = getattr(module, attr)
+        self.add_command(cmd, name=cmd_name)
+        return cmd
+
     def list_commands(self, ctx: click.Context) -> list[str]:
-        builtin = super().list_commands(ctx)
+        builtin = sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
         try:
             from frago.def_.registry import load_registry
             registered = sorted(load_registry().keys())
@@ -109,14 +144,14 @@ class AgentFriendlyGroupedGroup(AgentFriendlyGroup):
             return builtin
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
-        cmd = super().get_command(ctx, cmd_name)
+        cmd = self._builtin_command(ctx, cmd_name)
         if cmd is not None:
             return cmd
         # Resolve aliases silently. They deliberately stay out of list_commands:
         # an alias that shows up in --help reads as a second, different command.
         alias = COMMAND_ALIASES.get(cmd_name)
         if alias:
-            aliased = super().get_command(ctx, alias)
+            aliased = self._builtin_command(ctx, alias)
             if aliased is not None:
                 return aliased
         # Check if it's a registered domain
@@ -230,7 +265,11 @@ class AgentFriendlyGroupedGroup(AgentFriendlyGroup):
         return rows
 
 
-@click.group(cls=AgentFriendlyGroupedGroup, invoke_without_command=True)
+@click.group(
+    cls=AgentFriendlyGroupedGroup,
+    invoke_without_command=True,
+    lazy_commands=LAZY_COMMAND_SPECS,
+)
 @click.version_option(version=__version__, prog_name="frago")
 @click.option(
     '--gui',
@@ -370,99 +409,6 @@ def cli(ctx, gui: bool, gui_background: bool, debug: bool, timeout: int, host: s
             click.echo(f"Proxy config: {proxy_host}:{proxy_port}")
 
 
-# Register top-level commands
-cli.add_command(start)  # User-friendly entry point: starts server + opens browser
-cli.add_command(init)  # New environment init command
-cli.add_command(init_dirs, name="init-dirs")  # Legacy directory init command
-cli.add_command(status)  # CDP connection status (kept at top level for quick checks)
-cli.add_command(update)  # Self-update command
-
-# Command groups
-cli.add_command(browser_group)  # browser automation command group
-cli.add_command(desktop_group)  # virtual desktop stage (forwards to the agent_os recipe)
-cli.add_command(extension_group, name="extension")  # Browser extension bridge (P1 MVP)
-
-# Recipe management command group
-cli.add_command(recipe_group)
-
-# Skill management command group
-cli.add_command(skill_group)
-
-# Apps command group - built-in delivery capabilities
-cli.add_command(apps_group)
-
-# Agent commands
-cli.add_command(agent)
-cli.add_command(agent_status)
-
-# Session management command group
-cli.add_command(session_group)
-
-# Context command - resolve a keyword into a stored context (data:<keyword>)
-cli.add_command(context_command)
-
-# View command - universal content viewer
-cli.add_command(view)
-
-# Serve command - web service GUI (deprecated, use 'server' instead)
-cli.add_command(serve)
-
-# Server command group - background web service management
-cli.add_command(server_group)
-
-# Client command group - desktop client management
-cli.add_command(client_group)
-
-# Autostart command group - manage server autostart on boot
-cli.add_command(autostart_group)
-
-# Workspace command group - agent resource management
-cli.add_command(workspace_group)
-
-# Reply command - send replies through ingestion channels
-cli.add_command(reply_cmd, name="reply")
-
-# Channel command group - manage task ingestion channels
-cli.add_command(channel_group, name="channel")
-
-# Drive another frago (server deployment) through its PA intake
-cli.add_command(remote_group, name="remote")
-
-# Daemon command group - supervise long-lived recipe daemons
-cli.add_command(daemon_group, name="daemon")
-
-# User command group - accounts that sign in to this server's published pages.
-# Their login sessions live under `frago user session`, NEVER under the top-level
-# `frago session`: that group is the agent transcript store, and click replaces a
-# same-named command without warning, so adding one there deletes an existing one.
-cli.add_command(user_group, name="user")
-
-# Book command - built-in knowledge query
-cli.add_command(book_command)
-
-# Def command group - structured knowledge domain management
-cli.add_command(def_group)
-
-# Todo command group - standardized CRUD over ~/.frago/todo/ (one JSON per todo)
-cli.add_command(todo_group, name="todo")
-
-# Hook-rules command group - manage frago-core's data-driven routing rules
-cli.add_command(hook_rules_group)
-
-# Schedule command group - manage scheduled tasks
-cli.add_command(schedule_group, name="schedule")
-
-# Cloud commands - frago Cloud authentication, config, and market
-cli.add_command(login_cmd, name="login")
-cli.add_command(logout_cmd, name="logout")
-cli.add_command(whoami_cmd, name="whoami")
-cli.add_command(profile_group, name="profile")
-cli.add_command(config_group, name="config")
-cli.add_command(market_group, name="market")
-cli.add_command(install_group, name="install")
-
-
-
 def _force_utf8_stdio_on_windows() -> None:
     """Replace sys.stdout/stderr with explicit UTF-8 TextIOWrapper on Windows.
 
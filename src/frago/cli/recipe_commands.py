@@ -1,4 +1,5 @@
 """Recipe management commands"""
+import contextlib
 import json
 import re
 import shutil
@@ -583,6 +584,11 @@ def recipe_info(name: str, source: str | None, output_format: str):
     is_flag=True,
     help='Run in background, print execution_id'
 )
+@click.option(
+    '--no-cache', 'no_cache',
+    is_flag=True,
+    help='Always execute, even if the recipe declares cache_ttl and a fresh result is cached'
+)
 def run_recipe(
     name: str,
     source: str | None,
@@ -593,6 +599,7 @@ def run_recipe(
     output_clipboard: bool,
     timeout: int,
     async_exec: bool,
+    no_cache: bool,
 ):
     """Execute specified recipe"""
     try:
@@ -648,7 +655,8 @@ def run_recipe(
             output_target,
             output_options,
             env_overrides=env_overrides if env_overrides else None,
-            source=source
+            source=source,
+            use_cache=not no_cache,
         )
 
         # Output stderr (logs during script execution)
@@ -659,12 +667,13 @@ def run_recipe(
             click.echo("--- End Logs ---", err=True)
 
         # Execution summary to stderr (human-readable, doesn't pollute stdout)
-        exec_id = result.get('execution_id', '')
+        exec_id = result.get('execution_id') or ''
+        elapsed = 'cached' if result.get('cached') else f"{result.get('execution_time', 0):.1f}s"
         click.echo(
             f"[recipe] {result.get('recipe_name', name)} | "
             f"{exec_id + ' | ' if exec_id else ''}"
             f"{'OK' if result.get('success') else 'FAIL'} | "
-            f"{result.get('execution_time', 0):.1f}s",
+            f"{elapsed}",
             err=True
         )
 
@@ -2496,6 +2505,17 @@ def expose_recipe(name: str, slot: str, require_identity: bool, allow_who: tuple
 
     entry = mark_published(name, slot, mode, allow=allow_ids, runnable=runnable)
 
+    # Compress the page now, at full strength, so no visitor waits for it, and
+    # drop the variants of assets that are gone. Best effort: the server builds
+    # a cheap variant of whatever is missing on first request.
+    from frago.recipes import asset_variants
+    from frago.recipes.publish import load as load_published
+
+    with contextlib.suppress(OSError):
+        asset_variants.precompress(recipe_dir / 'assets')
+        live = [_find_recipe_dir_by_name(n) for n in load_published()]
+        asset_variants.prune([d / 'assets' for d in live if d is not None])
+
     if output_format == 'json':
         click.echo(json.dumps({
             "success": True,
@@ -1,6 +1,6 @@
 """frago todo — local todo management commands.
 
-  frago todo add/list/show/edit/done/rm/schema/next
+  frago todo add/list/show/edit/done/rm/schema/next/reindex
 
 A thin CLI over ``frago.todo.store``; one JSON file per todo under
 ``~/.frago/todo/`` (``FRAGO_TODO_DIR`` overrides). Bare ``frago todo`` shows
@@ -27,10 +27,15 @@ def todo_group(ctx):
     _print_list()
 
 
-def _print_list(status=None, priority=None, tag=None):
+def _print_list(status=None, priority=None, tag=None, due_before=None, archived=False):
     from frago.todo import store
 
-    todos = store.list_todos(status=status, priority=priority, tag=tag)
+    try:
+        todos = store.list_todos(
+            status=status, priority=priority, tag=tag, due_before=due_before, archived=archived
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e)) from None
     if not todos:
         click.echo("No todos.")
         click.echo('  frago todo add --title "..."')
@@ -50,11 +55,12 @@ def _print_list(status=None, priority=None, tag=None):
 @click.option("--priority", type=_PRIORITY_CHOICE, default="normal", help="Priority (default normal)")
 @click.option("--status", type=_STATUS_CHOICE, default="todo", help="Initial status (default todo)")
 @click.option("--tag", "tags", multiple=True, help="Tag (repeatable)")
+@click.option("--due", default=None, help="Due date (YYYY-MM-DD)")
 @click.option("--context", default=None, help="Background / why")
 @click.option("--step", "steps", multiple=True, help="Step (repeatable)")
 @click.option("--done-when", "done_when", multiple=True, help="Completion condition (repeatable)")
 @click.option("--link", "links", multiple=True, help="Related URL (repeatable)")
-def todo_add(title_arg, title_opt, summary, priority, status, tags, context, steps, done_when, links):
+def todo_add(title_arg, title_opt, summary, priority, status, tags, due, context, steps, done_when, links):
     """Create a new todo. Title can be positional (`todo add "..."`) or via --title."""
     from frago.todo import store
 
@@ -71,6 +77,7 @@ def todo_add(title_arg, title_opt, summary, priority, status, tags, context, ste
             priority=priority,
             status=status,
             tags=list(tags),
+            due=due,
             context=context,
             steps=list(steps),
             done_when=list(done_when),
@@ -87,9 +94,11 @@ def todo_add(title_arg, title_opt, summary, priority, status, tags, context, ste
 @click.option("--status", type=_STATUS_CHOICE, default=None, help="Filter by status")
 @click.option("--priority", type=_PRIORITY_CHOICE, default=None, help="Filter by priority")
 @click.option("--tag", default=None, help="Filter by tag")
-def todo_list(status, priority, tag):
+@click.option("--due-before", default=None, help="Only todos due on or before this date (YYYY-MM-DD)")
+@click.option("--archived", is_flag=True, help="Include archived (long-closed) todos")
+def todo_list(status, priority, tag, due_before, archived):
     """List todos (sorted by priority then created)."""
-    _print_list(status=status, priority=priority, tag=tag)
+    _print_list(status=status, priority=priority, tag=tag, due_before=due_before, archived=archived)
 
 
 @todo_group.command(name="show", cls=AgentFriendlyCommand)
@@ -112,11 +121,12 @@ def todo_show(ref):
 @click.option("--priority", type=_PRIORITY_CHOICE, default=None)
 @click.option("--status", type=_STATUS_CHOICE, default=None)
 @click.option("--tag", "tags", multiple=True, help="Replace tags (repeatable)")
+@click.option("--due", default=None, help="Due date (YYYY-MM-DD)")
 @click.option("--context", default=None)
 @click.option("--step", "steps", multiple=True, help="Replace steps (repeatable)")
 @click.option("--done-when", "done_when", multiple=True, help="Replace conditions (repeatable)")
 @click.option("--link", "links", multiple=True, help="Replace links (repeatable)")
-def todo_edit(ref, title, summary, priority, status, tags, context, steps, done_when, links):
+def todo_edit(ref, title, summary, priority, status, tags, due, context, steps, done_when, links):
     """Edit fields of a todo (only provided options change)."""
     from frago.todo import store
 
@@ -129,6 +139,8 @@ def todo_edit(ref, title, summary, priority, status, tags, context, steps, done_
         changes["priority"] = priority
     if status is not None:
         changes["status"] = status
+    if due is not None:
+        changes["due"] = due
     if context is not None:
         changes["context"] = context
     # Repeatable options replace the list only when supplied at least once.
@@ -201,3 +213,11 @@ def todo_next():
         click.echo("\ndone when:")
         for cond in todo.done_when:
             click.echo(f"  - {cond}")
+
+
+@todo_group.command(name="reindex", cls=AgentFriendlyCommand)
+def todo_reindex():
+    """Rebuild the todo index from the files (after editing an archived one in place)."""
+    from frago.todo import store
+
+    click.echo(f"Indexed {store.reindex()} todos")
@@ -0,0 +1,93 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+import { FragoWebSocketClient, MessageType, Topic, topicFor } from '../websocket';
+
+/** Stands in for the browser WebSocket; records what the client sends. */
+class FakeWebSocket {
+  static OPEN = 1;
+  static instances: FakeWebSocket[] = [];
+  readyState = 0;
+  sent: Record<string, unknown>[] = [];
+  onopen: (() => void) | null = null;
+  onclose: ((event: { code: number; reason: string }) => void) | null = null;
+  onerror: ((error: unknown) => void) | null = null;
+  onmessage: ((event: { data: string }) => void) | null = null;
+
+  constructor(public url: string) {
+    FakeWebSocket.instances.push(this);
+  }
+
+  send(text: string) {
+    this.sent.push(JSON.parse(text));
+  }
+
+  close() {
+    this.readyState = 3;
+  }
+
+  open() {
+    this.readyState = FakeWebSocket.OPEN;
+    this.onopen?.();
+  }
+}
+
+function subscriptionFrames(socket: FakeWebSocket) {
+  return socket.sent.filter(
+    (m) => m.type === MessageType.SUBSCRIBE || m.type === MessageType.UNSUBSCRIBE
+  );
+}
+
+describe('FragoWebSocketClient topics', () => {
+  beforeEach(() => {
+    FakeWebSocket.instances = [];
+    vi.stubGlobal('WebSocket', FakeWebSocket);
+  });
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('tells the server only when a topic gains its first or loses its last holder', () => {
+    const client = new FragoWebSocketClient({ autoReconnect: false, pingInterval: 60_000 });
+    client.connect();
+    const socket = FakeWebSocket.instances[0];
+    socket.open();
+
+    const releaseA = client.subscribe(['workbench:/p']);
+    const releaseB = client.subscribe(['workbench:/p']);
+    releaseA();
+    releaseA();
+    expect(subscriptionFrames(socket)).toEqual([
+      { type: MessageType.SUBSCRIBE, topics: ['workbench:/p'] },
+    ]);
+
+    releaseB();
+    expect(subscriptionFrames(socket)).toEqual([
+      { type: MessageType.SUBSCRIBE, topics: ['workbench:/p'] },
+      { type: MessageType.UNSUBSCRIBE, topics: ['workbench:/p'] },
+    ]);
+    client.disconnect();
+  });
+
+  it('re-sends the held topics after reconnecting', () => {
+    const client = new FragoWebSocketClient({ autoReconnect: false, pingInterval: 60_000 });
+    client.subscribe([Topic.DATA, Topic.AGENT]);
+    client.subscribe([Topic.AGENT])();
+    client.connect();
+    const socket = FakeWebSocket.instances[0];
+    socket.open();
+
+    expect(subscriptionFrames(socket)).toEqual([
+      { type: MessageType.SUBSCRIBE, topics: [Topic.DATA, Topic.AGENT] },
+    ]);
+    client.disconnect();
+  });
+
+  it('maps message types to the topics the server publishes them on', () => {
+    expect(topicFor(MessageType.SESSION_RECORDS_APPEND)).toBe(Topic.WORKBENCH);
+    expect(topicFor(MessageType.SESSION_SYNC)).toBe(Topic.TASKS);
+    expect(topicFor(MessageType.TASK_COMPLETED)).toBe(Topic.TASKS);
+    expect(topicFor('agent_text_delta')).toBe(Topic.AGENT);
+    expect(topicFor(MessageType.TIMELINE_EVENT)).toBe(Topic.TRACE);
+    expect(topicFor(MessageType.DATA_RECIPES)).toBe(Topic.DATA);
+    expect(topicFor(MessageType.PONG)).toBe('');
+  });
+});
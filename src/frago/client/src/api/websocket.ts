@@ -15,6 +15,11 @@ export const MessageType = {
   PING: 'ping',
   PONG: 'pong',
 
+  // Topic subscription
+  SUBSCRIBE: 'subscribe',
+  UNSUBSCRIBE: 'unsubscribe',
+  SUBSCRIBED: 'subscribed',
+
   // Task events
   TASK_STARTED: 'task_started',
   TASK_UPDATED: 'task_updated',
@@ -55,6 +60,35 @@ export const MessageType = {
 
 export type MessageTypeValue = (typeof MessageType)[keyof typeof MessageType];
 
+// Topics matching server. ``workbench`` is a family: a subscriber of
+// ``workbench:<project>`` receives only that project's session frames.
+export const Topic = {
+  TASKS: 'tasks',
+  AGENT: 'agent',
+  TRACE: 'trace',
+  DATA: 'data',
+  INIT: 'init',
+  WORKBENCH: 'workbench',
+} as const;
+
+/**
+ * The topic the server publishes a message type on (mirrors ``topic_for``).
+ * Empty for connection-level messages, which every client receives.
+ */
+export function topicFor(type: string): string {
+  if (type === MessageType.SESSION_RECORDS_APPEND || type === MessageType.SESSION_TURN_DONE) {
+    return Topic.WORKBENCH;
+  }
+  if (type.startsWith('task_') || type.startsWith('recipe_') || type.startsWith('session_')) {
+    return Topic.TASKS;
+  }
+  if (type.startsWith('agent_')) return Topic.AGENT;
+  if (type.startsWith('pa_') || type === MessageType.TIMELINE_EVENT) return Topic.TRACE;
+  if (type.startsWith('data_')) return Topic.DATA;
+  if (type.startsWith('init_')) return Topic.INIT;
+  return '';
+}
+
 export interface WebSocketMessage {
   type: MessageTypeValue;
   timestamp: string;
@@ -88,6 +122,10 @@ export class FragoWebSocketClient {
   private reconnectTimer: ReturnType<typeof setTimeout> | null = null;
   private pingTimer: ReturnType<typeof setInterval> | null = null;
   private isConnecting = false;
+  // Topic → number of holders. The server is told when a topic gains its
+  // first holder or loses its last one, and the held set is re-sent on every
+  // reconnect. Until the first subscribe the server sends everything.
+  private topicRefs: Map<string, number> = new Map();
 
   constructor(options: WebSocketClientOptions = {}) {
     // Build WebSocket URL from current location
@@ -122,6 +160,9 @@ export class FragoWebSocketClient {
         this.isConnecting = false;
         this.reconnectAttempts = 0;
         this.startPingTimer();
+        if (this.topicRefs.size > 0) {
+          this.send({ type: MessageType.SUBSCRIBE, topics: [...this.topicRefs.keys()] });
+        }
         this.onConnectHandlers.forEach((handler) => handler());
       };
 
@@ -211,6 +252,50 @@ export class FragoWebSocketClient {
     return () => this.onDisconnectHandlers.delete(handler);
   }
 
+  /**
+   * Receive these topics (e.g. 'tasks', 'workbench:<project>') for as long as
+   * the returned release function has not been called. Holders are counted,
+   * so two views sharing a topic keep it until both let go.
+   */
+  subscribe(topics: string[]): () => void {
+    const added: string[] = [];
+    topics.forEach((topic) => {
+      const count = this.topicRefs.get(topic) ?? 0;
+      this.topicRefs.set(topic, count + 1);
+      if (count === 0) added.push(topic);
+    });
+    if (added.length > 0) {
+      this.send({ type: MessageType.SUBSCRIBE, topics: added });
+    }
+
+    let released = false;
+    return () => {
+      if (released) return;
+      released = true;
+      this.unsubscribe(topics);
+    };
+  }
+
+  /**
+   * Release one hold on each of these topics
+   */
+  unsubscribe(topics: string[]): void {
+    const removed: string[] = [];
+    topics.forEach((topic) => {
+      const count = this.topicRefs.get(topic);
+      if (count === undefined) return;
+      if (count > 1) {
+        this.topicRefs.set(topic, count - 1);
+      } else {
+        this.topicRefs.delete(topic);
+        removed.push(topic);
+      }
+    });
+    if (removed.length > 0) {
+      this.send({ type: MessageType.UNSUBSCRIBE, topics: removed });
+    }
+  }
+
   /**
    * Send a message to the server
    */
@@ -2,7 +2,7 @@ import { useState, useEffect, useRef, useCallback, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import { Compass, Bot, FileCode, Play } from 'lucide-react';
 import { useAppStore } from '@/stores/appStore';
-import { getWebSocketClient } from '@/api/websocket';
+import { getWebSocketClient, Topic } from '@/api/websocket';
 import { recordDirectoriesFromText } from '@/utils/recentDirectories';
 import type { ConsoleMessage } from '@/types/console';
 import { toUnifiedMessage } from '@/types/message';
@@ -192,13 +192,15 @@ export default function NewTaskPage() {
   useEffect(() => {
     const client = getWebSocketClient();
 
-    // Subscribe to all messages and filter agent-related ones
+    // Agent frames are published on the agent topic; filter them here
+    const release = client.subscribe([Topic.AGENT]);
     const unsubscribe = client.on('*', (message) => {
       handleWebSocketMessage(message as unknown as Record<string, unknown>);
     });
 
     return () => {
       unsubscribe();
+      release();
     };
   }, [handleWebSocketMessage]);
 
@@ -7,8 +7,10 @@
 
 import { act, renderHook, waitFor } from '@testing-library/react';
 import { afterEach, describe, expect, it, vi } from 'vitest';
+import { FragoWebSocketClient } from '../../api/websocket';
 import {
   PAGE_SIZE,
+  STREAM_TOPIC_HEADER,
   POLL_INTERVAL_MS,
   useWorkbenchRecords,
   type WorkbenchRecord,
@@ -51,6 +53,7 @@ function stubSession(total: () => number) {
 
 afterEach(() => {
   vi.unstubAllGlobals();
+  vi.restoreAllMocks();
 });
 
 describe('useWorkbenchRecords', () => {
@@ -168,4 +171,26 @@ describe('useWorkbenchRecords', () => {
     });
     await waitFor(() => expect(result.current.records).toHaveLength(PAGE_SIZE));
   });
+
+  it('订阅服务端报来的推送主题，卸载时退订', async () => {
+    vi.stubGlobal(
+      'fetch',
+      vi.fn(async () => ({
+        ok: true,
+        headers: new Headers({ [STREAM_TOPIC_HEADER]: 'workbench:/proj' }),
+        json: async () => [record(0)],
+      }) as unknown as Response)
+    );
+    const release = vi.fn();
+    const subscribe = vi
+      .spyOn(FragoWebSocketClient.prototype, 'subscribe')
+      .mockReturnValue(release);
+
+    const { unmount } = renderHook(() => useWorkbenchRecords(SID));
+    await waitFor(() => expect(subscribe).toHaveBeenCalledWith(['workbench:/proj']));
+    expect(release).not.toHaveBeenCalled();
+
+    unmount();
+    expect(release).toHaveBeenCalledTimes(1);
+  });
 });
@@ -9,6 +9,7 @@ import {
   getWebSocketClient,
   connectWebSocket,
   MessageType,
+  topicFor,
   type WebSocketMessage,
   type MessageTypeValue,
 } from '@/api/websocket';
@@ -17,7 +18,7 @@ import { getApiMode } from '@/api';
 interface UseWebSocketOptions {
   /** Auto-connect on mount (default: true) */
   autoConnect?: boolean;
-  /** Message types to subscribe to */
+  /** Message types to subscribe to (their server topics are subscribed too) */
   messageTypes?: MessageTypeValue[];
   /** Callback when message received */
   onMessage?: (message: WebSocketMessage) => void;
@@ -102,6 +103,19 @@ export function useWebSocket(options: UseWebSocketOptions = {}): UseWebSocketRet
     };
   }, [autoConnect, messageTypes]);
 
+  // Hold the server topics those message types are published on. Keyed on the
+  // joined names so a caller passing a fresh array each render does not make
+  // the server drop and re-add the topic every time.
+  const topicsKey = [...new Set((messageTypes ?? []).map(topicFor).filter(Boolean))]
+    .sort()
+    .join(',');
+  useEffect(() => {
+    if (getApiMode() !== 'http' || !topicsKey) {
+      return;
+    }
+    return getWebSocketClient().subscribe(topicsKey.split(','));
+  }, [topicsKey]);
+
   const connect = useCallback(() => {
     if (getApiMode() === 'http') {
       connectWebSocket();
@@ -101,10 +101,19 @@ export interface WorkbenchRecordsState {
   reload: () => Promise<void>;
 }
 
-export async function fetchWorkbenchRecords(
+/** 记录接口在这个响应头里给出这场会话的增量推在哪个 WebSocket 主题上。 */
+export const STREAM_TOPIC_HEADER = 'X-Frago-Topic';
+
+/** 一批记录，连同服务端报来的推送主题（没开流时为 null）。 */
+export interface WorkbenchRecordsPage {
+  records: WorkbenchRecord[];
+  topic: string | null;
+}
+
+export async function fetchWorkbenchPage(
   sessionId: string,
   opts: { after?: number; limit?: number; tail?: boolean } = {}
-): Promise<WorkbenchRecord[]> {
+): Promise<WorkbenchRecordsPage> {
   const { after = 0, limit = PAGE_SIZE, tail = false } = opts;
   const query = tail
     ? `tail=true&limit=${limit}`
@@ -115,7 +124,15 @@ export async function fetchWorkbenchRecords(
   if (!res.ok) {
     throw new Error(`记录取不到（HTTP ${res.status}）`);
   }
-  return (await res.json()) as WorkbenchRecord[];
+  const records = (await res.json()) as WorkbenchRecord[];
+  return { records, topic: res.headers?.get(STREAM_TOPIC_HEADER) ?? null };
+}
+
+export async function fetchWorkbenchRecords(
+  sessionId: string,
+  opts: { after?: number; limit?: number; tail?: boolean } = {}
+): Promise<WorkbenchRecord[]> {
+  return (await fetchWorkbenchPage(sessionId, opts)).records;
 }
 
 /**
@@ -148,6 +165,8 @@ export function useWorkbenchRecords(
   const [loadingOlder, setLoadingOlder] = useState(false);
   const [hasOlder, setHasOlder] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  // 这场会话的增量推在哪个主题上，由尾部那次拉取从响应头里带回来。
+  const [streamTopic, setStreamTopic] = useState<string | null>(null);
 
   // 同一方向的两次加载不许叠在一起：滚动与轮询触发得都很密，不闸住会重复插入。
   const inflightNewer = useRef(false);
@@ -168,8 +187,12 @@ export function useWorkbenchRecords(
     setLoading(true);
     setError(null);
     try {
-      const batch = await fetchWorkbenchRecords(sid, { tail: true, limit: PAGE_SIZE });
+      const { records: batch, topic } = await fetchWorkbenchPage(sid, {
+        tail: true,
+        limit: PAGE_SIZE,
+      });
       if (activeSession.current !== sid) return;
+      setStreamTopic(topic);
       recordsRef.current = batch;
       setRecords(batch);
       setHasOlder(batch.length > 0 && batch[0].seq > 0);
@@ -222,6 +245,7 @@ export function useWorkbenchRecords(
     setRecords([]);
     setHasOlder(false);
     setError(null);
+    setStreamTopic(null);
     if (!sessionId) return;
     void loadTail(sessionId);
   }, [sessionId, loadTail]);
@@ -307,5 +331,12 @@ export function useWorkbenchRecords(
     };
   }, [sessionId]);
 
+  // 订阅这场会话的推送主题。服务端按订阅者计数撑着会话流：这一栏卸载或换会话时退订，
+  // 最后一个看的人走了，流过了宽限期就停。
+  useEffect(() => {
+    if (!sessionId || !streamTopic) return;
+    return getWebSocketClient().subscribe([streamTopic]);
+  }, [sessionId, streamTopic]);
+
   return { records, loading, loadingOlder, hasOlder, error, loadOlder, reload };
 }
@@ -24,6 +24,8 @@ from typing import Optional, List
 
 import requests
 
+from frago.downloader import DOWNLOAD_DIR, DownloadError, download, private_dir
+
 logger = logging.getLogger(__name__)
 
 # frago user data directory (for version tracking)
@@ -232,7 +234,11 @@ def find_asset_for_platform(release: dict) -> Optional[dict]:
 
 
 def _download_with_mirrors(url: str, dest_path: Path, mirrors: List[str]) -> bool:
-    """Download a file trying multiple mirror sources.
+    """Download a file from the fastest of several mirror sources.
+
+    All mirrors are raced; the download continues from the fastest over
+    parallel range requests, falling back to the others on errors. An
+    interrupted download resumes from ``<dest_path>.part`` on the next call.
 
     Args:
         url: Original GitHub download URL.
@@ -242,43 +248,31 @@ def _download_with_mirrors(url: str, dest_path: Path, mirrors: List[str]) -> boo
     Returns:
         True on success, False if all mirrors failed.
     """
-    for i, mirror in enumerate(mirrors):
-        # Construct the full URL
-        if mirror:
-            # Mirror: prefix the GitHub URL
-            full_url = mirror + url
-        else:
-            # Direct GitHub
-            full_url = url
-
-        mirror_name = mirror.split("/")[2] if mirror else "github.com"
-        logger.info(f"Trying {mirror_name}... ({i + 1}/{len(mirrors)})")
-
-        try:
-            response = requests.get(full_url, stream=True, timeout=60)
-            response.raise_for_status()
+    # Mirror: prefix the GitHub URL; "" is direct GitHub
+    sources = [mirror + url for mirror in mirrors]
 
-            total_size = int(response.headers.get("content-length", 0))
-            downloaded = 0
+    def show_progress(downloaded: int, total: int) -> None:
+        if total:
+            progress = (downloaded / total) * 100
+            print(f"\rDownloading... {progress:.1f}%", end="", flush=True)
 
-            with open(dest_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size:
-                        progress = (downloaded / total_size) * 100
-                        print(f"\rDownloading... {progress:.1f}%", end="", flush=True)
-
-            print()  # Newline after progress
-            logger.info(f"Download successful from {mirror_name}")
-            return True
-
-        except requests.RequestException as e:
-            logger.warning(f"Mirror {mirror_name} failed: {e}")
-            continue
+    try:
+        result = download(sources, dest_path, progress=show_progress)
+    except DownloadError as e:
+        print()
+        logger.error(f"All download sources failed: {e}")
+        return False
 
-    logger.error("All download sources failed")
-    return False
+    print()  # Newline after progress
+    mirror_name = next(
+        (m.split("/")[2] for m in mirrors if m and result.url == m + url), "github.com"
+    )
+    logger.info(
+        f"Download successful from {mirror_name} "
+        f"({result.size / 1e6:.1f} MB in {result.seconds:.1f}s, "
+        f"{result.throughput / 1e6:.1f} MB/s)"
+    )
+    return True
 
 
 def _create_linux_desktop_entry(app_path: Path) -> None:
@@ -369,10 +363,17 @@ def download_client(version: Optional[str] = None) -> bool:
         temp_path = Path(temp_dir)
         archive_path = temp_path / asset_name
 
-        # Download with mirror fallback
+        # Download with mirror fallback. The download lands outside the temp
+        # directory so an interrupted one resumes on the next run.
+        try:
+            downloaded_path = private_dir(DOWNLOAD_DIR) / asset_name
+        except (OSError, DownloadError) as e:
+            logger.error(f"Cannot prepare {DOWNLOAD_DIR}: {e}")
+            return False
         logger.info(f"Downloading {asset_name}...")
-        if not _download_with_mirrors(download_url, archive_path, DOWNLOAD_MIRRORS):
+        if not _download_with_mirrors(download_url, downloaded_path, DOWNLOAD_MIRRORS):
             return False
+        shutil.move(str(downloaded_path), str(archive_path))
 
         # Extract and install
         logger.info("Installing client...")
@@ -14,7 +14,6 @@ import platform
 import stat
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -188,11 +187,30 @@ def get_mirror_info(platform_arch: str = None) -> Optional[dict]:
     return None
 
 
+def _download(url: str, dest_path: Path, expected_sha256: str = None, progress_callback=None) -> bool:
+    """
+    下载到 dest_path（并行分段、断点续传，边下载边计算 SHA256）
+
+    Raises:
+        VerificationError: 校验和不匹配
+    """
+    from frago.downloader import ChecksumMismatch, DownloadError, download
+
+    try:
+        download([url], dest_path, expected_sha256=expected_sha256, progress=progress_callback)
+        return True
+    except ChecksumMismatch as e:
+        raise VerificationError(f'文件校验失败: {e}', 'checksum_mismatch') from e
+    except DownloadError:
+        return False
+
+
 def download_from_official(
     version: str,
     platform_arch: str,
     dest_path: Path,
-    progress_callback=None
+    progress_callback=None,
+    expected_sha256: str = None,
 ) -> bool:
     """
     从官方源下载二进制文件
@@ -202,30 +220,16 @@ def download_from_official(
         platform_arch: 平台架构
         dest_path: 目标路径
         progress_callback: 进度回调函数 (downloaded, total)
+        expected_sha256: 预期的 SHA256，下载时即校验
 
     Returns:
         bool: 下载成功返回 True
+
+    Raises:
+        VerificationError: 校验和不匹配
     """
     url = f'{GCS_BASE_URL}/{version}/{platform_arch}/claude'
-
-    try:
-        response = requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
-        response.raise_for_status()
-
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded_size = 0
-
-        with open(dest_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded_size += len(chunk)
-                if progress_callback:
-                    progress_callback(downloaded_size, total_size)
-
-        return True
-
-    except Exception:
-        return False
+    return _download(url, dest_path, expected_sha256, progress_callback)
 
 
 def download_from_mirror(
@@ -237,6 +241,8 @@ def download_from_mirror(
     """
     从镜像源下载二进制文件
 
+    镜像返回的 SHA256 在下载过程中即完成校验。
+
     Args:
         platform_arch: 平台架构
         dest_path: 目标路径
@@ -245,6 +251,9 @@ def download_from_mirror(
 
     Returns:
         Tuple[bool, dict]: (成功与否, 版本信息)
+
+    Raises:
+        VerificationError: 校验和不匹配
     """
     try:
         client = get_client()
@@ -264,30 +273,18 @@ def download_from_mirror(
             return False, None
 
         info = response.get('data', {})
+    except Exception:
+        return False, None
 
-        # 构建下载 URL
-        download_url = f"{get_api_base_url()}/claude-code/download/{platform_arch}"
-        if version:
-            download_url += f"?version={version}"
-
-        # 下载文件
-        resp = requests.get(download_url, stream=True, timeout=DOWNLOAD_TIMEOUT, allow_redirects=True)
-        resp.raise_for_status()
-
-        total_size = int(resp.headers.get('content-length', 0))
-        downloaded_size = 0
-
-        with open(dest_path, 'wb') as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded_size += len(chunk)
-                if progress_callback:
-                    progress_callback(downloaded_size, total_size)
-
-        return True, info
+    # 构建下载 URL
+    download_url = f"{get_api_base_url()}/claude-code/download/{platform_arch}"
+    if version:
+        download_url += f"?version={version}"
 
-    except Exception as e:
+    # 下载文件
+    if not _download(download_url, dest_path, info.get('sha256'), progress_callback):
         return False, None
+    return True, info
 
 
 def verify_checksum(file_path: Path, expected_sha256: str) -> bool:
@@ -508,12 +505,19 @@ class ClaudeCodeInstaller:
         if not target_version:
             raise DownloadError('无法确定版本', 'no_version')
 
-        # 创建临时文件
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.tmp') as tmp_file:
-            tmp_path = Path(tmp_file.name)
+        # 临时文件路径固定（按版本和平台），中断的下载下次可以续传。
+        # 放在只有本用户能进的 ~/.frago/downloads，而不是共享的 /tmp：
+        # 可预测的文件名在 /tmp 里能被别的用户抢先放一个链接或文件。
+        from frago import downloader
+
+        try:
+            downloads = downloader.private_dir(downloader.DOWNLOAD_DIR)
+        except (OSError, downloader.DownloadError) as e:
+            raise DownloadError(f'无法准备下载目录: {e}', 'download_dir') from e
+        tmp_path = downloads / f'claude-code-{target_version}-{self.platform_arch}.tmp'
 
         try:
-            # 下载
+            # 下载（校验和在下载过程中完成）
             success = False
 
             if use_mirror:
@@ -526,23 +530,27 @@ class ClaudeCodeInstaller:
                 )
                 if info and not sha256:
                     sha256 = info.get('sha256')
+                verified = bool(info and info.get('sha256'))
             else:
                 self._log(f'从官方源下载 Claude Code v{target_version}...')
                 success = download_from_official(
                     target_version,
                     self.platform_arch,
                     tmp_path,
-                    self._progress
+                    self._progress,
+                    expected_sha256=sha256,
                 )
+                verified = bool(sha256)
 
             if not success:
                 raise DownloadError('下载失败', 'download_failed')
 
             # 验证校验和
             if sha256:
-                self._log('验证文件完整性...')
-                if not verify_checksum(tmp_path, sha256):
-                    raise VerificationError('文件校验失败', 'checksum_mismatch')
+                if not verified:
+                    self._log('验证文件完整性...')
+                    if not verify_checksum(tmp_path, sha256):
+                        raise VerificationError('文件校验失败', 'checksum_mismatch')
                 self._log('校验通过')
             else:
                 self._log('警告: 无法验证文件校验和')
@@ -0,0 +1,586 @@
+"""Parallel, resumable HTTP downloads with streaming SHA-256.
+
+Used for the large binaries frago fetches (the desktop client, Claude Code):
+
+- Every source (mirror) is probed concurrently with a small ranged request;
+  the fastest one is used and the rest become fallbacks.
+- When the server honours ``Range``, the file is split into segments
+  fetched over parallel connections; a dropped connection resumes its
+  segment from the last byte written, on the next source if it keeps failing.
+- Progress is kept next to the destination (``<dest>.part`` plus a small
+  ``<dest>.part.json``), so an interrupted download resumes on the next call.
+  Callers keep destinations in `DOWNLOAD_DIR` (see `private_dir`): a
+  predictable name in a shared directory such as /tmp is one another user
+  can plant first. The progress files are opened without following links,
+  created 0600, and a partial that is not a private file of the current user
+  is discarded rather than resumed. Partials of other files that have sat
+  idle for a while (an old version never to be resumed) are pruned.
+- SHA-256 is computed while bytes land, in file order: bytes at the hash
+  frontier are hashed from memory; bytes a later segment fetched ahead of
+  it are read back (from the page cache) when the frontier reaches them.
+  The finished file is never re-read just to verify it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Read size for network and file I/O
+CHUNK_SIZE = 64 * 1024
+
+# Bytes each source serves during the race
+RACE_BYTES = 256 * 1024
+
+# After the first source answers, how long the slower ones may still finish
+RACE_GRACE_SECONDS = 2.0
+
+# Parallel segments for a ranged download, and the smallest worth splitting
+DEFAULT_SEGMENTS = 4
+MIN_SEGMENT_SIZE = 1024 * 1024
+
+# Consecutive failed attempts (without progress) before a segment gives up,
+# and the first pause between them (doubling, at most 2 s)
+MAX_ATTEMPTS = 5
+RETRY_BACKOFF = 0.1
+
+# Progress state is saved every this many fetched bytes
+STATE_SAVE_BYTES = 4 * 1024 * 1024
+
+# How often the caller's progress callback runs
+PROGRESS_INTERVAL = 0.2
+
+# (connect, read) timeouts in seconds
+TIMEOUT = (10, 60)
+
+# Where resumable downloads live: per user, and only that user may enter it
+DOWNLOAD_DIR = Path.home() / ".frago" / "downloads"
+
+# Progress files of other downloads untouched for this long are dropped when
+# a download starts next to them (an older version, a URL no longer used)
+STALE_PARTIAL_SECONDS = 600
+
+# What a download leaves next to its destination while unfinished
+_PARTIAL_SUFFIXES = (".part.json.tmp", ".part.json", ".part")
+
+# Not every platform has these flags (Windows has no O_NOFOLLOW, POSIX no O_BINARY)
+_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+_BINARY = getattr(os, "O_BINARY", 0)
+
+# Ownership and permission bits only mean something where there are user ids
+_UID = os.getuid() if hasattr(os, "getuid") else None
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class DownloadError(RuntimeError):
+    """A download could not be completed"""
+
+
+class ChecksumMismatch(DownloadError):
+    """The downloaded bytes do not hash to the expected SHA-256"""
+
+
+def _owned(st: os.stat_result) -> bool:
+    """Whether only the current user can read or write what ``st`` describes."""
+    if _UID is None:
+        return True
+    return st.st_uid == _UID and not stat.S_IMODE(st.st_mode) & 0o077
+
+
+def _is_private(path: Path) -> bool:
+    """A regular file, not a link, that belongs to the current user alone."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and _owned(st)
+
+
+def private_dir(path: Path) -> Path:
+    """``path`` as a directory only the current user can enter, created if missing.
+
+    Raises:
+        DownloadError: ``path`` is a link, not a directory, or someone else's
+    """
+    path = Path(path)
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or (_UID is not None and st.st_uid != _UID):
+        raise DownloadError(f"{path} is not a directory of this user")
+    if _UID is not None and stat.S_IMODE(st.st_mode) & 0o077:
+        os.chmod(path, 0o700)
+    return path
+
+
+def _open_part(part: Path, resume: bool):
+    """The part file, opened without following links; created 0600 when new."""
+    flags = os.O_RDWR | _NOFOLLOW | _BINARY
+    if not resume:
+        # Whatever is there is stale; O_EXCL fails if it cannot be removed.
+        with suppress(FileNotFoundError):
+            os.unlink(part)
+        flags |= os.O_CREAT | os.O_EXCL
+    try:
+        fd = os.open(part, flags, 0o600)
+    except OSError as e:
+        raise DownloadError(f"cannot open {part}: {e}") from e
+    if resume and not _owned(os.fstat(fd)):
+        os.close(fd)
+        raise DownloadError(f"{part} is not a private file of this user")
+    return os.fdopen(fd, "r+b")
+
+
+def _write_private(path: Path, text: str) -> None:
+    with suppress(FileNotFoundError):
+        os.unlink(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _NOFOLLOW | _BINARY, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(text.encode("utf-8"))
+
+
+def _read_private(path: Path) -> str:
+    fd = os.open(path, os.O_RDONLY | _NOFOLLOW | _BINARY)
+    with os.fdopen(fd, "rb") as f:
+        if not _owned(os.fstat(f.fileno())):
+            raise ValueError(f"{path} is not a private file of this user")
+        return f.read().decode("utf-8")
+
+
+def _prune_stale_partials(dest: Path) -> None:
+    """Remove progress files of other downloads in ``dest``'s directory left idle.
+
+    A download that is still running writes its part file continuously, so
+    only groups whose newest file is older than ``STALE_PARTIAL_SECONDS``
+    go.
+    """
+    groups: dict[str, list[tuple[str, float]]] = {}
+    try:
+        entries = list(os.scandir(dest.parent))
+    except OSError:
+        return
+    for entry in entries:
+        suffix = next((s for s in _PARTIAL_SUFFIXES if entry.name.endswith(s)), None)
+        if suffix is None:
+            continue
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            continue
+        groups.setdefault(entry.name[: -len(suffix)], []).append((entry.path, st.st_mtime))
+
+    cutoff = time.time() - STALE_PARTIAL_SECONDS
+    for name, files in groups.items():
+        if name == dest.name or max(mtime for _, mtime in files) > cutoff:
+            continue
+        for path, _ in files:
+            with suppress(OSError):
+                os.unlink(path)
+        logger.info(f"Removed the unfinished download of {name}")
+
+
+@dataclass
+class DownloadResult:
+    """A finished download and how it went"""
+
+    path: Path
+    url: str  # the source the download started from
+    size: int
+    sha256: str
+    seconds: float  # time to complete, race included
+    downloaded: int  # bytes fetched by this call
+    resumed: int  # bytes reused from an interrupted earlier call
+    segments: int
+    race: dict[str, float | None] = field(default_factory=dict)  # probe seconds; None = failed
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second fetched by this call"""
+        return self.downloaded / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class _Probe:
+    url: str
+    seconds: float
+    size: int | None  # None: unknown
+    ranges: bool  # the server honours Range
+    validator: str | None  # ETag or Last-Modified
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int  # exclusive; -1 while the length is unknown
+    done: int  # next offset to fetch
+
+    @property
+    def finished(self) -> bool:
+        return 0 <= self.end <= self.done
+
+
+def _probe(url: str) -> _Probe:
+    started = time.perf_counter()
+    with requests.get(
+        url, headers={"Range": f"bytes=0-{RACE_BYTES - 1}"}, stream=True, timeout=TIMEOUT
+    ) as resp:
+        resp.raise_for_status()
+        received = 0
+        for chunk in resp.iter_content(CHUNK_SIZE):
+            received += len(chunk)
+            if received >= RACE_BYTES:
+                break
+        seconds = time.perf_counter() - started
+        ranges = resp.status_code == 206
+        if ranges:
+            total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+        else:
+            total = resp.headers.get("Content-Length", "")
+        return _Probe(
+            url=url,
+            seconds=seconds,
+            size=int(total) if total.isdigit() else None,
+            ranges=ranges,
+            validator=resp.headers.get("ETag") or resp.headers.get("Last-Modified"),
+        )
+
+
+def _race(sources: list[str]) -> tuple[list[_Probe], dict[str, float | None]]:
+    """Probe every source concurrently; answering sources, fastest first."""
+    race: dict[str, float | None] = dict.fromkeys(sources)
+    probes: list[_Probe] = []
+    pool = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="frago-race")
+    pending = {pool.submit(_probe, url): url for url in sources}
+    deadline = None
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break  # the stragglers lost
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    probe = future.result()
+                except (requests.RequestException, OSError) as e:
+                    logger.warning(f"Source {url} failed: {e}")
+                    continue
+                race[url] = probe.seconds
+                probes.append(probe)
+                if deadline is None:
+                    deadline = time.monotonic() + RACE_GRACE_SECONDS
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    probes.sort(key=lambda p: p.seconds)
+    return probes, race
+
+
+class _Job:
+    """Shared state of one download: segments, the part file and the hash frontier."""
+
+    def __init__(
+        self,
+        part: Path,
+        state_file: Path,
+        probe: _Probe,
+        segments: list[_Segment],
+        expected_sha256: str | None,
+        resumable: bool,
+    ):
+        self.part = part
+        self.state_file = state_file
+        self.probe = probe
+        self.segments = segments
+        self.expected_sha256 = expected_sha256
+        self.resumable = resumable
+        self.lock = threading.Lock()
+        self.failed = threading.Event()
+        self.resumed = sum(s.done - s.start for s in segments)
+        self.fetched = 0
+        self._saved_at = 0
+        self._sha = hashlib.sha256()
+        self._hashed = 0
+        self._file = _open_part(part, resume=bool(self.resumed))
+        if not self.resumed and probe.size:
+            self._file.truncate(probe.size)
+        with self.lock:
+            self._advance()
+
+    @property
+    def size(self) -> int:
+        return self.probe.size or sum(s.done - s.start for s in self.segments)
+
+    def write(self, segment: _Segment, data: bytes) -> None:
+        with self.lock:
+            offset = segment.done
+            self._file.seek(offset)
+            self._file.write(data)
+            segment.done += len(data)
+            self.fetched += len(data)
+            if offset == self._hashed:
+                self._sha.update(data)
+                self._hashed += len(data)
+            self._advance()
+            if self.resumable and self.fetched - self._saved_at >= STATE_SAVE_BYTES:
+                self._save_state()
+
+    def restart(self, segment: _Segment) -> None:
+        """Drop what a non-ranged stream fetched; it can only start over."""
+        with self.lock:
+            self._file.truncate(0)
+            segment.done = segment.start
+            self._sha = hashlib.sha256()
+            self._hashed = 0
+
+    def _advance(self) -> None:
+        """Move the hash frontier over bytes already on disk ahead of it."""
+        while True:
+            segment = next(
+                (s for s in self.segments
+                 if s.start <= self._hashed and (s.end < 0 or self._hashed < s.end)),
+                None,
+            )
+            if segment is None or segment.done <= self._hashed:
+                return
+            self._file.seek(self._hashed)
+            remaining = segment.done - self._hashed
+            while remaining > 0:
+                data = self._file.read(min(CHUNK_SIZE, remaining))
+                if not data:
+                    raise DownloadError(f"{self.part} is shorter than its recorded progress")
+                self._sha.update(data)
+                remaining -= len(data)
+            self._hashed = segment.done
+
+    def _save_state(self) -> None:
+        self._file.flush()
+        state = {
+            "size": self.probe.size,
+            "validator": self.probe.validator,
+            "sha256": self.expected_sha256,
+            "segments": [[s.start, s.end, s.done] for s in self.segments],
+        }
+        tmp = self.state_file.with_name(self.state_file.name + ".tmp")
+        _write_private(tmp, json.dumps(state))
+        os.replace(tmp, self.state_file)
+        self._saved_at = self.fetched
+
+    def suspend(self) -> None:
+        """Keep the progress for the next call and close the part file."""
+        with self.lock:
+            if self.resumable:
+                try:
+                    self._save_state()
+                except OSError as e:
+                    logger.warning(f"Could not save download progress: {e}")
+            self._file.close()
+
+    def finish(self) -> str:
+        """Close the part file; the SHA-256 of the whole file."""
+        with self.lock:
+            self._advance()
+            self._file.close()
+            if self._hashed != self.size:
+                raise DownloadError(f"hashed {self._hashed} of {self.size} bytes")
+            return self._sha.hexdigest()
+
+
+def _load_state(
+    state_file: Path, part: Path, probe: _Probe, expected_sha256: str | None
+) -> list[_Segment] | None:
+    """Segments of an interrupted earlier call for the same file, if any."""
+    if not _is_private(part):
+        return None
+    try:
+        state = json.loads(_read_private(state_file))
+        segments = [_Segment(*map(int, s)) for s in state["segments"]]
+        part_size = os.lstat(part).st_size
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    # Mirrors may disagree on ETags; an expected digest identifies the file too.
+    same_file = state.get("size") == probe.size and (
+        (expected_sha256 is not None and state.get("sha256") == expected_sha256)
+        or (probe.validator is not None and state.get("validator") == probe.validator)
+    )
+    if not same_file or part_size != probe.size:
+        return None
+    position = 0
+    for segment in segments:
+        if segment.start != position or not segment.start <= segment.done <= segment.end:
+            return None
+        position = segment.end
+    return segments if position == probe.size else None
+
+
+def _plan(probe: _Probe, segments: int) -> list[_Segment]:
+    if not probe.ranges or not probe.size:
+        return [_Segment(0, probe.size if probe.size is not None else -1, 0)]
+    count = max(1, min(segments, probe.size // MIN_SEGMENT_SIZE))
+    bounds = [probe.size * i // count for i in range(count + 1)]
+    return [_Segment(bounds[i], bounds[i + 1], bounds[i]) for i in range(count)]
+
+
+def _fetch(job: _Job, segment: _Segment, sources: list[_Probe], session: requests.Session) -> None:
+    """Fetch one segment, resuming after drops and moving down the sources."""
+    ranged = job.probe.ranges
+    attempts = 0
+    turn = 0
+    while not segment.finished and not job.failed.is_set():
+        url = sources[turn % len(sources)].url
+        before = segment.done
+        try:
+            if not ranged and segment.done:
+                job.restart(segment)
+            headers = {"Range": f"bytes={segment.done}-{segment.end - 1}"} if ranged else {}
+            with session.get(url, headers=headers, stream=True, timeout=TIMEOUT) as resp:
+                resp.raise_for_status()
+                if ranged and resp.status_code != 206:
+                    raise DownloadError(f"{url} ignored the range request")
+                for chunk in resp.iter_content(CHUNK_SIZE):
+                    if job.failed.is_set():
+                        return
+                    if segment.end >= 0:
+                        chunk = chunk[:segment.end - segment.done]
+                    if chunk:
+                        job.write(segment, chunk)
+                    if segment.finished:
+                        break
+            if segment.end < 0:
+                segment.end = segment.done  # unknown length: the stream's end is the file's
+            elif not segment.finished:
+                raise DownloadError(f"{url} closed the connection early")
+        except (requests.RequestException, DownloadError, OSError) as e:
+            attempts = 1 if segment.done > before else attempts + 1
+            if attempts >= MAX_ATTEMPTS:
+                raise DownloadError(
+                    f"bytes {segment.start}-{segment.end}: giving up after {attempts} attempts: {e}"
+                ) from e
+            if attempts > 1:
+                turn += 1  # this source keeps failing: try the next one
+            logger.debug(f"Segment {segment.start}-{segment.end} retrying at {segment.done}: {e}")
+            time.sleep(min(RETRY_BACKOFF * 2 ** attempts, 2.0))
+
+
+def download(
+    sources: list[str],
+    dest: Path,
+    expected_sha256: str | None = None,
+    segments: int = DEFAULT_SEGMENTS,
+    progress: ProgressCallback | None = None,
+) -> DownloadResult:
+    """Download ``dest`` from the fastest of ``sources``.
+
+    Args:
+        sources: URLs serving the same file
+        dest: Destination path; ``<dest>.part`` / ``<dest>.part.json`` hold
+            the progress of an unfinished download. Idle progress files of
+            other downloads in the same directory are removed
+        expected_sha256: Verify the file against this digest
+        segments: Parallel connections for servers that honour ``Range``
+        progress: Called as ``progress(bytes_on_disk, total)`` from the
+            calling thread; ``total`` is 0 when unknown
+
+    Raises:
+        ChecksumMismatch: The file does not match ``expected_sha256`` (the
+            partial download is discarded)
+        DownloadError: No source answered, or a segment kept failing (the
+            progress is kept for the next call)
+    """
+    if not sources:
+        raise ValueError("no download sources")
+    dest = Path(dest)
+    part = dest.with_name(dest.name + ".part")
+    state_file = dest.with_name(dest.name + ".part.json")
+    expected_sha256 = expected_sha256.lower() if expected_sha256 else None
+    started = time.perf_counter()
+    _prune_stale_partials(dest)
+
+    probes, race = _race(sources)
+    if not probes:
+        raise DownloadError(f"no download source answered: {', '.join(sources)}")
+    best = probes[0]
+    fallbacks = [p for p in probes if p.size == best.size and p.ranges == best.ranges]
+    logger.info(f"Downloading from {best.url} (answered in {best.seconds:.2f}s)")
+
+    resumable = best.ranges and bool(best.size)
+    plan = _load_state(state_file, part, best, expected_sha256) if resumable else None
+    if plan is None:
+        # Not ours to resume (or nothing to resume): start over from scratch.
+        with suppress(OSError):
+            os.unlink(state_file)
+        plan = _plan(best, segments)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    job = _Job(part, state_file, best, plan, expected_sha256, resumable)
+    if job.resumed:
+        logger.info(f"Resuming with {job.resumed} of {best.size} bytes already fetched")
+
+    def report() -> None:
+        if progress:
+            progress(job.resumed + job.fetched, best.size or 0)
+
+    try:
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_maxsize=max(len(plan), 1))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            with ThreadPoolExecutor(max_workers=len(plan), thread_name_prefix="frago-download") as pool:
+                pending = {
+                    pool.submit(_fetch, job, segment, fallbacks, session)
+                    for segment in plan
+                    if not segment.finished
+                }
+                try:
+                    while pending:
+                        done, pending = wait(pending, timeout=PROGRESS_INTERVAL,
+                                             return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                        report()
+                except BaseException:
+                    job.failed.set()
+                    raise
+    except BaseException:
+        job.suspend()
+        raise
+
+    digest = job.finish()
+    if expected_sha256 and digest != expected_sha256:
+        part.unlink(missing_ok=True)
+        state_file.unlink(missing_ok=True)
+        raise ChecksumMismatch(f"SHA-256 of {dest.name} is {digest}, expected {expected_sha256}")
+    os.replace(part, dest)
+    state_file.unlink(missing_ok=True)
+
+    result = DownloadResult(
+        path=dest,
+        url=best.url,
+        size=job.size,
+        sha256=digest,
+        seconds=time.perf_counter() - started,
+        downloaded=job.fetched,
+        resumed=job.resumed,
+        segments=len(plan),
+        race=race,
+    )
+    logger.info(
+        f"Downloaded {dest.name}: {result.size} bytes in {result.seconds:.2f}s "
+        f"({result.throughput / 1e6:.1f} MB/s, {result.segments} segments)"
+    )
+    return result
@@ -45,6 +45,7 @@ import contextlib
 import json
 import os
 import re
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -71,6 +72,14 @@ DEFAULT_SLOT = "default"
 
 _SAFE_NAME = re.compile(r"^[A-Za-z0-9._-]+$")
 
+# Parsed slots, keyed by path and checked against the file's (inode, mtime,
+# size) on every read. The server reads a slot on every config and data
+# request; parsing the same JSON each time bought nothing. Keyed on the stamp
+# rather than invalidated by `publish()` alone, because the recipe that
+# publishes usually runs in another process — the stamp is what sees that.
+_slot_cache: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+_slot_cache_lock = threading.Lock()
+
 
 class InvalidSlotName(ValueError):
     """Raised when a recipe or slot name would escape the state directory."""
@@ -182,29 +191,62 @@ def publish(
 
     tmp = path.with_suffix(".tmp")
     fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    serialized = json.dumps(state, ensure_ascii=False)
     with os.fdopen(fd, "w", encoding="utf-8") as fh:
-        fh.write(json.dumps(state, ensure_ascii=False))
+        fh.write(serialized)
     tmp.replace(path)
     # Catches slots written by an older frago, which followed the umask.
     with contextlib.suppress(OSError):
         path.chmod(0o600)
+    # What a reader would parse back, not the caller's dict: tuples, int keys.
+    _remember(path, json.loads(serialized))
     return path
 
 
+def _stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _remember(path: Path, state: dict[str, Any]) -> None:
+    stamp = _stamp(path)
+    with _slot_cache_lock:
+        if stamp is None:
+            _slot_cache.pop(path, None)
+        else:
+            _slot_cache[path] = (stamp, state)
+
+
 def read(recipe_name: str, slot: str = DEFAULT_SLOT, *, identity: bool = False) -> dict[str, Any]:
     """Read a slot's state. A slot that was never published reads as empty.
 
     Empty is the right answer for an identity that has never used the page:
     the front end renders nothing rather than the server raising.
+
+    Served from memory while the file's stamp is unchanged. Each caller gets
+    its own top-level dict; nested values are shared, so treat them as read-only.
     """
     path = slot_path(recipe_name, slot, identity=identity)
-    if not path.is_file():
+    stamp = _stamp(path)
+    if stamp is None:
+        with _slot_cache_lock:
+            _slot_cache.pop(path, None)
         return {}
+    with _slot_cache_lock:
+        cached = _slot_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
     try:
         loaded = json.loads(path.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
-        return {}
-    return loaded if isinstance(loaded, dict) else {}
+        loaded = {}
+    state = loaded if isinstance(loaded, dict) else {}
+    with _slot_cache_lock:
+        _slot_cache[path] = (stamp, state)
+    return dict(state)
 
 
 def list_slots(recipe_name: str, *, identity: bool = False) -> list[str]:
@@ -0,0 +1,326 @@
+"""Validators and precompressed variants for the files a recipe page serves.
+
+`/app/<name>/` answers every request with `Cache-Control: no-cache`, so a
+browser asks again on every load. That is the right promise — an edited front
+end shows up on the next reload — but it is only cheap if "nothing changed"
+costs a 304 and not the file. Two things make it cheap:
+
+- A strong ETag per *version* of a file. The version is the file's stat stamp
+  (inode, mtime, size); the tag is a digest of the bytes, computed once per
+  stamp and remembered. A reload of an unchanged page is one `stat` per file
+  and a string compare.
+- Compressed variants, stored by content digest under
+  ``~/.frago/cache/app-assets/`` — never next to the recipe's own files, which
+  belong to the recipe. `frago recipe expose` builds them at full strength for
+  the whole `assets/` directory, so no visitor pays for Brotli 11. Anything
+  missing (an asset edited since, a data file the recipe just wrote) gets a
+  *fast* variant on first request — a few milliseconds rather than a second
+  for a large bundle — and keeps it until the next expose builds the real one.
+  Because variants are filed by digest, an edit simply addresses a different
+  file; the superseded ones are evicted when the server sees the edit and when
+  `expose` sweeps the store against the assets that are still live.
+
+Brotli is used when the ``brotli`` package is importable and skipped otherwise;
+gzip is always available.
+
+No server imports: the CLI builds variants at expose time without FastAPI.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # Optional: gzip alone is still served
+
+VARIANTS_DIR = Path.home() / ".frago" / "cache" / "app-assets"
+
+# Below this the headers outweigh the saving; above it the one-off compression
+# costs more than a local transfer is worth.
+MIN_COMPRESS_SIZE = 1024
+MAX_COMPRESS_SIZE = 32 * 1024 * 1024
+
+# Past this a file is not read end to end just to name it; its tag comes from
+# the stamp instead. Still strong in practice — any write moves the stamp.
+MAX_DIGEST_SIZE = 64 * 1024 * 1024
+
+_COMPRESSIBLE_SUFFIXES = frozenset({
+    ".html", ".htm", ".js", ".mjs", ".cjs", ".css", ".json", ".map", ".svg",
+    ".xml", ".txt", ".md", ".csv", ".tsv", ".wasm", ".ico", ".jsonl",
+})
+
+_SUFFIX = {"br": "br", "gzip": "gz"}
+
+# Levels per coding: the full-strength build done off the request path, and the
+# cheap one a request may do when nothing was built ahead of time.
+_BEST = {"br": 11, "gzip": 9}
+_FAST = {"br": 4, "gzip": 6}
+
+_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class AssetVersion:
+    """One version of one file: what it is called on the wire."""
+
+    path: Path
+    stamp: tuple[int, int, int]
+    etag: str
+    digest: str | None
+    compressible: bool
+
+    def etag_for(self, encoding: str | None) -> str:
+        """The tag of one representation. Each content-coding gets its own."""
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{_SUFFIX[encoding]}"'
+
+    def match(self, if_none_match: str | None) -> str | None:
+        """The tag in ``If-None-Match`` that names this version, if any.
+
+        Any representation counts: they are all the same version of the file.
+        """
+        if not if_none_match:
+            return None
+        known = {self.etag_for(None), *(self.etag_for(e) for e in _SUFFIX)}
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*":
+                return self.etag
+            tag = tag.removeprefix("W/")
+            if tag in known:
+                return tag
+        return None
+
+
+_versions: dict[Path, AssetVersion] = {}
+_incompressible: set[tuple[str, str]] = set()
+_lock = threading.Lock()
+
+
+def variants_dir() -> Path:
+    return VARIANTS_DIR
+
+
+def encodings() -> tuple[str, ...]:
+    """Content-codings this process can produce, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str | None) -> list[str]:
+    """Codings the client accepts, in our order of preference.
+
+    Our order rather than the client's q-values: every browser that sends
+    `br` prefers it, and the few that weigh codings differently lose nothing
+    but a few bytes. A coding with `q=0` is refused outright.
+    """
+    if not accept_encoding:
+        return []
+    accepted: dict[str, bool] = {}
+    for item in accept_encoding.split(","):
+        token, _, params = item.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[token] = q > 0
+    wildcard = accepted.get("*", False)
+    return [e for e in encodings() if accepted.get(e, wildcard)]
+
+
+def _stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def version(path: Path) -> AssetVersion | None:
+    """The current version of ``path``, or None when it is not a readable file.
+
+    Hashes only when the stamp moved since the last call.
+    """
+    stamp = _stamp(path)
+    if stamp is None:
+        with _lock:
+            _versions.pop(path, None)
+        return None
+    with _lock:
+        cached = _versions.get(path)
+    if cached is not None and cached.stamp == stamp:
+        return cached
+
+    size = stamp[2]
+    digest: str | None = None
+    if size <= MAX_DIGEST_SIZE:
+        try:
+            digest = _digest(path)
+        except OSError:
+            return None
+        etag = f'"{digest[:32]}"'
+    else:
+        etag = f'"{stamp[0]:x}-{stamp[1]:x}-{size:x}"'
+    compressible = (
+        digest is not None
+        and MIN_COMPRESS_SIZE <= size <= MAX_COMPRESS_SIZE
+        and path.suffix.lower() in _COMPRESSIBLE_SUFFIXES
+    )
+    current = AssetVersion(path, stamp, etag, digest, compressible)
+    with _lock:
+        _versions[path] = current
+        superseded = cached.digest if cached is not None else None
+        if superseded == digest or any(v.digest == superseded for v in _versions.values()):
+            superseded = None
+    if superseded is not None:
+        evict(superseded)
+    return current
+
+
+def _variant_paths(digest: str, encoding: str) -> tuple[Path, Path]:
+    """Where the full-strength and the fast variant of one digest live."""
+    suffix = _SUFFIX[encoding]
+    return variants_dir() / f"{digest}.{suffix}", variants_dir() / f"{digest}.fast.{suffix}"
+
+
+def evict(digest: str) -> None:
+    """Delete every stored variant of ``digest``."""
+    for encoding in _SUFFIX:
+        for path in _variant_paths(digest, encoding):
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+def _compress(data: bytes, encoding: str, fast: bool) -> bytes:
+    level = (_FAST if fast else _BEST)[encoding]
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    # mtime=0 keeps the bytes a pure function of the content.
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def variant(
+    asset: AssetVersion, encoding: str, *, build: bool = True, fast: bool = False
+) -> Path | None:
+    """The stored ``encoding`` variant of this version, building it if allowed.
+
+    With ``fast`` a cheap variant also counts, and is what gets built when
+    nothing is stored — the request path passes it, so a visitor never waits
+    on a full-strength compression. Without it only the full-strength variant
+    counts, and building it replaces any cheap one.
+
+    None when the file is not worth compressing, the coding is unavailable, or
+    compression would not have made it smaller.
+    """
+    if not asset.compressible or encoding not in encodings() or asset.digest is None:
+        return None
+    if (asset.digest, encoding) in _incompressible:
+        return None
+    best, cheap = _variant_paths(asset.digest, encoding)
+    if best.is_file():
+        return best
+    if fast and cheap.is_file():
+        return cheap
+    if not build:
+        return None
+    target = cheap if fast else best
+
+    try:
+        data = asset.path.read_bytes()
+    except OSError:
+        return None
+    # Written between the stat and this read: storing it under the old digest
+    # would serve the new bytes for the old tag. The next request re-versions.
+    if hashlib.sha256(data).hexdigest() != asset.digest:
+        return None
+    compressed = _compress(data, encoding, fast)
+    if len(compressed) >= len(data):
+        with _lock:
+            _incompressible.add((asset.digest, encoding))
+        return None
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(compressed)
+        os.replace(tmp, target)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+        return None
+    if not fast:
+        with contextlib.suppress(OSError):
+            cheap.unlink()
+    return target
+
+
+def _assets(directory: Path) -> list[AssetVersion]:
+    if not directory.is_dir():
+        return []
+    found = []
+    for path in sorted(directory.rglob("*")):
+        if path.is_file() and (asset := version(path)) is not None:
+            found.append(asset)
+    return found
+
+
+def precompress(directory: Path) -> int:
+    """Build every missing full-strength variant under ``directory``.
+
+    Returns how many were built.
+    """
+    built = 0
+    for asset in _assets(directory):
+        if not asset.compressible:
+            continue
+        for encoding in encodings():
+            if variant(asset, encoding, build=False) is not None:
+                continue
+            if variant(asset, encoding) is not None:
+                built += 1
+    return built
+
+
+def prune(live: list[Path]) -> int:
+    """Delete stored variants whose digest is no file under the ``live`` directories.
+
+    Returns how many files were removed. A page that is not among them merely
+    loses its cache: its next request builds a fast variant again.
+    """
+    keep = {asset.digest for directory in live for asset in _assets(directory) if asset.digest}
+    removed = 0
+    try:
+        entries = list(os.scandir(variants_dir()))
+    except OSError:
+        return removed
+    for entry in entries:
+        digest = entry.name.partition(".")[0]
+        if digest in keep or entry.name.endswith(".tmp"):
+            continue
+        with contextlib.suppress(OSError):
+            os.unlink(entry.path)
+            removed += 1
+    return removed
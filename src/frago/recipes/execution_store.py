@@ -1,18 +1,39 @@
 """Persistent storage for Execution records.
 
 Stores execution records as JSON files under ~/.frago/executions/.
-Uses a lightweight index.json for fast list queries.
+
+Queries are answered from an in-memory index built from two files:
+
+- ``index.json`` — a compacted snapshot, newest first (the format the index
+  has always had, so an older frago reading the directory still understands it)
+- ``index.log`` — one JSON line per state change since that snapshot
+
+A state change appends one line instead of rewriting the whole index, so a run
+costs three small appends rather than three full rewrites. Every process keeps
+its own in-memory copy and catches up by reading only the bytes appended since
+it last looked; when the log grows past a threshold it is folded back into the
+snapshot.
 """
 
+import contextlib
 import json
 import logging
+import os
 import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .execution import Execution, ExecutionStatus
 
+try:  # POSIX only; on Windows only the in-process half of the lock applies
+    import fcntl
+except ImportError:  # pragma: no cover - frago targets macOS and Linux
+    fcntl = None  # type: ignore[assignment]
+
 # Module level, not per instance: the server builds a fresh `RecipeRunner` — and
 # with it a fresh store — for every request, so a lock held on the instance would
 # be a lock each writer holds alone. What needs serialising is the file, and the
@@ -25,6 +46,132 @@ MAX_STORED_DATA_SIZE = 100 * 1024  # 100KB
 DEFAULT_INDEX_LIMIT = 200  # Max entries in index.json
 AUTO_CLEANUP_INTERVAL = 100  # Trigger cleanup every N creates
 AUTO_CLEANUP_MAX_COUNT = 1000  # Keep at most this many records
+COMPACT_AFTER_LINES = 500  # Fold index.log into index.json past this many lines
+
+
+class _ExecutionIndex:
+    """In-memory view of one store directory's index, shared by its stores.
+
+    Entries are kept oldest-to-newest by creation; an update replaces an entry
+    in place, so a run that finishes does not jump ahead of one started after
+    it. ``by_workflow`` answers ``list_by_workflow`` without a scan.
+    """
+
+    def __init__(self, index_file: Path, log_file: Path, limit: int):
+        self.index_file = index_file
+        self.log_file = log_file
+        self.limit = limit
+        self.entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.by_workflow: dict[str, set[str]] = {}
+        self.log_offset = 0
+        self.log_lines = 0
+        self.snapshot_sig: tuple[int, int, int] | None = None
+        self.loaded = False
+
+    # --- catching up with disk ---
+
+    def refresh(self) -> None:
+        """Bring the in-memory view up to date with what is on disk.
+
+        One stat of each file when nothing changed. A changed snapshot means
+        somebody compacted: start over from it. Otherwise apply only the log
+        lines written since the last look.
+        """
+        sig = self._stat_sig(self.index_file)
+        try:
+            log_size = self.log_file.stat().st_size
+        except OSError:
+            log_size = 0
+
+        if not self.loaded or sig != self.snapshot_sig or log_size < self.log_offset:
+            self._reload(sig)
+            return
+        if log_size > self.log_offset:
+            self._read_log()
+
+    def _reload(self, sig: tuple[int, int, int] | None) -> None:
+        self.entries.clear()
+        self.by_workflow.clear()
+        self.log_offset = 0
+        self.log_lines = 0
+        for entry in reversed(self._read_snapshot()):
+            self.apply(entry)
+        self.snapshot_sig = sig
+        self.loaded = True
+        self._read_log()
+
+    def _read_snapshot(self) -> list[dict[str, Any]]:
+        if not self.index_file.exists():
+            return []
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return []
+        return [e for e in data if isinstance(e, dict)] if isinstance(data, list) else []
+
+    def _read_log(self) -> None:
+        try:
+            with open(self.log_file, "rb") as f:
+                f.seek(self.log_offset)
+                chunk = f.read()
+        except OSError:
+            return
+        # Only whole lines. A writer mid-append leaves a tail without its
+        # newline; it is picked up on the next refresh once complete.
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return
+        for raw in chunk[: end + 1].splitlines():
+            if not raw.strip():
+                continue
+            try:
+                entry = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict):
+                self.apply(entry)
+                self.log_lines += 1
+        self.log_offset += end + 1
+
+    @staticmethod
+    def _stat_sig(path: Path) -> tuple[int, int, int] | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    # --- mutation ---
+
+    def apply(self, entry: dict[str, Any]) -> None:
+        exec_id = entry.get("id")
+        if not exec_id:
+            return
+        previous = self.entries.get(exec_id)
+        if previous is not None:
+            self._unlink_workflow(exec_id, previous)
+        self.entries[exec_id] = entry
+        workflow_id = entry.get("workflow_id")
+        if workflow_id:
+            self.by_workflow.setdefault(workflow_id, set()).add(exec_id)
+        while len(self.entries) > self.limit:
+            old_id, old_entry = self.entries.popitem(last=False)
+            self._unlink_workflow(old_id, old_entry)
+
+    def _unlink_workflow(self, exec_id: str, entry: dict[str, Any]) -> None:
+        workflow_id = entry.get("workflow_id")
+        if workflow_id and workflow_id in self.by_workflow:
+            self.by_workflow[workflow_id].discard(exec_id)
+            if not self.by_workflow[workflow_id]:
+                del self.by_workflow[workflow_id]
+
+    def newest_first(self) -> Iterator[dict[str, Any]]:
+        return reversed(self.entries.values())
+
+
+# One index per store directory per process, for the same reason _INDEX_LOCK is
+# module level: stores are created per request and must share what they learn.
+_INDEXES: dict[Path, _ExecutionIndex] = {}
 
 
 class ExecutionStore:
@@ -33,6 +180,8 @@ class ExecutionStore:
     def __init__(self, store_dir: Path | None = None):
         self.store_dir = store_dir or (Path.home() / ".frago" / "executions")
         self.index_file = self.store_dir / "index.json"
+        self.log_file = self.store_dir / "index.log"
+        self.lock_file = self.store_dir / "index.lock"
         self._create_count = 0
 
     def create(
@@ -110,15 +259,16 @@ class ExecutionStore:
 
     def get(self, execution_id: str) -> Execution | None:
         """Load a single Execution by ID."""
-        # Search in index first to find the month directory
-        index = self._load_index()
-        for entry in index:
-            if entry.get("id") == execution_id:
-                file_path = self._file_path_from_entry(entry)
-                if file_path and file_path.exists():
-                    return self._load_execution_file(file_path)
-
-        # Fallback: scan directories (for entries not yet in index)
+        # The index knows the month directory
+        with _INDEX_LOCK:
+            index = self._index()
+            entry = index.entries.get(execution_id)
+        if entry is not None:
+            file_path = self._file_path_from_entry(entry)
+            if file_path and file_path.exists():
+                return self._load_execution_file(file_path)
+
+        # Fallback: scan directories (for entries trimmed out of the index)
         for json_file in self.store_dir.rglob(f"{execution_id}.json"):
             return self._load_execution_file(json_file)
         return None
@@ -130,16 +280,16 @@ class ExecutionStore:
         status: ExecutionStatus | None = None,
     ) -> list[Execution]:
         """Query recent executions from the index."""
-        index = self._load_index()
         results = []
-        for entry in index:
-            if recipe_name and entry.get("recipe_name") != recipe_name:
-                continue
-            if status and entry.get("status") != status.value:
-                continue
-            results.append(entry)
-            if len(results) >= limit:
-                break
+        with _INDEX_LOCK:
+            for entry in self._index().newest_first():
+                if recipe_name and entry.get("recipe_name") != recipe_name:
+                    continue
+                if status and entry.get("status") != status.value:
+                    continue
+                results.append(entry)
+                if len(results) >= limit:
+                    break
         # Load full execution objects
         executions = []
         for entry in results:
@@ -159,11 +309,11 @@ class ExecutionStore:
         Returns:
             List of Execution objects sorted by step_index (nulls last).
         """
-        index = self._load_index()
+        with _INDEX_LOCK:
+            index = self._index()
+            entries = [index.entries[i] for i in index.by_workflow.get(workflow_id, ())]
         executions = []
-        for entry in index:
-            if entry.get("workflow_id") != workflow_id:
-                continue
+        for entry in entries:
             file_path = self._file_path_from_entry(entry)
             if file_path and file_path.exists():
                 ex = self._load_execution_file(file_path)
@@ -175,28 +325,29 @@ class ExecutionStore:
 
     def cleanup(self, _max_age_days: int = 30, max_count: int = 1000) -> int:
         """Remove old execution records. Returns count of removed entries."""
-        index = self._load_index()
-        if len(index) <= max_count:
-            return 0
-
-        removed = 0
-        new_index = []
-
-        for i, entry in enumerate(index):
-            if i < max_count:
-                new_index.append(entry)
-            else:
-                # Remove the file
-                file_path = self._file_path_from_entry(entry)
-                if file_path and file_path.exists():
-                    try:
-                        file_path.unlink()
-                        removed += 1
-                    except OSError:
-                        new_index.append(entry)
-
-        self._save_index(new_index)
-        return removed
+        with _INDEX_LOCK, self._file_lock():
+            index = self._load_index()
+            if len(index) <= max_count:
+                return 0
+
+            removed = 0
+            new_index = []
+
+            for i, entry in enumerate(index):
+                if i < max_count:
+                    new_index.append(entry)
+                else:
+                    # Remove the file
+                    file_path = self._file_path_from_entry(entry)
+                    if file_path and file_path.exists():
+                        try:
+                            file_path.unlink()
+                            removed += 1
+                        except OSError:
+                            new_index.append(entry)
+
+            self._compact_locked(new_index)
+            return removed
 
     def _maybe_cleanup(self) -> None:
         """Periodically trigger cleanup to prevent unbounded file growth."""
@@ -253,56 +404,75 @@ class ExecutionStore:
             logger.warning("Failed to load execution from %s: %s", file_path, e)
             return None
 
+    def _index(self) -> _ExecutionIndex:
+        """The shared in-memory index for this directory, caught up. Hold _INDEX_LOCK."""
+        index = _INDEXES.get(self.store_dir)
+        if index is None:
+            index = _ExecutionIndex(self.index_file, self.log_file, DEFAULT_INDEX_LIMIT)
+            _INDEXES[self.store_dir] = index
+        index.refresh()
+        return index
+
     def _load_index(self) -> list[dict]:
-        """Load the index file."""
-        if not self.index_file.exists():
-            return []
-        try:
-            content = self.index_file.read_text(encoding="utf-8")
-            data = json.loads(content)
-            if isinstance(data, list):
-                return data
-            return []
-        except (json.JSONDecodeError, OSError):
-            return []
+        """The current index as a list, newest first."""
+        with _INDEX_LOCK:
+            return list(self._index().newest_first())
 
-    def _save_index(self, index: list[dict]) -> None:
-        """Write the index file, atomically.
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive across processes, on a sidecar file.
+
+        A sidecar rather than the index itself, because compaction swaps
+        ``index.json`` with ``os.replace``: a waiter blocked on the old inode
+        would wake up holding a lock on a file that is no longer the index.
+        """
+        try:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(str(self.lock_file), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            yield
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            if fcntl is not None:
+                with contextlib.suppress(OSError):
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _compact_locked(self, entries: list[dict]) -> None:
+        """Write ``entries`` as the new snapshot and empty the log. Hold both locks.
 
         Written to a temporary file and moved into place. A direct write leaves
         the file truncated-then-refilled, and anything reading during that gap
-        gets an unparseable document — which ``_load_index`` reports as "no
-        history at all", after which the next write persists that emptiness.
+        gets an unparseable document — which reads as "no history at all".
+        The log is emptied only after the snapshot that absorbed it is in
+        place; a crash between the two replays lines the snapshot already has,
+        which is harmless because applying an entry twice is the same as once.
         """
         try:
             self.index_file.parent.mkdir(parents=True, exist_ok=True)
-            content = json.dumps(index, indent=2, ensure_ascii=False)
+            content = json.dumps(entries, indent=2, ensure_ascii=False)
             tmp = self.index_file.with_suffix(".tmp")
             tmp.write_text(content, encoding="utf-8")
             tmp.replace(self.index_file)
+            with open(self.log_file, "wb"):
+                pass
         except OSError as e:
-            logger.warning("Failed to save execution index: %s", e)
+            logger.warning("Failed to compact execution index: %s", e)
+        # Everybody, this process included, rebuilds from the new snapshot.
+        self._index().loaded = False
 
     def _update_index(self, execution: Execution) -> None:
-        """Update or insert an entry in the index (sorted by created_at desc).
-
-        Under a lock, because this is a read-modify-write of one shared file and
-        recipes run concurrently: two executions starting together would each
-        load the index, each add their own entry to the copy they loaded, and
-        the second to finish would write a document missing the first. Visitor
-        runs make that concurrency ordinary rather than rare.
-
-        The lock is per process. Two frago processes writing this index at once
-        can still lose an entry — the file is a convenience log rather than a
-        record anything depends on, and a cross-process lock here would buy less
-        than it costs.
-        """
-        with _INDEX_LOCK:
-            self._update_index_locked(execution)
-
-    def _update_index_locked(self, execution: Execution) -> None:
-        index = self._load_index()
+        """Record an execution's new index entry.
 
+        One appended line, written under a lock held across processes as well
+        as threads: concurrent runs — visitor runs make that ordinary — each add
+        their line without being able to lose anybody else's, which the old
+        read-modify-write of a single document could.
+        """
         entry = {
             "id": execution.id,
             "recipe_name": execution.recipe_name,
@@ -310,20 +480,24 @@ class ExecutionStore:
             "created_at": execution.created_at.isoformat(),
             "workflow_id": execution.workflow_id,
         }
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
 
-        # Update existing or prepend
-        updated = False
-        for i, existing in enumerate(index):
-            if existing.get("id") == execution.id:
-                index[i] = entry
-                updated = True
-                break
-
-        if not updated:
-            index.insert(0, entry)
-
-        # Trim index
-        if len(index) > DEFAULT_INDEX_LIMIT:
-            index = index[:DEFAULT_INDEX_LIMIT]
-
-        self._save_index(index)
+        with _INDEX_LOCK, self._file_lock():
+            index = self._index()
+            try:
+                with open(self.log_file, "ab") as f:
+                    # Past the last whole line sits only what an interrupted
+                    # append left behind (writers hold this lock). Cut it off;
+                    # glued to it, this line would be lost on replay as well.
+                    if f.tell() > index.log_offset:
+                        f.truncate(index.log_offset)
+                    f.write(line)
+            except OSError as e:
+                logger.warning("Failed to append to execution index: %s", e)
+                return
+            index.apply(entry)
+            index.log_offset += len(line)
+            index.log_lines += 1
+
+            if index.log_lines >= COMPACT_AFTER_LINES:
+                self._compact_locked(list(index.newest_first()))
@@ -0,0 +1,232 @@
+"""Pooled, conditional GitHub API requests with an on-disk response cache.
+
+The community listing is polled every minute and every install used to walk
+the contents API a file at a time, each through a bare ``requests.get`` — a
+fresh TCP and TLS handshake per call, and a full body (and a full re-parse)
+even when nothing upstream had moved. Three things change that:
+
+- One ``requests.Session`` for the process, so calls to api.github.com reuse
+  pooled keep-alive connections.
+- Conditional requests. A cached answer is sent back as ``If-None-Match``; a
+  ``304`` carries no body and hands back the value parsed last time, so an
+  unchanged listing costs one round trip and no parsing. Authenticated 304s
+  do not count against GitHub's hourly quota either.
+- The cache lives under ``~/.frago/cache/github-http/``, one file per URL, so
+  the first poll after a restart is already conditional.
+
+``stats()`` counts requests, 304s and latency, for logs and for tests that
+run against a local mock of the API.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / ".frago" / "cache" / "github-http"
+
+# Connections kept open per host. The refresh loop, an install and a CLI
+# search can overlap; beyond that requests simply wait for a free one.
+POOL_SIZE = 8
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """What a URL last answered, already parsed."""
+
+    url: str
+    etag: str
+    value: Any
+    tag: str | None = None
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.not_modified = 0
+            self.errors = 0
+            self.by_status: dict[int, int] = {}
+            self.total_seconds = 0.0
+            self.max_seconds = 0.0
+
+    def record(self, status: int | None, seconds: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            if status is None:
+                self.errors += 1
+                return
+            self.by_status[status] = self.by_status.get(status, 0) + 1
+            if status == 304:
+                self.not_modified += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "not_modified": self.not_modified,
+                "errors": self.errors,
+                "by_status": dict(self.by_status),
+                "total_ms": round(self.total_seconds * 1000, 1),
+                "mean_ms": round(self.total_seconds * 1000 / self.requests, 1)
+                if self.requests
+                else 0.0,
+                "max_ms": round(self.max_seconds * 1000, 1),
+            }
+
+
+_stats = _Stats()
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_memory: dict[str, CachedResponse] = {}
+_memory_lock = threading.Lock()
+
+
+def stats() -> dict[str, Any]:
+    """Request counts and latency since start (or the last ``reset_stats``)."""
+    return _stats.snapshot()
+
+
+def reset_stats() -> None:
+    _stats.reset()
+
+
+def session() -> requests.Session:
+    """The process-wide pooled session."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=POOL_SIZE)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _session = s
+    return _session
+
+
+def reset_session() -> None:
+    """Drop the pooled session and the in-memory cache (for testing)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+    with _memory_lock:
+        _memory.clear()
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}.json"
+
+
+def lookup(url: str) -> CachedResponse | None:
+    """The cached answer for ``url``, from memory or disk."""
+    with _memory_lock:
+        cached = _memory.get(url)
+    if cached is not None:
+        return cached
+    try:
+        raw = json.loads(_cache_path(url).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("url") != url or not raw.get("etag"):
+        return None
+    cached = CachedResponse(url, raw["etag"], raw.get("value"), raw.get("tag"))
+    with _memory_lock:
+        _memory[url] = cached
+    return cached
+
+
+def _remember(cached: CachedResponse) -> None:
+    with _memory_lock:
+        _memory[cached.url] = cached
+    path = _cache_path(cached.url)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    record = {"url": cached.url, "etag": cached.etag, "value": cached.value, "tag": cached.tag}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError) as e:
+        # The memory copy still serves this process; only the next run loses it.
+        logger.debug("Failed to persist GitHub response cache for %s: %s", cached.url, e)
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+def get(
+    url: str,
+    *,
+    headers: Mapping[str, str],
+    timeout: float,
+    conditional: bool = False,
+    stream: bool = False,
+) -> requests.Response:
+    """GET ``url`` over the pooled session.
+
+    With ``conditional`` the cached ETag, if any, goes out as
+    ``If-None-Match``; read the answer with ``json_value``.
+    """
+    send = dict(headers)
+    if conditional:
+        cached = lookup(url)
+        if cached is not None:
+            send["If-None-Match"] = cached.etag
+    started = time.perf_counter()
+    try:
+        response = session().get(url, headers=send, timeout=timeout, stream=stream)
+    except requests.RequestException:
+        _stats.record(None, time.perf_counter() - started)
+        raise
+    _stats.record(response.status_code, time.perf_counter() - started)
+    return response
+
+
+def json_value(
+    url: str,
+    response: requests.Response,
+    parse: Callable[[Any], Any] | None = None,
+    *,
+    tag: str | None = None,
+) -> Any:
+    """The parsed body of a conditional ``get``.
+
+    On ``304`` this is the value stored last time — the body is neither sent
+    nor parsed again. On ``200`` the JSON is run through ``parse`` and, when
+    the response carries an ETag, stored with ``tag`` for ``lookup`` to find.
+    """
+    if response.status_code == 304:
+        cached = lookup(url)
+        if cached is None:
+            raise requests.RequestException(f"304 for {url} with nothing cached")
+        if tag is not None and cached.tag != tag:
+            _remember(CachedResponse(url, cached.etag, cached.value, tag))
+        return cached.value
+    value = response.json()
+    if parse is not None:
+        value = parse(value)
+    etag = response.headers.get("ETag")
+    if etag:
+        _remember(CachedResponse(url, etag, value, tag))
+    return value
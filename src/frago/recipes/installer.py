@@ -1,13 +1,15 @@
 """Recipe installation and management module"""
 import json
 import logging
+import os
 import shutil
+import tarfile
 import tempfile
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any, Optional
 
 import platform
@@ -15,14 +17,15 @@ import subprocess
 
 import requests
 
-logger = logging.getLogger(__name__)
-
 from frago.compat import get_windows_subprocess_kwargs
 
+from . import github_http
 from .exceptions import RecipeAlreadyExistsError, RecipeInstallError
 from .github_rate_limit import GitHubRateLimitManager
 from .metadata import parse_metadata_file, validate_metadata
 
+logger = logging.getLogger(__name__)
+
 
 class InstallSource(str, Enum):
     """Recipe installation source types"""
@@ -103,6 +106,43 @@ class InstallManifest:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+def _listing_entries(contents: list[dict]) -> list[dict[str, Any]]:
+    """The fields of a contents-API listing that a search reads."""
+    return [
+        {
+            "type": item.get("type"),
+            "name": item.get("name"),
+            "html_url": item.get("html_url"),
+            "sha": item.get("sha"),
+        }
+        for item in contents
+    ]
+
+
+def _recipe_summary(payload: dict) -> dict[str, Any]:
+    """Search fields from a contents-API ``recipe.md`` response ({} if unparsable)."""
+    import base64
+
+    import yaml
+
+    content = base64.b64decode(payload["content"]).decode('utf-8')
+
+    # Parse YAML frontmatter
+    if not content.startswith('---'):
+        return {}
+    parts = content.split('---', 2)
+    if len(parts) < 3:
+        return {}
+    metadata = yaml.safe_load(parts[1]) or {}
+    return {
+        "description": metadata.get("description", ""),
+        "version": metadata.get("version", ""),
+        "type": metadata.get("type", ""),
+        "runtime": metadata.get("runtime", ""),
+        "tags": metadata.get("tags", []),
+    }
+
+
 class RecipeInstaller:
     """Handles recipe installation from various sources"""
 
@@ -118,6 +158,9 @@ class RecipeInstaller:
     def __init__(self):
         self.community_dir = Path.home() / ".frago" / "community-recipes"
         self.manifest_path = self.community_dir / ".installed" / "manifest.json"
+        # One repository tarball per upstream commit, shared by every install
+        # and update made against that commit.
+        self.archive_dir = Path.home() / ".frago" / "cache" / "community-archives"
         self._manifest: Optional[InstallManifest] = None
 
         # Load community repo from config
@@ -222,6 +265,9 @@ class RecipeInstaller:
         url: str,
         max_retries: int = 3,
         base_delay: float = 1.0,
+        *,
+        conditional: bool = False,
+        stream: bool = False,
     ) -> requests.Response:
         """Make request with exponential backoff retry.
 
@@ -229,6 +275,9 @@ class RecipeInstaller:
             url: URL to request
             max_retries: Maximum retry attempts
             base_delay: Base delay in seconds for backoff
+            conditional: Send the cached ETag; a 304 is returned as is and
+                its value read with ``github_http.json_value``
+            stream: Leave the body unread (for archive downloads)
 
         Returns:
             Response object
@@ -248,17 +297,19 @@ class RecipeInstaller:
                         logger.debug(f"Rate limit delay: {delay:.1f}s before request")
                         time.sleep(min(delay, 60))  # Cap at 60s
 
-                response = requests.get(
+                response = github_http.get(
                     url,
                     headers=self._get_headers(),
-                    timeout=self.REQUEST_TIMEOUT
+                    timeout=self.REQUEST_TIMEOUT,
+                    conditional=conditional,
+                    stream=stream,
                 )
 
                 # Update rate limit state from response
                 if rate_manager:
                     rate_manager.update_from_headers(dict(response.headers))
 
-                if response.status_code == 200:
+                if response.status_code in (200, 304):
                     return response
                 elif response.status_code == 403:
                     if rate_manager:
@@ -356,42 +407,123 @@ class RecipeInstaller:
         force: bool,
         name_override: Optional[str],
     ) -> str:
-        """Install recipe from community repository"""
-        # Fetch recipe directory listing from GitHub
-        api_url = (
-            f"{self.GITHUB_API_BASE}/repos/{self.COMMUNITY_REPO}"
-            f"/contents/{self.COMMUNITY_PATH}/{name}"
-            f"?ref={self.COMMUNITY_BRANCH}"
-        )
+        """Install recipe from community repository.
 
-        try:
-            response = requests.get(
-                api_url,
-                headers=self._get_headers(),
-                timeout=self.REQUEST_TIMEOUT
-            )
-            if response.status_code == 404:
+        The recipe comes out of one tarball of the repository at the branch's
+        current commit, rather than a contents-API request per file and per
+        subdirectory. The tarball is kept per commit, so installing or updating
+        several recipes against the same commit downloads it once.
+        """
+        source_url = f"community:{name}"
+        if not name or name in (".", "..") or "/" in name or "\\" in name:
+            raise RecipeInstallError(name, source_url, f"Invalid recipe name '{name}'")
+
+        archive = self._fetch_community_archive(name)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir) / name
+            try:
+                found = self._extract_recipe(archive, name, temp_path)
+            except (OSError, tarfile.TarError) as e:
+                # A damaged archive must not be reused by the next attempt.
+                archive.unlink(missing_ok=True)
+                raise RecipeInstallError(name, source_url, f"Failed to unpack archive: {e}")
+            if not found:
                 raise RecipeInstallError(
                     name,
-                    f"community:{name}",
+                    source_url,
                     f"Recipe '{name}' not found in community repository"
                 )
-            response.raise_for_status()
-        except requests.RequestException as e:
-            raise RecipeInstallError(name, f"community:{name}", str(e))
-
-        # Download recipe files to temp directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir) / name
-            self._download_github_directory(response.json(), temp_path)
             return self._install_recipe_dir(
                 temp_path,
                 source_type=InstallSource.COMMUNITY,
-                source_url=f"community:{name}",
+                source_url=source_url,
                 force=force,
                 name_override=name_override,
             )
 
+    def _fetch_community_archive(self, name: str) -> Path:
+        """Tarball of the community repository at the branch head, cached by commit."""
+        source_url = f"community:{name}"
+        repo_api = f"{self.GITHUB_API_BASE}/repos/{self.COMMUNITY_REPO}"
+        branch_url = f"{repo_api}/branches/{self.COMMUNITY_BRANCH}"
+
+        try:
+            response = self._request_with_retry(branch_url, conditional=True)
+            if response.status_code == 404:
+                raise RecipeInstallError(
+                    name,
+                    source_url,
+                    f"Community repository {self.COMMUNITY_REPO} not found"
+                )
+            response.raise_for_status()
+            sha = github_http.json_value(
+                branch_url, response, lambda body: body["commit"]["sha"]
+            )
+        except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+            raise RecipeInstallError(name, source_url, str(e))
+
+        slug = self.COMMUNITY_REPO.replace("/", "-")
+        archive = self.archive_dir / f"{slug}-{sha}.tar.gz"
+        if archive.is_file():
+            return archive
+
+        tmp = archive.with_name(f"{archive.name}.{os.getpid()}.tmp")
+        try:
+            response = self._request_with_retry(f"{repo_api}/tarball/{sha}", stream=True)
+            response.raise_for_status()
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            with response, open(tmp, "wb") as fh:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    fh.write(chunk)
+            os.replace(tmp, archive)
+        except (requests.RequestException, OSError) as e:
+            tmp.unlink(missing_ok=True)
+            raise RecipeInstallError(name, source_url, f"Failed to download recipe: {e}")
+
+        # Older commits' archives will not be asked for again.
+        for stale in self.archive_dir.glob(f"{slug}-*.tar.gz"):
+            if stale != archive:
+                stale.unlink(missing_ok=True)
+        return archive
+
+    def _extract_recipe(self, archive: Path, name: str, target_dir: Path) -> bool:
+        """Extract only ``COMMUNITY_PATH/<name>`` from a repository tarball.
+
+        GitHub tarballs nest everything under one ``<owner>-<repo>-<sha>/``
+        directory. Only regular files and directories are written; links,
+        devices and any path that would climb out of ``target_dir`` are skipped.
+
+        Returns:
+            True if the recipe directory exists in the archive
+        """
+        prefix = (*PurePosixPath(self.COMMUNITY_PATH).parts, name)
+        found = False
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        with tarfile.open(archive, "r:gz") as tar:
+            for member in tar:
+                parts = PurePosixPath(member.name).parts
+                if parts[1:len(prefix) + 1] != prefix:
+                    continue
+                found = True
+                relative = parts[len(prefix) + 1:]
+                if not relative:
+                    continue
+                if any(part in ("", ".", "..") for part in relative):
+                    continue
+                dest = target_dir.joinpath(*relative)
+                if member.isdir():
+                    dest.mkdir(parents=True, exist_ok=True)
+                elif member.isfile():
+                    source = tar.extractfile(member)
+                    if source is None:
+                        continue
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    with source, open(dest, "wb") as fh:
+                        shutil.copyfileobj(source, fh)
+        return found
+
     def _install_from_local_path(
         self,
         path: str,
@@ -488,48 +620,6 @@ class RecipeInstaller:
 
         return recipe_name
 
-    def _download_github_directory(self, contents: list[dict], target_dir: Path) -> None:
-        """Download a directory from GitHub using contents API response"""
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        for item in contents:
-            if item["type"] == "file":
-                # Download file
-                try:
-                    file_response = requests.get(
-                        item["download_url"],
-                        headers=self._get_headers(),
-                        timeout=self.REQUEST_TIMEOUT
-                    )
-                    file_response.raise_for_status()
-                    file_path = target_dir / item["name"]
-                    file_path.write_bytes(file_response.content)
-                except requests.RequestException as e:
-                    raise RecipeInstallError(
-                        target_dir.name,
-                        "github",
-                        f"Failed to download {item['name']}: {e}"
-                    )
-            elif item["type"] == "dir":
-                # Recursively download subdirectory
-                try:
-                    dir_response = requests.get(
-                        item["url"],
-                        headers=self._get_headers(),
-                        timeout=self.REQUEST_TIMEOUT
-                    )
-                    dir_response.raise_for_status()
-                    self._download_github_directory(
-                        dir_response.json(),
-                        target_dir / item["name"]
-                    )
-                except requests.RequestException as e:
-                    raise RecipeInstallError(
-                        target_dir.name,
-                        "github",
-                        f"Failed to download directory {item['name']}: {e}"
-                    )
-
     def uninstall(self, name: str) -> bool:
         """
         Uninstall a recipe
@@ -642,16 +732,17 @@ class RecipeInstaller:
         )
 
         try:
-            response = self._request_with_retry(api_url)
+            response = self._request_with_retry(api_url, conditional=True)
             if response.status_code == 404:
                 return []  # Directory doesn't exist yet
             if response.status_code == 403:
                 raise RuntimeError("GitHub API rate limit exceeded")
             response.raise_for_status()
+            # Unchanged since the last poll: a 304, and the listing parsed then.
+            contents = github_http.json_value(api_url, response, _listing_entries)
         except requests.RequestException as e:
             raise RuntimeError(f"GitHub API request failed: {e}") from e
 
-        contents = response.json()
         results = []
 
         # Parse query keywords (support '|' separated multiple keywords)
@@ -682,28 +773,26 @@ class RecipeInstaller:
                 "url": item["html_url"],
             }
 
+            # The listing names each directory's tree hash. While it has not
+            # moved, recipe.md has not either, and needs no request at all.
+            tree_sha = item.get("sha")
+            cached = github_http.lookup(metadata_url)
+            if cached is not None and tree_sha and cached.tag == tree_sha:
+                recipe_info.update(cached.value)
+                results.append(recipe_info)
+                continue
+
             try:
                 # Use retry mechanism for metadata requests
-                meta_response = self._request_with_retry(metadata_url, max_retries=2)
-                if meta_response.status_code == 200:
-                    import base64
-                    content = base64.b64decode(
-                        meta_response.json()["content"]
-                    ).decode('utf-8')
-
-                    # Parse YAML frontmatter
-                    if content.startswith('---'):
-                        parts = content.split('---', 2)
-                        if len(parts) >= 3:
-                            import yaml
-                            metadata = yaml.safe_load(parts[1])
-                            recipe_info.update({
-                                "description": metadata.get("description", ""),
-                                "version": metadata.get("version", ""),
-                                "type": metadata.get("type", ""),
-                                "runtime": metadata.get("runtime", ""),
-                                "tags": metadata.get("tags", []),
-                            })
+                meta_response = self._request_with_retry(
+                    metadata_url, max_retries=2, conditional=True
+                )
+                if meta_response.status_code in (200, 304):
+                    recipe_info.update(
+                        github_http.json_value(
+                            metadata_url, meta_response, _recipe_summary, tag=tree_sha
+                        )
+                    )
             except Exception:
                 pass  # Continue without detailed metadata
 
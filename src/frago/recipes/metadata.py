@@ -44,6 +44,13 @@ class RecipeMetadata:
     # Optional so a hand-written recipe stays valid before the dates are stamped.
     created_at: str | None = None
     updated_at: str | None = None
+    # Opt-in result cache (see result_cache.py). A positive cache_ttl says a
+    # repeat call with the same params may be answered from the last result for
+    # that many seconds; cache_key narrows which params count as "the same".
+    # Absent means every run executes — the right default for anything with
+    # side effects, which is most recipes.
+    cache_ttl: int | None = None
+    cache_key: list[str] | None = None
 
 
 def _iso_or_none(value: Any) -> str | None:
@@ -121,6 +128,8 @@ def parse_metadata_file(path: Path) -> RecipeMetadata:
             ui_from=data.get('ui_from'),
             created_at=_iso_or_none(data.get('created_at')),
             updated_at=_iso_or_none(data.get('updated_at')),
+            cache_ttl=data.get('cache_ttl'),
+            cache_key=data.get('cache_key'),
         )
     except KeyError as e:
         raise MetadataParseError(str(path), f"Missing required field: {e}") from e
@@ -178,6 +187,21 @@ def validate_metadata(metadata: RecipeMetadata) -> None:
             f"restart_policy must be 'always', 'on-failure' or 'never', current value: '{metadata.restart_policy}'"
         )
 
+    # Validate result cache declaration
+    if metadata.cache_ttl is not None and (
+        isinstance(metadata.cache_ttl, bool)
+        or not isinstance(metadata.cache_ttl, int)
+        or metadata.cache_ttl < 0
+    ):
+        errors.append(f"cache_ttl must be a non-negative integer (seconds), current value: '{metadata.cache_ttl}'")
+    if metadata.cache_key is not None:
+        if not isinstance(metadata.cache_key, list) or not all(isinstance(k, str) for k in metadata.cache_key):
+            errors.append("cache_key must be a list of input parameter names")
+        else:
+            for key_field in metadata.cache_key:
+                if key_field not in metadata.inputs:
+                    errors.append(f"cache_key field '{key_field}' is not a declared input")
+
     # Validate inputs
     for param_name, param_def in metadata.inputs.items():
         if 'type' not in param_def or 'required' not in param_def:
@@ -1,16 +1,157 @@
 """Recipe registry"""
+import json
+import logging
+import os
 import threading
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from .exceptions import RecipeNotFoundError
 from .metadata import RecipeMetadata, parse_metadata_file, validate_metadata
 
+logger = logging.getLogger(__name__)
 
 # Source priority order (highest to lowest)
 SOURCE_PRIORITY = ['User', 'Community', 'Official']
 
+# Parsed metadata survives between CLI invocations here, so a cold
+# `frago recipe run` stats its recipes instead of YAML-parsing every one.
+METADATA_CACHE_FILE = Path.home() / '.frago' / 'cache' / 'recipe_metadata.json'
+# Bump when what an entry means changes; a change to RecipeMetadata's fields is
+# detected on its own (see _MetadataCache._schema).
+METADATA_CACHE_VERSION = 1
+
+_CacheSig = tuple[int, int, int]
+
+
+class _MetadataCache:
+    """Parsed recipe metadata keyed on the recipe.md path.
+
+    An entry is reused while its signature — recipe.md size and mtime_ns plus
+    the recipe directory's mtime_ns — is unchanged. The file covers edits to
+    the metadata itself; the directory covers a script file appearing or
+    disappearing next to it, which decides whether the recipe registers at all.
+
+    Failures are cached too (``metadata`` None): a broken recipe.md is not
+    worth re-parsing until somebody edits it.
+
+    Module level rather than per registry, because callers refresh by throwing
+    the registry away (``invalidate_registry``) and building a new one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._loaded_from: Path | None = None
+        self._dirty = False
+
+    @staticmethod
+    def _schema() -> list[str]:
+        return sorted(f.name for f in fields(RecipeMetadata))
+
+    @staticmethod
+    def signature(metadata_path: Path, base_dir: Path) -> _CacheSig | None:
+        try:
+            md = metadata_path.stat()
+            d = base_dir.stat()
+        except OSError:
+            return None
+        return (md.st_size, md.st_mtime_ns, d.st_mtime_ns)
+
+    def _ensure_loaded(self) -> None:
+        cache_file = METADATA_CACHE_FILE
+        if self._loaded_from == cache_file:
+            return
+        self._entries = {}
+        self._loaded_from = cache_file
+        self._dirty = False
+        try:
+            data = json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != METADATA_CACHE_VERSION
+            or data.get('schema') != self._schema()
+            or not isinstance(data.get('entries'), dict)
+        ):
+            return
+        self._entries = data['entries']
+
+    def get(self, metadata_path: Path, sig: _CacheSig) -> dict[str, Any] | None:
+        """The cached entry for this signature, or None on a miss."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(str(metadata_path))
+        if entry is None or tuple(entry.get('sig') or ()) != sig:
+            return None
+        return entry
+
+    def put(
+        self,
+        metadata_path: Path,
+        sig: _CacheSig,
+        metadata: RecipeMetadata | None,
+        script_name: str | None,
+    ) -> None:
+        meta_dict = asdict(metadata) if metadata is not None else None
+        if meta_dict is not None:
+            # Only what survives JSON unchanged is cached. A frontmatter value
+            # YAML turned into something else (a date in an input default, say)
+            # would come back as a string and quietly change the recipe.
+            try:
+                if json.loads(json.dumps(meta_dict)) != meta_dict:
+                    return
+            except (TypeError, ValueError):
+                return
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[str(metadata_path)] = {
+                'sig': list(sig),
+                'metadata': meta_dict,
+                'script': script_name,
+            }
+            self._dirty = True
+
+    def prune(self, roots: list[Path], seen: set[str]) -> None:
+        """Forget entries under ``roots`` that the last scan did not see."""
+        prefixes = tuple(str(r) + os.sep for r in roots)
+        with self._lock:
+            stale = [k for k in self._entries if k.startswith(prefixes) and k not in seen]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            cache_file = METADATA_CACHE_FILE
+            payload = {
+                'version': METADATA_CACHE_VERSION,
+                'schema': self._schema(),
+                'entries': self._entries,
+            }
+            self._dirty = False
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+            tmp.replace(cache_file)
+        except OSError as e:
+            logger.debug("Failed to save recipe metadata cache: %s", e)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._loaded_from = None
+            self._dirty = False
+
+
+_metadata_cache = _MetadataCache()
+
 # Module-level singleton for RecipeRegistry
 _registry_instance: Optional["RecipeRegistry"] = None
 _registry_lock = threading.Lock()
@@ -72,6 +213,8 @@ class RecipeRegistry:
         self.recipes: dict[str, dict[str, Recipe]] = {}
         # Track modification times for cache invalidation
         self._last_scan_mtimes: dict[Path, float] = {}
+        # recipe.md paths the current scan has visited, for pruning the cache
+        self._seen_metadata: set[str] = set()
         self._setup_search_paths()
 
     def _setup_search_paths(self) -> None:
@@ -137,9 +280,16 @@ class RecipeRegistry:
         return False
 
     def scan(self) -> None:
-        """Scan all search_paths, parse metadata and build index"""
+        """Scan all search_paths and build the index.
+
+        Incremental: a recipe whose recipe.md and directory are unchanged since
+        it was last parsed — by this process or an earlier one — is taken from
+        the metadata cache, so a scan costs a few stats per recipe and parses
+        only what was edited.
+        """
         self.recipes.clear()
         self._last_scan_mtimes.clear()
+        self._seen_metadata.clear()
 
         for search_path in self.search_paths:
             # Record mtime for top-level path, subdirectories, and recipe dirs
@@ -174,6 +324,9 @@ class RecipeRegistry:
         # Validate Workflow dependencies
         self._validate_dependencies()
 
+        _metadata_cache.prune(self.search_paths, self._seen_metadata)
+        _metadata_cache.save()
+
     def _get_source_label(self, path: Path) -> str:
         """Return source label based on path"""
         path_str = str(path)
@@ -201,46 +354,60 @@ class RecipeRegistry:
 
     def _register_recipe(self, metadata_path: Path, source: str, base_dir: Path) -> None:
         """Register a single Recipe (directory-based)"""
-        try:
-            # Parse metadata
-            metadata = parse_metadata_file(metadata_path)
-
-            # Validate metadata
-            validate_metadata(metadata)
+        self._seen_metadata.add(str(metadata_path))
+
+        sig = _metadata_cache.signature(metadata_path, base_dir)
+        cached = _metadata_cache.get(metadata_path, sig) if sig is not None else None
+        if cached is not None:
+            if cached['metadata'] is None or cached['script'] is None:
+                # Known broken or scriptless, and unchanged since. Like a fresh
+                # failure, its mtime stays unrecorded.
+                return
+            metadata = RecipeMetadata(**cached['metadata'])
+            script_path: Path | None = base_dir / cached['script']
+        else:
+            try:
+                metadata = parse_metadata_file(metadata_path)
+                validate_metadata(metadata)
+            except Exception:
+                # Parse or validation failed, skip this Recipe.
+                # recipe.md mtime is NOT recorded, so next needs_rescan() will retry.
+                if sig is not None:
+                    _metadata_cache.put(metadata_path, sig, None, None)
+                return
 
             # Find corresponding script file (search for recipe.py/js/sh in recipe directory)
             script_path = self._find_script_file(base_dir, metadata.runtime)
+            if sig is not None:
+                _metadata_cache.put(
+                    metadata_path, sig, metadata, script_path.name if script_path else None
+                )
             if not script_path:
                 # Script file does not exist, skip
                 return
 
-            # Create Recipe object
-            recipe = Recipe(
-                metadata=metadata,
-                script_path=script_path,
-                metadata_path=metadata_path,
-                source=source,
-                base_dir=base_dir
-            )
-
-            # Initialize dictionary for recipe name (if not exists)
-            if metadata.name not in self.recipes:
-                self.recipes[metadata.name] = {}
-
-            # Store by source (same-name recipes under the same source still override)
-            self.recipes[metadata.name][source] = recipe
-
-            # Record recipe.md mtime only after successful registration.
-            # If parse/validation failed, we intentionally skip this so that
-            # needs_rescan() detects the unrecorded file and triggers re-scan.
-            try:
-                self._last_scan_mtimes[metadata_path] = metadata_path.stat().st_mtime
-            except OSError:
-                pass
-
-        except Exception:
-            # Parse or validation failed, skip this Recipe.
-            # recipe.md mtime is NOT recorded, so next needs_rescan() will retry.
+        # Create Recipe object
+        recipe = Recipe(
+            metadata=metadata,
+            script_path=script_path,
+            metadata_path=metadata_path,
+            source=source,
+            base_dir=base_dir
+        )
+
+        # Initialize dictionary for recipe name (if not exists)
+        if metadata.name not in self.recipes:
+            self.recipes[metadata.name] = {}
+
+        # Store by source (same-name recipes under the same source still override)
+        self.recipes[metadata.name][source] = recipe
+
+        # Record recipe.md mtime only after successful registration.
+        # If parse/validation failed, we intentionally skip this so that
+        # needs_rescan() detects the unrecorded file and triggers re-scan.
+        try:
+            self._last_scan_mtimes[metadata_path] = metadata_path.stat().st_mtime
+        except OSError:
             pass
 
     def _find_script_file(self, recipe_dir: Path, runtime: str) -> Optional[Path]:
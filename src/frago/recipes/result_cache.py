@@ -0,0 +1,215 @@
+"""On-disk result cache for idempotent recipe invocations.
+
+An agent asks the same atomic recipe the same question many times in one
+session — fetch this page, look up that id — and every ask used to cost a
+subprocess. A recipe that knows its answer does not change from one minute to
+the next can say so in its frontmatter:
+
+    cache_ttl: 600            # seconds a result stays fresh
+    cache_key: [url]          # which params identify the question (default: all)
+
+and a repeat call is then answered from ~/.frago/cache/recipe-results/ without
+starting anything.
+
+The cache is opt-in on purpose. Most recipes have side effects — they post,
+they write, they click — and replaying the output of one of those is a lie
+about what happened. Only the recipe's author knows which kind theirs is.
+
+Entries are keyed on the recipe's script content as well as its params, so
+editing the script retires every result the old script produced without anyone
+having to remember to clear anything.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / ".frago" / "cache" / "recipe-results"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64MB across all entries
+MAX_ENTRY_BYTES = 1024 * 1024  # A single result larger than this is not kept
+
+# Script digests, keyed on (path, size, mtime_ns). Hashing the script is what
+# makes an edit invalidate its results, but re-reading it on every lookup would
+# put a file read back on the path this module exists to keep short.
+_script_digests: dict[tuple[str, int, int], str] = {}
+_digest_lock = threading.Lock()
+
+# Eviction walks the directory; one walk at a time is plenty.
+_evict_lock = threading.Lock()
+
+
+def cache_policy(metadata: Any) -> tuple[int, list[str] | None] | None:
+    """Return (ttl_seconds, key_fields) if the recipe opted in, else None.
+
+    Read defensively with getattr: the runner is handed recipe objects from
+    several places, some of which predate these fields.
+    """
+    ttl = getattr(metadata, "cache_ttl", None)
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+        return None
+    fields = getattr(metadata, "cache_key", None)
+    if not isinstance(fields, list) or not fields:
+        fields = None
+    return int(ttl), fields
+
+
+def _script_digest(script_path: Path) -> str:
+    st = script_path.stat()
+    memo_key = (str(script_path), st.st_size, st.st_mtime_ns)
+    with _digest_lock:
+        digest = _script_digests.get(memo_key)
+    if digest is None:
+        digest = hashlib.sha256(script_path.read_bytes()).hexdigest()
+        with _digest_lock:
+            _script_digests[memo_key] = digest
+    return digest
+
+
+def make_key(
+    recipe_name: str,
+    script_path: Path,
+    params: dict[str, Any],
+    key_fields: list[str] | None = None,
+) -> str:
+    """Cache key for one invocation.
+
+    With ``key_fields`` only those params identify the question — a recipe can
+    leave out a ``verbose`` flag that changes nothing about the answer. A field
+    absent from ``params`` still takes part (as absent), so ``{}`` and
+    ``{"url": None}`` do not collide with ``{"url": "x"}``.
+    """
+    keyed = params if key_fields is None else {f: params.get(f) for f in key_fields}
+    payload = json.dumps(
+        {
+            "recipe": recipe_name,
+            "script": _script_digest(script_path),
+            "params": keyed,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RecipeResultCache:
+    """Size-bounded LRU of recipe results, one JSON file per entry.
+
+    Recency is the file's mtime: a hit touches it, eviction removes the oldest
+    first. That keeps the bookkeeping in the filesystem, where every frago
+    process already sees it, rather than in an index file that concurrent runs
+    would have to take turns rewriting.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored result for ``key`` if present and still fresh."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            self._discard(path)
+            return None
+
+        if not isinstance(entry, dict) or entry.get("expires_at", 0) <= time.time():
+            self._discard(path)
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry.get("result")
+
+    def put(self, key: str, result: dict[str, Any], ttl: int) -> None:
+        """Store ``result`` for ``ttl`` seconds. Failure to store is not an error."""
+        entry = {
+            "stored_at": time.time(),
+            "expires_at": time.time() + ttl,
+            "result": result,
+        }
+        try:
+            content = json.dumps(entry, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+        if len(content) > MAX_ENTRY_BYTES:
+            return
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(content, encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            logger.debug("Failed to store recipe result: %s", e)
+            return
+        self._evict()
+
+    def clear(self) -> int:
+        """Remove every entry. Returns how many were removed."""
+        removed = 0
+        for path in self._entries():
+            if self._discard(path):
+                removed += 1
+        return removed
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _entries(self) -> list[Path]:
+        try:
+            return [p for p in self.cache_dir.iterdir() if p.suffix == ".json"]
+        except OSError:
+            return []
+
+    def _discard(self, path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the directory is under budget.
+
+        Expired entries are not sought out here — that would mean reading every
+        file — they are removed when a lookup finds them, and otherwise age out
+        of the LRU like anything else nobody asks for.
+        """
+        if not _evict_lock.acquire(blocking=False):
+            return
+        try:
+            live: list[tuple[float, int, Path]] = []
+            total = 0
+            for path in self._entries():
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                live.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            live.sort()
+            for _mtime, size, path in live:
+                if total <= self.max_bytes:
+                    break
+                if self._discard(path):
+                    total -= size
+            logger.debug("Recipe result cache evicted down to %d bytes", total)
+        finally:
+            _evict_lock.release()
@@ -12,13 +12,14 @@ from typing import Any
 
 from frago.compat import get_windows_subprocess_kwargs
 
-from . import context
+from . import context, result_cache
 from .env_loader import EnvLoader, WorkflowContext
 from .exceptions import RecipeExecutionError, RecipeValidationError
 from .execution import ExecutionStatus
 from .execution_store import ExecutionStore
 from .metadata import validate_params
 from .registry import RecipeRegistry, get_registry
+from .result_cache import RecipeResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,7 @@ class RecipeRunner:
         self.registry = registry
         self.env_loader = EnvLoader(project_root=project_root)
         self.store = ExecutionStore()
+        self.result_cache = RecipeResultCache()
 
     def run(
         self,
@@ -72,6 +74,7 @@ class RecipeRunner:
         timeout: int | None = None,
         step_index: int | None = None,
         ctx: context.InvocationContext | None = None,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """
         Execute the specified Recipe
@@ -86,6 +89,9 @@ class RecipeRunner:
             source: Specify recipe source ('project' | 'user' | 'example'), selects by priority when None
             ctx: Who this run is for. None is the owner, which is every run
                 started from this machine; the server passes a visitor context.
+            use_cache: Consult the result cache for recipes that declare
+                ``cache_ttl``. False always executes (``--no-cache``), and the
+                fresh result still refreshes the cache.
 
         Returns:
             Execution result dictionary in format:
@@ -112,6 +118,26 @@ class RecipeRunner:
         # Validate parameters
         self._validate_params(recipe.metadata, params)
 
+        # A recipe that declared its results reusable may not need to run at
+        # all. Checked before anything else is prepared, because on a hit
+        # nothing else is needed.
+        cache_key = self._result_cache_key(name, recipe, params, env_overrides, workflow_context, ctx)
+        if cache_key is not None and use_cache:
+            lookup_start = time.time()
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return {
+                    "success": True,
+                    "data": cached.get("data"),
+                    "stderr": "",
+                    "error": None,
+                    "execution_time": time.time() - lookup_start,
+                    "execution_id": None,
+                    "recipe_name": name,
+                    "runtime": recipe.metadata.runtime,
+                    "cached": True,
+                }
+
         # Resolve environment variables
         try:
             resolved_env = self.env_loader.resolve_for_recipe(
@@ -137,7 +163,7 @@ class RecipeRunner:
             step_index=step_index,
         )
 
-        return self._run_with_execution(
+        result = self._run_with_execution(
             execution_id=execution.id,
             name=name,
             recipe=recipe,
@@ -147,6 +173,46 @@ class RecipeRunner:
             ctx=ctx,
         )
 
+        if cache_key is not None and result.get("success"):
+            data = result.get("data")
+            # A result that asks for a page to be opened is an instruction, not
+            # an answer; replaying it would either open the page again or
+            # silently not, and neither is what the caller asked for.
+            if not (isinstance(data, dict) and data.get("open_url")):
+                policy = result_cache.cache_policy(recipe.metadata)
+                if policy is not None:
+                    self.result_cache.put(cache_key, {"data": data}, ttl=policy[0])
+
+        return result
+
+    def _result_cache_key(
+        self,
+        name: str,
+        recipe: Any,
+        params: dict[str, Any],
+        env_overrides: dict[str, str] | None,
+        workflow_context: WorkflowContext | None,
+        ctx: context.InvocationContext | None,
+    ) -> str | None:
+        """Cache key for this invocation, or None when it must not be cached.
+
+        Only the recipe's own declaration makes a run cacheable, and a few
+        circumstances unmake it: a visitor's run stands in a directory of its
+        own and may answer differently for them, and an ``--env`` override or a
+        workflow's shared variables are inputs the key would not see.
+        """
+        policy = result_cache.cache_policy(recipe.metadata)
+        if policy is None:
+            return None
+        if ctx is not None and ctx.is_visitor:
+            return None
+        if env_overrides or workflow_context is not None:
+            return None
+        try:
+            return result_cache.make_key(name, Path(recipe.script_path), params, policy[1])
+        except OSError:
+            return None
+
     def run_async(
         self,
         name: str,
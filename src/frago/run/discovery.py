@@ -1,7 +1,8 @@
 """Run Instance Auto-discovery
 
 Uses RapidFuzz fuzzy matching to find similar run instances.
-Provides keyword search across run IDs/themes and log step fields.
+Provides keyword search across run IDs/themes and log step fields, served
+from a persistent search index (see search_index.py).
 Extracts and aggregates _insights from run logs.
 """
 
@@ -11,6 +12,20 @@ from rapidfuzz import fuzz
 
 from .logger import RunLogger
 from .manager import RunManager
+from .models import RunInstance
+from .search_index import RunSearchIndex
+
+# Runs handed to rapidfuzz per query, at least (picked from the index postings)
+FUZZY_CANDIDATES = 50
+
+
+def _theme_similarity(query: str, text: str) -> float:
+    """Use multiple algorithms and take maximum to improve matching accuracy"""
+    return max(
+        fuzz.token_sort_ratio(query, text),  # Ignore word order
+        fuzz.partial_ratio(query, text),     # Partial matching
+        fuzz.token_set_ratio(query, text)    # Set matching
+    )
 
 
 class RunDiscovery:
@@ -23,6 +38,7 @@ class RunDiscovery:
             manager: RunManager instance
         """
         self.manager = manager
+        self.index = RunSearchIndex(manager.projects_dir)
 
     def discover_similar_runs(
         self, task_description: str, threshold: int = 60, max_results: int = 5
@@ -42,13 +58,7 @@ class RunDiscovery:
         # Calculate similarity
         results = []
         for run in all_runs:
-            # Use multiple algorithms and take maximum to improve matching accuracy
-            theme = run["theme_description"]
-            similarity = max(
-                fuzz.token_sort_ratio(task_description, theme),  # Ignore word order
-                fuzz.partial_ratio(task_description, theme),     # Partial matching
-                fuzz.token_set_ratio(task_description, theme)    # Set matching
-            )
+            similarity = _theme_similarity(task_description, run["theme_description"])
 
             if similarity >= threshold:
                 results.append(
@@ -76,7 +86,12 @@ class RunDiscovery:
         return {}
 
     def search_runs(self, keyword: str, max_results: int = 10) -> List[Dict]:
-        """Two-layer search: fuzzy match run ID/theme + grep log step fields
+        """Two-layer search: fuzzy match run ID/theme/purpose + grep log step fields
+
+        Both layers are answered from the run search index: the index postings
+        pick the few runs worth fuzzy-scoring, and the step layer only checks
+        runs whose indexed steps contain every trigram of the keyword. No log
+        is read unless it grew since the last query.
 
         Args:
             keyword: search keyword
@@ -88,49 +103,51 @@ class RunDiscovery:
         if not keyword.strip():
             return []
 
-        # Layer 1: fuzzy match on run ID/theme (low threshold for wide recall)
-        fuzzy_matches = self.discover_similar_runs(
-            keyword, threshold=40, max_results=max_results * 2
-        )
-        matched_ids = {m["run_id"] for m in fuzzy_matches}
-        results = [
-            {**m, "match_source": "id", "matched_steps": []}
-            for m in fuzzy_matches
+        self.index.refresh()
+        docs = self.index.docs
+
+        # Layer 1: fuzzy match on run ID/theme/purpose (low threshold for wide recall)
+        scored = []
+        limit = max(FUZZY_CANDIDATES, max_results * 5)
+        for run_id in self.index.fuzzy_candidates(keyword, limit):
+            doc = docs[run_id]
+            similarity = _theme_similarity(keyword, doc["theme"])
+            source = "id"
+            if doc.get("purpose"):
+                purpose_similarity = _theme_similarity(keyword, doc["purpose"])
+                if purpose_similarity > similarity:
+                    similarity, source = purpose_similarity, "purpose"
+            if similarity >= 40:
+                scored.append((similarity, doc["instance"]["last_accessed"], run_id, source))
+        scored.sort(reverse=True)
+        scored = scored[:max_results * 2]
+        matched_ids = {run_id for _, _, run_id, _ in scored}
+        hits = [
+            (similarity, last_accessed, run_id, source, [])
+            for similarity, last_accessed, run_id, source in scored
         ]
 
-        # Layer 2: grep logs for keyword in step field
-        keyword_lower = keyword.lower()
-        for run in self.manager.list_runs():
-            if run["run_id"] in matched_ids:
-                continue
-            try:
-                run_dir = self.manager.projects_dir / run["run_id"]
-                logger = RunLogger(run_dir)
-                matched_steps = []
-                for entry in logger.read_logs(skip_corrupted=True):
-                    if keyword_lower in entry.step.lower():
-                        matched_steps.append(entry.step)
-                if matched_steps:
-                    results.append({
-                        **run,
-                        "match_source": "log",
-                        "similarity": 50,
-                        "matched_steps": matched_steps,
-                    })
-            except Exception:
-                continue
-
-        results.sort(
-            key=lambda r: (r["similarity"], r.get("last_accessed", "")),
-            reverse=True,
-        )
-        results = results[:max_results]
+        # Layer 2: keyword in log step field
+        for run_id, steps in self.index.step_matches(keyword).items():
+            if run_id not in matched_ids:
+                hits.append((50, docs[run_id]["instance"]["last_accessed"], run_id, "log", steps))
 
-        # Attach purpose from metadata
-        for r in results:
-            meta = self._read_metadata(r["run_id"])
-            r["purpose"] = meta.get("purpose")
+        hits.sort(key=lambda h: (h[0], h[1]), reverse=True)
 
+        results = []
+        for similarity, _, run_id, source, steps in hits[:max_results]:
+            doc = docs[run_id]
+            instance = RunInstance.from_dict(dict(doc["instance"]))
+            summary = self.manager.run_summary(
+                self.manager.projects_dir / run_id, instance, doc["log_lines"]
+            )
+            results.append({
+                **summary,
+                "similarity": similarity,
+                "match_source": source,
+                "matched_steps": steps,
+                "purpose": doc.get("purpose"),
+            })
         return results
 
     def extract_insights(
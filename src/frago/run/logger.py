@@ -72,13 +72,20 @@ class RunLogger:
         )
 
         # Append to JSONL file
+        line = (json.dumps(entry.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
         try:
-            with self.log_file.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+            with self.log_file.open("ab") as f:
+                f.write(line)
                 f.flush()  # Ensure data is written to disk
+                end = f.tell()
         except Exception as e:
             raise FileSystemError("write", str(self.log_file), str(e)) from e
 
+        # Hand the step to the run search index so it need not re-read this log
+        from .search_index import record_log_append
+
+        record_log_append(self.run_dir, step, end - len(line), end)
+
         # 2026-07-26: insight 形态退役后，这里不再把附带的 insight 转写进
         # insight.jsonl。附带项仍留在本条 execution.jsonl 记录里（历史日志
         # 保持可读），但不再派生第二份领域知识。CLI 层的 --insight 已直接
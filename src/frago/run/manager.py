@@ -308,32 +308,33 @@ class RunManager:
             except Exception:
                 log_count = 0
 
-            screenshots_dir = run_dir / "screenshots"
-            screenshot_count = (
-                len(list(screenshots_dir.glob("*.png"))) if screenshots_dir.is_dir() else 0
-            )
-
-            runs.append(
-                {
-                    "run_id": instance.run_id,
-                    "status": instance.status.value,
-                    "created_at": instance.created_at.isoformat(),
-                    "last_accessed": instance.last_accessed.isoformat(),
-                    "theme_description": instance.theme_description,
-                    "domain": instance.domain,
-                    "is_cross_domain": instance.is_cross_domain,
-                    "component_domains": instance.component_domains,
-                    "session_count": instance.session_count,
-                    "insight_count": instance.insight_count,
-                    "log_count": log_count,
-                    "screenshot_count": screenshot_count,
-                    "is_legacy": is_legacy_run_dir(run_dir.name),
-                }
-            )
+            runs.append(self.run_summary(run_dir, instance, log_count))
 
         runs.sort(key=lambda r: str(r["last_accessed"]), reverse=True)
         return runs
 
+    def run_summary(self, run_dir: Path, instance: RunInstance, log_count: int) -> dict:
+        """Summary dict of one run, as returned by :meth:`list_runs`."""
+        screenshots_dir = run_dir / "screenshots"
+        screenshot_count = (
+            len(list(screenshots_dir.glob("*.png"))) if screenshots_dir.is_dir() else 0
+        )
+        return {
+            "run_id": instance.run_id,
+            "status": instance.status.value,
+            "created_at": instance.created_at.isoformat(),
+            "last_accessed": instance.last_accessed.isoformat(),
+            "theme_description": instance.theme_description,
+            "domain": instance.domain,
+            "is_cross_domain": instance.is_cross_domain,
+            "component_domains": instance.component_domains,
+            "session_count": instance.session_count,
+            "insight_count": instance.insight_count,
+            "log_count": log_count,
+            "screenshot_count": screenshot_count,
+            "is_legacy": is_legacy_run_dir(run_dir.name),
+        }
+
     # ------------------------------------------------------------------
     # Phase 2 — domain peek / counters / patch
     # ------------------------------------------------------------------
@@ -5,9 +5,21 @@ Relocated from cli/commands.py: DOM feature extraction, perception
 screenshot capture, and post-action perception orchestration.  The CLI
 layer only injects an output callback (printer) and the run screenshots
 directory; the perception logic lives here.
+
+Perception is incremental.  The first call on a document installs a change
+journal in the page (a MutationObserver plus scroll/resize/input listeners,
+kept on ``window.__fragoPerception``) and reports the full features as a
+*baseline*.  Later calls — from this process or the next CLI invocation, the
+journal lives in the page — report a *delta*: the element counts that moved,
+the nodes that changed and their text, and the visible text only when the
+viewport moved.  A page nothing happened to answers *unchanged* from a flag
+check, with no walk and no screenshot.  A navigation replaces the document and
+with it the journal, so the next call is a baseline again.
 """
 
+import json
 import time
+from collections import Counter
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -82,6 +94,265 @@ def get_dom_features(session: CDPSession) -> dict:
     return session.evaluate(script, return_by_value=True) or {}
 
 
+BASELINE = "baseline"
+DELTA = "delta"
+UNCHANGED = "unchanged"
+
+# Changes reported per call; the rest are counted in ``more_changes``.
+MAX_REPORTED_CHANGES = 40
+
+_PERCEIVE_SCRIPT = """
+(function(full) {
+    const MAX_RECORDS = 200;
+    const OWN = '[id^="__frago"], [class*="frago-"]';
+    const WATCHED_ATTRIBUTES = [
+        'class', 'hidden', 'disabled', 'checked', 'selected', 'open', 'src', 'href',
+        'aria-expanded', 'aria-hidden', 'aria-selected', 'aria-checked'
+    ];
+
+    function own(node) {
+        const el = node.nodeType === 1 ? node : node.parentElement;
+        return !!(el && el.closest && el.closest(OWN));
+    }
+    function describe(node) {
+        const el = node.nodeType === 1 ? node : node.parentElement;
+        if (!el) return '#text';
+        let d = el.tagName.toLowerCase();
+        if (el.id) d += '#' + el.id;
+        if (typeof el.className === 'string' && el.className.trim()) {
+            d += '.' + el.className.trim().split(/\\s+/).slice(0, 2).join('.');
+        }
+        return d;
+    }
+    function snippet(text) {
+        text = (text || '').replace(/\\s+/g, ' ').trim();
+        return text.length > 80 ? text.substring(0, 80) + '...' : text;
+    }
+    function note(s, kind, node, text, before) {
+        s.dirty = true;
+        if (s.records.length >= MAX_RECORDS) { s.overflow++; return; }
+        const r = {kind: kind, node: describe(node)};
+        if (text) r.text = text;
+        if (before !== undefined && before !== text) r.before = before;
+        s.records.push(r);
+    }
+    function handle(s, mutations) {
+        for (const m of mutations) {
+            if (own(m.target)) continue;
+            if (m.type === 'childList') {
+                m.addedNodes.forEach(function(n) {
+                    if (own(n)) return;
+                    const text = snippet(n.textContent);
+                    if (n.nodeType === 3 && !text) return;
+                    note(s, 'added', n.nodeType === 3 ? m.target : n, text);
+                });
+                m.removedNodes.forEach(function(n) {
+                    if (n.nodeType === 1 && n.matches && n.matches(OWN)) return;
+                    const text = snippet(n.textContent);
+                    if (n.nodeType === 3 && !text) return;
+                    note(s, 'removed', n.nodeType === 3 ? m.target : n, text);
+                });
+            } else if (m.type === 'characterData') {
+                const text = snippet(m.target.textContent);
+                const before = snippet(m.oldValue);
+                if (text !== before) note(s, 'text', m.target, text, before);
+            } else if (m.type === 'attributes') {
+                note(s, 'attr', m.target,
+                     m.attributeName + '=' + snippet(String(m.target.getAttribute(m.attributeName))));
+            }
+        }
+    }
+    function install() {
+        const s = {records: [], overflow: 0, viewport: false, dirty: false, url: location.href};
+        s.observer = new MutationObserver(function(mutations) { handle(s, mutations); });
+        s.observer.observe(document.documentElement, {
+            childList: true, subtree: true,
+            characterData: true, characterDataOldValue: true,
+            attributes: true, attributeFilter: WATCHED_ATTRIBUTES
+        });
+        s.moved = function() { s.viewport = true; s.dirty = true; };
+        s.typed = function(e) {
+            const t = e.target;
+            if (!t || own(t)) return;
+            const last = s.records[s.records.length - 1];
+            const value = t.type === 'password' ? '(hidden)' : snippet(String(t.value || ''));
+            if (last && last.kind === 'input' && last.element === t) { last.text = value; return; }
+            note(s, 'input', t, value);
+            if (s.records.length) {
+                Object.defineProperty(s.records[s.records.length - 1], 'element',
+                                      {value: t, enumerable: false});
+            }
+        };
+        window.addEventListener('scroll', s.moved, {passive: true, capture: true});
+        window.addEventListener('resize', s.moved, {passive: true});
+        document.addEventListener('input', s.typed, true);
+        document.addEventListener('change', s.typed, true);
+        s.teardown = function() {
+            s.observer.disconnect();
+            window.removeEventListener('scroll', s.moved, {capture: true});
+            window.removeEventListener('resize', s.moved);
+            document.removeEventListener('input', s.typed, true);
+            document.removeEventListener('change', s.typed, true);
+        };
+        window.__fragoPerception = s;
+        return s;
+    }
+    function counts() {
+        const body = document.body || document.documentElement;
+        return {
+            title: document.title || '',
+            url: window.location.href,
+            body_class: body.className || '',
+            body_id: body.id || '',
+            forms: document.forms.length,
+            buttons: document.querySelectorAll('button, input[type="button"], input[type="submit"]').length,
+            links: document.querySelectorAll('a[href]').length,
+            inputs: document.querySelectorAll('input, textarea, select').length,
+            images: document.images.length,
+            headings: document.querySelectorAll('h1, h2, h3').length,
+            scroll_y: Math.round(window.scrollY)
+        };
+    }
+    function visibleContent() {
+        const viewportHeight = window.innerHeight;
+        const viewportWidth = window.innerWidth;
+        const visibleTexts = [];
+        const walker = document.createTreeWalker(
+            document.body || document.documentElement,
+            NodeFilter.SHOW_TEXT,
+            {
+                acceptNode: function(node) {
+                    const parent = node.parentElement;
+                    if (!parent || own(parent)) return NodeFilter.FILTER_REJECT;
+                    const style = window.getComputedStyle(parent);
+                    if (style.display === 'none' || style.visibility === 'hidden') {
+                        return NodeFilter.FILTER_REJECT;
+                    }
+                    const rect = parent.getBoundingClientRect();
+                    if (rect.bottom < 0 || rect.top > viewportHeight ||
+                        rect.right < 0 || rect.left > viewportWidth) {
+                        return NodeFilter.FILTER_REJECT;
+                    }
+                    if (node.textContent.trim().length < 2) return NodeFilter.FILTER_REJECT;
+                    return NodeFilter.FILTER_ACCEPT;
+                }
+            }
+        );
+        let charCount = 0;
+        while (walker.nextNode() && charCount < 300) {
+            const text = walker.currentNode.textContent.trim();
+            if (text) {
+                visibleTexts.push(text);
+                charCount += text.length;
+            }
+        }
+        const content = visibleTexts.join(' ').replace(/\\s+/g, ' ').trim();
+        return content.substring(0, 300) + (content.length > 300 ? '...' : '');
+    }
+
+    let s = window.__fragoPerception;
+    if (s && full) { s.teardown(); s = null; }
+    if (!s) {
+        s = install();
+        const features = counts();
+        s.counts = features;
+        return Object.assign({perception: 'baseline', visible_content: visibleContent()}, features);
+    }
+
+    handle(s, s.observer.takeRecords());
+    if (s.url !== location.href) { s.url = location.href; s.viewport = true; s.dirty = true; }
+    if (!s.dirty) {
+        return {perception: 'unchanged', title: document.title || '', url: location.href,
+                scroll_y: Math.round(window.scrollY)};
+    }
+
+    const features = counts();
+    const changed = {};
+    for (const key of ['forms', 'buttons', 'links', 'inputs', 'images', 'headings']) {
+        if (s.counts[key] !== features[key]) changed[key] = [s.counts[key], features[key]];
+    }
+    const out = Object.assign({perception: 'delta', changed: changed}, features);
+    if (s.viewport || s.overflow) out.visible_content = visibleContent();
+    out.changes = s.records;
+    out.overflow = s.overflow;
+    s.counts = features;
+    s.records = [];
+    s.overflow = 0;
+    s.viewport = false;
+    s.dirty = false;
+    return out;
+})(%s)
+"""
+
+
+def _coalesce(records: list[dict]) -> list[dict]:
+    """Drop changes that undo each other (a node re-rendered with the same text)."""
+    def key(record: dict) -> tuple:
+        return record.get("node"), record.get("text")
+
+    removed = Counter(key(r) for r in records if r.get("kind") == "removed")
+    added = Counter(key(r) for r in records if r.get("kind") == "added")
+    undone = removed & added
+    skip = {"added": Counter(undone), "removed": Counter(undone)}
+
+    result = []
+    for record in records:
+        pending = skip.get(record.get("kind"))
+        if pending and pending[key(record)] > 0:
+            pending[key(record)] -= 1
+            continue
+        result.append(record)
+    return result
+
+
+def perceive(
+    session: CDPSession,
+    full: bool = False,
+    screenshots_dir: Path | None = None,
+    description: str = "page",
+) -> dict:
+    """
+    Perceive the page incrementally
+
+    Args:
+        session: CDP session
+        full: Drop the page's journal and take a fresh baseline
+        screenshots_dir: Also take a screenshot — unless the page is unchanged
+        description: Screenshot description for filename generation
+
+    Returns:
+        Features dict with ``perception`` set to "baseline", "delta" or
+        "unchanged".  A delta carries ``changed`` (count → [before, after]),
+        ``changes`` (node-level changes with their text) and ``more_changes``;
+        ``visible_content`` only when the viewport moved.  ``screenshot`` holds
+        the file path when one was taken.
+    """
+    features = session.evaluate(_PERCEIVE_SCRIPT % json.dumps(bool(full)), return_by_value=True)
+    if not isinstance(features, dict) or "perception" not in features:
+        # Nothing usable came back (evaluate failed, or the document is being
+        # replaced): fall back to a plain extraction.
+        features = dict(get_dom_features(session), perception=BASELINE)
+
+    if features["perception"] == DELTA:
+        changes = _coalesce(features.pop("changes", None) or [])
+        overflow = int(features.pop("overflow", 0) or 0)
+        features["changes"] = changes[:MAX_REPORTED_CHANGES]
+        features["more_changes"] = max(0, len(changes) - MAX_REPORTED_CHANGES) + overflow
+        if not (changes or overflow or features.get("changed")
+                or "visible_content" in features):
+            # Everything that happened was undone: report it as such.
+            features = {
+                "perception": UNCHANGED,
+                "title": features.get("title", ""),
+                "url": features.get("url", ""),
+                "scroll_y": features.get("scroll_y", 0),
+            }
+
+    if screenshots_dir is not None and features["perception"] != UNCHANGED:
+        features["screenshot"] = take_perception_screenshot(session, screenshots_dir, description)
+    return features
+
+
 def take_perception_screenshot(
     session: CDPSession, screenshots_dir: Path, description: str = "page"
 ) -> Optional[str]:
@@ -124,7 +395,10 @@ def do_perception(
     printer: Optional[Callable[[dict], None]] = None,
 ) -> None:
     """
-    Post-action perception: get DOM features
+    Post-action perception: what the action changed on the page
+
+    The first perception of a document reports its full features; later ones
+    report only what changed since the previous one (see ``perceive``).
 
     Note: No longer auto-screenshots. Screenshots should be explicitly called via screenshot command.
     Reason: Reduce hints to model, avoid over-reliance on screenshots over structured data extraction.
@@ -139,7 +413,7 @@ def do_perception(
     if delay > 0:
         time.sleep(delay)
 
-    # Get and print DOM features
-    features = get_dom_features(session)
+    # Get and print DOM features (or what changed in them)
+    features = perceive(session)
     if printer is not None:
         printer(features)
@@ -0,0 +1,399 @@
+"""Run Search Index
+
+Persistent index behind ``RunDiscovery.search_runs``. Searching used to list
+every run twice, fuzzy-score every theme and parse every log of every run on
+each query, so its cost grew with the total log volume. The index keeps, per
+run, the metadata summary, the purpose and the ``step`` text of its log
+entries, plus postings over them:
+
+- terms: word tokens of run id / theme / purpose → run ids
+- grams: character trigrams of run id / theme / purpose → run ids, used to
+  pick the few runs worth handing to rapidfuzz
+- step grams: character trigrams of log steps → run ids; a run can only
+  contain a step matching a substring if it has all of its trigrams
+
+The index is stored as ``_search_index.json`` in the projects directory (the
+``_`` prefix keeps it out of ``RunManager.list_runs``) and kept current
+incrementally: metadata is re-read only when its file stamp changes, and logs
+are read from the last indexed byte offset. ``RunLogger.write_log`` also
+journals each appended step to ``_search_index.journal`` so that the next
+refresh does not have to read the log at all.
+"""
+
+import hashlib
+import json
+import os
+import re
+from contextlib import suppress
+from pathlib import Path
+
+from .models import LogEntry, RunInstance
+
+INDEX_FILENAME = "_search_index.json"
+JOURNAL_FILENAME = "_search_index.journal"
+INDEX_VERSION = 1
+
+# Metadata files, newest layout first (mirrors RunManager)
+_METADATA_FILENAMES = ("_domain.json", ".metadata.json")
+
+_LOG_RELPATH = Path("logs") / "execution.jsonl"
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Leading log bytes fingerprinted to tell an appended log from a replaced one
+_HEAD_BYTES = 256
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _grams(text: str) -> set[str]:
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def _stamp(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def record_log_append(run_dir: Path, step: str, start: int, end: int) -> None:
+    """Journal one appended log entry for the index, if an index exists.
+
+    Called by ``RunLogger.write_log``. Best effort: a lost journal line only
+    means the next refresh reads the log tail itself.
+    """
+    projects_dir = run_dir.parent
+    if not (projects_dir / INDEX_FILENAME).exists():
+        return
+    line = json.dumps(
+        {"run_id": run_dir.name, "step": step, "start": start, "end": end},
+        ensure_ascii=False,
+    )
+    with suppress(OSError), (projects_dir / JOURNAL_FILENAME).open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+class _Postings:
+    """key → set of run ids"""
+
+    def __init__(self, data: dict[str, list[str]] | None = None):
+        self.map: dict[str, set[str]] = {k: set(v) for k, v in (data or {}).items()}
+
+    def add(self, run_id: str, keys: set[str]) -> None:
+        for key in keys:
+            self.map.setdefault(key, set()).add(run_id)
+
+    def remove(self, run_id: str, keys: set[str]) -> None:
+        for key in keys:
+            ids = self.map.get(key)
+            if ids is not None:
+                ids.discard(run_id)
+                if not ids:
+                    del self.map[key]
+
+    def get(self, key: str) -> set[str]:
+        return self.map.get(key, set())
+
+    def to_json(self) -> dict[str, list[str]]:
+        return {k: sorted(v) for k, v in self.map.items()}
+
+
+class RunSearchIndex:
+    """Incrementally maintained search index over the runs of one projects dir"""
+
+    def __init__(self, projects_dir: Path):
+        """Initialize index
+
+        Args:
+            projects_dir: projects directory path
+        """
+        self.projects_dir = projects_dir
+        self.index_file = projects_dir / INDEX_FILENAME
+        self.journal_file = projects_dir / JOURNAL_FILENAME
+        self.docs: dict[str, dict] = {}
+        self._terms = _Postings()
+        self._grams = _Postings()
+        self._step_grams = _Postings()
+        self._loaded = False
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the projects directory."""
+        if not self._loaded:
+            self._load()
+        self._fold_journal()
+
+        seen = set()
+        if self.projects_dir.exists():
+            for run_dir in self.projects_dir.iterdir():
+                if run_dir.name.startswith("_") or not run_dir.is_dir():
+                    continue
+                if self._refresh_run(run_dir):
+                    seen.add(run_dir.name)
+        for run_id in set(self.docs) - seen:
+            self._drop(run_id)
+            self._dirty = True
+
+        if self._dirty:
+            self._save()
+
+    def _refresh_run(self, run_dir: Path) -> bool:
+        run_id = run_dir.name
+        meta_stamp = [_stamp(run_dir / name) for name in _METADATA_FILENAMES]
+        if meta_stamp == [None, None]:
+            if run_id in self.docs:
+                self._drop(run_id)
+                self._dirty = True
+            return False
+
+        doc = self.docs.get(run_id)
+        if doc is None or doc["meta_stamp"] != meta_stamp:
+            fields = self._read_metadata(run_dir)
+            if fields is None:
+                return doc is not None  # keep the last good metadata
+            if doc is not None:
+                self._unindex_fields(run_id, doc)
+            else:
+                doc = {"steps": [], "log_lines": 0, "log_offset": 0, "log_inode": None,
+                       "log_mtime": None, "log_head": None}
+                self.docs[run_id] = doc
+            doc.update(fields, meta_stamp=meta_stamp)
+            self._index_fields(run_id, doc)
+            self._dirty = True
+
+        self._read_log_tail(run_dir, doc)
+        return True
+
+    def _read_metadata(self, run_dir: Path) -> dict | None:
+        raw: dict = {}
+        for name in _METADATA_FILENAMES:
+            path = run_dir / name
+            if path.exists():
+                try:
+                    raw[name] = json.loads(path.read_text(encoding="utf-8"))
+                except Exception:
+                    raw[name] = None
+        primary = next((raw[n] for n in _METADATA_FILENAMES if n in raw), None)
+        if not isinstance(primary, dict):
+            return None
+        try:
+            instance = RunInstance.from_dict(dict(primary))
+        except Exception:
+            return None
+        legacy = raw.get(".metadata.json") or {}
+        purpose = legacy.get("purpose") if isinstance(legacy, dict) else None
+        return {
+            "instance": instance.to_dict(),
+            "theme": instance.theme_description or "",
+            "purpose": purpose if isinstance(purpose, str) else primary.get("purpose"),
+        }
+
+    def _read_log_tail(self, run_dir: Path, doc: dict) -> None:
+        log_file = run_dir / _LOG_RELPATH
+        try:
+            st = log_file.stat()
+        except OSError:
+            if doc["log_offset"]:
+                self._reset_log(run_dir.name, doc)
+            return
+        if (
+            st.st_size == doc["log_offset"]
+            and st.st_ino == doc["log_inode"]
+            and st.st_mtime_ns == doc["log_mtime"]
+        ):
+            return
+
+        with log_file.open("rb") as f:
+            head_len, head_digest = doc["log_head"] or (0, None)
+            if (
+                st.st_ino != doc["log_inode"]
+                or st.st_size < doc["log_offset"]
+                or _digest(f.read(head_len)) != head_digest
+            ):
+                # New or rewritten log: index it from the start.
+                self._reset_log(run_dir.name, doc)
+                doc["log_inode"] = st.st_ino
+            f.seek(doc["log_offset"])
+            tail = f.read(st.st_size - doc["log_offset"])
+            # Stop at the last complete line; a line being written is picked up next time.
+            complete = tail.rfind(b"\n") + 1
+            new_offset = doc["log_offset"] + complete
+            if (doc["log_head"] or (0,))[0] < min(_HEAD_BYTES, new_offset):
+                f.seek(0)
+                head = f.read(min(_HEAD_BYTES, new_offset))
+                doc["log_head"] = [len(head), _digest(head)]
+
+        steps = []
+        for raw in tail[:complete].splitlines():
+            line = raw.strip()
+            if not line:
+                continue
+            doc["log_lines"] += 1
+            try:
+                steps.append(LogEntry.from_dict(json.loads(line)).step)
+            except Exception:
+                continue  # corrupted lines are skipped, as RunLogger.read_logs does
+        doc["log_offset"] = new_offset
+        doc["log_mtime"] = st.st_mtime_ns
+        self._add_steps(run_dir.name, doc, steps)
+        self._dirty = True
+
+    def _fold_journal(self) -> None:
+        """Apply journaled appends that continue exactly where a run's log index stops."""
+        try:
+            with self.journal_file.open("r+", encoding="utf-8") as f:
+                lines = f.readlines()
+                f.truncate(0)
+        except OSError:
+            return
+        for line in lines:
+            try:
+                item = json.loads(line)
+                doc = self.docs.get(item["run_id"])
+                if doc is None or doc["log_offset"] != item["start"]:
+                    continue
+                doc["log_offset"] = item["end"]
+                doc["log_lines"] += 1
+                self._add_steps(item["run_id"], doc, [item["step"]])
+                self._dirty = True
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    # ------------------------------------------------------------------
+    # Postings
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _field_text(run_id: str, doc: dict) -> str:
+        return " ".join(t for t in (run_id, doc.get("theme"), doc.get("purpose")) if t)
+
+    def _index_fields(self, run_id: str, doc: dict) -> None:
+        text = self._field_text(run_id, doc)
+        self._terms.add(run_id, _tokens(text))
+        self._grams.add(run_id, _grams(text))
+
+    def _unindex_fields(self, run_id: str, doc: dict) -> None:
+        text = self._field_text(run_id, doc)
+        self._terms.remove(run_id, _tokens(text))
+        self._grams.remove(run_id, _grams(text))
+
+    def _add_steps(self, run_id: str, doc: dict, steps: list[str]) -> None:
+        doc["steps"].extend(steps)
+        keys: set[str] = set()
+        for step in steps:
+            keys |= _grams(step)
+        self._step_grams.add(run_id, keys)
+
+    def _reset_log(self, run_id: str, doc: dict) -> None:
+        keys: set[str] = set()
+        for step in doc["steps"]:
+            keys |= _grams(step)
+        self._step_grams.remove(run_id, keys)
+        doc.update(steps=[], log_lines=0, log_offset=0, log_inode=None, log_mtime=None,
+                   log_head=None)
+        self._dirty = True
+
+    def _drop(self, run_id: str) -> None:
+        doc = self.docs.get(run_id)
+        if doc is None:
+            return
+        self._unindex_fields(run_id, doc)
+        self._reset_log(run_id, doc)
+        del self.docs[run_id]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def fuzzy_candidates(self, query: str, limit: int) -> list[str]:
+        """Runs most likely to fuzzy-match ``query``, best first.
+
+        Ranked by shared word tokens, then shared trigrams, over run id /
+        theme / purpose. Queries too short for trigrams consider every run.
+        """
+        grams = _grams(query)
+        if not grams:
+            return list(self.docs)
+        scores: dict[str, int] = {}
+        for gram in grams:
+            for run_id in self._grams.get(gram):
+                scores[run_id] = scores.get(run_id, 0) + 1
+        for token in _tokens(query):
+            for run_id in self._terms.get(token):
+                scores[run_id] = scores.get(run_id, 0) + len(grams)
+        ranked = sorted(scores, key=lambda r: scores[r], reverse=True)
+        return ranked[:limit]
+
+    def step_matches(self, keyword: str) -> dict[str, list[str]]:
+        """Steps containing ``keyword`` (case-insensitive), by run id."""
+        keyword_lower = keyword.lower()
+        grams = _grams(keyword_lower)
+        if grams:
+            candidates: set[str] | None = None
+            for gram in sorted(grams, key=lambda g: len(self._step_grams.get(g))):
+                ids = self._step_grams.get(gram)
+                candidates = set(ids) if candidates is None else candidates & ids
+                if not candidates:
+                    return {}
+        else:
+            candidates = set(self.docs)
+
+        matches = {}
+        for run_id in candidates or ():
+            doc = self.docs.get(run_id)
+            if doc is None:
+                continue
+            steps = [s for s in doc["steps"] if keyword_lower in s.lower()]
+            if steps:
+                matches[run_id] = steps
+        return matches
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                raise ValueError("index version changed")
+            self.docs = data["docs"]
+            self._terms = _Postings(data["terms"])
+            self._grams = _Postings(data["grams"])
+            self._step_grams = _Postings(data["step_grams"])
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or unreadable: rebuild from the run directories.
+            self.docs = {}
+            self._terms, self._grams, self._step_grams = _Postings(), _Postings(), _Postings()
+            self._dirty = True
+
+    def _save(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "docs": self.docs,
+            "terms": self._terms.to_json(),
+            "grams": self._grams.to_json(),
+            "step_grams": self._step_grams.to_json(),
+        }
+        tmp = self.index_file.with_name(f".{self.index_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.index_file)
+            self._dirty = False
+        except OSError:
+            with suppress(OSError):
+                tmp.unlink()
@@ -10,6 +10,7 @@ Creates and configures the FastAPI application with:
 
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
@@ -158,20 +159,31 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
     - Start background session sync
     - Start community recipe refresh service
     - Stop services on shutdown
+
+    Startup runs as a dependency graph (see ``frago.server.startup``): only the
+    stages marked ``required`` hold the first request back, everything else
+    starts concurrently and finishes in the background. ``GET /api/ready``
+    shows how long each stage took.
     """
+    import asyncio
     import logging
 
+    from frago.server.startup import StartupOrchestrator, set_startup
+
     logger = logging.getLogger(__name__)
+    startup = StartupOrchestrator()
+    # Services that started, by stage name — shutdown only stops those.
+    started: dict[str, Any] = {}
 
     # Startup: Initialize state manager (unified state)
     state_manager = StateManager.get_instance()
-    await state_manager.initialize()
+    startup.add("state", state_manager.initialize, required=True)
 
     # Phase 3 (去账本): board EXECUTING-task zombie cleanup 已退役——sub-agent worker
     # 由 `frago agent start` 常驻会话承载，不再有 board run-type task 状态机要回收。
 
     # Auto-sync official resources if enabled
-    try:
+    def official_sync() -> None:
         from frago.init.config_manager import load_config
         from frago.server.services.official_resource_sync_service import (
             OfficialResourceSyncService,
@@ -181,62 +193,109 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
         if config.official_resource_sync_enabled:
             logger.info("Auto-syncing official resources from GitHub...")
             OfficialResourceSyncService.start_sync()
-    except Exception as e:
-        logger.warning("Failed to auto-sync official resources: %s", e)
+
+    startup.add("official_sync", official_sync, after=("state",))
 
     # Start sync service (syncs Claude Code sessions to frago storage)
-    sync_service = SyncService.get_instance()
-    await sync_service.start()
+    async def sync_sessions() -> None:
+        sync_service = SyncService.get_instance()
+        await sync_service.start()
+        started["sync"] = sync_service
+
+    startup.add("sync", sync_sessions, after=("state",))
 
     # Start community recipe service (60s refresh interval). Nothing here waits
     # on GitHub: startup used to fetch the community list before serving its
     # first request, so a slow — or rate-limited, which is the normal state for
     # an unauthenticated gh — api.github.com held the whole server shut. The
     # list arrives over the websocket a moment later instead.
-    community_service = CommunityRecipeService.get_instance()
-    await community_service.start()
+    async def community() -> None:
+        community_service = CommunityRecipeService.get_instance()
+        await community_service.start()
+        started["community"] = community_service
+
+    startup.add("community", community, after=("state",))
 
     # Same for the PyPI update check: publish the installed version now, let
     # the background loop discover whether a newer one exists.
-    version_service = VersionCheckService.get_instance()
-    version_service.prime()
-    await version_service.start()
+    async def version_check() -> None:
+        version_service = VersionCheckService.get_instance()
+        version_service.prime()
+        await version_service.start()
+        started["version"] = version_service
 
-    # Prepare recipe scheduler (started after PA wiring below)
-    scheduler = SchedulerService.get_instance()
+    startup.add("version", version_check)
 
     # Start tab cleanup service (periodic orphan tab reconciliation)
-    from frago.server.services.tab_cleanup_service import TabCleanupService
+    async def tab_cleanup() -> None:
+        from frago.server.services.tab_cleanup_service import TabCleanupService
+
+        service = TabCleanupService.get_instance()
+        await service.start()
+        started["tab_cleanup"] = service
+
+    startup.add("tab_cleanup", tab_cleanup)
+
+    # Start project catalog service (warms and reconciles the file browser's
+    # cached project listing and sizes)
+    async def project_catalog() -> None:
+        from frago.server.services.project_catalog import ProjectCatalogService
+
+        service = ProjectCatalogService.get_instance()
+        await service.start()
+        started["project_catalog"] = service
+
+    startup.add("project_catalog", project_catalog)
+
+    # Start skill watch service (refreshes the skill list when SKILL.md files
+    # or skill directories change)
+    async def skill_watch() -> None:
+        from frago.server.services.skill_service import SkillWatchService
+
+        service = SkillWatchService.get_instance()
+        await service.start()
+        started["skill_watch"] = service
 
-    tab_cleanup = TabCleanupService.get_instance()
-    await tab_cleanup.start()
+    startup.add("skill_watch", skill_watch, after=("state",))
 
     # Start WebUI session idle-reclaim service (periodic eviction of idle tmux
     # claude sessions driven from the claude-sessions page).
-    from frago.server.services.ui_session_lifecycle import UiSessionLifecycleService
+    async def ui_session_lifecycle() -> None:
+        from frago.server.services.ui_session_lifecycle import UiSessionLifecycleService
 
-    ui_session_lifecycle = UiSessionLifecycleService.get_instance()
-    await ui_session_lifecycle.start()
+        service = UiSessionLifecycleService.get_instance()
+        await service.start()
+        started["ui_session_lifecycle"] = service
+
+    startup.add("ui_session_lifecycle", ui_session_lifecycle)
 
     # Keep the virtual desktop up whenever a person wants it there. Deliberately
     # not a DaemonService entry: that one restarts on any non-zero exit, which
     # would resurrect a desktop the operator just shut down.
-    from frago.server.services.virtual_os_lifecycle import VirtualOsLifecycleService
+    async def virtual_os() -> None:
+        from frago.server.services.virtual_os_lifecycle import VirtualOsLifecycleService
+
+        service = VirtualOsLifecycleService.get_instance()
+        await service.start()
+        started["virtual_os"] = service
 
-    virtual_os = VirtualOsLifecycleService.get_instance()
-    await virtual_os.start()
+    startup.add("virtual_os", virtual_os)
 
     # Start hourly orphan recipe reaper (kills recipe daemon leftovers that no
     # supervisor owns any more — e.g. a HUD surviving a SIGKILLed server).
-    from frago.server.services.orphan_recipe_cleanup_service import (
-        OrphanRecipeCleanupService,
-    )
+    async def orphan_cleanup() -> None:
+        from frago.server.services.orphan_recipe_cleanup_service import (
+            OrphanRecipeCleanupService,
+        )
 
-    orphan_cleanup = OrphanRecipeCleanupService.get_instance()
-    await orphan_cleanup.start()
+        service = OrphanRecipeCleanupService.get_instance()
+        await service.start()
+        started["orphan_cleanup"] = service
+
+    startup.add("orphan_cleanup", orphan_cleanup)
 
     # Deploy frago-core binary if missing or outdated, then sync event registration
-    try:
+    def hook_binary() -> None:
         from frago.init.hook_binary import deploy_hook_binary, sync_hook_events
         from frago.init.retired_artifacts import retire_superseded_install_artifacts
 
@@ -255,22 +314,23 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
             logger.info("Retired superseded install artifacts: %s", ", ".join(retired))
         logger.info("Hook binary ready: %s", hook_path)
         sync_hook_events(str(hook_path))
-    except Exception as e:
-        logger.warning("Failed to deploy hook binary: %s", e)
+
+    startup.add("hook_binary", hook_binary)
 
     # Bridge the same hook binary into opencode, when opencode is installed
-    try:
+    def opencode_plugin() -> None:
         from frago.init.opencode_plugin import deploy_opencode_plugin
+
         plugin_path = deploy_opencode_plugin()
         if plugin_path:
             logger.info("opencode plugin ready: %s", plugin_path)
-    except Exception as e:
-        logger.warning("Failed to deploy opencode plugin: %s", e)
+
+    startup.add("opencode_plugin", opencode_plugin, after=("hook_binary",))
 
     # Register the same hook binary with codex, when codex is installed. codex
     # speaks the Claude Code hook protocol natively, so this is a registration
     # file and no bridge process.
-    try:
+    def codex_hooks() -> None:
         from frago.init.codex_hooks import TRUST_HINT, sync_codex_hook_events
         from frago.init.hook_binary import get_engine_argv, get_hook_binary_path
 
@@ -279,80 +339,127 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
         )
         if codex_hooks_path:
             logger.info("codex hooks registered: %s — %s", codex_hooks_path, TRUST_HINT)
-    except Exception as e:
-        logger.warning("Failed to register codex hooks: %s", e)
+
+    startup.add("codex_hooks", codex_hooks, after=("hook_binary",))
 
     # Cleanup old trace files
-    from frago.telemetry.trace import cleanup_old_traces, register_broadcast_hook
-    cleanup_old_traces()
+    def trace_cleanup() -> None:
+        from frago.telemetry.trace import cleanup_old_traces
+
+        cleanup_old_traces()
+
+    startup.add("trace_cleanup", trace_cleanup)
 
     # Wire timeline entries → WS timeline_event (spec 20260418-timeline-consumer-unification Phase 3)
-    _wire_timeline_broadcast(register_broadcast_hook)
+    async def timeline_broadcast() -> None:
+        from frago.telemetry.trace import register_broadcast_hook
+
+        _wire_timeline_broadcast(register_broadcast_hook)
+
+    startup.add("timeline_broadcast", timeline_broadcast, required=True)
+
+    # Materialize the timeline (checkpoint + trace tail) so the first query
+    # does not pay for it
+    def timeline_feed() -> None:
+        from frago.server.services.timeline_service import get_feed
+
+        get_feed()
+
+    startup.add("timeline_feed", timeline_feed, after=("trace_cleanup",))
 
     # Initialize Primary Agent (PID 1 — always available, independent of features)
     from frago.server.services.primary_agent_service import PrimaryAgentService
 
     primary_agent = PrimaryAgentService.get_instance()
-    try:
-        await primary_agent.initialize()
-    except Exception as e:
-        logger.warning("Failed to initialize Primary Agent: %s", e)
+    startup.add("primary_agent", primary_agent.initialize, after=("state",), required=True)
 
     # Start task ingestion scheduler (if enabled in config)
-    ingestion_scheduler = await _start_ingestion_scheduler(logger)
+    async def ingestion() -> None:
+        started["ingestion"] = await _start_ingestion_scheduler(logger)
+
+    startup.add("ingestion", ingestion)
 
     # Start daemon service (supervises config-declared recipe daemons, if enabled)
-    daemon_service = await _start_daemon_service(logger)
+    async def daemons() -> None:
+        started["daemon"] = await _start_daemon_service(logger)
+
+    startup.add("daemon", daemons)
 
     # Telemetry: ensure config exists + report server start for DAU tracking
-    try:
+    def telemetry() -> None:
         from frago.telemetry import capture
         from frago.telemetry.config import ensure_config
+
         ensure_config()
         capture("server_started")
-    except Exception:
-        pass
 
-    # Wire ingestion scheduler ↔ PA (bidirectional)
-    if ingestion_scheduler is not None:
-        ingestion_scheduler.set_pa_enqueue(primary_agent.enqueue_message)
-        primary_agent.set_ingestion_scheduler(ingestion_scheduler)
+    startup.add("telemetry", telemetry)
+
+    # Wire ingestion scheduler ↔ PA (bidirectional), then the recipe scheduler
+    # ↔ PA (bidirectional), then start its loop
+    scheduler = SchedulerService.get_instance()
+
+    async def recipe_scheduler() -> None:
+        ingestion_scheduler = started.get("ingestion")
+        if ingestion_scheduler is not None:
+            ingestion_scheduler.set_pa_enqueue(primary_agent.enqueue_message)
+            primary_agent.set_ingestion_scheduler(ingestion_scheduler)
+
+        scheduler.set_pa_enqueue(primary_agent.enqueue_message)
+        primary_agent.set_scheduler_service(scheduler)
+        await scheduler.start()
+        started["scheduler"] = scheduler
 
-    # Wire recipe scheduler ↔ PA (bidirectional), then start loop
-    scheduler.set_pa_enqueue(primary_agent.enqueue_message)
-    primary_agent.set_scheduler_service(scheduler)
-    await scheduler.start()
+    startup.add("scheduler", recipe_scheduler, after=("primary_agent", "ingestion"))
 
     # Initialize workbench stream bridge (lazy — starts watching when a
     # session is first viewed, pushes record deltas via WebSocket).
-    import asyncio
+    async def workbench_bridge() -> None:
+        from frago.server.services.workbench_stream_bridge import WorkbenchStreamBridge
 
-    from frago.server.services.workbench_stream_bridge import WorkbenchStreamBridge
+        loop = asyncio.get_running_loop()
+        WorkbenchStreamBridge.get_instance(loop)
+        logger.info("WorkbenchStreamBridge initialized (loop=%s)", loop is not None)
 
-    loop = asyncio.get_running_loop()
-    WorkbenchStreamBridge.get_instance(loop)
-    logger.info("WorkbenchStreamBridge initialized (loop=%s)", loop is not None)
+    startup.add("workbench_bridge", workbench_bridge, required=True)
+
+    set_startup(startup)
+    startup.start()
+    await startup.wait_ready()
 
     yield
 
-    # Shutdown
-    if daemon_service is not None:
-        await daemon_service.stop()
-    if ingestion_scheduler is not None:
-        await ingestion_scheduler.stop()
-    await tab_cleanup.stop()
-    await ui_session_lifecycle.stop()
-    await virtual_os.stop()
-    await orphan_cleanup.stop()
+    # Shutdown. A stage still starting its service would otherwise come back
+    # after the stop below and leave that service running.
+    await startup.settle()
+    for name in (
+        "daemon",
+        "ingestion",
+        "tab_cleanup",
+        "project_catalog",
+        "skill_watch",
+        "ui_session_lifecycle",
+        "virtual_os",
+        "orphan_cleanup",
+    ):
+        if started.get(name) is not None:
+            await started[name].stop()
     await primary_agent.stop()
-    await scheduler.stop()
-    await version_service.stop()
-    await community_service.stop()
-    await sync_service.stop()
+    for name in ("scheduler", "version", "community", "sync"):
+        if started.get(name) is not None:
+            await started[name].stop()
 
     # Stop workbench stream bridge
+    from frago.server.services.workbench_stream_bridge import WorkbenchStreamBridge
+
     WorkbenchStreamBridge.reset_instance()
 
+    # Checkpoint the timeline feed so the next start only reads the trace tail
+    from frago.server.services.timeline_service import stop_feed
+
+    stop_feed()
+    set_startup(None)
+
 
 async def _start_ingestion_scheduler(logger):
     """Start the task ingestion scheduler if enabled in config."""
@@ -600,6 +707,9 @@ def create_app(
         - Session sync events
         - Log streaming
         - Initial data push on connect
+
+        Clients may send ``{"type": "subscribe", "topics": [...]}`` to receive
+        only those topics; until they do, they receive everything.
         """
         await manager.connect(websocket)
         try:
@@ -642,6 +752,19 @@ def create_app(
                             websocket,
                             create_message(MessageType.PONG),
                         )
+                    elif msg.get("type") in (MessageType.SUBSCRIBE, MessageType.UNSUBSCRIBE):
+                        raw_topics = msg.get("topics") or []
+                        if isinstance(raw_topics, str):
+                            raw_topics = [raw_topics]
+                        topics = [str(t) for t in raw_topics if t]
+                        if msg["type"] == MessageType.SUBSCRIBE:
+                            current = await manager.subscribe(websocket, topics)
+                        else:
+                            current = await manager.unsubscribe(websocket, topics)
+                        await manager.send_personal(
+                            websocket,
+                            create_message(MessageType.SUBSCRIBED, {"topics": current}),
+                        )
                 except (json.JSONDecodeError, KeyError):
                     pass
         except WebSocketDisconnect:
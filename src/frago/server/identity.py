@@ -41,6 +41,7 @@ one letter. The directories are kept apart precisely because the names are not.
 
 from __future__ import annotations
 
+import atexit
 import base64
 import contextlib
 import hashlib
@@ -54,6 +55,7 @@ import shutil
 import threading
 import time
 import unicodedata
+from collections import OrderedDict
 from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -104,6 +106,8 @@ DEFAULT_TOTAL_CAP = 500
 DEFAULT_UNUSED_CAP = 200
 DEFAULT_SESSIONS_PER_USER = 10
 DEFAULT_TOTAL_SESSIONS = 5000
+DEFAULT_SESSION_CACHE_TTL = 30
+SESSION_CACHE_SIZE = 4096
 
 # How long a session file is allowed to be unreadable before the purge treats it
 # as rubbish rather than as one being written right now. Any value comfortably
@@ -812,6 +816,24 @@ def _session_path(sid: str) -> Path:
     return sessions_dir() / f"{sid}.json"
 
 
+# Held while a session file is deleted, and while a queued ``last_seen`` is
+# written back. The write is a read, a rewrite and a rename; a revoke that
+# lands between the read and the rename would otherwise be undone by it.
+_session_files_lock = threading.Lock()
+
+
+def _unlink_session(path: Path) -> bool:
+    """Delete a session file, never in the middle of a ``last_seen`` write-back."""
+    with _session_files_lock:
+        try:
+            path.unlink()
+        except OSError:
+            return False
+    with _pending_lock:
+        _pending_seen.pop(path, None)
+    return True
+
+
 def _read_session(sid: str) -> dict[str, Any] | None:
     try:
         loaded = json.loads(_session_path(sid).read_text(encoding="utf-8"))
@@ -863,8 +885,8 @@ def purge_expired_sessions() -> int:
             expires = _parse_time(record.get("expires"))
             if expires is not None and expires > now:
                 continue
-        with contextlib.suppress(OSError):
-            path.unlink()
+        _SESSION_CACHE.drop(path.stem)
+        if _unlink_session(path):
             removed += 1
     return removed
 
@@ -882,8 +904,8 @@ def _enforce_session_caps(identity: str) -> None:
     def evict(candidates: list[tuple[str, Path, dict[str, Any]]], keep: int) -> None:
         ordered = sorted(candidates, key=lambda item: str(item[2].get("created") or ""))
         for _, path, _record in ordered[: max(0, len(ordered) - keep + 1)]:
-            with contextlib.suppress(OSError):
-                path.unlink()
+            _SESSION_CACHE.drop(path.stem)
+            _unlink_session(path)
 
     mine = [item for item in live if item[0] == identity]
     if len(mine) >= per_user:
@@ -938,6 +960,109 @@ def create_session(identity: str) -> str:
 # anything by it.
 _LAST_SEEN_RESOLUTION = 300
 
+# Even the coarse stamp is not written on the request that earns it: it is
+# queued and written by a timer (and at exit), so no request ever waits on a
+# session-file rewrite.
+_LAST_SEEN_FLUSH_INTERVAL = 30.0
+
+
+class _SessionCache:
+    """Session records this process has already read, most recent last.
+
+    The access gate resolves the cookie on every request, asset fetches
+    included, and a public page with a few dozen signed-in visitors turned that
+    into a file read per request. A hit here costs one ``stat`` of the session
+    directory instead.
+
+    That stat is what keeps the cache honest across processes. Every way a
+    session stops being one — ``frago user session revoke`` in another process,
+    a purge, a logout — is an ``unlink`` in that directory, and an unlink moves
+    the directory's mtime. Any change to the stamp drops everything: the cache
+    cannot tell which entry the change was about, and re-reading a few files is
+    cheap next to serving a revoked one. The TTL is the backstop for
+    filesystems whose mtime is too coarse to see two changes in one tick.
+
+    The account is *not* cached here. Suspension has to take effect on the very
+    next request, and ``load_users`` already answers that with a stat of its own.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._lock = threading.Lock()
+        self._stamp: tuple[Path, int] | None = None
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def _check_stamp(self, stamp: tuple[Path, int] | None) -> None:
+        if stamp is None or stamp != self._stamp:
+            self._entries.clear()
+            self._stamp = stamp
+
+    def get(self, sid: str, stamp: tuple[Path, int] | None) -> dict[str, Any] | None:
+        with self._lock:
+            self._check_stamp(stamp)
+            hit = self._entries.get(sid)
+            if hit is None:
+                return None
+            if time.monotonic() - hit[0] > session_cache_ttl():
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+            return hit[1]
+
+    def put(self, sid: str, stamp: tuple[Path, int] | None, record: dict[str, Any]) -> None:
+        with self._lock:
+            self._check_stamp(stamp)
+            if stamp is None:
+                return
+            self._entries[sid] = (time.monotonic(), record)
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+    def drop(self, sid: str) -> None:
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def drop_identity(self, identity: str) -> None:
+        with self._lock:
+            for sid in [
+                sid for sid, (_, record) in self._entries.items()
+                if str(record.get("identity") or "") == identity
+            ]:
+                del self._entries[sid]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stamp = None
+
+
+_SESSION_CACHE = _SessionCache(SESSION_CACHE_SIZE)
+
+# Keyed on the session file's full path rather than the sid, so that a flush
+# lands in the directory the stamp was earned in even if the override changed.
+_pending_seen: dict[Path, str] = {}
+_pending_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+
+
+def session_cache_ttl() -> int:
+    """Longest a cached session record is trusted without re-reading it."""
+    return _int_env("FRAGO_SESSION_CACHE_TTL", DEFAULT_SESSION_CACHE_TTL)
+
+
+def _sessions_stamp() -> tuple[Path, int] | None:
+    directory = sessions_dir()
+    try:
+        return directory, directory.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def clear_session_cache() -> None:
+    """Forget every cached session record. Pending ``last_seen`` writes stay."""
+    _SESSION_CACHE.clear()
+
 
 def resolve_session(token: str | None) -> LoginSession | None:
     """The session this cookie names, or None if it is not one we honour.
@@ -948,19 +1073,26 @@ def resolve_session(token: str | None) -> LoginSession | None:
     session pointing at an account that no longer exists must not be readable as
     "not disabled, therefore fine". That is the ghost session no operator tool
     can see or stop.
+
+    Misses are not cached: the sid comes from whatever cookie the client sent,
+    and remembering every made-up one would let anyone fill the cache.
     """
     if not token:
         return None
     sid = _sid_of(token)
-    record = _read_session(sid)
+    stamp = _sessions_stamp()
+    record = _SESSION_CACHE.get(sid, stamp)
     if record is None:
-        return None
+        record = _read_session(sid)
+        if record is None:
+            return None
+        _SESSION_CACHE.put(sid, stamp, record)
 
     identity = str(record.get("identity") or "")
     expires = _parse_time(record.get("expires"))
     if expires is None or expires <= _now():
-        with contextlib.suppress(OSError):
-            _session_path(sid).unlink()
+        _SESSION_CACHE.drop(sid)
+        _unlink_session(_session_path(sid))
         return None
 
     user = find_user_by_id(identity)
@@ -986,30 +1118,76 @@ def resolve_session(token: str | None) -> LoginSession | None:
 
 
 def _touch(sid: str, record: dict[str, Any], session: LoginSession) -> None:
+    """Queue a ``last_seen`` update if the stored one is out of date.
+
+    The cached record is stamped straight away, so the requests that follow do
+    not queue the same update again while it waits for the flush.
+    """
+    global _flush_timer
     seen = _parse_time(session.last_seen)
     now = _now()
     if seen is not None and (now - seen).total_seconds() < _LAST_SEEN_RESOLUTION:
         return
-    record["last_seen"] = _stamp(now)
-    path = _session_path(sid)
-    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
-    try:
-        fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        with os.fdopen(fd, "w", encoding="utf-8") as fh:
-            json.dump(record, fh, ensure_ascii=False)
-        os.replace(str(tmp), str(path))
-    except OSError:
-        with contextlib.suppress(OSError):
-            tmp.unlink()
+    stamp = _stamp(now)
+    record["last_seen"] = stamp
+    with _pending_lock:
+        _pending_seen[_session_path(sid)] = stamp
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(_LAST_SEEN_FLUSH_INTERVAL, flush_last_seen)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_last_seen() -> int:
+    """Write every queued ``last_seen`` stamp. Returns how many were written.
+
+    Each file is re-read first and skipped if it is gone: a session revoked
+    while its stamp waited in the queue must stay revoked, and writing the
+    queued record back would be exactly the resurrection the queue could cause.
+    Deletions wait for a write-back in progress, and a write-back for them.
+    """
+    global _flush_timer
+    with _pending_lock:
+        pending = dict(_pending_seen)
+        _pending_seen.clear()
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+
+    written = 0
+    for path, stamp in pending.items():
+        # Read, rewrite and rename under the lock every deletion takes, so a
+        # session evicted or revoked meanwhile is seen as gone here rather
+        # than written back after its file was removed.
+        with _session_files_lock:
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            if not isinstance(record, dict):
+                continue
+            record["last_seen"] = stamp
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            try:
+                fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(record, fh, ensure_ascii=False)
+                os.replace(str(tmp), str(path))
+                written += 1
+            except OSError:
+                with contextlib.suppress(OSError):
+                    tmp.unlink()
+    return written
+
+
+atexit.register(flush_last_seen)
 
 
 def revoke_session(token: str) -> bool:
     """Log this one cookie out."""
-    try:
-        _session_path(_sid_of(token)).unlink()
-        return True
-    except OSError:
-        return False
+    sid = _sid_of(token)
+    _SESSION_CACHE.drop(sid)
+    return _unlink_session(_session_path(sid))
 
 
 def list_sessions() -> list[LoginSession]:
@@ -1048,11 +1226,8 @@ def revoke_session_id(sid: str) -> bool:
     """
     if not sid or "/" in sid or "\\" in sid or "." in sid:
         return False
-    try:
-        _session_path(sid).unlink()
-        return True
-    except OSError:
-        return False
+    _SESSION_CACHE.drop(sid)
+    return _unlink_session(_session_path(sid))
 
 
 def revoke_identity_sessions(identity: str) -> int:
@@ -1066,13 +1241,12 @@ def revoke_identity_sessions(identity: str) -> int:
     the current session here instead would be the same outcome with one more
     thing to get wrong.
     """
+    _SESSION_CACHE.drop_identity(identity)
     revoked = 0
     for path in _session_files():
         record = _read_session(path.stem)
-        if record and str(record.get("identity") or "") == identity:
-            with contextlib.suppress(OSError):
-                path.unlink()
-                revoked += 1
+        if record and str(record.get("identity") or "") == identity and _unlink_session(path):
+            revoked += 1
     return revoked
 
 
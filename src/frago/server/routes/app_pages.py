@@ -32,14 +32,21 @@ and read back here.
 signed in — is served the slot the access gate decided on, never one they named.
 For a signed-in visitor that slot is their own account id, read from the
 separate identity root; see `_slot_state`.
+
+Files go out through `_file_response`: a strong ETag per file version, a 304
+when the browser already holds it, and a precompressed variant when the
+browser takes one. See `frago.recipes.asset_variants`.
 """
 
+import hashlib
 import mimetypes
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, Response
+from starlette.concurrency import run_in_threadpool
 
+from frago.recipes import asset_variants
 from frago.recipes.app_state import DEFAULT_SLOT, InvalidSlotName
 from frago.recipes.app_state import read as read_slot
 
@@ -121,6 +128,60 @@ def _resolve_within(base: Path, relative: str) -> Path:
     return candidate
 
 
+def _if_none_match(request: Request) -> set[str]:
+    header = request.headers.get("if-none-match") or ""
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def _negotiate(asset: asset_variants.AssetVersion, accept_encoding: str | None):
+    """Pick the representation to send: (path, coding or None)."""
+    accepted = asset_variants.negotiate(accept_encoding)
+    # A variant built ahead of time in any accepted coding beats building one.
+    # Only if there is none does the request compress, and then only cheaply:
+    # the full-strength build belongs to `frago recipe expose`.
+    for encoding in accepted:
+        variant = asset_variants.variant(asset, encoding, build=False, fast=True)
+        if variant is not None:
+            return variant, encoding
+    for encoding in accepted:
+        variant = asset_variants.variant(asset, encoding, fast=True)
+        if variant is not None:
+            return variant, encoding
+    return asset.path, None
+
+
+async def _file_response(
+    request: Request, path: Path, *, headers: dict, missing: dict | None = None
+) -> Response:
+    """Serve one file with a strong validator and, where it pays, compressed.
+
+    The version (and its digest) is worked out once per change to the file and
+    remembered, so the common case — a reload of a page nothing has touched —
+    is a stat and a 304. Hashing a changed file and building its variants is
+    blocking work, so it runs in the thread pool rather than on the loop.
+    """
+    asset = await run_in_threadpool(asset_variants.version, path)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="File not found", headers=missing)
+
+    headers = dict(headers)
+    if asset.compressible:
+        headers["Vary"] = "Accept-Encoding"
+
+    held = asset.match(request.headers.get("if-none-match"))
+    if held is not None:
+        headers["ETag"] = held
+        return Response(status_code=304, headers=headers)
+
+    served, encoding = await run_in_threadpool(
+        _negotiate, asset, request.headers.get("accept-encoding")
+    )
+    headers["ETag"] = asset.etag_for(encoding)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return FileResponse(path=served, media_type=_mime_type(path), headers=headers)
+
+
 def _slot_state(name: str, request: Request) -> tuple[str, dict]:
     """Resolve the requested slot and read its state.
 
@@ -198,7 +259,12 @@ async def serve_app_config(name: str, request: Request):
     config["recipeName"] = name
     config["appBase"] = f"/app/{name}/"
     config["slot"] = key
-    return JSONResponse(content=config, headers=_REVALIDATE)
+    response = JSONResponse(content=config, headers=_REVALIDATE)
+    etag = f'"{hashlib.sha256(response.body).hexdigest()[:32]}"'
+    response.headers["ETag"] = etag
+    if etag in _if_none_match(request):
+        return Response(status_code=304, headers={**_REVALIDATE, "ETag": etag})
+    return response
 
 
 @router.get("/{name}/data/{file_path:path}")
@@ -258,12 +324,12 @@ async def serve_app_data(name: str, file_path: str, request: Request):
     if not full_path.is_file():
         raise HTTPException(status_code=404, detail="File not found", headers=_NO_STORE)
 
-    return FileResponse(path=full_path, media_type=_mime_type(full_path), headers=_REVALIDATE)
+    return await _file_response(request, full_path, headers=_REVALIDATE, missing=_NO_STORE)
 
 
 @router.get("/{name}/")
 @router.get("/{name}/{file_path:path}")
-async def serve_app_asset(name: str, file_path: str = ""):
+async def serve_app_asset(name: str, request: Request, file_path: str = ""):
     """Serve the recipe's own front-end files straight from its assets/ directory."""
     assets = _assets_dir(name)
     full_path = _resolve_within(assets, file_path or "index.html")
@@ -274,4 +340,4 @@ async def serve_app_asset(name: str, file_path: str = ""):
     if not full_path.is_file():
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(path=full_path, media_type=_mime_type(full_path), headers=_REVALIDATE)
+    return await _file_response(request, full_path, headers=_REVALIDATE)
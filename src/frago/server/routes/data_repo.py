@@ -135,13 +135,16 @@ class SyncPromptResponse(BaseModel):
 @router.get("/data-repo/status", response_model=DataRepoStatusResponse)
 async def data_repo_status(
     limit: int = Query(DEFAULT_FILE_LIMIT, ge=0, le=MAX_FILE_LIMIT),
+    refresh: bool = Query(False),
 ) -> DataRepoStatusResponse:
     """What is pending in the data repository.
 
-    Runs off the event loop: on a working directory in daily use this shells
-    out over tens of thousands of paths.
+    Usually answered from the cached snapshot. Still runs off the event loop:
+    the first poll, an index change or ``refresh=true`` shells out over tens of
+    thousands of paths.
     """
-    status = await asyncio.get_running_loop().run_in_executor(None, get_status, limit)
+    args = (limit, True) if refresh else (limit,)
+    status = await asyncio.get_running_loop().run_in_executor(None, get_status, *args)
     return DataRepoStatusResponse(**status)
 
 
@@ -32,6 +32,7 @@ class ProjectDetailResponse(ProjectInfoResponse):
     file_count: int
     total_size: int
     subdirectories: List[str]
+    last_modified: str = ""
 
 
 class FileInfoResponse(BaseModel):
@@ -82,7 +83,7 @@ async def refresh_projects():
 
     from frago.server.services.file_service import FileService
 
-    projects = FileService.list_projects()
+    projects = FileService.refresh_projects()
     return [asdict(p) for p in projects]
 
 
@@ -3,13 +3,18 @@
 CLI chat ingestion endpoint + PA resident-session listing/send for the WebUI
 claude-sessions page's "PA" tab (spec: jump straight into whichever conversation
 PA is already holding open, instead of re-deriving it from Feishu).
+Also serves the PA timeline: a query endpoint and a server-sent event stream,
+both backed by the materialized timeline feed.
 """
 
+import asyncio
+import json
 import logging
 import re
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -173,3 +178,80 @@ async def send_pa_session_message(request: PaSendRequest) -> dict:
         "status": "ready" if was_warm else "activating",
         "msg_id": msg_id,
     }
+
+
+# Seconds between keep-alive comments on an idle timeline stream
+TIMELINE_HEARTBEAT = 15.0
+
+
+@router.get("/pa/timeline")
+async def get_pa_timeline(
+    since: str | None = None,
+    limit: int = Query(50, ge=1, le=1000),
+) -> dict:
+    """Timeline events after ``since`` (oldest first), at most the newest ``limit``."""
+    from frago.server.services.timeline_service import get_timeline
+
+    try:
+        events = await asyncio.to_thread(get_timeline, since, limit)
+    except ValueError as e:
+        raise HTTPException(400, f"invalid since: {e}") from e
+    return {"events": events}
+
+
+@router.get("/pa/timeline/stream")
+async def stream_pa_timeline(request: Request, since: str | None = None) -> StreamingResponse:
+    """Push timeline events as server-sent events instead of polling ``/pa/timeline``.
+
+    With ``since``, the events after it that the feed still holds are sent
+    first. Each event is one ``data:`` line holding a TimelineAggEvent dict.
+    """
+    from frago.server.services.timeline_service import FEED_CAPACITY, get_feed, get_timeline
+
+    feed = await asyncio.to_thread(get_feed)
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=FEED_CAPACITY)
+
+    def push(event: dict) -> None:
+        # Runs on the trace writer's thread; a client too slow to keep up
+        # loses events rather than stalling the writer.
+        def put() -> None:
+            if not queue.full():
+                queue.put_nowait(event)
+
+        loop.call_soon_threadsafe(put)
+
+    # Subscribe before reading the backlog so nothing falls in between;
+    # an event seen in both is sent once.
+    unsubscribe = feed.subscribe(push)
+    backlog = []
+    if since:
+        try:
+            backlog = await asyncio.to_thread(get_timeline, since, FEED_CAPACITY)
+        except ValueError as e:
+            unsubscribe()
+            raise HTTPException(400, f"invalid since: {e}") from e
+
+    async def events():
+        sent = {e["id"] for e in backlog}
+        try:
+            for event in backlog:
+                yield f"data: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), TIMELINE_HEARTBEAT)
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event["id"] in sent:
+                    sent.discard(event["id"])
+                    continue
+                yield f"data: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+        finally:
+            unsubscribe()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,6 +4,7 @@ Provides endpoints for server health checks and information.
 """
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 from frago.server.models import SystemStatusResponse, ServerInfoResponse, SystemDirectoriesResponse
 from frago.server.services.system_service import SystemService
@@ -32,6 +33,25 @@ async def get_status() -> SystemStatusResponse:
     )
 
 
+@router.get("/ready")
+async def get_ready() -> JSONResponse:
+    """Get startup readiness and the startup timeline.
+
+    200 once every stage the server needs to answer requests has settled,
+    503 before that. Background stages still running are listed under
+    ``pending``; each stage carries its start offset and duration, and
+    ``critical_path`` / ``ready_path`` name the chain that gated completion
+    and readiness.
+    """
+    from frago.server.startup import get_startup
+
+    startup = get_startup()
+    if startup is None:
+        return JSONResponse({"ready": False, "complete": False, "stages": []}, status_code=503)
+    timeline = startup.timeline()
+    return JSONResponse(timeline, status_code=200 if timeline["ready"] else 503)
+
+
 @router.get("/info", response_model=ServerInfoResponse)
 async def get_info() -> ServerInfoResponse:
     """Get server information.
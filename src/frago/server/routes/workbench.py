@@ -19,7 +19,7 @@ import asyncio
 from dataclasses import asdict
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
 
 from frago.server.services import session_send
@@ -33,6 +33,9 @@ from frago.session.record_reader import DEFAULT_LIMIT, UnknownSessionFamily
 
 router = APIRouter()
 
+# 记录接口在这个响应头里告诉页面：这场会话的增量推在哪个主题上。
+STREAM_TOPIC_HEADER = "X-Frago-Topic"
+
 
 @router.get("/workbench/sessions")
 async def list_workbench_sessions() -> list[dict[str, Any]]:
@@ -51,6 +54,7 @@ async def list_workbench_sessions() -> list[dict[str, Any]]:
 @router.get("/workbench/sessions/{sid}/records")
 async def read_workbench_records(
     sid: str,
+    response: Response,
     after: int = Query(0, description="本批第一条的 seq，闭区间起点"),
     limit: int = Query(
         DEFAULT_LIMIT,
@@ -65,6 +69,9 @@ async def read_workbench_records(
     执行，这里一个数字都不算，NEVER 在两处各写一遍上限。
 
     会话编号两家的形状都不像时回 404，NEVER 猜一家试试。
+
+    响应头 ``X-Frago-Topic`` 给出这场会话的增量推在哪个 WebSocket 主题上。页面订阅它，
+    会话流就一直开着；最后一个订阅者退订后，流过了宽限期就停。
     """
     try:
         records = await asyncio.to_thread(record_reader.read_records, sid, after, limit, tail)
@@ -73,7 +80,9 @@ async def read_workbench_records(
 
     # Lazily start file watching for this session's project so that
     # subsequent record deltas are pushed via WebSocket instead of polling.
-    _ensure_watching(sid)
+    topic = _ensure_watching(sid)
+    if topic:
+        response.headers[STREAM_TOPIC_HEADER] = topic
 
     return [asdict(record) for record in records]
 
@@ -187,14 +196,30 @@ async def read_workbench_record_raw(
     return raw
 
 
+@router.get("/workbench/streams")
+async def get_workbench_streams() -> dict[str, Any]:
+    """服务端眼下开着哪些会话流、各有几个订阅者，以及它们占了多少线程、目录监听与内存。
+
+    这些数字应该跟着「此刻有几个人在看」走，而不是跟着「开过多少个项目」涨——
+    看它就知道空闲回收有没有在干活。
+    """
+    from frago.server.services.workbench_stream_bridge import WorkbenchStreamBridge
+
+    return WorkbenchStreamBridge.get_instance().stats()
+
+
 # ── internal helpers ─────────────────────────────────────────────────
 
 
-def _ensure_watching(session_id: str) -> None:
+def _ensure_watching(session_id: str) -> str | None:
     """Trigger lazy file watching for the project of *session_id*.
 
     Claude Code sessions (UUID-shaped) start a ``SessionStream`` per project;
     opencode sessions (``ses_`` prefix) start a shared ``OpencodeStream``.
+    Each call renews the stream's idle lease, so the frontend's polling keeps
+    a stream alive for as long as someone is actually looking at it.
+
+    Returns the WebSocket topic the session's frames go out on, or None.
     """
     try:
         from frago.server.services.workbench_stream_bridge import (
@@ -202,10 +227,11 @@ def _ensure_watching(session_id: str) -> None:
         )
 
         bridge = WorkbenchStreamBridge.get_instance()
-        bridge.ensure_watching(session_id)
+        return bridge.ensure_watching(session_id)
     except Exception:
         import logging
 
         logging.getLogger(__name__).warning(
             "Failed to start workbench watching for %s", session_id, exc_info=True
         )
+        return None
@@ -144,8 +144,11 @@ class CommunityRecipeService:
 
     async def _do_refresh(self) -> None:
         """Perform refresh and broadcast if changed."""
+        from frago.recipes import github_http
+
         loop = asyncio.get_event_loop()
         new_data = await loop.run_in_executor(None, self._fetch_community_recipes)
+        logger.debug("GitHub requests so far: %s", github_http.stats())
 
         # Compare with cache - if different, update and broadcast
         if new_data != self._cache:
@@ -27,6 +27,7 @@ outcome today.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
 import subprocess
@@ -55,9 +56,12 @@ def repo_path() -> Path:
     return Path(os.environ.get("FRAGO_HOME") or (Path.home() / ".frago"))
 
 
-def _git(*args: str, timeout: int = GIT_TIMEOUT) -> subprocess.CompletedProcess:
+def _git(
+    *args: str, timeout: int = GIT_TIMEOUT, config: tuple[str, ...] = ()
+) -> subprocess.CompletedProcess:
+    options = [part for item in config for part in ("-c", item)]
     return subprocess.run(
-        ["git", "-C", str(repo_path()), *args],
+        ["git", "-C", str(repo_path()), *options, *args],
         capture_output=True,
         text=True,
         encoding="utf-8",
@@ -179,12 +183,399 @@ def _top_level(path: str) -> str:
     return f"{head}/" if rest else head
 
 
-def get_status(limit: int = DEFAULT_FILE_LIMIT) -> dict[str, Any]:
+def _parse_porcelain(output: str) -> dict[str, str]:
+    """``git status --porcelain -z`` output as path → the word the page shows."""
+    found: dict[str, str] = {}
+    # -z is NUL-separated; a rename additionally carries its old path as a
+    # second NUL-terminated field, which is why this walks an iterator
+    # instead of splitting into a list.
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        # Codes are two columns wide and may themselves contain a space
+        # (" M" = modified in the worktree only), so this slices by
+        # position rather than splitting on whitespace.
+        code, name = entry[:2], entry[3:]
+        if not name:
+            continue
+        kind = _classify(code)
+        if kind == "renamed":
+            # Consume the paired old path so it is not counted twice.
+            next(entries, None)
+        found[name] = kind
+    return found
+
+
+# Past this many changed paths since the last poll, asking git about each of
+# them costs more than asking about everything.
+MAX_DIRTY_PATHS = 512
+
+# Each watched subtree costs the watcher an inotify instance, of which a user
+# gets 128 by default. Past this many tracked top-level directories, one
+# recursive watch on the root is the cheaper of the two.
+MAX_SUBTREE_WATCHES = 32
+
+# Full-scan options. The untracked cache lets git skip directories whose mtime
+# has not moved since the last scan, which on ~/.frago is nearly all of them;
+# it is kept in the index, so it only pays off because git may write the index
+# back (see `_index_stamp` for why that does not trigger a rescan of its own).
+_SCAN_CONFIG = ("core.untrackedCache=true",)
+
+
+def _git_dir(root: Path) -> Path:
+    dot_git = root / ".git"
+    if dot_git.is_file():
+        # A worktree or submodule checkout: `.git` names the real directory.
+        with contextlib.suppress(OSError):
+            line = dot_git.read_text(encoding="utf-8").strip()
+            if line.startswith("gitdir:"):
+                target = Path(line[len("gitdir:"):].strip())
+                return target if target.is_absolute() else root / target
+    return dot_git
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _index_stamp(git_dir: Path) -> tuple[int, int] | None:
+    """What moves when something is staged, committed, reset or checked out."""
+    return _stamp(git_dir / "index")
+
+
+def _refs_stamp(git_dir: Path) -> tuple:
+    """What moves when the branch, its upstream, the remote or the tip changes.
+
+    Ref updates are written beside the ref and renamed into place, so the
+    containing directory's mtime moves with them.
+    """
+    return tuple(
+        _stamp(git_dir / name)
+        for name in (
+            "HEAD", "config", "packed-refs", "FETCH_HEAD", "logs/HEAD",
+            "refs/heads", "refs/remotes/origin",
+        )
+    )
+
+
+class StatusSnapshot:
+    """The classified pending set of one repository, kept current between polls.
+
+    The backup page polls, and every poll used to run ``git status -uall`` over
+    tens of thousands of files to find that nothing had changed. Instead:
+
+    - a full scan happens on the first poll, when git's index moves (a commit,
+      a ``git add``, a checkout — anything that can reclassify files wholesale),
+      and when asked for explicitly;
+    - between those, watches on the working tree collect the paths that
+      changed, and the next poll asks git about those paths only and
+      patches the counts. This is git's fsmonitor contract — "tell me what
+      changed since my last question" — answered by our own watcher;
+    - a poll where neither happened is answered from memory.
+
+    Branch, upstream and last commit are re-read only when the refs move.
+
+    The watches skip what git ignores. Browser profiles, sessions and caches
+    are most of the directories under ``~/.frago``; a recursive inotify watch
+    on the root spends a kernel watch on each of them, for events nothing
+    here would act on. So the root is watched on its own, and only the
+    top-level directories git does not ignore are watched recursively —
+    re-decided when a top-level entry or ``.gitignore`` changes. Overlapping
+    watches (``projects/`` is also the project catalog's) share one.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.git_dir = _git_dir(root)
+        self.lock = threading.Lock()
+        self.entries: dict[str, str] = {}
+        self.by_status: dict[str, int] = {}
+        self.by_area: dict[str, int] = {}
+        self.head: dict[str, Any] | None = None
+        self.index_stamp: tuple[int, int] | None = None
+        self.refs_stamp: tuple | None = None
+        self.scanned = False
+        self.full_scans = 0
+        self._dirty: set[str] = set()
+        self._dirty_dirs: set[str] = set()
+        self._overflow = False
+        self._dirty_lock = threading.Lock()
+        self._target: Any = None
+        self._subtrees: dict[str, Any] = {}  # top-level dir → its WatchTarget
+        self._layout_changed = True
+
+    # ---- change notifications (observer thread) ----------------------------
+
+    def watch(self) -> bool:
+        """Start collecting changed paths. False when no watch could be set up.
+
+        Only the root itself is watched here; `refresh` adds its subtrees
+        before it next reads git, so nothing changed in between goes unseen.
+        """
+        if self._target is not None:
+            return True
+        try:
+            target = self._watch_target(self.root, recursive=False)
+            self._target = target
+            return True
+        except Exception as e:  # noqa: BLE001
+            logger.debug("data repo watch unavailable: %s", e)
+            return False
+
+    def unwatch(self) -> None:
+        targets = [self._target, *self._subtrees.values()]
+        self._target = None
+        self._subtrees = {}
+        self._layout_changed = True
+        with contextlib.suppress(Exception):
+            from frago.watcher import WatchdogObserverService
+
+            svc = WatchdogObserverService.get_instance()
+            for target in targets:
+                if target is not None:
+                    svc.remove(target)
+
+    def _watch_target(self, path: Path, *, recursive: bool) -> Any:
+        from frago.watcher import WatchdogObserverService, WatchTarget
+
+        target = WatchTarget(
+            path=str(path),
+            on_created=self._on_event,
+            on_modified=self._on_event,
+            on_deleted=self._on_event,
+            on_moved=self._on_event,
+            recursive=recursive,
+        )
+        svc = WatchdogObserverService.get_instance()
+        svc.add(target)
+        svc.start()
+        return target
+
+    def _tracked_subtrees(self) -> set[str]:
+        """The top-level directories git does not ignore."""
+        try:
+            names = sorted(
+                entry.name
+                for entry in os.scandir(self.root)
+                if entry.name != ".git" and entry.is_dir(follow_symlinks=False)
+            )
+        except OSError:
+            return set()
+        if not names:
+            return set()
+        ignored = _git("check-ignore", "--", *names)
+        if ignored.returncode not in (0, 1):
+            # Cannot tell: watching too much only costs watches.
+            return set(names)
+        return set(names) - set(ignored.stdout.splitlines())
+
+    def _sync_subtrees(self) -> None:
+        """Watch the top-level directories git tracks, and only those."""
+        with self._dirty_lock:
+            self._layout_changed = False
+        wanted = self._tracked_subtrees()
+        if len(wanted) > MAX_SUBTREE_WATCHES:
+            wanted = {""}  # the whole root, as one watch
+        # New watches first: what moves from one watch to another is never
+        # unwatched in between.
+        for name in sorted(wanted - set(self._subtrees)):
+            try:
+                self._subtrees[name] = self._watch_target(self.root / name, recursive=True)
+            except Exception as e:  # noqa: BLE001
+                # Unwatched changes still surface at the next full scan.
+                logger.debug("data repo watch on %s unavailable: %s", name, e)
+                self.mark_stale()
+        with contextlib.suppress(Exception):
+            from frago.watcher import WatchdogObserverService
+
+            svc = WatchdogObserverService.get_instance()
+            for name in set(self._subtrees) - wanted:
+                svc.remove(self._subtrees.pop(name))
+
+    def _relative(self, path: str | None) -> str | None:
+        if not path:
+            return None
+        try:
+            rel = Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        if rel in ("", ".") or rel == ".git" or rel.startswith(".git/"):
+            return None
+        return rel
+
+    def _on_event(self, event: Any) -> None:
+        # A directory "modified" only says an entry in it changed; that entry
+        # has an event of its own, and rescanning the whole directory for it
+        # would turn one new file in data/ into a status of all of data/.
+        if event.is_directory and event.event_type == "modified":
+            return
+        paths = [self._relative(event.path), self._relative(getattr(event, "src_path", None))]
+        with self._dirty_lock:
+            for rel in paths:
+                if rel is None:
+                    continue
+                if "/" not in rel and (event.is_directory or rel == ".gitignore"):
+                    # Which subtrees deserve a watch may have changed.
+                    self._layout_changed = True
+                self._dirty.add(rel)
+                if event.is_directory or event.event_type in ("deleted", "moved"):
+                    self._dirty_dirs.add(rel)
+            if len(self._dirty) > MAX_DIRTY_PATHS:
+                self._overflow = True
+                self._dirty.clear()
+                self._dirty_dirs.clear()
+
+    def mark_stale(self) -> None:
+        """Forget what is known about the working tree; the next poll rescans."""
+        with self._dirty_lock:
+            self._overflow = True
+
+    def _drain(self) -> tuple[set[str], set[str], bool]:
+        with self._dirty_lock:
+            dirty, dirs, overflow = self._dirty, self._dirty_dirs, self._overflow
+            self._dirty, self._dirty_dirs, self._overflow = set(), set(), False
+        return dirty, dirs, overflow
+
+    # ---- bookkeeping -------------------------------------------------------
+
+    def _count(self, path: str, kind: str, delta: int) -> None:
+        self.by_status[kind] = self.by_status.get(kind, 0) + delta
+        if not self.by_status[kind]:
+            del self.by_status[kind]
+        area = _top_level(path)
+        self.by_area[area] = self.by_area.get(area, 0) + delta
+        if not self.by_area[area]:
+            del self.by_area[area]
+
+    def _replace_all(self, entries: dict[str, str]) -> None:
+        self.entries = entries
+        self.by_status = {}
+        self.by_area = {}
+        for path, kind in entries.items():
+            self._count(path, kind, 1)
+
+    def _patch(self, paths: set[str], dirs: set[str], found: dict[str, str]) -> None:
+        stale = [p for p in paths if p in self.entries]
+        if dirs:
+            prefixes = tuple(f"{d}/" for d in dirs)
+            stale.extend(p for p in self.entries if p.startswith(prefixes))
+        for path in set(stale):
+            self._count(path, self.entries.pop(path), -1)
+        for path, kind in found.items():
+            previous = self.entries.get(path)
+            if previous is not None:
+                self._count(path, previous, -1)
+            self.entries[path] = kind
+            self._count(path, kind, 1)
+
+    # ---- reading git -------------------------------------------------------
+
+    def _read_head(self) -> dict[str, Any]:
+        head: dict[str, Any] = {
+            "remote_url": None, "branch": None, "ahead": 0, "behind": 0, "last_commit": None,
+        }
+        remote = _git("remote", "get-url", "origin")
+        branch = _git("rev-parse", "--abbrev-ref", "HEAD")
+        head["remote_url"] = remote.stdout.strip() or None
+        head["branch"] = branch.stdout.strip() or None
+
+        # Ahead/behind against the tracking branch. A repository that has never
+        # been pushed has no upstream; that is a zero, not a failure.
+        counts = _git("rev-list", "--left-right", "--count", "@{upstream}...HEAD")
+        if counts.returncode == 0:
+            parts = counts.stdout.split()
+            if len(parts) == 2:
+                head["behind"], head["ahead"] = int(parts[0]), int(parts[1])
+
+        last = _git("log", "-1", "--format=%H%x1f%s%x1f%cI")
+        if last.returncode == 0 and last.stdout.strip():
+            sha, subject, when = (last.stdout.strip().split("\x1f") + ["", "", ""])[:3]
+            head["last_commit"] = {"sha": sha[:9], "subject": subject, "committed_at": when}
+        return head
+
+    def refresh(self, *, full: bool = False, watching: bool = True) -> str | None:
+        """Bring the snapshot up to date. Returns git's complaint, if it had one."""
+        refs = _refs_stamp(self.git_dir)
+        if full or self.head is None or refs != self.refs_stamp:
+            self.head = self._read_head()
+            self.refs_stamp = refs
+
+        if watching and self._layout_changed:
+            # Before draining: a directory that just appeared is in the dirty
+            # set, so the status below covers whatever landed in it before
+            # its watch existed.
+            self._sync_subtrees()
+        dirty, dirs, overflow = self._drain()
+        index = _index_stamp(self.git_dir)
+        if full or overflow or not watching or not self.scanned or index != self.index_stamp:
+            # -uall so an untracked directory counts as its files rather than
+            # as one line: "1 pending" and "1,866 pending" are different
+            # decisions.
+            status = _git("status", "--porcelain", "-uall", "-z", config=_SCAN_CONFIG)
+            if status.returncode != 0:
+                self.scanned = False
+                return status.stderr.strip() or "git status failed"
+            self._replace_all(_parse_porcelain(status.stdout))
+            self.scanned = True
+            self.full_scans += 1
+            # Taken after the scan: git may have written the index itself
+            # (refreshed stat data, the untracked cache), and that is not a
+            # change anyone else made.
+            self.index_stamp = _index_stamp(self.git_dir)
+            return None
+
+        if dirty:
+            specs = [f":(literal){p}" for p in sorted(dirty)]
+            status = _git("status", "--porcelain", "-uall", "-z", "--", *specs)
+            if status.returncode != 0:
+                self.mark_stale()
+                return status.stderr.strip() or "git status failed"
+            self._patch(dirty, dirs, _parse_porcelain(status.stdout))
+            # Same as after a full scan: a narrow status refreshes the index too.
+            self.index_stamp = _index_stamp(self.git_dir)
+        return None
+
+
+_snapshot: StatusSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def _snapshot_for(path: Path) -> tuple[StatusSnapshot, bool]:
+    """The snapshot for ``path`` and whether its watch is live."""
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.root != path:
+            if _snapshot is not None:
+                _snapshot.unwatch()
+            _snapshot = StatusSnapshot(path)
+        snapshot = _snapshot
+    # Watch before the first scan, so nothing changed in between goes unseen.
+    return snapshot, snapshot.watch()
+
+
+def reset_snapshot() -> None:
+    """Drop the cached snapshot and its watch. For tests."""
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is not None:
+            _snapshot.unwatch()
+        _snapshot = None
+
+
+def get_status(limit: int = DEFAULT_FILE_LIMIT, refresh: bool = False) -> dict[str, Any]:
     """What is waiting to be backed up.
 
     Returns ``configured: False`` rather than raising when ``~/.frago`` is not
     a git repository yet — that is a setup state to explain on the page, not an
     error to throw at the user.
+
+    Served from a `StatusSnapshot`; ``refresh=True`` forces the full rescan
+    that otherwise only an index change triggers.
     """
     limit = max(0, min(limit, MAX_FILE_LIMIT))
     path = repo_path()
@@ -208,77 +599,42 @@ def get_status(limit: int = DEFAULT_FILE_LIMIT) -> dict[str, Any]:
     if not (path / ".git").exists():
         return result
 
+    snapshot: StatusSnapshot | None = None
     try:
-        remote = _git("remote", "get-url", "origin")
-        branch = _git("rev-parse", "--abbrev-ref", "HEAD")
-        result["configured"] = True
-        result["remote_url"] = remote.stdout.strip() or None
-        result["branch"] = branch.stdout.strip() or None
-
-        # Ahead/behind against the tracking branch. A repository that has never
-        # been pushed has no upstream; that is a zero, not a failure.
-        counts = _git("rev-list", "--left-right", "--count", "@{upstream}...HEAD")
-        if counts.returncode == 0:
-            parts = counts.stdout.split()
-            if len(parts) == 2:
-                result["behind"], result["ahead"] = int(parts[0]), int(parts[1])
-
-        last = _git("log", "-1", "--format=%H%x1f%s%x1f%cI")
-        if last.returncode == 0 and last.stdout.strip():
-            sha, subject, when = (last.stdout.strip().split("\x1f") + ["", "", ""])[:3]
-            result["last_commit"] = {"sha": sha[:9], "subject": subject, "committed_at": when}
-
-        # -uall so an untracked directory counts as its files rather than as
-        # one line: "1 pending" and "1,866 pending" are different decisions.
-        status = _git("status", "--porcelain", "-uall", "-z")
-        if status.returncode != 0:
-            result["error"] = status.stderr.strip() or "git status failed"
-            return result
-
-        by_status: dict[str, int] = {}
-        by_area: dict[str, int] = {}
-        files: list[dict[str, str]] = []
-        total = 0
-
-        # -z is NUL-separated; a rename additionally carries its old path as a
-        # second NUL-terminated field, which is why this walks an iterator
-        # instead of splitting into a list.
-        entries = iter(status.stdout.split("\0"))
-        for entry in entries:
-            if not entry:
-                continue
-            # Codes are two columns wide and may themselves contain a space
-            # (" M" = modified in the worktree only), so this slices by
-            # position rather than splitting on whitespace.
-            code, name = entry[:2], entry[3:]
-            if not name:
-                continue
-            kind = _classify(code)
-            if kind == "renamed":
-                # Consume the paired old path so it is not counted twice.
-                next(entries, None)
-
-            total += 1
-            by_status[kind] = by_status.get(kind, 0) + 1
-            area = _top_level(name)
-            by_area[area] = by_area.get(area, 0) + 1
-            if len(files) < limit:
-                files.append({"path": name, "status": kind})
-
-        result["pending_total"] = total
-        result["counts"] = by_status
-        result["files"] = files
-        result["truncated"] = total > len(files)
-        result["rollup"] = [
-            {"area": area, "count": count}
-            for area, count in sorted(by_area.items(), key=lambda kv: -kv[1])
-        ]
+        snapshot, watching = _snapshot_for(path)
+        with snapshot.lock:
+            error = snapshot.refresh(full=refresh, watching=watching)
+            result["configured"] = True
+            result.update(snapshot.head or {})
+            if error is not None:
+                result["error"] = error
+                return result
+
+            files: list[dict[str, str]] = []
+            if limit:
+                for name, kind in snapshot.entries.items():
+                    files.append({"path": name, "status": kind})
+                    if len(files) >= limit:
+                        break
+            total = len(snapshot.entries)
+            result["pending_total"] = total
+            result["counts"] = dict(snapshot.by_status)
+            result["files"] = files
+            result["truncated"] = total > len(files)
+            result["rollup"] = [
+                {"area": area, "count": count}
+                for area, count in sorted(snapshot.by_area.items(), key=lambda kv: -kv[1])
+            ]
 
     except subprocess.TimeoutExpired:
         result["error"] = "git 响应超时，仓库可能正被另一个进程占用"
+        if snapshot is not None:
+            snapshot.mark_stale()
     except Exception as e:  # noqa: BLE001 - the page has to render regardless
         logger.warning("Failed to read data repo status: %s", e)
         result["error"] = str(e)
+        if snapshot is not None:
+            snapshot.mark_stale()
 
     return result
 
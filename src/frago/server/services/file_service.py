@@ -3,8 +3,6 @@
 Provides safe access to run instance directories in ~/.frago/projects/.
 """
 
-import contextlib
-import json
 import mimetypes
 import os
 import platform
@@ -14,6 +12,7 @@ from datetime import datetime
 from pathlib import Path
 
 from frago.compat import get_windows_subprocess_kwargs
+from frago.server.services.project_catalog import get_catalog
 
 PROJECTS_DIR = Path.home() / ".frago" / "projects"
 
@@ -34,6 +33,7 @@ class ProjectDetail(ProjectInfo):
     file_count: int
     total_size: int  # bytes
     subdirectories: list[str]
+    last_modified: str = ""  # ISO format, newest file; empty when there are none
 
 
 @dataclass
@@ -54,55 +54,39 @@ class FileService:
     def list_projects() -> list[ProjectInfo]:
         """List all run instances.
 
-        Uses os.scandir() for better Windows performance.
+        Served from the project catalog: metadata files are only re-read
+        when their mtime or size changed.
 
         Returns:
             List of ProjectInfo objects sorted by last_accessed (newest first)
         """
-        if not PROJECTS_DIR.exists():
-            return []
-
-        projects = []
-        # Use os.scandir() instead of iterdir() for better Windows performance
-        # DirEntry.is_dir() uses cached attributes from directory enumeration
-        with os.scandir(PROJECTS_DIR) as entries:
-            for entry in entries:
-                # Windows: entry.is_dir() may raise OSError for symlinks/junctions
-                try:
-                    if not entry.is_dir():
-                        continue
-                except OSError:
-                    continue  # Skip entries that cannot be checked
-
-                metadata_file = Path(entry.path) / ".metadata.json"
-                # Windows: exists() may raise OSError for permission/encoding issues
-                try:
-                    if not metadata_file.exists():
-                        continue  # Skip directories without .metadata.json
-                except OSError:
-                    continue  # Skip directories with inaccessible metadata
-
-                try:
-                    metadata = json.loads(metadata_file.read_text(encoding="utf-8"))
-                    projects.append(ProjectInfo(
-                        run_id=metadata.get("run_id", entry.name),
-                        theme_description=metadata.get("theme_description", ""),
-                        created_at=metadata.get("created_at", ""),
-                        last_accessed=metadata.get("last_accessed", ""),
-                        status=metadata.get("status", "active"),
-                    ))
-                except (json.JSONDecodeError, OSError, UnicodeDecodeError):
-                    continue  # Skip directories with invalid .metadata.json
+        projects = [
+            ProjectInfo(
+                run_id=metadata.get("run_id", name),
+                theme_description=metadata.get("theme_description", ""),
+                created_at=metadata.get("created_at", ""),
+                last_accessed=metadata.get("last_accessed", ""),
+                status=metadata.get("status", "active"),
+            )
+            for name, metadata in get_catalog(PROJECTS_DIR).projects()
+        ]
 
         # Sort by last_accessed (newest first)
         projects.sort(key=lambda p: p.last_accessed, reverse=True)
         return projects
 
+    @staticmethod
+    def refresh_projects() -> list[ProjectInfo]:
+        """Drop the project catalog and list projects from disk again."""
+        get_catalog(PROJECTS_DIR).invalidate()
+        return FileService.list_projects()
+
     @staticmethod
     def get_project(run_id: str) -> ProjectDetail | None:
         """Get detailed project information.
 
-        Uses os.scandir() and os.walk() for better Windows performance.
+        File counts and sizes come from the project catalog's per-directory
+        aggregates; only directories whose mtime changed are rescanned.
 
         Args:
             run_id: Project identifier
@@ -114,41 +98,10 @@ class FileService:
         if project_dir is None or not project_dir.exists():
             return None
 
-        # Load metadata
-        metadata_file = project_dir / ".metadata.json"
-        metadata = {}
-        if metadata_file.exists():
-            with contextlib.suppress(json.JSONDecodeError, OSError, UnicodeDecodeError):
-                metadata = json.loads(metadata_file.read_text(encoding="utf-8"))
-
-        # Get subdirectories list (fast operation)
-        subdirectories = []
-        with os.scandir(project_dir) as entries:
-            for entry in entries:
-                if entry.name.startswith("."):
-                    continue
-                if entry.is_dir():
-                    subdirectories.append(entry.name)
-
-        # Count files and size using os.walk() + scandir() for optimal performance
-        file_count = 0
-        total_size = 0
-        for dirpath, dirnames, _ in os.walk(project_dir):
-            # Skip hidden directories
-            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-            try:
-                with os.scandir(dirpath) as entries:
-                    for entry in entries:
-                        if entry.name.startswith("."):
-                            continue
-                        if entry.is_file():
-                            file_count += 1
-                            # DirEntry.stat() is cached on Windows
-                            with contextlib.suppress(OSError):
-                                total_size += entry.stat().st_size
-            except OSError:
-                pass
+        summary = get_catalog(PROJECTS_DIR).project(run_id)
+        if summary is None:
+            return None
+        metadata = summary.metadata
 
         return ProjectDetail(
             run_id=metadata.get("run_id", run_id),
@@ -156,9 +109,13 @@ class FileService:
             created_at=metadata.get("created_at", ""),
             last_accessed=metadata.get("last_accessed", ""),
             status=metadata.get("status", "active"),
-            file_count=file_count,
-            total_size=total_size,
-            subdirectories=sorted(subdirectories),
+            file_count=summary.file_count,
+            total_size=summary.total_size,
+            subdirectories=summary.subdirectories,
+            last_modified=(
+                datetime.fromtimestamp(summary.newest_mtime).isoformat()
+                if summary.newest_mtime else ""
+            ),
         )
 
     @staticmethod
@@ -0,0 +1,402 @@
+"""Cached catalog of run project directories for the file browser.
+
+``FileService.list_projects`` / ``get_project`` used to read every
+``.metadata.json`` and ``os.walk`` a whole project to count its files on each
+request. The catalog keeps, per project, the parsed metadata (keyed by the
+file's mtime and size) and one aggregate per directory: files directly in it,
+their bytes and newest mtime, and its subdirectories.
+
+Keeping it fresh:
+
+- Adding, removing or renaming an entry changes the directory's mtime, so a
+  query re-stats the project's directories (not its files) and rescans only
+  the ones whose mtime moved.
+- A file rewritten in place leaves its directory's mtime alone. Watcher
+  events mark that directory dirty; without a watcher, the background
+  reconciler's full pass picks the change up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILENAME = ".metadata.json"
+
+# Reconcile interval: 5 minutes
+RECONCILE_INTERVAL_SECONDS = 300
+
+
+@dataclass(slots=True)
+class DirAggregate:
+    """Non-hidden files directly inside one directory."""
+
+    mtime_ns: int  # the directory's own mtime when it was scanned
+    files: int = 0
+    bytes: int = 0
+    newest: float = 0.0  # newest file mtime, 0.0 when there are no files
+    dirs: tuple[str, ...] = ()  # subdirectories, descended into
+    links: tuple[str, ...] = ()  # symlinked directories, listed but not descended into
+
+
+@dataclass
+class ProjectSummary:
+    """Aggregates of one project, as served to ``FileService.get_project``."""
+
+    metadata: dict
+    file_count: int
+    total_size: int
+    newest_mtime: float
+    subdirectories: list[str]
+
+
+@dataclass
+class _Project:
+    meta_stamp: tuple[int, int] | None = None
+    metadata: dict | None = None  # None: missing or invalid .metadata.json
+    tree: dict[str, DirAggregate] = field(default_factory=dict)  # "" is the project root
+    dirty: set[str] = field(default_factory=set)
+
+
+def scan_dir(path: str) -> DirAggregate | None:
+    """Aggregate one directory (not recursive); None if it cannot be listed."""
+    try:
+        # mtime first: a change during the scan leaves it stale, so the
+        # directory is rescanned on the next check rather than missed.
+        agg = DirAggregate(mtime_ns=os.stat(path).st_mtime_ns)
+        dirs: list[str] = []
+        links: list[str] = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_file():
+                        agg.files += 1
+                        with contextlib.suppress(OSError):
+                            st = entry.stat()
+                            agg.bytes += st.st_size
+                            agg.newest = max(agg.newest, st.st_mtime)
+                    elif entry.is_dir():
+                        (links if entry.is_symlink() else dirs).append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    agg.dirs = tuple(sorted(dirs))
+    agg.links = tuple(sorted(links))
+    return agg
+
+
+def _read_metadata(path: str) -> dict | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            metadata = json.load(f)
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+class ProjectCatalog:
+    """Per-directory aggregates and metadata of every project under ``root``.
+
+    Thread-safe: queries run on request threads, the reconciler on a worker
+    thread and watcher callbacks on the observer thread.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.RLock()
+        self._root_mtime_ns: int | None = None
+        self._projects: dict[str, _Project] = {}
+
+    # -- queries -----------------------------------------------------------
+
+    def projects(self) -> list[tuple[str, dict]]:
+        """``(directory name, metadata)`` of every project with valid metadata."""
+        with self._lock:
+            self._sync_root()
+            listed = []
+            for name, project in self._projects.items():
+                self._sync_metadata(name, project)
+                if project.metadata is not None:
+                    listed.append((name, project.metadata))
+            return listed
+
+    def project(self, name: str) -> ProjectSummary | None:
+        """Aggregates of one project, rescanning only directories that changed."""
+        with self._lock:
+            self._sync_root()
+            project = self._projects.get(name)
+            if project is None:
+                # Created within the root's mtime granularity: not listed yet.
+                if not os.path.isdir(os.path.join(self.root, name)):
+                    return None
+                project = self._projects[name] = _Project()
+            self._sync_metadata(name, project)
+            if not self._sync_tree(name, project):
+                return None
+            files = size = 0
+            newest = 0.0
+            for agg in project.tree.values():
+                files += agg.files
+                size += agg.bytes
+                newest = max(newest, agg.newest)
+            top = project.tree[""]
+            return ProjectSummary(
+                metadata=project.metadata or {},
+                file_count=files,
+                total_size=size,
+                newest_mtime=newest,
+                subdirectories=sorted(top.dirs + top.links),
+            )
+
+    # -- maintenance -------------------------------------------------------
+
+    def reconcile(self, full: bool = False) -> None:
+        """Bring every project up to date.
+
+        Args:
+            full: Rescan every directory, catching files rewritten in place
+                when no watcher reports them. Otherwise only directories whose
+                mtime moved (or that were marked dirty) are rescanned.
+        """
+        with self._lock:
+            self._sync_root()
+            names = list(self._projects)
+        for name in names:
+            # One project per lock hold, so queries are not stalled behind a
+            # pass over every project.
+            with self._lock:
+                project = self._projects.get(name)
+                if project is None:
+                    continue
+                self._sync_metadata(name, project)
+                if full:
+                    project.dirty.update(project.tree)
+                self._sync_tree(name, project)
+
+    def invalidate(self) -> None:
+        """Forget everything; the next queries reload from disk."""
+        with self._lock:
+            self._root_mtime_ns = None
+            self._projects.clear()
+
+    def mark_dirty(self, path: str, is_directory: bool = False) -> None:
+        """Note a change at ``path`` (a watcher event) for the next query."""
+        try:
+            rel = Path(path).relative_to(self.root)
+        except ValueError:
+            return
+        if not rel.parts:
+            return
+        with self._lock:
+            project = self._projects.get(rel.parts[0])
+            if project is None:
+                self._root_mtime_ns = None
+                return
+            if len(rel.parts) == 2 and rel.parts[1] == METADATA_FILENAME:
+                project.meta_stamp = None
+            parent = Path(*rel.parts[1:-1]).as_posix() if len(rel.parts) > 2 else ""
+            project.dirty.add(parent)
+            if is_directory and len(rel.parts) > 1:
+                project.dirty.add(Path(*rel.parts[1:]).as_posix())
+
+    # -- internals (lock held) -------------------------------------------------
+
+    def _sync_root(self) -> None:
+        try:
+            mtime_ns = os.stat(self.root).st_mtime_ns
+        except OSError:
+            self._root_mtime_ns = None
+            self._projects.clear()
+            return
+        if mtime_ns == self._root_mtime_ns:
+            return
+        names = set()
+        try:
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    # Windows: entry.is_dir() may raise OSError for symlinks/junctions
+                    try:
+                        if entry.is_dir():
+                            names.add(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return
+        for name in set(self._projects) - names:
+            del self._projects[name]
+        for name in names - set(self._projects):
+            self._projects[name] = _Project()
+        self._root_mtime_ns = mtime_ns
+
+    def _sync_metadata(self, name: str, project: _Project) -> None:
+        path = os.path.join(self.root, name, METADATA_FILENAME)
+        try:
+            st = os.stat(path)
+        except OSError:
+            project.meta_stamp = None
+            project.metadata = None
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != project.meta_stamp:
+            project.metadata = _read_metadata(path)
+            project.meta_stamp = stamp
+
+    def _sync_tree(self, name: str, project: _Project) -> bool:
+        """Refresh the project's directory aggregates; False if it is gone."""
+        base = os.path.join(self.root, name)
+        seen = set()
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            path = os.path.join(base, rel) if rel else base
+            cached = project.tree.get(rel)
+            if cached is None or rel in project.dirty:
+                project.dirty.discard(rel)
+                agg = scan_dir(path)
+            else:
+                try:
+                    unchanged = os.stat(path).st_mtime_ns == cached.mtime_ns
+                except OSError:
+                    unchanged = False
+                agg = cached if unchanged else scan_dir(path)
+            if agg is None:
+                continue
+            seen.add(rel)
+            project.tree[rel] = agg
+            stack.extend(f"{rel}/{d}" if rel else d for d in agg.dirs)
+        for rel in set(project.tree) - seen:
+            del project.tree[rel]
+        project.dirty &= seen
+        if "" not in seen:
+            self._projects.pop(name, None)
+            return False
+        return True
+
+
+_catalog: ProjectCatalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(root: Path) -> ProjectCatalog:
+    """The process-wide catalog of ``root`` (replaced if ``root`` changes)."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None or _catalog.root != Path(root):
+            _catalog = ProjectCatalog(root)
+        return _catalog
+
+
+class ProjectCatalogService:
+    """Keeps the project catalog warm: watcher events plus periodic reconcile."""
+
+    _instance: ProjectCatalogService | None = None
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+        self._watch_target = None
+
+    @classmethod
+    def get_instance(cls) -> ProjectCatalogService:
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._stop_event.clear()
+        self._watch()
+        self._task = asyncio.create_task(self._reconcile_loop())
+        logger.info(
+            "Project catalog service started (interval: %ds, watcher: %s)",
+            RECONCILE_INTERVAL_SECONDS,
+            self._watch_target is not None,
+        )
+
+    async def stop(self) -> None:
+        if self._task is None or self._task.done():
+            return
+        self._stop_event.set()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._unwatch()
+        logger.info("Project catalog service stopped")
+
+    @staticmethod
+    def _catalog() -> ProjectCatalog:
+        from frago.server.services import file_service
+
+        return get_catalog(file_service.PROJECTS_DIR)
+
+    async def _reconcile_loop(self) -> None:
+        while not self._stop_event.is_set():
+            # With a watcher, in-place rewrites are reported and the mtime
+            # check suffices; without one, rescan everything.
+            full = self._watch_target is None
+            try:
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(None, self._catalog().reconcile, full)
+            except Exception as e:
+                logger.debug("Project catalog reconcile failed: %s", e)
+
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(),
+                    timeout=RECONCILE_INTERVAL_SECONDS,
+                )
+                break
+            except TimeoutError:
+                continue
+
+    def _watch(self) -> None:
+        """Watch the projects tree; a watcher that cannot start is not fatal."""
+        catalog = self._catalog()
+        try:
+            from frago.watcher import WatchdogObserverService, WatchTarget
+
+            def on_event(event) -> None:
+                catalog.mark_dirty(event.path, event.is_directory)
+                if event.src_path:
+                    catalog.mark_dirty(event.src_path, event.is_directory)
+
+            catalog.root.mkdir(parents=True, exist_ok=True)
+            target = WatchTarget(
+                path=str(catalog.root),
+                on_created=on_event,
+                on_modified=on_event,
+                on_deleted=on_event,
+                on_moved=on_event,
+                recursive=True,
+            )
+            svc = WatchdogObserverService.get_instance()
+            svc.add(target)
+            svc.start()
+            self._watch_target = target
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Project catalog watch unavailable: %s", e)
+
+    def _unwatch(self) -> None:
+        if self._watch_target is None:
+            return
+        with contextlib.suppress(Exception):
+            from frago.watcher import WatchdogObserverService
+
+            WatchdogObserverService.get_instance().remove(self._watch_target)
+        self._watch_target = None
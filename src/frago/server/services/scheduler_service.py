@@ -15,12 +15,19 @@ agent 能不能启动上。
 给自己或给系统安排定时任务）。
 
 执行完的通知回路见 schedule_executor 模块的模块文档。
+
+调度循环不轮询。任务表常驻内存，按文件的 ``(mtime_ns, size)`` 判断要不要重读；
+每条任务的下次触发时刻只在表变了、或它自己刚跑完时算一次，放进一个小顶堆。循环
+睡到堆顶那一刻，或者被改任务的人叫醒（同进程直接叫，CLI 改文件靠文件监听叫）——
+没有任务到期的那些秒里什么都不做。
 """
 
 import asyncio
 import contextlib
+import heapq
 import json
 import logging
+import os
 import threading
 import time
 import uuid
@@ -31,8 +38,19 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
-# How often the scheduler checks for due recipes (seconds)
-TICK_INTERVAL = 5
+# 最长连睡多久（秒）。正常由堆顶的截止时刻或改表唤醒；这个上限只兜漏掉的
+# 文件系统事件，到点 stat 一次文件而已。
+MAX_SLEEP = 60
+
+# 启动后第一次检查之前的延迟（秒）
+INITIAL_DELAY = 5
+
+# 逾期巡检的间隔（秒）——它盯的是「几个周期都没跑」这种慢故障
+STALENESS_INTERVAL = 1800
+
+# 同一条任务检查过一次之后，至少隔这么久再看（秒）。overlap=skip 被跳过的任务
+# 截止时刻仍在过去，没有这个下限会原地空转。
+RETRY_DELAY = 5
 
 
 def _now_utc() -> datetime:
@@ -76,6 +94,18 @@ class SchedulerService:
         self._pa_enqueue: Callable[[dict[str, Any]], Coroutine] | None = None
         # Track schedules with active (unresolved) tasks for overlap control
         self._active_schedule_ids: set = set()
+        # 表的文件指纹 (ino, mtime_ns, size)；没变就不重读。
+        self._stamp: tuple[int, int, int] | None = None
+        # 到期堆：(触发时刻 epoch 秒, 版本号, 任务 id)。任务的下次触发重算时版本号
+        # 加一，堆里的旧项在弹出时按版本号识别并丢弃，不做原地删除。
+        self._heap: list[tuple[float, int, str]] = []
+        self._heap_versions: dict[str, int] = {}
+        self._heap_seq = 0
+        self._heap_dirty = True
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._wake = asyncio.Event()
+        self._loop_ref: asyncio.AbstractEventLoop | None = None
+        self._watch_target: Any = None
 
     @classmethod
     def get_instance(cls) -> "SchedulerService":
@@ -86,7 +116,13 @@ class SchedulerService:
         return cls._instance
 
     def _load(self) -> None:
-        if self._schedules_path.exists():
+        """把任务表同步到文件的当前内容。文件没变时只花一次 stat。"""
+        stamp = self._file_stamp()
+        if stamp is not None and stamp == self._stamp:
+            return
+        self._stamp = stamp
+        self._heap_dirty = True
+        if stamp is not None:
             try:
                 data = json.loads(self._schedules_path.read_text(encoding="utf-8"))
                 self._schedules = [
@@ -104,6 +140,27 @@ class SchedulerService:
             json.dumps({"schedules": self._schedules}, ensure_ascii=False, indent=2),
             encoding="utf-8",
         )
+        # 自己写的不算变更：内存里本来就是这份。
+        self._stamp = self._file_stamp()
+
+    def _file_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            st = os.stat(self._schedules_path)
+        except OSError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _table_changed(self) -> None:
+        """增删改过任务：到期堆作废，叫醒调度循环重排。可从任意线程调用。"""
+        self._heap_dirty = True
+        self._wakeup()
+
+    def _wakeup(self) -> None:
+        loop = self._loop_ref
+        if loop is None or loop.is_closed():
+            return
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(self._wake.set)
 
     # --- PA integration ---
 
@@ -246,6 +303,7 @@ class SchedulerService:
         }
         self._schedules.append(schedule)
         self._save()
+        self._table_changed()
         return schedule
 
     def remove_schedule(self, schedule_id: str) -> bool:
@@ -254,6 +312,7 @@ class SchedulerService:
         self._schedules = [s for s in self._schedules if s["id"] != schedule_id]
         if len(self._schedules) < before:
             self._save()
+            self._table_changed()
             return True
         return False
 
@@ -263,6 +322,7 @@ class SchedulerService:
             if s["id"] == schedule_id:
                 s["enabled"] = not s["enabled"]
                 self._save()
+                self._table_changed()
                 return s["enabled"]
         return None
 
@@ -278,14 +338,18 @@ class SchedulerService:
             logger.warning("Recipe scheduler already running")
             return
         self._stop_event.clear()
+        self._loop_ref = asyncio.get_running_loop()
+        self._watch_file()
         self._task = asyncio.create_task(self._loop())
         count = len(self._schedules)
         logger.info(f"Recipe scheduler started ({count} schedule{'s' if count != 1 else ''})")
 
     async def stop(self) -> None:
+        self._unwatch_file()
         if self._task is None or self._task.done():
             return
         self._stop_event.set()
+        self._wake.set()
         self._task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await self._task
@@ -295,6 +359,45 @@ class SchedulerService:
     def is_running(self) -> bool:
         return self._task is not None and not self._task.done()
 
+    def _watch_file(self) -> None:
+        """CLI 在另一个进程里改表，靠监听文件把睡着的循环叫醒。
+
+        监听起不来（没有 watchdog、目录不可读）不致命：循环最多睡 ``MAX_SLEEP``，
+        醒来 stat 一次照样能发现改动，只是慢一点。
+        """
+        if self._watch_target is not None:
+            return
+        try:
+            from frago.watcher import WatchdogObserverService, WatchTarget
+
+            self._schedules_path.parent.mkdir(parents=True, exist_ok=True)
+            target = WatchTarget(
+                path=str(self._schedules_path.parent),
+                patterns=[self._schedules_path.name],
+                on_created=self._on_file_event,
+                on_modified=self._on_file_event,
+                on_moved=self._on_file_event,
+            )
+            svc = WatchdogObserverService.get_instance()
+            svc.add(target)
+            svc.start()
+            self._watch_target = target
+        except Exception as e:  # noqa: BLE001
+            logger.debug("[scheduler] schedules.json watch unavailable: %s", e)
+
+    def _unwatch_file(self) -> None:
+        if self._watch_target is None:
+            return
+        with contextlib.suppress(Exception):
+            from frago.watcher import WatchdogObserverService
+
+            WatchdogObserverService.get_instance().remove(self._watch_target)
+        self._watch_target = None
+
+    def _on_file_event(self, _event: Any) -> None:
+        # 观察者线程上：只叫醒，读文件交给循环（它会先比指纹，自己写的不重读）。
+        self._wakeup()
+
     def _is_due(self, schedule: dict[str, Any], now: datetime) -> bool:
         """Check if a schedule is due for triggering."""
         interval = schedule.get("interval_seconds")
@@ -387,42 +490,102 @@ class SchedulerService:
                 schedule["id"], overdue, result.get("status"),
             )
 
+    # --- 到期堆 ---
+
+    def _deadline(self, schedule: dict[str, Any]) -> float | None:
+        """这条任务下次该被看一眼的时刻（epoch 秒）。停用的、永不到期的返回 None。
+
+        到了 ``start_at`` 才开始，过了 ``end_at`` 要被停用——这两个边界也是截止时刻，
+        否则一条永不到期的过期任务就一直没人去停它。
+        """
+        if not schedule.get("enabled", True):
+            return None
+        end = _parse_dt(schedule.get("end_at"))
+        next_run = self._next_run_at(schedule)
+        if next_run is None:
+            return end.timestamp() + 0.001 if end else None
+        start = _parse_dt(schedule.get("start_at"))
+        if start and next_run < start:
+            next_run = start
+        if end and next_run > end:
+            return end.timestamp() + 0.001
+        return next_run.timestamp()
+
+    def _push(self, schedule: dict[str, Any], not_before: float = 0.0) -> None:
+        self._heap_seq += 1
+        self._heap_versions[schedule["id"]] = self._heap_seq
+        deadline = self._deadline(schedule)
+        if deadline is None:
+            return
+        heapq.heappush(self._heap, (max(deadline, not_before), self._heap_seq, schedule["id"]))
+
+    def _rebuild_heap(self) -> None:
+        """表变了：每条任务的下次触发时刻重算一遍。只在改表之后发生。"""
+        self._heap = []
+        self._heap_versions = {}
+        self._by_id = {s["id"]: s for s in self._schedules}
+        for schedule in self._schedules:
+            self._push(schedule)
+        self._heap_dirty = False
+
+    async def _run_due(self) -> None:
+        """弹出所有到点的任务逐个处理，处理完按它的新状态重新入堆。"""
+        now = _now_utc()
+        now_ts = now.timestamp()
+        while self._heap and self._heap[0][0] <= now_ts and not self._heap_dirty:
+            _at, version, schedule_id = heapq.heappop(self._heap)
+            if self._heap_versions.get(schedule_id) != version:
+                continue  # 这一项已被后来的重算取代
+            schedule = self._by_id.get(schedule_id)
+            if schedule is None or not schedule.get("enabled", True):
+                continue
+            start = _parse_dt(schedule.get("start_at"))
+            end = _parse_dt(schedule.get("end_at"))
+            if start and now < start:
+                self._push(schedule)
+                continue
+            if end and now > end:
+                # Auto-disable expired schedules
+                schedule["enabled"] = False
+                self._save()
+                logger.info("[scheduler] Schedule %s expired (end_at reached), disabled", schedule["id"])
+                continue
+            if self._is_due(schedule, now):
+                await self._execute(schedule)
+            # 跳过（overlap）或没跑成时截止时刻还在过去，压到 RETRY_DELAY 之后再看，
+            # 与旧版五秒一拍的重试节奏一致，不在这里空转。
+            self._push(schedule, not_before=now_ts + RETRY_DELAY)
+
+    def _sleep_for(self, next_staleness_check: float) -> float:
+        delay = min(float(MAX_SLEEP), next_staleness_check - time.monotonic())
+        if self._heap:
+            delay = min(delay, self._heap[0][0] - time.time())
+        return max(delay, 0.0)
+
     async def _loop(self) -> None:
-        await asyncio.sleep(5)  # initial delay
+        await asyncio.sleep(INITIAL_DELAY)
         last_staleness_check = 0.0
         while not self._stop_event.is_set():
-            # Reload schedules each tick (CLI may have added new ones)
+            self._wake.clear()
+            # CLI may have added new ones — one stat tells whether to reread.
             self._load()
-            now = _now_utc()
+            if self._heap_dirty:
+                self._rebuild_heap()
 
-            # 逾期巡检半小时一次就够——它盯的是「几个周期都没跑」这种慢故障
-            if time.monotonic() - last_staleness_check > 1800:
+            if time.monotonic() - last_staleness_check > STALENESS_INTERVAL:
                 last_staleness_check = time.monotonic()
                 with contextlib.suppress(Exception):
                     await self._check_staleness()
-            for schedule in self._schedules:
-                if not schedule.get("enabled", True):
-                    continue
-                start = _parse_dt(schedule.get("start_at"))
-                end = _parse_dt(schedule.get("end_at"))
-                if start and now < start:
-                    continue
-                if end and now > end:
-                    # Auto-disable expired schedules
-                    schedule["enabled"] = False
-                    self._save()
-                    logger.info("[scheduler] Schedule %s expired (end_at reached), disabled", schedule["id"])
-                    continue
-                if self._is_due(schedule, now):
-                    await self._execute(schedule)
-            # Wait for tick or stop
-            try:
+            await self._run_due()
+            if self._heap_dirty:
+                continue  # 执行途中表被改过，先重排再睡
+
+            # Sleep until the earliest deadline, an edit, or stop
+            with contextlib.suppress(TimeoutError):
                 await asyncio.wait_for(
-                    self._stop_event.wait(), timeout=TICK_INTERVAL
+                    self._wake.wait(),
+                    timeout=self._sleep_for(last_staleness_check + STALENESS_INTERVAL),
                 )
-                break
-            except TimeoutError:
-                continue
 
     async def _execute(self, schedule: dict[str, Any]) -> None:
         """到期分流：命令和配方 frago 自己跑，自然语言任务交给 PA。"""
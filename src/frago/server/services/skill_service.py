@@ -3,19 +3,27 @@
 Provides functionality to list and load skills from ~/.claude/skills/ directory.
 """
 
+import asyncio
+import contextlib
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-import frontmatter
+from frago.skills.registry import read_frontmatter, save_frontmatter_cache
 
 logger = logging.getLogger(__name__)
 
+# Watcher events arriving within this window collapse into one refresh
+REFRESH_DEBOUNCE_SECONDS = 0.5
+
 
 class SkillService:
     """Service for skill management operations.
 
-    Note: This service always loads fresh from filesystem.
+    Note: This service always lists the filesystem, but SKILL.md frontmatter
+    is only re-parsed when the file changed (see ``frago.skills.registry``).
     For cached access via WebSocket updates, use StateManager.get_skills().
     """
 
@@ -48,6 +56,7 @@ class SkillService:
             logger.debug("Skills directory does not exist: %s", skills_dir)
             return skills
 
+        seen: set[str] = set()
         for skill_path in skills_dir.iterdir():
             if not skill_path.is_dir():
                 continue
@@ -56,28 +65,135 @@ class SkillService:
             if not skill_file.exists():
                 continue
 
-            try:
-                post = frontmatter.load(skill_file)
-                name = post.get("name", skill_path.name)
-                description = post.get("description")
-
-                skills.append({
-                    "name": name,
-                    "description": description,
-                    "file_path": str(skill_file),
-                })
-            except Exception as e:
-                logger.warning(
-                    "Failed to parse skill file %s: %s",
-                    skill_file,
-                    e,
-                )
+            seen.add(str(skill_file))
+            metadata, _ = read_frontmatter(skill_file, warn=logger)
+            if metadata is None:
                 # Fallback: use directory name
                 skills.append({
                     "name": skill_path.name,
                     "description": None,
                     "file_path": str(skill_file),
                 })
+                continue
+
+            skills.append({
+                "name": metadata.get("name", skill_path.name),
+                "description": metadata.get("description"),
+                "file_path": str(skill_file),
+            })
 
+        save_frontmatter_cache(skills_dir, seen)
         logger.debug("Loaded %d skills from %s", len(skills), skills_dir)
         return skills
+
+
+class SkillWatchService:
+    """Keeps StateManager's skill list live: watcher events trigger a refresh.
+
+    A refresh re-lists the skills directory, but only SKILL.md files whose
+    size or mtime changed are parsed again, so reacting to every burst of
+    events is cheap. Without a watcher, skills refresh on the existing paths
+    (settings changes, ``refresh_all``) as before.
+    """
+
+    _instance: Optional["SkillWatchService"] = None
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._changed = asyncio.Event()
+        self._watch_target = None
+        self.skills_dir = Path.home() / ".claude" / "skills"
+
+    @classmethod
+    def get_instance(cls) -> "SkillWatchService":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._changed.clear()
+        self._watch()
+        self._task = asyncio.create_task(self._refresh_loop())
+        logger.info("Skill watch service started (watcher: %s)", self._watch_target is not None)
+
+    async def stop(self) -> None:
+        if self._task is None or self._task.done():
+            return
+        self._unwatch()
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        logger.info("Skill watch service stopped")
+
+    async def _refresh_loop(self) -> None:
+        from frago.server.state import StateManager
+
+        while True:
+            await self._changed.wait()
+            await asyncio.sleep(REFRESH_DEBOUNCE_SECONDS)
+            self._changed.clear()
+            state_manager = StateManager.get_instance()
+            if not state_manager.is_initialized():
+                continue
+            try:
+                await state_manager.refresh_skills(broadcast=True)
+            except Exception as e:
+                logger.debug("Skill refresh failed: %s", e)
+
+    def _is_relevant(self, path: str | None) -> bool:
+        """A skill directory itself, or a SKILL.md directly inside one."""
+        if not path:
+            return False
+        try:
+            rel = Path(path).relative_to(self.skills_dir).parts
+        except ValueError:
+            return False
+        return len(rel) == 1 or (len(rel) == 2 and rel[1] == "SKILL.md")
+
+    def _on_event(self, event) -> None:
+        # Observer thread: only flag the change, the refresh runs on the loop.
+        if not (self._is_relevant(event.path) or self._is_relevant(event.src_path)):
+            return
+        if self._loop is not None:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                self._loop.call_soon_threadsafe(self._changed.set)
+
+    def _watch(self) -> None:
+        """Watch the skills tree; a missing directory or watcher is not fatal."""
+        if not os.path.isdir(self.skills_dir):
+            logger.debug("Skills directory does not exist, not watching: %s", self.skills_dir)
+            return
+        try:
+            from frago.watcher import WatchdogObserverService, WatchTarget
+
+            target = WatchTarget(
+                path=str(self.skills_dir),
+                on_created=self._on_event,
+                on_modified=self._on_event,
+                on_deleted=self._on_event,
+                on_moved=self._on_event,
+                recursive=True,
+            )
+            svc = WatchdogObserverService.get_instance()
+            svc.add(target)
+            svc.start()
+            self._watch_target = target
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Skill watch unavailable: %s", e)
+
+    def _unwatch(self) -> None:
+        if self._watch_target is None:
+            return
+        with contextlib.suppress(Exception):
+            from frago.watcher import WatchdogObserverService
+
+            WatchdogObserverService.get_instance().remove(self._watch_target)
+        self._watch_target = None
@@ -4,11 +4,22 @@ Merges events from multiple data sources into a unified timeline:
 1. Pipeline trace (trace JSONL — decision, reply, agent lifecycle)
 
 Returns TimelineAggEvent list sorted by timestamp, with humanized title/subtitle.
+
+Queries are served by ``TimelineFeed``, a materialized, bounded ring of
+humanized events fed by the trace writer and checkpointed next to the traces.
 """
 
+import bisect
+import contextlib
+import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -102,16 +113,315 @@ def humanize_event(event_type: str, data: dict) -> dict:
     }
 
 
-def get_timeline(since: str | None = None, limit: int = 50) -> list[dict]:
-    """Get aggregated timeline events from trace JSONL.
+def _agg_event(event: dict) -> TimelineAggEvent:
+    """Humanize one pa_events-compatible trace event."""
+    et = event.get("event_type", "")
+    data = event.get("data", {})
+    ts = event.get("timestamp", "")
+    title, subtitle = _humanize_pa_event(et, data)
+    return TimelineAggEvent(
+        id=f"pa-{et}-{ts}",
+        timestamp=ts,
+        event_type=_TYPE_MAP.get(et, et),
+        source="trace",
+        title=title,
+        subtitle=subtitle,
+        task_id=data.get("task_id"),
+        run_id=data.get("run_id"),
+        msg_id=data.get("msg_id"),
+        raw_data=data,
+    )
 
-    Args:
-        since: ISO timestamp — only return events after this time
-        limit: Max number of events to return
 
-    Returns:
-        List of TimelineAggEvent dicts, sorted by timestamp (oldest first)
+# ---------------------------------------------------------------------------
+# Materialized feed
+# ---------------------------------------------------------------------------
+
+# Humanized events kept in memory (newest win)
+FEED_CAPACITY = 2000
+
+# Checkpoint file, next to the trace files it summarizes
+CHECKPOINT_FILENAME = ".timeline-feed.json"
+CHECKPOINT_VERSION = 1
+
+# Appends between background checkpoints
+CHECKPOINT_EVERY = 100
+
+# Bytes re-read before each checkpointed trace offset on restore
+CHECKPOINT_REWIND = 16 * 1024
+
+# task_id → msg_id pairs remembered for msg_id resolution
+TASK_MSG_MEMORY = 10_000
+
+# Trace files read at bootstrap, as load_trace_events does
+LOOKBACK_DAYS = 7
+
+
+class TimelineFeed:
+    """Bounded, sorted ring of humanized timeline events.
+
+    Fed by the trace writer's append listener, so a query no longer scans
+    days of trace JSONL and humanizes every event: ``since`` / ``limit`` are
+    answered by binary search over the ring. On start the ring is restored
+    from a compact checkpoint plus whatever the trace files gained since it
+    was written (only the first start ever scans the full lookback window).
+    ``subscribe`` pushes each new event to in-process consumers.
     """
+
+    def __init__(self, trace_dir: Path, capacity: int = FEED_CAPACITY):
+        self.trace_dir = trace_dir
+        self.checkpoint_file = trace_dir / CHECKPOINT_FILENAME
+        self.capacity = capacity
+        self._lock = threading.RLock()
+        self._events: list[TimelineAggEvent] = []
+        self._keys: list[str] = []  # timestamps, parallel to _events
+        # Newest timestamp ever evicted: queries reaching back past it cannot
+        # be answered from the ring alone.
+        self._dropped_until: str | None = None
+        self._task_msg: OrderedDict[str, str] = OrderedDict()
+        self._subscribers: list[Callable[[dict], None]] = []
+        self._since_checkpoint = 0
+        self._checkpointing = False
+        self._started = False
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> "TimelineFeed":
+        """Restore the ring and start following trace appends. Idempotent."""
+        from frago.telemetry import trace as trace_mod
+
+        with self._lock:
+            if self._started:
+                return self
+            self._started = True
+            # Listen first: an entry appended during the restore is then seen
+            # twice at worst, and _insert drops the duplicate.
+            trace_mod.add_append_listener(self._on_append)
+            offsets = self._load_checkpoint()
+            self._read_traces(offsets)
+        return self
+
+    def stop(self) -> None:
+        """Stop following appends and write a checkpoint."""
+        from frago.telemetry import trace as trace_mod
+
+        trace_mod.remove_append_listener(self._on_append)
+        with self._lock:
+            if self._started:
+                self.checkpoint()
+            self._started = False
+
+    # -- feeding -----------------------------------------------------------
+
+    def _remember_task_msg(self, entry: dict) -> None:
+        tid = entry.get("task_id", "")
+        mid = entry.get("msg_id", "")
+        if tid and mid and tid not in self._task_msg:
+            self._task_msg[tid] = mid
+            if len(self._task_msg) > TASK_MSG_MEMORY:
+                self._task_msg.popitem(last=False)
+
+    def _on_append(self, entry: dict) -> None:
+        from frago.telemetry.trace import timeline_event_from_entry
+
+        with self._lock:
+            self._remember_task_msg(entry)
+            event = timeline_event_from_entry(entry, self._task_msg)
+            if event is None:
+                return
+            agg = _agg_event(event)
+            if not self._insert(agg):
+                return
+            subscribers = list(self._subscribers)
+            self._since_checkpoint += 1
+            if self._since_checkpoint >= CHECKPOINT_EVERY and not self._checkpointing:
+                self._checkpointing = True
+                threading.Thread(
+                    target=self._background_checkpoint, name="timeline-checkpoint", daemon=True
+                ).start()
+        payload = agg.to_dict()
+        for callback in subscribers:
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.debug("Timeline subscriber failed: %s", e)
+
+    def _insert(self, agg: TimelineAggEvent) -> bool:
+        """Insert in timestamp order; False if already present or too old to keep."""
+        if self._dropped_until is not None and agg.timestamp <= self._dropped_until:
+            return False
+        lo = bisect.bisect_left(self._keys, agg.timestamp)
+        hi = bisect.bisect_right(self._keys, agg.timestamp, lo)
+        if any(e.id == agg.id for e in self._events[lo:hi]):
+            return False
+        self._keys.insert(hi, agg.timestamp)
+        self._events.insert(hi, agg)
+        if len(self._events) > self.capacity:
+            # Evict in chunks so eviction stays amortized O(1) per append.
+            excess = len(self._events) - self.capacity + self.capacity // 10
+            self._dropped_until = self._keys[excess - 1]
+            del self._keys[:excess]
+            del self._events[:excess]
+        return True
+
+    # -- queries -----------------------------------------------------------
+
+    def query(self, since: str | None = None, limit: int = 50) -> list[dict] | None:
+        """Events after ``since`` (oldest first), at most the newest ``limit``.
+
+        Returns None when the ring cannot answer exactly — events that would
+        belong to the answer were already evicted.
+        """
+        with self._lock:
+            start = bisect.bisect_right(self._keys, since) if since else 0
+            available = len(self._events) - start
+            reaches_evicted = self._dropped_until is not None and (
+                since is None or since < self._dropped_until
+            )
+            if (limit <= 0 or available < limit) and reaches_evicted:
+                return None
+            begin = max(start, len(self._events) - limit) if limit > 0 else start
+            return [e.to_dict() for e in self._events[begin:]]
+
+    def subscribe(self, callback: Callable[[dict], None]) -> Callable[[], None]:
+        """Call ``callback(event_dict)`` for every new event; returns an unsubscribe function.
+
+        Callbacks run on the thread that wrote the trace entry: they must be
+        quick and thread-safe (e.g. ``loop.call_soon_threadsafe``).
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    # -- persistence -------------------------------------------------------
+
+    def _trace_files(self) -> list[Path]:
+        today = datetime.now().date()
+        return [
+            self.trace_dir / f"trace-{(today - timedelta(days=d)).strftime('%Y-%m-%d')}.jsonl"
+            for d in reversed(range(LOOKBACK_DAYS))
+        ]
+
+    def _read_traces(self, offsets: dict[str, int]) -> None:
+        """Fold trace lines past ``offsets`` into the ring (two passes, like load_trace_events)."""
+        from frago.telemetry.trace import timeline_event_from_entry
+
+        entries = []
+        for path in self._trace_files():
+            # Re-read a little before the checkpointed offset: an entry written
+            # just before the checkpoint may not have reached the listener yet.
+            # Duplicates are dropped by _insert; a cut first line fails to parse.
+            offset = max(0, offsets.get(path.name, 0) - CHECKPOINT_REWIND)
+            try:
+                with open(path, "rb") as f:
+                    f.seek(offset)
+                    chunk = f.read()
+            except OSError:
+                continue
+            for line in chunk[:chunk.rfind(b"\n") + 1].splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and entry.get("ts"):
+                    entries.append(entry)
+
+        for entry in entries:
+            self._remember_task_msg(entry)
+        for entry in entries:
+            event = timeline_event_from_entry(entry, self._task_msg)
+            if event is not None:
+                self._insert(_agg_event(event))
+
+    def _load_checkpoint(self) -> dict[str, int]:
+        """Restore ring state; returns the trace offsets it covers ({} if none)."""
+        try:
+            data = json.loads(self.checkpoint_file.read_text(encoding="utf-8"))
+            if data.get("version") != CHECKPOINT_VERSION:
+                return {}
+            events = [TimelineAggEvent(**e) for e in data["events"]]
+            offsets = {str(k): int(v) for k, v in data["offsets"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        self._events = events
+        self._keys = [e.timestamp for e in events]
+        self._dropped_until = data.get("dropped_until")
+        self._task_msg = OrderedDict(data.get("task_msg", {}))
+        return offsets
+
+    def checkpoint(self) -> None:
+        """Write the ring, the task_id → msg_id memory and the covered trace offsets."""
+        with self._lock:
+            offsets = {}
+            for path in self._trace_files():
+                try:
+                    offsets[path.name] = path.stat().st_size
+                except OSError:
+                    continue
+            data = {
+                "version": CHECKPOINT_VERSION,
+                "events": [asdict(e) for e in self._events],
+                "dropped_until": self._dropped_until,
+                "task_msg": dict(self._task_msg),
+                "offsets": offsets,
+            }
+            self._since_checkpoint = 0
+        tmp = self.checkpoint_file.with_name(f"{self.checkpoint_file.name}.{os.getpid()}.tmp")
+        try:
+            self.trace_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, ensure_ascii=False, default=str), encoding="utf-8")
+            os.replace(tmp, self.checkpoint_file)
+        except OSError as e:
+            logger.debug("Failed to write timeline checkpoint: %s", e)
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+
+    def _background_checkpoint(self) -> None:
+        try:
+            self.checkpoint()
+        finally:
+            self._checkpointing = False
+
+
+_feed: TimelineFeed | None = None
+_feed_lock = threading.Lock()
+
+
+def get_feed() -> TimelineFeed:
+    """The process-wide feed for the current trace directory, started on first use."""
+    global _feed
+    from frago.telemetry import trace as trace_mod
+
+    with _feed_lock:
+        if _feed is not None and _feed.trace_dir != trace_mod.TRACE_DIR:
+            _feed.stop()
+            _feed = None
+        if _feed is None:
+            _feed = TimelineFeed(trace_mod.TRACE_DIR)
+        feed = _feed
+    return feed.start()
+
+
+def stop_feed() -> None:
+    """Checkpoint and drop the process-wide feed (server shutdown, tests)."""
+    global _feed
+    with _feed_lock:
+        feed, _feed = _feed, None
+    if feed is not None:
+        feed.stop()
+
+
+def _scan_timeline(since: str | None, limit: int) -> list[dict]:
+    """Build the timeline straight from the trace files."""
     since_dt = datetime.fromisoformat(since) if since else None
 
     try:
@@ -121,29 +431,35 @@ def get_timeline(since: str | None = None, limit: int = 50) -> list[dict]:
         logger.debug("Failed to load trace events: %s", e)
         trace_events = []
 
-    all_events: list[TimelineAggEvent] = []
-    for entry in trace_events:
-        et = entry.get("event_type", "")
-        data = entry.get("data", {})
-        ts = entry.get("timestamp", "")
-        title, subtitle = _humanize_pa_event(et, data)
-
-        all_events.append(TimelineAggEvent(
-            id=f"pa-{et}-{ts}",
-            timestamp=ts,
-            event_type=_TYPE_MAP.get(et, et),
-            source="trace",
-            title=title,
-            subtitle=subtitle,
-            task_id=data.get("task_id"),
-            run_id=data.get("run_id"),
-            msg_id=data.get("msg_id"),
-            raw_data=data,
-        ))
-
+    all_events = [_agg_event(entry) for entry in trace_events]
     all_events.sort(key=lambda e: e.timestamp)
 
     if since_dt:
         all_events = [e for e in all_events if e.timestamp > since]
 
     return [e.to_dict() for e in all_events[-limit:]]
+
+
+def get_timeline(since: str | None = None, limit: int = 50) -> list[dict]:
+    """Get aggregated timeline events.
+
+    Answered from the materialized feed; falls back to scanning the trace
+    JSONL only when the query reaches past what the feed still holds.
+
+    Args:
+        since: ISO timestamp — only return events after this time
+        limit: Max number of events to return
+
+    Returns:
+        List of TimelineAggEvent dicts, sorted by timestamp (oldest first)
+    """
+    if since:
+        datetime.fromisoformat(since)  # reject malformed input as before
+    try:
+        events = get_feed().query(since, limit)
+    except Exception as e:
+        logger.debug("Timeline feed unavailable: %s", e)
+        events = None
+    if events is not None:
+        return events
+    return _scan_timeline(since, limit)
@@ -2,13 +2,26 @@
 
 Manages content preparation and resources for the viewer functionality.
 Content is stored in ~/.frago/viewer/ with automatic cleanup of old content.
+
+Rendered content is cached and content-addressed. A source file is looked up
+by its stat (path, size, mtime_ns) plus the render options and the renderer
+version; only when that misses is the file read and hashed, and only when the
+hash misses too is it rendered. Re-opening an unchanged document therefore
+costs a stat. Files the page needs beside its HTML (the media itself, the
+`images/`-style directories next to a document) are hard-linked into the
+content directory rather than copied, falling back to a reflink and then a
+copy. Entries are evicted least-recently-used under a disk budget.
 """
 
+import contextlib
 import hashlib
+import json
+import os
 import shutil
+import threading
 import time
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 # Viewer directory structure
 VIEWER_DIR = Path.home() / ".frago" / "viewer"
@@ -18,18 +31,250 @@ RESOURCES_DIR = VIEWER_DIR / "resources"
 # Content expiration (24 hours in seconds)
 CONTENT_MAX_AGE = 24 * 60 * 60
 
+# Disk the render cache may hold. Linked files cost nothing against it; what
+# counts is what was actually written (the HTML, and any copy a link could not
+# replace).
+CONTENT_BUDGET_BYTES = 512 * 1024 * 1024
+
+# A cache hit rewrites the index at most this often per entry. Eviction works
+# in hours, so a minute of slack in "last used" changes nothing.
+USED_WRITE_INTERVAL = 60.0
+
+# Bump when the rendered HTML would change for the same input, so that cached
+# renders from before the change are not served.
+RENDERER_VERSION = 1
+
 # Media type extensions
 VIDEO_EXTENSIONS = {".mp4", ".webm", ".mov", ".avi", ".mkv", ".m4v"}
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".bmp", ".ico"}
 AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg", ".m4a", ".flac", ".aac"}
 THREE_EXTENSIONS = {".gltf", ".glb"}
 
+# Directories next to a document that its relative links point into.
+RESOURCE_SUBDIRS = ("images", "assets", "img", "media", "figures", "videos", "styles")
+
+RESOURCE_DIRS = ("reveal", "highlight", "pdfjs", "mermaid", "three")
+
+_FICLONE = 0x40049409  # linux/fs.h
+
+_HASH_CHUNK = 1024 * 1024
+
 
 def get_package_resources_path() -> Path:
     """Get path to viewer resources in the package."""
     return Path(__file__).parent.parent.parent / "resources" / "viewer"
 
 
+def _renderer_version() -> str:
+    try:
+        from frago import __version__
+    except ImportError:
+        __version__ = "0.0.0"
+    return f"{RENDERER_VERSION}:{__version__}"
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone ``src`` into ``dst`` sharing extents (btrfs, xfs). False if unsupported."""
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - frago targets macOS and Linux
+        return False
+    try:
+        with open(src, "rb") as fin, open(dst, "wb") as fout:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+        return True
+    except OSError:
+        with contextlib.suppress(OSError):
+            dst.unlink()
+        return False
+
+
+def _link_or_copy(src: Path, dst: Path) -> int:
+    """Materialize ``src`` at ``dst``; returns the bytes this wrote to disk.
+
+    A hard link rather than a symlink: the viewer route resolves every path and
+    refuses anything outside ~/.frago/viewer, which a symlink would be. Linking
+    fails across filesystems (and under protected_hardlinks for files this user
+    does not own); a reflink is tried next, a copy last.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return 0
+    except OSError:
+        pass
+    if _reflink(src, dst):
+        return 0
+    shutil.copy2(src, dst)
+    return dst.stat().st_size
+
+
+def _materialize_tree(src: Path, dst: Path) -> int:
+    """Recreate the directory ``src`` at ``dst`` from links; returns bytes written."""
+    written = 0
+    if dst.exists():
+        shutil.rmtree(dst, ignore_errors=True)
+    for root, dirs, files in os.walk(src):
+        rel = Path(root).relative_to(src)
+        target = dst / rel
+        target.mkdir(parents=True, exist_ok=True)
+        dirs[:] = [d for d in dirs if not (Path(root) / d).is_symlink()]
+        for name in files:
+            try:
+                written += _link_or_copy(Path(root) / name, target / name)
+            except OSError:
+                continue
+    return written
+
+
+class _RenderIndex:
+    """Which content directory holds which render, and when it was last used.
+
+    Persisted next to the content (``content/.index.json``) so the CLI's
+    `frago view` and the server share one cache. Kept in memory between calls;
+    the file is reread when another process has rewritten it since.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._path: Path | None = None
+        self._stamp: tuple[int, int] | None = None
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._by_key: dict[str, str] = {}
+        self._by_digest: dict[str, str] = {}
+
+    def _file(self) -> Path:
+        return CONTENT_DIR / ".index.json"
+
+    def _sync(self) -> None:
+        """Load the index for the current CONTENT_DIR, if it is new or changed."""
+        path = self._file()
+        try:
+            st = path.stat()
+            stamp: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if path == self._path and stamp == self._stamp:
+            return
+        entries: dict[str, dict[str, Any]] = {}
+        if stamp is not None:
+            try:
+                loaded = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict) and isinstance(loaded.get("entries"), dict):
+                    entries = loaded["entries"]
+            except (OSError, json.JSONDecodeError):
+                entries = {}
+        self._entries = entries
+        self._path = path
+        self._stamp = stamp
+        self._by_key = {e["key"]: cid for cid, e in self._entries.items() if e.get("key")}
+        self._by_digest = {e["digest"]: cid for cid, e in self._entries.items() if e.get("digest")}
+
+    def _save(self) -> None:
+        path = self._file()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".index.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"entries": self._entries}), encoding="utf-8")
+        os.replace(tmp, path)
+        st = path.stat()
+        self._stamp = (st.st_mtime_ns, st.st_size)
+
+    def _live(self, content_id: str | None) -> str | None:
+        if content_id is None:
+            return None
+        if not (CONTENT_DIR / content_id / "index.html").is_file():
+            self._forget(content_id)
+            return None
+        now = time.time()
+        if now - self._entries[content_id].get("used", 0) < USED_WRITE_INTERVAL:
+            return content_id
+        # Eviction reads the saved index, and may run in another process, so a
+        # hit is only a use once it is on disk. Re-read first: the write must
+        # not undo a render or an eviction another process saved meanwhile.
+        self._sync()
+        entry = self._entries.get(content_id)
+        if entry is None:
+            return None
+        entry["used"] = now
+        with contextlib.suppress(OSError):
+            self._save()
+        return content_id
+
+    def _forget(self, content_id: str) -> None:
+        entry = self._entries.pop(content_id, None)
+        if entry is None:
+            return
+        if self._by_key.get(entry.get("key")) == content_id:
+            del self._by_key[entry["key"]]
+        if self._by_digest.get(entry.get("digest")) == content_id:
+            del self._by_digest[entry["digest"]]
+
+    def by_key(self, key: str) -> str | None:
+        with self._lock:
+            if self._path != self._file():
+                self._sync()
+            found = self._live(self._by_key.get(key))
+            if found is None:
+                # Another process may have rendered it since we last looked.
+                self._sync()
+                found = self._live(self._by_key.get(key))
+            return found
+
+    def by_digest(self, digest: str) -> str | None:
+        with self._lock:
+            self._sync()
+            return self._live(self._by_digest.get(digest))
+
+    def known(self, content_id: str) -> bool:
+        with self._lock:
+            self._sync()
+            return content_id in self._entries
+
+    def record(
+        self, content_id: str, *, key: str | None, digest: str, size: int | None = None
+    ) -> None:
+        with self._lock:
+            self._sync()
+            entry = self._entries.setdefault(content_id, {"size": 0})
+            old_key = entry.get("key")
+            if old_key and self._by_key.get(old_key) == content_id:
+                del self._by_key[old_key]
+            entry.update({"key": key, "digest": digest, "used": time.time()})
+            if size is not None:
+                entry["size"] = size
+            if key:
+                self._by_key[key] = content_id
+            self._by_digest[digest] = content_id
+            self._save()
+
+    def evict(self, budget: int, max_age: float, keep: str | None = None) -> list[str]:
+        """Drop entries unused for ``max_age``, then least recently used over ``budget``."""
+        with self._lock:
+            self._sync()
+            now = time.time()
+            order = sorted(self._entries.items(), key=lambda item: item[1].get("used", 0))
+            total = sum(int(e.get("size", 0)) for _, e in order)
+            evicted: list[str] = []
+            for content_id, entry in order:
+                if content_id == keep:
+                    continue
+                if total <= budget and now - entry.get("used", 0) <= max_age:
+                    break
+                shutil.rmtree(CONTENT_DIR / content_id, ignore_errors=True)
+                total -= int(entry.get("size", 0))
+                self._forget(content_id)
+                evicted.append(content_id)
+            if evicted:
+                self._save()
+            return evicted
+
+
+_render_index = _RenderIndex()
+
+_resources_ready: Path | None = None
+
+
 class ViewerService:
     """Service for managing viewer content and resources."""
 
@@ -41,26 +286,36 @@ class ViewerService:
 
     @staticmethod
     def ensure_resources() -> None:
-        """Copy viewer resources from package if not present or outdated.
+        """Link viewer resources in from the package if not present.
 
         Resources include: reveal.js, highlight.js, pdfjs, mermaid, three.js
+
+        Checked once per process (per resources directory): they only ever
+        appear, and every open would otherwise pay a stat per library.
         """
+        global _resources_ready
+        if _resources_ready == RESOURCES_DIR:
+            return
         ViewerService.ensure_directories()
 
         package_resources = get_package_resources_path()
         if not package_resources.exists():
             return
 
-        # Resource directories to copy
-        resource_dirs = ["reveal", "highlight", "pdfjs", "mermaid", "three"]
-
-        for res_dir in resource_dirs:
+        for res_dir in RESOURCE_DIRS:
             src = package_resources / res_dir
             dst = RESOURCES_DIR / res_dir
 
-            # Copy if destination doesn't exist
+            # Materialize if destination doesn't exist
             if src.exists() and not dst.exists():
-                shutil.copytree(src, dst)
+                tmp = RESOURCES_DIR / f".{res_dir}.{os.getpid()}.tmp"
+                _materialize_tree(src, tmp)
+                try:
+                    tmp.rename(dst)
+                except OSError:
+                    # Another process got there first.
+                    shutil.rmtree(tmp, ignore_errors=True)
+        _resources_ready = RESOURCES_DIR
 
     @staticmethod
     def generate_content_id(content: str, file_path: Path | None = None) -> str:
@@ -100,7 +355,6 @@ class ViewerService:
             content_id for constructing the viewer URL
         """
         ViewerService.ensure_resources()
-        ViewerService.cleanup_old_content()
 
         # Determine content source
         if isinstance(content, Path) or (isinstance(content, str) and Path(content).exists()):
@@ -114,34 +368,102 @@ class ViewerService:
             content_str = content
             title = title or "frago view"
 
-        # Detect content type early for binary file handling
-        content_type = ViewerService._get_content_type(file_path)
-        is_binary = content_type in {"video", "image", "audio", "3d", "pdf"}
-
-        # Generate content ID
-        if is_file and is_binary:
-            # For binary files, use file path and mtime for hash
-            content_id = ViewerService.generate_content_id(
-                str(file_path.stat().st_mtime),
-                file_path,
-            )
-        else:
-            content_id = ViewerService.generate_content_id(
-                content_str if not is_file else file_path.read_text(encoding="utf-8", errors="replace"),
-                file_path,
+        options = json.dumps([_renderer_version(), mode, theme, title])
+
+        # Metadata first: an unchanged file is found by its stat alone.
+        key = None
+        if is_file:
+            st = file_path.stat()
+            key = hashlib.sha256(
+                f"{options}\0{os.path.abspath(file_path)}\0{st.st_size}\0{st.st_mtime_ns}".encode()
+            ).hexdigest()
+            cached = _render_index.by_key(key)
+            if cached is not None:
+                return cached
+
+        # Then the content: a touched-but-identical file reuses its render.
+        digest = ViewerService._content_digest(file_path, content_str, options)
+        reused = _render_index.by_digest(digest)
+        if reused is not None:
+            if file_path is not None:
+                ViewerService._link_source_resources(file_path, CONTENT_DIR / reused)
+            _render_index.record(reused, key=key, digest=digest)
+            return reused
+
+        content_id = digest[:12]
+        if _render_index.known(content_id):
+            # A different digest sharing the prefix; keep both apart.
+            content_id = digest[:16]
+        CONTENT_DIR.mkdir(parents=True, exist_ok=True)
+        staging = CONTENT_DIR / f".{content_id}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        try:
+            written = ViewerService._render_into(
+                staging, file_path, content_str, is_file, mode, theme, title
             )
+            target = CONTENT_DIR / content_id
+            shutil.rmtree(target, ignore_errors=True)
+            staging.rename(target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        _render_index.record(content_id, key=key, digest=digest, size=written)
+        _render_index.evict(CONTENT_BUDGET_BYTES, CONTENT_MAX_AGE, keep=content_id)
+        ViewerService.cleanup_old_content()
+        return content_id
 
-        # Create content directory
-        content_dir = CONTENT_DIR / content_id
-        content_dir.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _content_digest(file_path: Path | None, content_str: str, options: str) -> str:
+        """Hash what a render depends on: the bytes, the options, where it lives.
+
+        The directory is part of it because a document's relative resources are
+        linked in from beside it; the suffix because it picks the renderer.
+        """
+        h = hashlib.sha256(options.encode())
+        if file_path is None:
+            h.update(b"\0text\0")
+            h.update(content_str.encode("utf-8", errors="replace"))
+            return h.hexdigest()
+        h.update(f"\0{file_path.resolve().parent}\0{file_path.suffix.lower()}\0".encode())
+        with open(file_path, "rb") as fh:
+            while chunk := fh.read(_HASH_CHUNK):
+                h.update(chunk)
+        return h.hexdigest()
+
+    @staticmethod
+    def _link_source_resources(file_path: Path, content_dir: Path) -> int:
+        """Link the directories next to a document into its content directory."""
+        written = 0
+        source_dir = file_path.parent
+        for subdir in RESOURCE_SUBDIRS:
+            src_subdir = source_dir / subdir
+            if src_subdir.is_dir():
+                written += _materialize_tree(src_subdir, content_dir / subdir)
+        return written
+
+    @staticmethod
+    def _render_into(
+        content_dir: Path,
+        file_path: Path | None,
+        content_str: str,
+        is_file: bool,
+        mode: Literal["auto", "present", "doc"],
+        theme: str,
+        title: str,
+    ) -> int:
+        """Render into ``content_dir``; returns the bytes written to disk."""
+        content_type = ViewerService._get_content_type(file_path)
+        index = content_dir / "index.html"
 
         # Handle media types
         if content_type in {"video", "image", "audio", "3d"}:
             html_content = ViewerService._render_media_html(
                 file_path, content_type, title, content_dir
             )
-            (content_dir / "index.html").write_text(html_content, encoding="utf-8")
-            return content_id
+            index.write_text(html_content, encoding="utf-8")
+            return ViewerService._written(content_dir)
 
         # Detect mode for non-media content
         detected_mode = ViewerService._detect_mode(file_path, content_str) if mode == "auto" else mode
@@ -156,24 +478,31 @@ class ViewerService:
                 file_path, content_str, is_file, content_type, theme, title
             )
 
-        # Write index.html
-        (content_dir / "index.html").write_text(html_content, encoding="utf-8")
+        index.write_text(html_content, encoding="utf-8")
 
-        # Copy source file if PDF
+        # Link source file if PDF
         if file_path and file_path.suffix.lower() == ".pdf":
-            shutil.copy(file_path, content_dir / "source.pdf")
+            _link_or_copy(file_path, content_dir / "source.pdf")
 
-        # Copy relative resources from source file directory
+        # Link relative resources from source file directory
         if file_path:
-            source_dir = file_path.parent
-            for subdir in ["images", "assets", "img", "media", "figures", "videos", "styles"]:
-                src_subdir = source_dir / subdir
-                if src_subdir.exists() and src_subdir.is_dir():
-                    dst_subdir = content_dir / subdir
-                    if not dst_subdir.exists():
-                        shutil.copytree(src_subdir, dst_subdir)
+            ViewerService._link_source_resources(file_path, content_dir)
 
-        return content_id
+        return ViewerService._written(content_dir)
+
+    @staticmethod
+    def _written(content_dir: Path) -> int:
+        """Disk a content directory holds of its own: files no one else links to."""
+        total = 0
+        for root, _dirs, files in os.walk(content_dir):
+            for name in files:
+                try:
+                    st = os.stat(Path(root) / name)
+                except OSError:
+                    continue
+                if st.st_nlink == 1:
+                    total += st.st_size
+        return total
 
     @staticmethod
     def _detect_mode(file_path: Path | None, content_str: str) -> Literal["present", "doc"]:  # noqa: ARG004 — kept for API compatibility
@@ -274,7 +603,7 @@ class ViewerService:
     ) -> str:
         """Render media content (video, image, audio, 3D).
 
-        Copies source file to content directory and generates appropriate HTML.
+        Links source file into content directory and generates appropriate HTML.
         """
         from frago.viewer.modes.media import (
             render_3d,
@@ -283,9 +612,9 @@ class ViewerService:
             render_video,
         )
 
-        # Copy source file to content directory
+        # Link source file into content directory
         source_filename = f"source{file_path.suffix.lower()}"
-        shutil.copy(file_path, content_dir / source_filename)
+        _link_or_copy(file_path, content_dir / source_filename)
 
         resources_base = "/viewer/resources"
 
@@ -303,7 +632,7 @@ class ViewerService:
 
     @staticmethod
     def cleanup_old_content(max_age_seconds: int = CONTENT_MAX_AGE) -> int:
-        """Remove content directories older than max_age.
+        """Remove content directories older than max_age that the render cache does not track.
 
         Args:
             max_age_seconds: Maximum age in seconds (default 24 hours)
@@ -320,6 +649,9 @@ class ViewerService:
         for content_dir in CONTENT_DIR.iterdir():
             if not content_dir.is_dir():
                 continue
+            # Cached renders age by last use, not by when they were written.
+            if _render_index.known(content_dir.name):
+                continue
 
             try:
                 # Check directory modification time
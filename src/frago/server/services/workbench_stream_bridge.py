@@ -6,24 +6,36 @@ Design:
 - Lazily starts a ``SessionStream`` per project when a session from that
   project is first viewed in the workbench.
 - On receipt of new records, broadcasts ``session_records_append`` via the
-  shared WebSocket manager.
+  shared WebSocket manager, on the ``workbench:<project>`` topic so only the
+  clients following that project are sent the frames.
 - On turn completion, broadcasts ``session_turn_done``.
 - Callbacks fire on the watcher's thread; the bridge uses
   ``asyncio.run_coroutine_threadsafe`` to cross into the event loop.
+- A stream lives as long as someone is looking. WebSocket subscribers of its
+  topic hold it; a records fetch (the frontend's polling fallback) leases it
+  for an idle grace period. Once neither holds it, a reaper stops it, so the
+  watchdog targets and opencode poll thread follow the current viewers rather
+  than every project anyone ever opened.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
+import os
 import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
-from frago.server.websocket import create_message, manager
+from frago.server.websocket import TOPIC_WORKBENCH, create_message, manager
 from frago.session.adapters.claude_code_records import find_session_file
 from frago.session.opencode_stream import OpencodeStream
 from frago.session.stream import SessionStream
+from frago.watcher import WatchdogObserverService
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +44,31 @@ logger = logging.getLogger(__name__)
 WS_SESSION_RECORDS_APPEND = "session_records_append"
 WS_SESSION_TURN_DONE = "session_turn_done"
 
+# Opencode sessions share one stream with no project of its own.
+OPENCODE_TOPIC = f"{TOPIC_WORKBENCH}:opencode"
+
+
+DEFAULT_IDLE_GRACE = 300.0
+# How often the reaper looks for streams whose grace has run out. Stopping a
+# stream a little after its grace is harmless; a tight loop is not.
+_REAP_INTERVAL = 30.0
+
+
+def idle_grace() -> float:
+    """Seconds an unwatched stream is kept. ``FRAGO_WORKBENCH_STREAM_GRACE`` overrides."""
+    raw = os.environ.get("FRAGO_WORKBENCH_STREAM_GRACE")
+    if raw:
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            logger.warning("FRAGO_WORKBENCH_STREAM_GRACE=%r is not a number", raw)
+    return DEFAULT_IDLE_GRACE
+
+
+def workbench_topic(project_path: str) -> str:
+    """The WebSocket topic a project's session frames are published on."""
+    return f"{TOPIC_WORKBENCH}:{project_path}"
+
 
 def _read_cwd_from_jsonl(file_path: Path) -> str | None:
     """Read the ``cwd`` field from the first few lines of a session JSONL."""
@@ -53,6 +90,15 @@ def _read_cwd_from_jsonl(file_path: Path) -> str | None:
     return None
 
 
+@dataclass
+class _Watch:
+    """One running ``SessionStream`` and what keeps it alive."""
+
+    stream: Any
+    lease_until: float
+    started: float = field(default_factory=time.monotonic)
+
+
 class WorkbenchStreamBridge:
     """Singleton that lazily starts ``SessionStream`` instances per project.
 
@@ -66,10 +112,17 @@ class WorkbenchStreamBridge:
     _class_lock = threading.Lock()
 
     def __init__(self, loop: asyncio.AbstractEventLoop | None) -> None:
-        self._streams: dict[str, SessionStream] = {}  # project_path → stream
+        self._streams: dict[str, _Watch] = {}  # topic → watch
         self._opencode_stream: OpencodeStream | None = None
+        self._opencode_leases: dict[str, float] = {}  # session id → lease_until
+        # Explicit WebSocket subscribers per workbench topic, as reported by
+        # the connection manager. These are the refcounts.
+        self._refs: dict[str, int] = {}
         self._lock = threading.Lock()
         self._loop = loop
+        self._reaper: threading.Thread | None = None
+        self._reaper_stop = threading.Event()
+        manager.add_topic_listener(self._on_topic_subscribers)
 
     # ---- singleton --------------------------------------------------------
 
@@ -88,63 +141,147 @@ class WorkbenchStreamBridge:
         with cls._class_lock:
             if cls._instance is not None:
                 cls._instance.stop_all()
+                manager.remove_topic_listener(cls._instance._on_topic_subscribers)
                 cls._instance = None
 
     # ---- lifecycle --------------------------------------------------------
 
-    def ensure_watching(self, session_id: str) -> None:
+    def ensure_watching(self, session_id: str) -> str | None:
         """Start watching the project for *session_id* if not already.
 
         Claude Code sessions (UUID-shaped) → ``SessionStream`` per project.
         Opencode sessions (``ses_`` prefix) → shared ``OpencodeStream``.
 
-        Safe to call multiple times — duplicate calls are no-ops.
+        Safe to call multiple times — a repeat call renews the stream's lease.
+        Returns the topic the session's frames are published on, or None if
+        there is nothing to watch.
         """
+        lease_until = time.monotonic() + idle_grace()
+
         # Opencode session → shared OpencodeStream
         if session_id.startswith("ses_"):
             with self._lock:
                 if self._opencode_stream is None:
                     self._opencode_stream = OpencodeStream(
-                        on_records=self._on_new_records,
-                        on_turn_complete=self._on_turn_complete,
+                        on_records=functools.partial(self._on_new_records, topic=OPENCODE_TOPIC),
+                        on_turn_complete=functools.partial(
+                            self._on_turn_complete, topic=OPENCODE_TOPIC,
+                        ),
                     )
                     self._opencode_stream.start()
                 self._opencode_stream.watch_session(session_id)
-            return
+                self._opencode_leases[session_id] = lease_until
+                self._ensure_reaper()
+            return OPENCODE_TOPIC
 
         # Claude Code session → SessionStream per project
         file_path = find_session_file(session_id)
         if file_path is None:
             logger.warning("WorkbenchStreamBridge: session file not found for %s", session_id)
-            return
+            return None
 
         project_path = _read_cwd_from_jsonl(file_path)
         if project_path is None:
             logger.warning("WorkbenchStreamBridge: no cwd found in %s", file_path)
-            return
+            return None
 
+        topic = workbench_topic(project_path)
         with self._lock:
-            if project_path in self._streams:
-                return
+            watch = self._streams.get(topic)
+            if watch is not None:
+                watch.lease_until = max(watch.lease_until, lease_until)
+                return topic
 
             logger.info("WorkbenchStreamBridge: starting stream for %s", project_path)
             stream = SessionStream(
                 project_path=project_path,
-                on_records=self._on_new_records,
-                on_turn_complete=self._on_turn_complete,
+                on_records=functools.partial(self._on_new_records, topic=topic),
+                on_turn_complete=functools.partial(self._on_turn_complete, topic=topic),
             )
             stream.start()
-            self._streams[project_path] = stream
+            self._streams[topic] = _Watch(stream=stream, lease_until=lease_until)
+            self._ensure_reaper()
+        return topic
+
+    def refs(self, topic: str) -> int:
+        """Subscribers holding *topic*'s stream, including whole-family ones."""
+        return self._refs.get(topic, 0) + self._refs.get(TOPIC_WORKBENCH, 0)
+
+    def reap_idle(self, now: float | None = None) -> list[str]:
+        """Stop every stream nobody holds and whose lease has run out.
+
+        Returns the topics stopped (``OPENCODE_TOPIC`` once its last session
+        goes). Streams are stopped outside the lock: the opencode stream joins
+        its poll thread, and nothing else should wait on that.
+        """
+        now = time.monotonic() if now is None else now
+        doomed: list[tuple[str, Any]] = []
+        with self._lock:
+            for topic, watch in list(self._streams.items()):
+                if self.refs(topic) == 0 and watch.lease_until <= now:
+                    doomed.append((topic, self._streams.pop(topic).stream))
+
+            if self._opencode_stream is not None and self.refs(OPENCODE_TOPIC) == 0:
+                for sid, lease_until in list(self._opencode_leases.items()):
+                    if lease_until <= now:
+                        del self._opencode_leases[sid]
+                        self._opencode_stream.unwatch_session(sid)
+                if not self._opencode_leases:
+                    doomed.append((OPENCODE_TOPIC, self._opencode_stream))
+                    self._opencode_stream = None
+
+        for topic, stream in doomed:
+            logger.info("WorkbenchStreamBridge: stopping idle stream %s", topic)
+            try:
+                stream.stop()
+            except Exception:
+                logger.exception("WorkbenchStreamBridge: error stopping stream %s", topic)
+        return [topic for topic, _ in doomed]
+
+    def stats(self) -> dict[str, Any]:
+        """What the bridge is holding open, and what that costs the process."""
+        now = time.monotonic()
+        with self._lock:
+            streams = [
+                {
+                    "topic": topic,
+                    "refs": self.refs(topic),
+                    "lease_remaining": max(0.0, round(watch.lease_until - now, 1)),
+                    "age": round(now - watch.started, 1),
+                }
+                for topic, watch in self._streams.items()
+            ]
+            opencode_sessions = len(self._opencode_leases)
+            opencode_running = self._opencode_stream is not None
+
+        try:
+            import psutil
+
+            rss = psutil.Process().memory_info().rss
+        except Exception:
+            rss = None
+
+        return {
+            "streams": streams,
+            "opencode_running": opencode_running,
+            "opencode_sessions": opencode_sessions,
+            "watched_dirs": WatchdogObserverService.get_instance().watch_count,
+            "threads": threading.active_count(),
+            "rss_bytes": rss,
+        }
 
     def stop_all(self) -> None:
         """Stop all active streams."""
+        self._reaper_stop.set()
         with self._lock:
-            for path, stream in list(self._streams.items()):
+            self._reaper = None
+            for topic, watch in list(self._streams.items()):
                 try:
-                    stream.stop()
+                    watch.stream.stop()
                 except Exception:
-                    logger.exception("WorkbenchStreamBridge: error stopping stream %s", path)
+                    logger.exception("WorkbenchStreamBridge: error stopping stream %s", topic)
             self._streams.clear()
+            self._opencode_leases.clear()
             if self._opencode_stream is not None:
                 try:
                     self._opencode_stream.stop()
@@ -152,9 +289,60 @@ class WorkbenchStreamBridge:
                     logger.exception("WorkbenchStreamBridge: error stopping opencode stream")
                 self._opencode_stream = None
 
+    # ---- refcounting and reaping -------------------------------------------
+
+    def _on_topic_subscribers(self, topic: str, count: int) -> None:
+        """Connection-manager hook: a workbench topic gained or lost a subscriber.
+
+        Losing the last one starts the grace period from now, so a tab that
+        re-subscribes after a reload finds its stream still running.
+        """
+        if topic != TOPIC_WORKBENCH and not topic.startswith(f"{TOPIC_WORKBENCH}:"):
+            return
+        lease_until = time.monotonic() + idle_grace()
+        with self._lock:
+            if count:
+                self._refs[topic] = count
+                return
+            self._refs.pop(topic, None)
+            if topic == TOPIC_WORKBENCH:
+                watches = list(self._streams.values())
+            else:
+                watches = [w for t, w in self._streams.items() if t == topic]
+            for watch in watches:
+                watch.lease_until = max(watch.lease_until, lease_until)
+            if topic in (TOPIC_WORKBENCH, OPENCODE_TOPIC):
+                for sid in self._opencode_leases:
+                    self._opencode_leases[sid] = max(self._opencode_leases[sid], lease_until)
+
+    def _ensure_reaper(self) -> None:
+        """Start the reaper thread if it is not running. Caller holds the lock."""
+        if self._reaper is not None:
+            return
+        self._reaper_stop.clear()
+        self._reaper = threading.Thread(
+            target=self._reap_loop, daemon=True, name="workbench-stream-reaper",
+        )
+        self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        while not self._reaper_stop.wait(_REAP_INTERVAL):
+            self.reap_idle()
+            with self._lock:
+                if not self._streams and self._opencode_stream is None:
+                    # Step down while still holding the lock, so a stream
+                    # started right after this starts a reaper of its own.
+                    if self._reaper is threading.current_thread():
+                        self._reaper = None
+                    break
+        with self._lock:
+            if self._reaper is threading.current_thread():
+                self._reaper = None
+
     # ---- callbacks (called on watcher thread) -----------------------------
 
-    def _on_new_records(self, session_id: str, records: list[dict]) -> None:
+    def _on_new_records(self, session_id: str, records: list[dict],
+                        topic: str = TOPIC_WORKBENCH) -> None:
         """Called by SessionStream when new records arrive."""
         if not records:
             return
@@ -165,10 +353,11 @@ class WorkbenchStreamBridge:
 
         data = {"session_id": session_id, "records": records}
         msg = create_message(WS_SESSION_RECORDS_APPEND, data)
-        asyncio.run_coroutine_threadsafe(manager.broadcast(msg), loop)
+        asyncio.run_coroutine_threadsafe(manager.broadcast(msg, topic=topic), loop)
 
     def _on_turn_complete(self, session_id: str, done: bool,
-                          stop_reason: str | None) -> None:
+                          stop_reason: str | None,
+                          topic: str = TOPIC_WORKBENCH) -> None:
         """Called by SessionStream when a turn flips to complete."""
         try:
             loop = self._loop or asyncio.get_event_loop()
@@ -181,4 +370,4 @@ class WorkbenchStreamBridge:
             "stop_reason": stop_reason,
         }
         msg = create_message(WS_SESSION_TURN_DONE, data)
-        asyncio.run_coroutine_threadsafe(manager.broadcast(msg), loop)
+        asyncio.run_coroutine_threadsafe(manager.broadcast(msg, topic=topic), loop)
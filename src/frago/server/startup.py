@@ -0,0 +1,244 @@
+"""Staged, concurrent server startup with a readiness gate and a timeline.
+
+The lifespan used to start every service one after another, so the first
+request waited on the sum of all of them — tab reconciliation, hook
+deployment and the PyPI check included, none of which any request needs.
+Here each service is a *stage* that names the stages it must run after and
+whether the server is useless without it:
+
+- Stages whose dependencies are settled start at once; independent ones run
+  concurrently. Plain functions run in a worker thread, coroutines on the
+  loop.
+- ``wait_ready()`` returns once every ``required`` stage (and, by
+  construction, everything those depend on) has settled. The lifespan yields
+  there; the remaining stages keep going in the background.
+- A failed stage is logged and marked ``failed``; stages after it still run.
+  That is how the sequential lifespan behaved — each block caught its own
+  error — and a missing plugin must not keep the scheduler down.
+- ``timeline()`` reports per-stage start offset and duration plus the
+  critical path (the chain of stages that actually gated readiness and
+  completion), served by ``GET /api/ready``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+OK = "ok"
+FAILED = "failed"
+
+
+@dataclass
+class Stage:
+    """One startup step and what became of it."""
+
+    name: str
+    run: Callable[[], Any]
+    after: tuple[str, ...] = ()
+    required: bool = False
+    status: str = PENDING
+    started: float | None = None
+    finished: float | None = None
+    error: str | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def settled(self) -> bool:
+        return self.status in (OK, FAILED)
+
+
+class StartupOrchestrator:
+    """Run registered stages as a dependency graph.
+
+    Usage::
+
+        startup = StartupOrchestrator()
+        startup.add("state", state_manager.initialize, required=True)
+        startup.add("scheduler", start_scheduler, after=("state",))
+        startup.start()
+        await startup.wait_ready()
+        ...
+        await startup.settle()   # before shutting the services down
+    """
+
+    def __init__(self) -> None:
+        self._stages: dict[str, Stage] = {}
+        self._origin: float | None = None
+        self._ready_at: float | None = None
+        self._done_at: float | None = None
+
+    def add(
+        self,
+        name: str,
+        run: Callable[[], Any],
+        *,
+        after: tuple[str, ...] = (),
+        required: bool = False,
+    ) -> None:
+        """Register a stage. Dependencies MUST already be registered.
+
+        Requiring registration order keeps the graph acyclic without a separate
+        check, and reads top to bottom the way the old lifespan did.
+        """
+        if name in self._stages:
+            raise ValueError(f"duplicate startup stage: {name}")
+        unknown = [dep for dep in after if dep not in self._stages]
+        if unknown:
+            raise ValueError(f"stage {name} runs after unknown stage(s): {', '.join(unknown)}")
+        if self._origin is not None:
+            raise RuntimeError("cannot add stages after startup began")
+        self._stages[name] = Stage(name=name, run=run, after=tuple(after), required=required)
+
+    def start(self) -> None:
+        """Schedule every stage on the running loop."""
+        self._origin = time.monotonic()
+        for stage in self._stages.values():
+            stage.task = asyncio.create_task(self._run(stage), name=f"startup:{stage.name}")
+
+    async def wait_ready(self) -> None:
+        """Return once every required stage has settled."""
+        required = [s.task for s in self._stages.values() if s.required and s.task is not None]
+        if required:
+            await asyncio.gather(*required)
+        if self._ready_at is None:
+            finished = [
+                s.finished for s in self._stages.values() if s.required and s.finished is not None
+            ]
+            self._ready_at = max(finished, default=time.monotonic())
+            logger.info(
+                "Server ready in %.0fms (critical path: %s)",
+                self._offset_ms(self._ready_at),
+                " → ".join(self._critical_path(required_only=True)) or "-",
+            )
+
+    async def settle(self) -> None:
+        """Wait for every stage, background ones included."""
+        tasks = [s.task for s in self._stages.values() if s.task is not None]
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready_at is not None
+
+    @property
+    def complete(self) -> bool:
+        return self._done_at is not None
+
+    async def _run(self, stage: Stage) -> None:
+        for dep in stage.after:
+            task = self._stages[dep].task
+            if task is not None:
+                await task
+        stage.status = RUNNING
+        stage.started = time.monotonic()
+        try:
+            if inspect.iscoroutinefunction(stage.run):
+                await stage.run()
+            else:
+                result = await asyncio.to_thread(stage.run)
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as exc:
+            stage.status = FAILED
+            stage.error = str(exc) or type(exc).__name__
+            logger.warning("Startup stage %s failed: %s", stage.name, exc)
+        else:
+            stage.status = OK
+        finally:
+            stage.finished = time.monotonic()
+            self._maybe_done()
+
+    def _maybe_done(self) -> None:
+        if self._done_at is not None:
+            return
+        if all(s.settled for s in self._stages.values()):
+            self._done_at = time.monotonic()
+            failed = [s.name for s in self._stages.values() if s.status == FAILED]
+            logger.info(
+                "Startup complete in %.0fms%s",
+                self._offset_ms(self._done_at),
+                f" ({len(failed)} failed: {', '.join(failed)})" if failed else "",
+            )
+
+    # ---- reporting ----------------------------------------------------------
+
+    def _offset_ms(self, moment: float | None) -> float | None:
+        if moment is None or self._origin is None:
+            return None
+        return round((moment - self._origin) * 1000, 1)
+
+    def _critical_path(self, *, required_only: bool) -> list[str]:
+        """The chain of stages that gated the end of startup (or of readiness).
+
+        Start from the last stage to finish, then repeatedly step to the
+        dependency that finished last — that is the one it was waiting on.
+        """
+        pool = [
+            s for s in self._stages.values()
+            if s.finished is not None and (s.required or not required_only)
+        ]
+        if not pool:
+            return []
+        current = max(pool, key=lambda s: s.finished)
+        path = [current.name]
+        while current.after:
+            deps = [self._stages[d] for d in current.after if self._stages[d].finished is not None]
+            if not deps:
+                break
+            current = max(deps, key=lambda s: s.finished)
+            path.append(current.name)
+        path.reverse()
+        return path
+
+    def timeline(self) -> dict[str, Any]:
+        """Per-stage offsets and durations, in milliseconds from startup."""
+        stages = []
+        for stage in self._stages.values():
+            duration = None
+            if stage.started is not None and stage.finished is not None:
+                duration = round((stage.finished - stage.started) * 1000, 1)
+            stages.append(
+                {
+                    "name": stage.name,
+                    "required": stage.required,
+                    "after": list(stage.after),
+                    "status": stage.status,
+                    "started_ms": self._offset_ms(stage.started),
+                    "duration_ms": duration,
+                    "error": stage.error,
+                }
+            )
+        return {
+            "ready": self.ready,
+            "complete": self.complete,
+            "ready_ms": self._offset_ms(self._ready_at),
+            "complete_ms": self._offset_ms(self._done_at),
+            "pending": [s.name for s in self._stages.values() if not s.settled],
+            "critical_path": self._critical_path(required_only=False),
+            "ready_path": self._critical_path(required_only=True),
+            "stages": stages,
+        }
+
+
+_current: StartupOrchestrator | None = None
+
+
+def get_startup() -> StartupOrchestrator | None:
+    """The orchestrator of the running server, or None outside a lifespan."""
+    return _current
+
+
+def set_startup(orchestrator: StartupOrchestrator | None) -> None:
+    global _current
+    _current = orchestrator
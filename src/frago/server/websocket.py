@@ -4,21 +4,131 @@ Provides WebSocket broadcast capability for:
 - Task status updates
 - Session sync events
 - Log streaming
+
+Every message belongs to a topic (``tasks``, ``agent``, ``trace``, ``data``,
+``workbench:<project>`` ...). A client that has never subscribed receives every
+topic, which is what the frontend has always relied on; once it subscribes it
+receives only what it asked for, so a dashboard tab stops paying for the
+session-stream frames of a workbench it is not showing.
+
+Sends never happen on the broadcaster's path. Each client has a bounded queue
+drained by its own writer task, so one slow tab delays only itself. When a
+queue is full, state snapshots are coalesced (the newer one replaces the one
+still waiting) and everything else is dropped and counted.
 """
 
 import asyncio
 import json
+import logging
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
 from fastapi import WebSocket
 
+logger = logging.getLogger(__name__)
+
+# Topics. ``workbench`` is a family: ``workbench:<project>`` messages also reach
+# subscribers of plain ``workbench``.
+TOPIC_TASKS = "tasks"
+TOPIC_AGENT = "agent"
+TOPIC_TRACE = "trace"
+TOPIC_DATA = "data"
+TOPIC_INIT = "init"
+TOPIC_WORKBENCH = "workbench"
+
+# Messages that carry a whole state snapshot. Only the latest one of each type
+# is worth sending, so a queued one is replaced rather than sent twice.
+_COALESCE_PREFIXES = ("data_",)
+_COALESCE_TYPES = frozenset({"session_sync"})
+
+DEFAULT_QUEUE_SIZE = 256
+
+
+def topic_for(message: dict[str, Any]) -> str:
+    """The topic a message is published on when the caller does not say."""
+    msg_type = str(message.get("type") or "")
+    if msg_type in ("session_records_append", "session_turn_done"):
+        return TOPIC_WORKBENCH
+    if msg_type.startswith(("task_", "recipe_", "session_")):
+        return TOPIC_TASKS
+    if msg_type.startswith("agent_"):
+        return TOPIC_AGENT
+    if msg_type.startswith("pa_") or msg_type == "timeline_event":
+        return TOPIC_TRACE
+    if msg_type.startswith("data_"):
+        return TOPIC_DATA
+    if msg_type.startswith("init_"):
+        return TOPIC_INIT
+    return ""
+
+
+def _coalesce_key(message: dict[str, Any]) -> str | None:
+    msg_type = str(message.get("type") or "")
+    if msg_type in _COALESCE_TYPES or msg_type.startswith(_COALESCE_PREFIXES):
+        return msg_type
+    return None
+
+
+class _Client:
+    """One connection: its subscriptions, its send queue and its writer."""
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.topics: set[str] | None = None  # None = never subscribed = everything
+        self.queue_size = queue_size
+        # Entries are either ready-to-send text, or a coalesce key whose latest
+        # text is in ``latest``.
+        self.queue: deque[tuple[str | None, str]] = deque()
+        self.latest: dict[str, str] = {}
+        self.wakeup = asyncio.Event()
+        self.writer: asyncio.Task | None = None
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+
+    def enqueue(self, text: str, key: str | None = None) -> None:
+        if self.closed:
+            return
+        if key is not None and key in self.latest:
+            self.latest[key] = text
+            self.coalesced += 1
+            return
+        if len(self.queue) >= self.queue_size:
+            self.dropped += 1
+            return
+        if key is not None:
+            self.latest[key] = text
+            self.queue.append((key, ""))
+        else:
+            self.queue.append((None, text))
+        self.wakeup.set()
+
+    def next_text(self) -> str | None:
+        if not self.queue:
+            return None
+        key, text = self.queue.popleft()
+        if key is not None:
+            return self.latest.pop(key, None)
+        return text
+
 
 class ConnectionManager:
     """Manages WebSocket connections and message broadcasting."""
 
-    def __init__(self):
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
         self.active_connections: set[WebSocket] = set()
+        self._clients: dict[WebSocket, _Client] = {}
+        self._firehose: set[_Client] = set()
+        self._subscribers: dict[str, set[_Client]] = {}
+        self._queue_size = queue_size
+        # Called with (topic, subscriber_count) whenever a topic's subscriber
+        # count changes, so producers can start and stop work with their
+        # audience. Called outside the lock.
+        self._topic_listeners: list[Callable[[str, int], None]] = []
+        # Guards the indexes only. Nothing is ever sent while holding it.
         self._lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket) -> None:
@@ -28,8 +138,12 @@ class ConnectionManager:
             websocket: The WebSocket connection to accept
         """
         await websocket.accept()
+        client = _Client(websocket, self._queue_size)
         async with self._lock:
             self.active_connections.add(websocket)
+            self._clients[websocket] = client
+            self._firehose.add(client)
+        client.writer = asyncio.create_task(self._write_loop(client))
 
     async def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection.
@@ -39,44 +153,166 @@ class ConnectionManager:
         """
         async with self._lock:
             self.active_connections.discard(websocket)
+            client = self._clients.pop(websocket, None)
+            if client is None:
+                return
+            self._unindex(client)
+        client.closed = True
+        client.wakeup.set()
+        self._notify(client.topics or ())
+
+    async def subscribe(self, websocket: WebSocket, topics: list[str]) -> list[str]:
+        """Limit a client to ``topics`` (added to any it already has).
+
+        Returns the client's topics afterwards.
+        """
+        async with self._lock:
+            client = self._clients.get(websocket)
+            if client is None:
+                return []
+            self._unindex(client)
+            added = {t for t in topics if t} - (client.topics or set())
+            client.topics = (client.topics or set()) | added
+            self._index(client)
+            current = sorted(client.topics)
+        self._notify(added)
+        return current
+
+    async def unsubscribe(self, websocket: WebSocket, topics: list[str]) -> list[str]:
+        """Drop ``topics`` from a client. A client left with none gets nothing.
+
+        Returns the client's topics afterwards.
+        """
+        async with self._lock:
+            client = self._clients.get(websocket)
+            if client is None or client.topics is None:
+                return []
+            self._unindex(client)
+            removed = client.topics & set(topics)
+            client.topics -= removed
+            self._index(client)
+            current = sorted(client.topics)
+        self._notify(removed)
+        return current
+
+    def add_topic_listener(self, listener: Callable[[str, int], None]) -> None:
+        """Be told ``(topic, subscriber_count)`` whenever a topic gains or loses one."""
+        self._topic_listeners.append(listener)
+
+    def remove_topic_listener(self, listener: Callable[[str, int], None]) -> None:
+        if listener in self._topic_listeners:
+            self._topic_listeners.remove(listener)
+
+    def subscriber_count(self, topic: str) -> int:
+        """Clients that explicitly subscribed to ``topic`` (not the firehose)."""
+        return len(self._subscribers.get(topic, ()))
+
+    def _notify(self, topics) -> None:
+        for topic in topics:
+            count = self.subscriber_count(topic)
+            for listener in list(self._topic_listeners):
+                try:
+                    listener(topic, count)
+                except Exception:
+                    logger.exception("WebSocket topic listener failed for %s", topic)
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
-        """Send a message to all connected clients.
+    def _index(self, client: _Client) -> None:
+        if client.topics is None:
+            self._firehose.add(client)
+            return
+        for topic in client.topics:
+            self._subscribers.setdefault(topic, set()).add(client)
+
+    def _unindex(self, client: _Client) -> None:
+        self._firehose.discard(client)
+        for topic in client.topics or ():
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(client)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def _recipients(self, topic: str) -> set[_Client]:
+        recipients = set(self._firehose)
+        recipients |= self._subscribers.get(topic, set())
+        family, sep, _ = topic.partition(":")
+        if sep:
+            recipients |= self._subscribers.get(family, set())
+        return recipients
+
+    async def broadcast(self, message: dict[str, Any], topic: str | None = None) -> None:
+        """Queue a message for every client subscribed to its topic.
 
         Args:
             message: Message dict to broadcast
+            topic: Topic to publish on; derived from the message type if omitted
         """
-        if not self.active_connections:
+        if not self._clients:
             return
 
-        message_json = json.dumps(message, default=str)
-        dead_connections: list[WebSocket] = []
-
-        async with self._lock:
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(message_json)
-                except Exception:
-                    dead_connections.append(connection)
+        if topic is None:
+            topic = topic_for(message)
+        recipients = self._recipients(topic)
+        if not recipients:
+            return
 
-        # Clean up dead connections
-        for conn in dead_connections:
-            await self.disconnect(conn)
+        message_json = json.dumps(message, default=str)
+        key = _coalesce_key(message)
+        for client in recipients:
+            client.enqueue(message_json, key)
 
     async def send_personal(
         self, websocket: WebSocket, message: dict[str, Any]
     ) -> None:
         """Send a message to a specific client.
 
+        Goes through the client's queue, so it stays in order with whatever
+        broadcasts were queued before it.
+
         Args:
             websocket: Target WebSocket connection
             message: Message dict to send
         """
+        client = self._clients.get(websocket)
+        if client is not None:
+            client.enqueue(json.dumps(message, default=str))
+            return
         try:
             await websocket.send_text(json.dumps(message, default=str))
         except Exception:
             await self.disconnect(websocket)
 
+    async def _write_loop(self, client: _Client) -> None:
+        """Drain one client's queue. A failed send ends the connection."""
+        try:
+            while not client.closed:
+                await client.wakeup.wait()
+                client.wakeup.clear()
+                while not client.closed:
+                    text = client.next_text()
+                    if text is None:
+                        break
+                    await client.websocket.send_text(text)
+                    client.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("WebSocket send failed, dropping client: %s", e)
+            await self.disconnect(client.websocket)
+
+    def client_stats(self) -> list[dict[str, Any]]:
+        """Per-client delivery counters, for diagnosing a slow or lossy tab."""
+        return [
+            {
+                "topics": sorted(client.topics) if client.topics is not None else None,
+                "queued": len(client.queue),
+                "sent": client.sent,
+                "dropped": client.dropped,
+                "coalesced": client.coalesced,
+            }
+            for client in list(self._clients.values())
+        ]
+
     @property
     def connection_count(self) -> int:
         """Get the number of active connections."""
@@ -96,6 +332,11 @@ class MessageType:
     PING = "ping"
     PONG = "pong"
 
+    # Topic subscription (client → server, acknowledged with SUBSCRIBED)
+    SUBSCRIBE = "subscribe"
+    UNSUBSCRIBE = "unsubscribe"
+    SUBSCRIBED = "subscribed"
+
     # Task events
     TASK_STARTED = "task_started"
     TASK_UPDATED = "task_updated"
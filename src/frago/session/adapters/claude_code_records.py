@@ -366,6 +366,10 @@ class _Translator:
         self._records: list[UnifiedRecord] = []
         self._stats = TranslationStats(lines_in=len(rows))
         self._last_ts = 0
+        # 增量翻（:meth:`feed`）时已经交出去的行数与记录数。整场翻时恒为 0。
+        self._row_base = 0
+        self._seq_base = 0
+        self._pending_boundary: int | None = None
 
         # 第一趟索引
         self._tool_name_by_call: dict[str, str] = {}
@@ -385,46 +389,48 @@ class _Translator:
 
     # ── 第一趟 ──────────────────────────────────────────────────
     def _build_index(self) -> None:
-        pending_boundary: int | None = None
         for i, row in enumerate(self._rows):
-            rtype = row.get("type")
-            if rtype == "assistant":
-                for block in _as_list(_as_dict(row.get("message")).get("content")):
-                    if isinstance(block, dict) and block.get("type") == "tool_use":
-                        call_id = block.get("id")
-                        if isinstance(call_id, str):
-                            self._tool_name_by_call[call_id] = str(block.get("name", ""))
-            elif rtype == "attachment":
-                attachment = _as_dict(row.get("attachment"))
-                atype = attachment.get("type")
-                if atype == "read_truncation_notice":
-                    call_id = attachment.get("toolUseID")
+            self._index_row(i, row)
+
+    def _index_row(self, i: int, row: dict[str, Any]) -> None:
+        rtype = row.get("type")
+        if rtype == "assistant":
+            for block in _as_list(_as_dict(row.get("message")).get("content")):
+                if isinstance(block, dict) and block.get("type") == "tool_use":
+                    call_id = block.get("id")
                     if isinstance(call_id, str):
-                        self._truncation_banner[call_id] = str(attachment.get("banner", ""))
-                elif atype == _HOOK_CONTEXT_TYPE:
-                    blocks = set(_hook_blocks(attachment.get("content")))
-                    self._injected_texts |= blocks
-                    call_id = attachment.get("toolUseID")
-                    if isinstance(call_id, str) and call_id:
-                        self._injected_by_call.setdefault(call_id, set()).update(blocks)
-            elif rtype == "system" and row.get("subtype") == "compact_boundary":
-                pending_boundary = i
-            # 摘要正文取紧随压缩边界之后的那一条；边界的 parentUuid 是 null，
-            # 只按 parentUuid 串链的读法会在这里把会话断成两截。
-            elif (
-                rtype == "user"
-                and row.get("isCompactSummary") is True
-                and pending_boundary is not None
-            ):
-                self._summary_for_boundary[pending_boundary] = _text_of(
-                    _as_dict(row.get("message")).get("content")
-                )
-                pending_boundary = None
+                        self._tool_name_by_call[call_id] = str(block.get("name", ""))
+        elif rtype == "attachment":
+            attachment = _as_dict(row.get("attachment"))
+            atype = attachment.get("type")
+            if atype == "read_truncation_notice":
+                call_id = attachment.get("toolUseID")
+                if isinstance(call_id, str):
+                    self._truncation_banner[call_id] = str(attachment.get("banner", ""))
+            elif atype == _HOOK_CONTEXT_TYPE:
+                blocks = set(_hook_blocks(attachment.get("content")))
+                self._injected_texts |= blocks
+                call_id = attachment.get("toolUseID")
+                if isinstance(call_id, str) and call_id:
+                    self._injected_by_call.setdefault(call_id, set()).update(blocks)
+        elif rtype == "system" and row.get("subtype") == "compact_boundary":
+            self._pending_boundary = i
+        # 摘要正文取紧随压缩边界之后的那一条；边界的 parentUuid 是 null，
+        # 只按 parentUuid 串链的读法会在这里把会话断成两截。
+        elif (
+            rtype == "user"
+            and row.get("isCompactSummary") is True
+            and self._pending_boundary is not None
+        ):
+            self._summary_for_boundary[self._pending_boundary] = _text_of(
+                _as_dict(row.get("message")).get("content")
+            )
+            self._pending_boundary = None
 
-            if isinstance(rtype, str) and rtype in _STANDING_TYPES:
-                self._last_standing_index[rtype] = i
-                if rtype in _STANDING_TITLE_TYPES:
-                    self._last_title_index = i
+        if isinstance(rtype, str) and rtype in _STANDING_TYPES:
+            self._last_standing_index[rtype] = i
+            if rtype in _STANDING_TITLE_TYPES:
+                self._last_title_index = i
 
     # ── 发条 ────────────────────────────────────────────────────
     def _emit(
@@ -445,10 +451,10 @@ class _Translator:
             self._last_ts = ts
         agent_id = row.get("agentId")
         record = UnifiedRecord(
-            id=record_id or str(row.get("uuid") or f"{self._session_id}#{len(self._records)}"),
+            id=record_id or str(row.get("uuid") or f"{self._session_id}#{self._next_seq()}"),
             session_id=str(row.get("sessionId") or self._session_id),
             group_id=group_id,
-            seq=len(self._records),
+            seq=self._next_seq(),
             ts=ts,
             kind=kind,
             agent_path=[str(agent_id)] if isinstance(agent_id, str) and agent_id else [],
@@ -475,6 +481,9 @@ class _Translator:
             },
         )
 
+    def _next_seq(self) -> int:
+        return self._seq_base + len(self._records)
+
     # ── 第二趟 ──────────────────────────────────────────────────
     def run(self) -> tuple[list[UnifiedRecord], TranslationStats]:
         self._build_index()
@@ -483,6 +492,28 @@ class _Translator:
         self._stats.records_out = len(self._records)
         return self._records, self._stats
 
+    def feed(self, rows: Sequence[dict[str, Any]]) -> list[UnifiedRecord]:
+        """增量翻：只翻新来的这几行，只吐这几行出的记录。
+
+        两趟照旧，只是范围是这一批：先给这批建索引，再逐行归类。往后看的判据（分页
+        通知并进更早的工具结果、标题只留最后一条）因此只看得到已经到了的行——与文件
+        写到一半时整场重翻看到的一样，不多也不少。已经交出去的行与记录不留在手上，
+        ``seq`` 接着上一批往下数。
+        """
+        start = self._row_base
+        for offset, row in enumerate(rows):
+            self._index_row(start + offset, row)
+        for offset, row in enumerate(rows):
+            self._translate_row(start + offset, row)
+        self._row_base += len(rows)
+        self._stats.lines_in += len(rows)
+
+        fresh = self._records
+        self._records = []
+        self._seq_base += len(fresh)
+        self._stats.records_out += len(fresh)
+        return fresh
+
     def _translate_row(self, index: int, row: dict[str, Any]) -> None:
         rtype = row.get("type")
         if rtype == "__unparsable__":
@@ -1107,20 +1138,26 @@ def translate_with_stats(
     return _Translator(rows, session_id, trace_dir).run()
 
 
+def _parse_line(line: str) -> dict[str, Any] | None:
+    """一行 → 一条原始记录。空行是 None；解不开的行给占位，NEVER 跳过。"""
+    stripped = line.strip()
+    if not stripped:
+        return None
+    try:
+        parsed = json.loads(stripped)
+    except json.JSONDecodeError:
+        return {"type": "__unparsable__", "raw_line": stripped[:2000]}
+    return parsed if isinstance(parsed, dict) else {"type": "__unparsable__"}
+
+
 def _read_rows(path: Path) -> list[dict[str, Any]]:
     """逐行读，解不开的行不跳过——留一个占位让翻译层出一条标记未识别的记录。"""
     rows: list[dict[str, Any]] = []
     with path.open(encoding="utf-8", errors="replace") as handle:
         for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                parsed = json.loads(stripped)
-            except json.JSONDecodeError:
-                rows.append({"type": "__unparsable__", "raw_line": stripped[:2000]})
-                continue
-            rows.append(parsed if isinstance(parsed, dict) else {"type": "__unparsable__"})
+            row = _parse_line(line)
+            if row is not None:
+                rows.append(row)
     return rows
 
 
@@ -1138,6 +1175,66 @@ def to_unified(source: Path | str | Iterable[dict[str, Any]]) -> list[UnifiedRec
     return translate_records(list(source))
 
 
+class TranscriptTail:
+    """一个会话文件的增量读者：只读上次之后追加的字节，只翻新来的行。
+
+    会话文件是逐 token 追加写的，活着的会话一秒能动好几次。每动一次就把整个文件
+    重读重翻，三十兆的会话就是每次三十兆——这里记住读到哪个字节，下次从那里接着读，
+    一次的代价只跟追加了多少成正比。
+
+    末尾没写完的半行（还没有换行符）留到下次再读，NEVER 当成一行解不开的 JSON 出
+    一条未识别记录。文件被截短或换了一个（inode 变了）时从头重来，``seq`` 也从 0
+    重新数，:attr:`restarted` 为真。
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.restarted = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._identity: tuple[int, int] | None = None
+        self._translator = _Translator([], self.path.stem, None)
+
+    def read_appended(self) -> tuple[list[dict[str, Any]], list[UnifiedRecord]]:
+        """读上次之后追加的完整行，返回 ``(原始行, 它们翻出的统一记录)``。"""
+        self.restarted = False
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return [], []
+        identity = (stat.st_dev, stat.st_ino)
+        if self._identity is not None and (identity != self._identity or stat.st_size < self._offset):
+            self._reset()
+            self.restarted = True
+        self._identity = identity
+        if stat.st_size == self._offset:
+            return [], []
+
+        with self.path.open("rb") as handle:
+            handle.seek(self._offset)
+            chunk = handle.read(stat.st_size - self._offset)
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return [], []
+        self._offset += end + 1
+
+        rows: list[dict[str, Any]] = []
+        # 只按 b"\n" 切，跟 ``_read_rows`` 一个口径。``str.splitlines`` 还认 U+2028、\x85、
+        # \x0b、\x0c，正文里带一个就会把一行 JSON 劈成两条解不开的占位。
+        for line in chunk[:end].split(b"\n"):
+            row = _parse_line(line.decode("utf-8", errors="replace"))
+            if row is not None:
+                rows.append(row)
+
+        if self._translator._trace_dir is None:
+            trace_dir = self.path.parent / self.path.stem / "subagents"
+            if trace_dir.is_dir():
+                self._translator._trace_dir = trace_dir
+        return rows, self._translator.feed(rows)
+
+
 class ClaudeCodeRecordAdapter:
     """Claude Code 这一家的翻译层。形状对齐 ``adapters.RecordAdapter``。
 
@@ -42,6 +42,7 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     "OpencodeRecordAdapter",
+    "PartTail",
     "read_raw",
     "to_unified",
 ]
@@ -124,6 +125,8 @@ class _Envelope:
     agent: str | None
     synthetic: bool = False
     """库里没有这条消息、只有挂在它下面的片段时为真（孤儿片段的兜底信封）。"""
+    parent_id: str | None = None
+    finish: str | None = None
 
 
 # ── 读库 ────────────────────────────────────────────────────────────
@@ -158,28 +161,42 @@ def _str_or_none(value: Any) -> str | None:
     return value if isinstance(value, str) and value else None
 
 
-def _read_envelopes(session_id: str) -> list[_Envelope]:
-    """这场会话的全部消息信封，按 ``(time_created, id)`` 升序。
+def _read_envelopes(
+    session_id: str, since: int | None = None, ids: tuple[str, ...] = ()
+) -> list[_Envelope]:
+    """这场会话的消息信封，按 ``(time_created, id)`` 升序。
 
     ``opencode_store`` 没有暴露「只要信封」的读法（它的 ``latest_turn`` 只回最新一轮），
     所以这一条查询写在这里，连接仍然走 ``opencode_store`` 的只读打开。正文一个字都不取，
     避开 ``summary.diffs`` 那几条 22 万字符的用户消息。
+
+    给了 ``since`` 就只取创建时刻不早于它的，外加 ``ids`` 点名的那几条——增量读信封
+    用：新消息按时刻取，还没写完的老消息按编号补。
     """
     conn = opencode_store._connect()
     if conn is None:
         return []
+    sql = (
+        "SELECT id, time_created, "
+        "json_extract(data, '$.role')       AS role, "
+        "json_extract(data, '$.time.completed') AS completed, "
+        "json_extract(data, '$.error')      AS error, "
+        "json_extract(data, '$.modelID')    AS model_id, "
+        "json_extract(data, '$.providerID') AS provider_id, "
+        "json_extract(data, '$.agent')      AS agent, "
+        "json_extract(data, '$.parentID')   AS parent_id, "
+        "json_extract(data, '$.finish')     AS finish "
+        "FROM message WHERE session_id = ? "
+    )
+    params: list[Any] = [session_id]
+    if since is not None:
+        marks = ", ".join("?" for _ in ids)
+        sql += f"AND (time_created >= ? OR id IN ({marks})) " if ids else "AND time_created >= ? "
+        params.append(since)
+        params.extend(ids)
+    sql += "ORDER BY time_created ASC, id ASC"
     try:
-        rows = conn.execute(
-            "SELECT id, time_created, "
-            "json_extract(data, '$.role')       AS role, "
-            "json_extract(data, '$.time.completed') AS completed, "
-            "json_extract(data, '$.error')      AS error, "
-            "json_extract(data, '$.modelID')    AS model_id, "
-            "json_extract(data, '$.providerID') AS provider_id, "
-            "json_extract(data, '$.agent')      AS agent "
-            "FROM message WHERE session_id = ? ORDER BY time_created ASC, id ASC",
-            (session_id,),
-        ).fetchall()
+        rows = conn.execute(sql, tuple(params)).fetchall()
     except sqlite3.Error as exc:
         logger.debug("opencode _read_envelopes failed: %s", exc)
         return []
@@ -187,7 +204,7 @@ def _read_envelopes(session_id: str) -> list[_Envelope]:
         conn.close()
 
     envelopes: list[_Envelope] = []
-    for mid, created, role, completed, error, model_id, provider_id, agent in rows:
+    for mid, created, role, completed, error, model_id, provider_id, agent, parent, finish in rows:
         envelopes.append(
             _Envelope(
                 message_id=str(mid),
@@ -198,15 +215,20 @@ def _read_envelopes(session_id: str) -> list[_Envelope]:
                 model_id=_str_or_none(model_id),
                 provider_id=_str_or_none(provider_id),
                 agent=_str_or_none(agent),
+                parent_id=_str_or_none(parent),
+                finish=_str_or_none(finish),
             )
         )
     return envelopes
 
 
-def _read_session_events(session_id: str) -> list[tuple[str, str, int, dict[str, Any]]]:
+def _read_session_events(
+    session_id: str, since: int = 0
+) -> list[tuple[str, str, int, dict[str, Any]]]:
     """会话级系统事件（切 agent / 切模型），按 ``(time_created, seq)`` 升序。
 
     这些行不在 ``message`` 表里，要与消息时间线归并渲染，两张表的 ``seq`` 不共享。
+    ``since`` 给了就只取创建时刻不早于它的。
     """
     conn = opencode_store._connect()
     if conn is None:
@@ -214,8 +236,8 @@ def _read_session_events(session_id: str) -> list[tuple[str, str, int, dict[str,
     try:
         rows = conn.execute(
             "SELECT id, type, time_created, data FROM session_message "
-            "WHERE session_id = ? ORDER BY time_created ASC, seq ASC",
-            (session_id,),
+            "WHERE session_id = ? AND time_created >= ? ORDER BY time_created ASC, seq ASC",
+            (session_id, since),
         ).fetchall()
     except sqlite3.Error as exc:
         # 早期版本没有这张表，取不到就当这场会话没切过 agent / 模型。
@@ -747,6 +769,23 @@ def translate_session(session_id: str) -> list[UnifiedRecord]:
     一条消息一个片段都没有（本机 4 条，全是被中断或出错的助手消息）照常处理，不当作损坏：
     它的信封里还有报错可渲染。
     """
+    drafts, _envelopes, _parts, _events = _session_drafts(session_id)
+    return [_record(session_id, draft, index) for index, draft in enumerate(drafts)]
+
+
+def _session_drafts(
+    session_id: str,
+) -> tuple[
+    list[_Draft],
+    list[_Envelope],
+    dict[str, list[dict[str, Any]]],
+    list[tuple[str, str, int, dict[str, Any]]],
+]:
+    """整场会话的草稿，连同翻它时读到的信封、按消息分好的片段与会话事件。
+
+    后三样是给 ``PartTail`` 锚基线用的：整场翻一遍的同时把增量要的账一起记下，不必
+    再读第二遍库。
+    """
     envelopes = _read_envelopes(session_id)
     parts_by_message: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for item in opencode_store.session_parts(session_id):
@@ -758,25 +797,12 @@ def translate_session(session_id: str) -> list[UnifiedRecord]:
         if message_id in known:
             continue
         logger.debug("opencode 片段挂在未知消息上，已补兜底信封: %s", message_id)
-        envelopes.append(
-            _Envelope(
-                message_id=message_id,
-                role="assistant",
-                time_created=int(items[0]["time_created"]),
-                time_completed=None,
-                error=None,
-                model_id=None,
-                provider_id=None,
-                agent=None,
-                synthetic=True,
-            )
-        )
+        envelopes.append(_orphan_envelope(message_id, int(items[0]["time_created"])))
     envelopes.sort(key=lambda envelope: (envelope.time_created, envelope.message_id))
 
     # 会话事件与消息按时刻归并。同刻时事件在前——切 agent / 切模型发生在那条发言之前。
-    blocks: list[tuple[int, int, Any]] = [
-        (row[2], 0, row) for row in _read_session_events(session_id)
-    ]
+    events = _read_session_events(session_id)
+    blocks: list[tuple[int, int, Any]] = [(row[2], 0, row) for row in events]
     blocks += [(envelope.time_created, 1, envelope) for envelope in envelopes]
     blocks.sort(key=lambda block: (block[0], block[1]))
 
@@ -793,23 +819,212 @@ def translate_session(session_id: str) -> list[UnifiedRecord]:
         error_draft = _envelope_error_draft(envelope, parts)
         if error_draft is not None:
             drafts.append(error_draft)
+    return drafts, envelopes, parts_by_message, events
+
+
+def _orphan_envelope(message_id: str, time_created: int) -> _Envelope:
+    return _Envelope(
+        message_id=message_id,
+        role="assistant",
+        time_created=time_created,
+        time_completed=None,
+        error=None,
+        model_id=None,
+        provider_id=None,
+        agent=None,
+        synthetic=True,
+    )
 
-    return [
-        UnifiedRecord(
-            id=draft.id,
-            session_id=session_id,
-            group_id=draft.group_id,
-            seq=index,
-            ts=draft.ts,
-            kind=draft.kind,
-            # opencode 的子 agent 是一等公民会话（``session.parent_id`` 非空），不混在父
-            # 会话的记录流里。轨迹关系由 ``subagent.dispatch`` 的 ``child_session_id`` 指出。
-            agent_path=[],
-            payload=draft.payload,
-            raw_available=draft.raw_available,
+
+def _record(session_id: str, draft: _Draft, seq: int) -> UnifiedRecord:
+    return UnifiedRecord(
+        id=draft.id,
+        session_id=session_id,
+        group_id=draft.group_id,
+        seq=seq,
+        ts=draft.ts,
+        kind=draft.kind,
+        # opencode 的子 agent 是一等公民会话（``session.parent_id`` 非空），不混在父
+        # 会话的记录流里。轨迹关系由 ``subagent.dispatch`` 的 ``child_session_id`` 指出。
+        agent_path=[],
+        payload=draft.payload,
+        raw_available=draft.raw_available,
+    )
+
+
+# 增量读最多盯几条「没写完」的消息；比最新一条早这么久还没写完的当作已被放弃。
+OPEN_MESSAGE_LIMIT = 16
+OPEN_MESSAGE_TTL_MS = 30 * 60_000
+
+
+class PartTail:
+    """一场会话的游标驱动增量翻译：每次只翻游标之后被写过的片段。
+
+    实时流用。首次 ``read_new`` 整场翻一遍锚基线（序号与 ``translate_session`` 一致），
+    顺手记下最大片段 id、信封、每条消息的片段类型与已发记录编号；之后每次只做三件事：
+    ``parts_after`` 取新插的片段并点名重读还没写完那几条消息底下的片段，补读新消息与
+    没写完那几条的信封，补读新的会话事件。一次的成本跟这段时间写了多少、眼下有几条
+    消息没写完有关，跟会话有多长无关。
+
+    opencode 先插空壳片段再把内容 UPDATE 进去，同一片段会被反复取回：发过的记录编号
+    不再发（前端本来也按编号去重），新编号接在末尾往后编序号。
+
+    「没写完」的消息最多记 :data:`OPEN_MESSAGE_LIMIT` 条，比最新一条早
+    :data:`OPEN_MESSAGE_TTL_MS` 以上的当作已被放弃（opencode 崩掉时留下的助手消息永远
+    等不到完成时刻）——不设上限的话，点名重读的名单会跟着会话一起长。
+    """
+
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        self._started = False
+        self._last_part: str | None = None
+        self._envelopes: dict[str, _Envelope] = {}
+        self._envelope_since = 0
+        self._event_since = 0
+        self._part_types: dict[str, dict[str, Any]] = defaultdict(dict)
+        self._emitted: set[str] = set()
+        self._next_seq = 0
+        # 还没写完的消息 → 创建时刻。它们的信封与片段每拍都要点名重读。
+        self._open: dict[str, int] = {}
+        # 本轮：最新那条用户消息的 (时刻, id)，以及指向它的助手消息信封。
+        self._anchor: tuple[int, str] | None = None
+        self._turn: dict[str, _Envelope] = {}
+
+    def read_new(self) -> list[UnifiedRecord]:
+        """自上次以来新出现的记录。读库失败时空列表，下次从原游标重来。"""
+        if not self._started:
+            return self._baseline()
+        return self._advance()
+
+    @property
+    def turn_done(self) -> bool:
+        """本轮是否答完，判据与 ``opencode_store.latest_turn`` 同一份，只看缓存的信封。"""
+        if self._anchor is None:
+            return False
+        messages: list[tuple[str, dict[str, Any]]] = [(self._anchor[1], {"role": "user"})]
+        for message_id, envelope in self._turn.items():
+            messages.append(
+                (
+                    message_id,
+                    {
+                        "role": "assistant",
+                        "parentID": envelope.parent_id,
+                        "time": {"completed": envelope.time_completed},
+                        "finish": envelope.finish,
+                    },
+                )
+            )
+        verdict = opencode_store.turn_verdict(messages)
+        return verdict is not None and verdict[2] is not None
+
+    def _baseline(self) -> list[UnifiedRecord]:
+        # 最大 id 先取、整场后翻：两步之间落下的片段下一次会再取回，靠编号去重。
+        last_part = opencode_store.latest_part_id(self.session_id)
+        drafts, envelopes, parts_by_message, events = _session_drafts(self.session_id)
+        self._last_part = last_part
+        self._started = True
+        for envelope in envelopes:
+            self._remember(envelope)
+        for message_id, items in parts_by_message.items():
+            for item in items:
+                self._part_types[message_id][str(item["part_id"])] = item["part"].get("type")
+        if events:
+            self._event_since = events[-1][2]
+        return self._emit(drafts)
+
+    def _advance(self) -> list[UnifiedRecord]:
+        self._expire_open()
+        reread = tuple(
+            sorted(part_id for message_id in self._open for part_id in self._part_types.get(message_id, ()))
         )
-        for index, draft in enumerate(drafts)
-    ]
+        items, self._last_part = opencode_store.parts_after(self.session_id, self._last_part, reread)
+        unknown = {str(item["message_id"]) for item in items} - self._envelopes.keys()
+        envelopes = _read_envelopes(
+            self.session_id, since=self._envelope_since, ids=tuple(sorted(self._open.keys() | unknown))
+        )
+        for envelope in envelopes:
+            self._remember(envelope)
+        for message_id in unknown - self._envelopes.keys():
+            created = min(
+                int(item["time_created"]) for item in items if item["message_id"] == message_id
+            )
+            self._remember(_orphan_envelope(message_id, created))
+
+        drafts: list[_Draft] = []
+        events = _read_session_events(self.session_id, since=self._event_since)
+        if events:
+            self._event_since = events[-1][2]
+        drafts.extend(_event_draft(row) for row in events)
+
+        for item in items:
+            types = self._part_types[str(item["message_id"])]
+            types[str(item["part_id"])] = item["part"].get("type")
+        items.sort(
+            key=lambda item: (
+                self._envelopes[str(item["message_id"])].time_created,
+                str(item["message_id"]),
+                int(item["time_created"]),
+                str(item["part_id"]),
+            )
+        )
+        for item in items:
+            envelope = self._envelopes[str(item["message_id"])]
+            drafts.extend(_part_drafts(item, envelope, self._counts(envelope.message_id)))
+        for envelope in envelopes:
+            if not envelope.error or f"{envelope.message_id}:interrupt" in self._emitted:
+                continue
+            error_draft = _envelope_error_draft(envelope, self._type_items(envelope.message_id))
+            if error_draft is not None:
+                drafts.append(error_draft)
+        return self._emit(drafts)
+
+    def _remember(self, envelope: _Envelope) -> None:
+        self._envelopes[envelope.message_id] = envelope
+        # 还可能变的：没写完的助手消息（完成时刻与中断报错都是后补的）和兜底信封。
+        if envelope.synthetic or (
+            envelope.role != "user" and envelope.time_completed is None and not envelope.error
+        ):
+            self._open[envelope.message_id] = envelope.time_created
+        else:
+            self._open.pop(envelope.message_id, None)
+        if envelope.synthetic:
+            return
+        self._envelope_since = max(self._envelope_since, envelope.time_created)
+        if envelope.role == "user":
+            key = (envelope.time_created, envelope.message_id)
+            if self._anchor is None or key > self._anchor:
+                self._anchor = key
+                self._turn = {}
+        elif self._anchor is not None and envelope.parent_id == self._anchor[1]:
+            self._turn[envelope.message_id] = envelope
+
+    def _expire_open(self) -> None:
+        """放弃太旧的、超出名额的「没写完」消息，点名重读的名单不跟着会话长。"""
+        if not self._open:
+            return
+        floor = max(self._open.values()) - OPEN_MESSAGE_TTL_MS
+        newest = sorted(self._open.items(), key=lambda kv: (kv[1], kv[0]), reverse=True)
+        self._open = {
+            message_id: created
+            for message_id, created in newest[:OPEN_MESSAGE_LIMIT]
+            if created >= floor
+        }
+
+    def _type_items(self, message_id: str) -> list[dict[str, Any]]:
+        return [{"part": {"type": t}} for t in self._part_types.get(message_id, {}).values()]
+
+    def _counts(self, message_id: str) -> tuple[int, int]:
+        return _step_counts(self._type_items(message_id))
+
+    def _emit(self, drafts: list[_Draft]) -> list[UnifiedRecord]:
+        records: list[UnifiedRecord] = []
+        for draft in drafts:
+            if draft.id in self._emitted:
+                continue
+            self._emitted.add(draft.id)
+            records.append(_record(self.session_id, draft, self._next_seq))
+            self._next_seq += 1
+        return records
 
 
 def to_unified(
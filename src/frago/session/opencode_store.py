@@ -19,6 +19,7 @@ opencode 把会话搬进了 SQLite（``~/.local/share/opencode/opencode.db``）
 
 from __future__ import annotations
 
+import contextlib
 import functools
 import json
 import logging
@@ -233,6 +234,30 @@ def latest_turn(opencode_session_id: str) -> OpencodeTurn | None:
         conn.close()
 
     messages = [(str(mid), _loads(raw)) for mid, raw in rows]
+    verdict = turn_verdict(messages)
+    if verdict is None:
+        return None
+    parent_id, turn_ids, final_message_id, completed_at = verdict
+    text = _turn_text(turn_ids)
+    return OpencodeTurn(
+        parent_id=parent_id,
+        final_message_id=final_message_id,
+        done=final_message_id is not None,
+        text=text,
+        completed_at=completed_at,
+    )
+
+
+def turn_verdict(
+    messages: list[tuple[str, dict[str, Any]]],
+) -> tuple[str, list[str], str | None, int | None] | None:
+    """按 ``latest_turn`` 的判据裁决最新一轮，只看消息信封，不读库。
+
+    ``messages`` 是 ``(id, data)`` 按创建时间升序；``data`` 里只用得到 ``role`` /
+    ``parentID`` / ``time.completed`` / ``finish`` 四个字段。返回
+    ``(本轮锚点 id, 本轮助手消息 id 列表, 终结消息 id, 完成时刻)``，没有用户消息时
+    返回 None。实时流手里已经缓存着信封，拿这里判完成就不必每拍整表重读。
+    """
     parent_id = next(
         (mid for mid, data in reversed(messages) if data.get("role") == "user"),
         None,
@@ -257,15 +282,7 @@ def latest_turn(opencode_session_id: str) -> OpencodeTurn | None:
             continue
         final_message_id = mid
         completed_at = stamp
-
-    text = _turn_text([mid for mid, _ in turn_messages])
-    return OpencodeTurn(
-        parent_id=parent_id,
-        final_message_id=final_message_id,
-        done=final_message_id is not None,
-        text=text,
-        completed_at=completed_at,
-    )
+    return parent_id, [mid for mid, _ in turn_messages], final_message_id, completed_at
 
 
 def _turn_text(message_ids: list[str]) -> str:
@@ -380,28 +397,158 @@ def parts_since(
 
     items: list[dict[str, Any]] = []
     new_cursor = cursor
-    for part_id, message_id, created, updated, part_raw, message_raw in rows:
-        created_int = created if isinstance(created, int) else 0
-        updated_int = updated if isinstance(updated, int) else created_int
-        new_cursor = PartCursor(time_updated=updated_int, part_id=str(part_id))
-        part = _loads(part_raw)
-        if not part:
-            # data 损坏：位置照样吃掉（游标已推进），内容当不存在。
-            continue
-        message = _loads(message_raw)
-        items.append(
-            {
-                "part": part,
-                "role": message.get("role") or "assistant",
-                "message_id": str(message_id),
-                "time_created": created_int,
-                "time_updated": updated_int,
-                "part_id": str(part_id),
-            }
-        )
+    for row in rows:
+        item = _part_item(row)
+        new_cursor = PartCursor(time_updated=item["time_updated"], part_id=item["part_id"])
+        if item["part"]:
+            # data 损坏的：位置照样吃掉（游标已推进），内容当不存在。
+            items.append(item)
     return items, new_cursor
 
 
+def _part_item(row: tuple[Any, ...]) -> dict[str, Any]:
+    part_id, message_id, created, updated, part_raw, message_raw = row
+    created_int = created if isinstance(created, int) else 0
+    return {
+        "part": _loads(part_raw),
+        "role": _loads(message_raw).get("role") or "assistant",
+        "message_id": str(message_id),
+        "time_created": created_int,
+        "time_updated": updated if isinstance(updated, int) else created_int,
+        "part_id": str(part_id),
+    }
+
+
+def latest_part_id(opencode_session_id: str) -> str | None:
+    """该会话最大的片段 id。没有片段 / 读失败返回 None。"""
+    conn = _connect()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute(
+            "SELECT max(id) FROM part WHERE session_id = ?", (opencode_session_id,)
+        ).fetchone()
+    except sqlite3.Error as exc:
+        logger.debug("opencode latest_part_id failed: %s", exc)
+        return None
+    finally:
+        conn.close()
+    return str(row[0]) if row and row[0] is not None else None
+
+
+def parts_after(
+    opencode_session_id: str, after_id: str | None, reread: tuple[str, ...] = ()
+) -> tuple[list[dict[str, Any]], str | None]:
+    """id 大于 ``after_id`` 的片段，外加 ``reread`` 点名重读的那几条，按 id 升序。
+
+    项的形状与 :func:`parts_since` 相同。opencode 的片段 id 是递增生成的，所以
+    「之后新插的」就是 ``id > after_id``，走主键区间；内容还会被 UPDATE 的那几条（没写完
+    的消息底下的片段）由调用方按 id 点名补读，同样走主键。一拍的成本只跟新片段与点名的
+    条数有关，跟会话有多长无关——``parts_since`` 按更新时间筛，库里没有那一列的索引，
+    每拍都要把整场的片段扫一遍。
+
+    第二个返回值是新的最大 id。读失败返回 ``([], after_id)``——不推进，下一拍重试。
+    """
+    conn = _connect()
+    if conn is None:
+        return [], after_id
+    sql = (
+        "SELECT p.id, p.message_id, p.time_created, p.time_updated, p.data, m.data "
+        "FROM part p JOIN message m ON m.id = p.message_id "
+    )
+    params: list[Any] = []
+    if after_id is None:
+        sql += "WHERE p.session_id = ?"
+    else:
+        # ``+`` 让会话那一列不参与选索引，否则规划器会挑会话索引把整场扫一遍；
+        # 也不写 ORDER BY——排序会逼它改成按主键全表走，次序在下面自己排。
+        clauses = ["p.id > ?"]
+        params.append(after_id)
+        if reread:
+            clauses.append(f"p.id IN ({', '.join('?' for _ in reread)})")
+            params.extend(reread)
+        sql += f"WHERE ({' OR '.join(clauses)}) AND +p.session_id = ?"
+    params.append(opencode_session_id)
+    try:
+        rows = sorted(conn.execute(sql, tuple(params)).fetchall(), key=lambda row: str(row[0]))
+    except sqlite3.Error as exc:
+        logger.debug("opencode parts_after failed: %s", exc)
+        return [], after_id
+    finally:
+        conn.close()
+
+    items: list[dict[str, Any]] = []
+    last_id = after_id
+    for row in rows:
+        item = _part_item(row)
+        if last_id is None or item["part_id"] > last_id:
+            last_id = item["part_id"]
+        if item["part"]:
+            items.append(item)
+    return items, last_id
+
+
+class ChangeProbe:
+    """"库自上次以来有没有人写过"的廉价探针，给轮询方在真正查询之前先问一句。
+
+    判据是 ``(库文件 stat, -wal 文件 stat, PRAGMA data_version)``。``data_version``
+    只在**别的连接**提交之后变，而且只对同一条连接有意义，故探针自己攥着一条只读
+    长连接，NEVER 每次新开；WAL 模式下提交只落日志文件、主库 mtime 不动，所以日志
+    的 stat 也要算进去。两样都没变就说明没有新片段，一条 SELECT 都不必发。
+
+    第一次调用恒为真；库不存在时恒为假；探测本身出错时当作变了——宁可多查一拍，
+    也不能把一次写入漏掉。
+    """
+
+    def __init__(self) -> None:
+        self._conn: sqlite3.Connection | None = None
+        self._path: Path | None = None
+        self._last: tuple[Any, ...] | None = None
+
+    def changed(self) -> bool:
+        path = db_path()
+        stamp = _file_stamp(path)
+        if stamp is None:
+            self.close()
+            self._last = None
+            return False
+        if self._path != path:
+            self.close()
+            self._path = path
+        signature = (stamp, _file_stamp(Path(f"{path}-wal")), self._data_version())
+        if signature[2] is None or signature != self._last:
+            self._last = signature
+            return True
+        return False
+
+    def _data_version(self) -> int | None:
+        if self._conn is None:
+            self._conn = _connect()
+            if self._conn is None:
+                return None
+        try:
+            row = self._conn.execute("PRAGMA data_version").fetchone()
+        except sqlite3.Error as exc:
+            logger.debug("opencode data_version probe failed: %s", exc)
+            self.close()
+            return None
+        return row[0] if row else None
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(sqlite3.Error):
+                self._conn.close()
+            self._conn = None
+
+
+def _file_stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
 # ── 片段翻成记录：两个消费方共用的唯一一份规则 ──────────────────────
 # 实时流（driver）与归档同步（opencode_sync）必须按同一套规则把片段翻成记录，
 # 否则同一个会话在 WebSocket 上与在归档里长得不一样。规则是纯函数：只看片段本身，
@@ -11,10 +11,19 @@ Design:
   seconds while any session is registered.
 - Consumers call ``watch_session(sid)`` / ``unwatch_session(sid)`` to
   register / deregister interest.
-- On each tick the stream re-translates watched sessions through
-  :func:`opencode_records.translate_session`, diffs against cached seq,
-  and pushes deltas via ``on_records`` callback.
-- Turn completion is detected via :func:`opencode_store.latest_turn`.
+- Each tick first asks :class:`opencode_store.ChangeProbe` whether anyone
+  wrote to the DB (``PRAGMA data_version`` on a long-lived read-only
+  connection plus the ``-wal`` file's stat). An idle tick stops there —
+  no query is issued.
+- Each watched session owns an :class:`opencode_records.PartTail`: the
+  highest part id it has seen plus the bookkeeping to translate only parts
+  inserted after it, and re-read the parts of the few messages still being
+  written. The first read anchors a baseline with a full translation;
+  later reads cost what was written, not how long the session is. Deltas
+  are pushed via the ``on_records`` callback.
+- Turn completion is judged from the tail's cached envelopes with the same
+  rule as :func:`opencode_store.latest_turn`, and only on ticks that
+  brought something new.
 - The polling thread stops automatically when no sessions are watched.
 """
 
@@ -23,8 +32,10 @@ from __future__ import annotations
 import logging
 import threading
 from collections.abc import Callable
+from dataclasses import asdict
 
-from frago.session.opencode_store import db_path, latest_turn
+from frago.session.adapters.opencode_records import PartTail
+from frago.session.opencode_store import ChangeProbe, db_path
 
 logger = logging.getLogger(__name__)
 
@@ -55,10 +66,11 @@ class OpencodeStream:
         self._on_records = on_records
         self._on_turn_complete = on_turn_complete
 
-        self._session_seqs: dict[str, int] = {}
+        self._tails: dict[str, PartTail] = {}
         self._session_done: dict[str, bool] = {}
         self._watched: set[str] = set()
         self._state_lock = threading.Lock()
+        self._probe = ChangeProbe()
 
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
@@ -104,29 +116,42 @@ class OpencodeStream:
         """Deregister interest in *session_id*."""
         with self._state_lock:
             self._watched.discard(session_id)
-            self._session_seqs.pop(session_id, None)
+            self._tails.pop(session_id, None)
             self._session_done.pop(session_id, None)
 
     # ---- internal ---------------------------------------------------------
 
     def _poll_loop(self) -> None:
         """Background thread: poll every POLL_INTERVAL while sessions are watched."""
-        while not self._stop_event.is_set():
-            with self._state_lock:
-                has_sessions = bool(self._watched)
+        try:
+            while not self._stop_event.is_set():
+                with self._state_lock:
+                    has_sessions = bool(self._watched)
 
-            if has_sessions:
-                self._process()
+                if has_sessions:
+                    self._process()
 
-            self._stop_event.wait(POLL_INTERVAL)
+                self._stop_event.wait(POLL_INTERVAL)
+        finally:
+            # The probe's connection belongs to this thread; close it here.
+            self._probe.close()
 
     def _process(self) -> None:
-        """Re-translate all watched sessions, emit deltas."""
+        """Advance watched sessions' tails, emit deltas.
+
+        Nothing is read unless the DB changed since the last tick — except for
+        sessions watched since then, which still need their baseline.
+        """
         with self._state_lock:
             sessions = set(self._watched)
+            fresh = sessions - self._tails.keys()
 
         if not sessions:
             return
+        if not self._probe.changed():
+            sessions = fresh
+            if not sessions:
+                return
 
         for sid in sessions:
             try:
@@ -137,36 +162,32 @@ class OpencodeStream:
                 )
 
     def _process_session(self, session_id: str) -> None:
-        """Re-translate one session, diff, and emit."""
-        records = _safe_translate(session_id)
-        if records is None:
-            return
-
-        last_seq = self._session_seqs.get(session_id, -1)
-        new_records = [r for r in records if r.seq > last_seq]
-
-        if new_records:
-            self._session_seqs[session_id] = new_records[-1].seq
-            if self._on_records is not None:
-                from dataclasses import asdict
-
-                try:
-                    self._on_records(session_id, [asdict(r) for r in new_records])
-                except Exception:
-                    logger.exception(
-                        "OpencodeStream on_records callback failed (session=%s)",
-                        session_id,
-                    )
+        """Translate what was written to one session since its cursor, and emit."""
+        with self._state_lock:
+            if session_id not in self._watched:
+                return
+            tail = self._tails.get(session_id)
+            if tail is None:
+                tail = self._tails[session_id] = PartTail(session_id)
+
+        new_records = tail.read_new()
+        if new_records and self._on_records is not None:
+            try:
+                self._on_records(session_id, [asdict(r) for r in new_records])
+            except Exception:
+                logger.exception(
+                    "OpencodeStream on_records callback failed (session=%s)",
+                    session_id,
+                )
 
-        turn = latest_turn(session_id)
-        done = turn.done if turn is not None else False
+        done = tail.turn_done
         prev_done = self._session_done.get(session_id, False)
 
         if done and not prev_done:
             self._session_done[session_id] = True
             if self._on_turn_complete is not None:
                 try:
-                    self._on_turn_complete(session_id, True, "stop" if done else None)
+                    self._on_turn_complete(session_id, True, "stop")
                 except Exception:
                     logger.exception(
                         "OpencodeStream on_turn_complete callback failed (session=%s)",
@@ -174,16 +195,3 @@ class OpencodeStream:
                     )
         elif not done:
             self._session_done[session_id] = False
-
-
-def _safe_translate(session_id: str) -> list | None:
-    """Call translate_session, returning None on failure."""
-    try:
-        from frago.session.adapters.opencode_records import translate_session
-
-        return translate_session(session_id)
-    except Exception:
-        logger.debug(
-            "OpencodeStream: translate_session failed for %s", session_id, exc_info=True
-        )
-        return None
@@ -4,14 +4,17 @@ Moved out of :mod:`frago.session.monitor`: the Observer lifecycle is now owned
 by :mod:`frago.watcher`, and this module handles only the session-domain logic:
 
 - Encode project paths → Claude Code session directory
-- On file change, debounce, re-read the full JSONL through
-  :mod:`frago.session.adapters.claude_code_records`
+- On file change, coalesce the burst on a per-file timer, then read only the
+  bytes appended since last time through
+  :class:`frago.session.adapters.claude_code_records.TranscriptTail`
 - Track the latest seen ``seq`` to surface only new ``UnifiedRecord`` entries
-- Check turn completion via :func:`frago.session.transcript_completion.evaluate_file`
+- Check turn completion via :func:`frago.session.transcript_completion.evaluate_records`
+  on the newly appended rows
 
 Design boundary:
 - ``SessionStream`` registers with ``WatchdogObserverService`` (never owns an Observer)
-- Callbacks fire on the Observer's thread — consumers must handle thread-safety
+- The Observer thread only arms a timer; it never sleeps or parses. Callbacks
+  fire on the timer's thread — consumers must handle thread-safety
 - This module does NOT import ``server/`` or ``cli/``
 """
 
@@ -20,17 +23,21 @@ from __future__ import annotations
 import logging
 import os
 import threading
-import time
 from collections.abc import Callable
+from dataclasses import asdict
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from frago.session.claude_sessions import CLAUDE_PROJECTS_DIR
 from frago.session.monitor import encode_project_path
 from frago.watcher import FileEvent, WatchdogObserverService, WatchTarget
 
+if TYPE_CHECKING:
+    from frago.session.adapters.claude_code_records import TranscriptTail
+
 logger = logging.getLogger(__name__)
 
-# Default debounce: wait for the file to settle before re-reading.
+# Default debounce: events for one file within this window are handled as one.
 DEFAULT_DEBOUNCE_SECONDS = 0.3
 
 
@@ -67,8 +74,8 @@ class SessionStream:
                 via ``dataclasses.asdict``.
             on_turn_complete: Called with ``(session_id, done, stop_reason)``
                 when the latest turn flips to complete.
-            debounce_seconds: How long to wait after the last file event before
-                re-reading and classifying.
+            debounce_seconds: How long after the first event of a burst the
+                file is read. Events arriving in between ride along with it.
             session_id_filter: If set, only track this specific session.
         """
         self._project_path = os.path.abspath(project_path)
@@ -84,10 +91,14 @@ class SessionStream:
         self._file_seqs: dict[str, int] = {}  # file_path → last seen seq
         # Per-file state: last known turn-completion verdict.
         self._file_done: dict[str, bool] = {}  # file_path → done
-        # Debounce timers: file_path → last-event-time
-        self._last_event_at: dict[str, float] = {}
+        # Per-file state: where reading and translating left off.
+        self._tails: dict[str, TranscriptTail] = {}  # file_path → TranscriptTail
+        # Debounce timers: file_path → timer armed by the first event of a burst
+        self._timers: dict[str, threading.Timer] = {}
         # Debounce lock
         self._debounce_lock = threading.Lock()
+        # One file processed at a time: the per-file state above is not locked.
+        self._process_lock = threading.Lock()
         # Running flag
         self._running = False
 
@@ -127,12 +138,20 @@ class SessionStream:
             self._target = None
 
         self._running = False
+        with self._debounce_lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
         logger.debug("SessionStream stopped: %s", self._project_path)
 
     # ---- internal ---------------------------------------------------------
 
     def _on_file_event(self, event: FileEvent) -> None:
-        """Called by the watcher thread when a ``*.jsonl`` file changes."""
+        """Called by the watcher thread when a ``*.jsonl`` file changes.
+
+        Only arms a timer. Sleeping here, as this once did, held up event
+        dispatch for every directory the shared Observer watches.
+        """
         if event.is_directory:
             return
 
@@ -144,29 +163,40 @@ class SessionStream:
             if stem != self._session_id_filter:
                 return
 
-        now = time.monotonic()
         with self._debounce_lock:
-            self._last_event_at[file_path] = now
-
-        # Sleep outside the lock so other events can update the timestamp
-        time.sleep(self._debounce)
+            if file_path in self._timers:
+                # A read is already scheduled and will see this write too.
+                return
+            timer = threading.Timer(self._debounce, self._flush, args=(file_path,))
+            timer.daemon = True
+            self._timers[file_path] = timer
+        timer.start()
 
+    def _flush(self, file_path: str) -> None:
+        """Timer callback: the burst for *file_path* is over, read it once."""
         with self._debounce_lock:
-            last = self._last_event_at.get(file_path, 0)
-            if last > now:
-                # A newer event arrived while we were sleeping — skip this round,
-                # the follow-up sleep (triggered by the newer event) will handle it.
+            self._timers.pop(file_path, None)
+            if not self._running:
                 return
-
-        self._process_file(file_path)
+        # Events from here on arm a fresh timer, so nothing written while
+        # this read is in progress is missed.
+        with self._process_lock:
+            self._process_file(file_path)
 
     def _process_file(self, file_path: str) -> None:
-        """Re-read and classify *file_path*, emit new records."""
+        """Read what was appended to *file_path*, emit new records."""
         try:
-            from frago.session.adapters.claude_code_records import to_unified
-            from frago.session.transcript_completion import evaluate_file
-
-            records = to_unified(file_path)
+            from frago.session.adapters.claude_code_records import TranscriptTail
+            from frago.session.transcript_completion import evaluate_records
+
+            tail = self._tails.get(file_path)
+            if tail is None:
+                tail = self._tails[file_path] = TranscriptTail(file_path)
+            rows, records = tail.read_appended()
+            if tail.restarted:
+                # The file was truncated or replaced; seq counts from 0 again.
+                self._file_seqs.pop(file_path, None)
+                self._file_done.pop(file_path, None)
 
             session_id = Path(file_path).stem
             last_seq = self._file_seqs.get(file_path, -1)
@@ -177,8 +207,6 @@ class SessionStream:
                 self._file_seqs[file_path] = new_records[-1].seq
 
                 if self._on_records is not None:
-                    from dataclasses import asdict
-
                     try:
                         self._on_records(
                             session_id,
@@ -190,9 +218,16 @@ class SessionStream:
                             session_id,
                         )
 
-            # Check turn completion (only if new records arrived or not yet known)
-            verdict = evaluate_file(Path(file_path))
-            done = bool(verdict.done) if verdict is not None else False
+            # The verdict is decided by the last main-conversation assistant
+            # row. If none was appended, the previous verdict still stands.
+            assistants = [
+                r for r in rows
+                if r.get("type") == "assistant" and not r.get("isSidechain", False)
+            ]
+            if not assistants:
+                return
+            verdict = evaluate_records(assistants[-1:], source_path=file_path)
+            done = bool(verdict.done)
             prev_done = self._file_done.get(file_path, False)
 
             if done and not prev_done:
@@ -200,11 +235,7 @@ class SessionStream:
                 self._file_done[file_path] = True
                 if self._on_turn_complete is not None:
                     try:
-                        self._on_turn_complete(
-                            session_id,
-                            True,
-                            verdict.stop_reason if verdict is not None else None,
-                        )
+                        self._on_turn_complete(session_id, True, verdict.stop_reason)
                     except Exception:
                         logger.exception(
                             "SessionStream on_turn_complete callback failed (session=%s)",
@@ -1,11 +1,25 @@
 """Skill registry - Scan and manage Claude Code Skills"""
 
+import json
+import logging
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
+# Parsed frontmatter survives between CLI invocations here, so a cold
+# `frago skill list` stats every SKILL.md instead of YAML-parsing each one.
+FRONTMATTER_CACHE_FILE = Path.home() / '.frago' / 'cache' / 'skill_frontmatter.json'
+# Bump when what an entry means changes (e.g. _parse_skill_md's rules).
+FRONTMATTER_CACHE_VERSION = 2
+
+_CacheSig = tuple[int, int]
+
 
 @dataclass
 class Skill:
@@ -23,6 +37,185 @@ class InvalidSkill:
     reason: str
 
 
+class _FrontmatterCache:
+    """Parsed SKILL.md frontmatter keyed on the file path.
+
+    An entry is reused while the file's size and mtime_ns are unchanged.
+    Failures are cached too (``metadata`` None, ``error`` set): a broken
+    SKILL.md is not worth re-parsing until somebody edits it.
+
+    Module level rather than per registry: the CLI and the server build a
+    fresh ``SkillRegistry`` (or call ``read_frontmatter``) for every listing.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._loaded_from: Path | None = None
+        self._dirty = False
+
+    @staticmethod
+    def signature(path: Path) -> _CacheSig | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def _ensure_loaded(self) -> None:
+        cache_file = FRONTMATTER_CACHE_FILE
+        if self._loaded_from == cache_file:
+            return
+        self._entries = {}
+        self._loaded_from = cache_file
+        self._dirty = False
+        try:
+            data = json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get('version') != FRONTMATTER_CACHE_VERSION
+            or not isinstance(data.get('entries'), dict)
+        ):
+            return
+        self._entries = data['entries']
+
+    def get(self, path: Path, sig: _CacheSig) -> dict[str, Any] | None:
+        """The cached entry for this signature, or None on a miss."""
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(str(path))
+        if not isinstance(entry, dict) or tuple(entry.get('sig') or ()) != sig:
+            return None
+        return entry
+
+    def put(self, path: Path, sig: _CacheSig, metadata: dict | None, error: str | None) -> None:
+        if metadata is not None:
+            # Only what survives JSON unchanged is cached. A frontmatter value
+            # YAML turned into something else (a date, say) would come back
+            # as a string and quietly change the skill.
+            try:
+                if json.loads(json.dumps(metadata)) != metadata:
+                    return
+            except (TypeError, ValueError):
+                return
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[str(path)] = {'sig': list(sig), 'metadata': metadata, 'error': error}
+            self._dirty = True
+
+    def prune(self, root: Path, seen: set[str]) -> None:
+        """Forget entries under ``root`` that the last scan did not see."""
+        prefix = str(root) + os.sep
+        with self._lock:
+            self._ensure_loaded()
+            stale = [k for k in self._entries if k.startswith(prefix) and k not in seen]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            cache_file = FRONTMATTER_CACHE_FILE
+            payload = {'version': FRONTMATTER_CACHE_VERSION, 'entries': self._entries}
+            self._dirty = False
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+            tmp.replace(cache_file)
+        except OSError as e:
+            logger.debug("Failed to save skill frontmatter cache: %s", e)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._loaded_from = None
+            self._dirty = False
+
+
+_frontmatter_cache = _FrontmatterCache()
+
+
+def parse_skill_md(path: Path) -> dict:
+    """Parse YAML frontmatter of SKILL.md file
+
+    Args:
+        path: SKILL.md file path
+
+    Returns:
+        Parsed metadata dictionary
+
+    Raises:
+        Exception: Raised when parsing fails
+    """
+    # utf-8-sig drops a BOM; splitlines() takes CRLF files as they come
+    lines = path.read_text(encoding='utf-8-sig').lstrip().splitlines()
+
+    # Check frontmatter start
+    if not lines or lines[0].rstrip() != '---':
+        raise Exception("File does not start with '---', missing YAML frontmatter")
+
+    # The YAML section ends at the next line that is just '---' (a '---'
+    # inside a value does not end it)
+    end = next((i for i, line in enumerate(lines[1:], 1) if line.rstrip() == '---'), None)
+    if end is None:
+        raise Exception("YAML frontmatter format error, missing closing '---'")
+
+    yaml_content = '\n'.join(lines[1:end])
+
+    # Parse YAML
+    try:
+        data = yaml.safe_load(yaml_content)
+    except yaml.YAMLError as e:
+        raise Exception(f"YAML parsing failed: {e}")
+
+    if not isinstance(data, dict):
+        raise Exception("YAML frontmatter must be in dictionary format")
+
+    return data
+
+
+def read_frontmatter(
+    path: Path, warn: logging.Logger | None = None
+) -> tuple[dict | None, str | None]:
+    """Frontmatter of a SKILL.md, parsed only if it changed since last time.
+
+    Args:
+        path: SKILL.md file path
+        warn: Log a parse failure here as a warning. Failures are cached, so
+            this happens once per version of the file, not on every listing.
+
+    Returns:
+        ``(metadata, None)`` on success, ``(None, reason)`` when the file
+        cannot be read or parsed.
+    """
+    sig = _frontmatter_cache.signature(path)
+    if sig is not None:
+        entry = _frontmatter_cache.get(path, sig)
+        if entry is not None:
+            return entry.get('metadata'), entry.get('error')
+    try:
+        metadata, error = parse_skill_md(path), None
+    except Exception as e:
+        metadata, error = None, str(e)
+        if warn is not None:
+            warn.warning("Failed to parse skill file %s: %s", path, e)
+    if sig is not None:
+        _frontmatter_cache.put(path, sig, metadata, error)
+    return metadata, error
+
+
+def save_frontmatter_cache(root: Path, seen: set[str]) -> None:
+    """Drop cache entries under ``root`` not in ``seen``, then persist the cache."""
+    _frontmatter_cache.prune(root, seen)
+    _frontmatter_cache.save()
+
+
 class SkillRegistry:
     """Skill registry
 
@@ -48,6 +241,7 @@ class SkillRegistry:
         if not self.skills_dir.exists():
             return
 
+        seen: set[str] = set()
         for skill_dir in sorted(self.skills_dir.iterdir()):
             if not skill_dir.is_dir():
                 continue
@@ -67,14 +261,14 @@ class SkillRegistry:
                 ))
                 continue
 
-            # Parse SKILL.md
-            try:
-                metadata = self._parse_skill_md(skill_md)
-            except Exception as e:
+            # Parse SKILL.md (cached until the file changes)
+            seen.add(str(skill_md))
+            metadata, error = read_frontmatter(skill_md)
+            if metadata is None:
                 self.invalid_skills.append(InvalidSkill(
                     dir_name=skill_dir.name,
                     path=skill_dir,
-                    reason=str(e)
+                    reason=error or "Failed to parse SKILL.md"
                 ))
                 continue
 
@@ -105,41 +299,11 @@ class SkillRegistry:
                 path=skill_dir
             ))
 
-    def _parse_skill_md(self, path: Path) -> dict:
-        """Parse YAML frontmatter of SKILL.md file
+        save_frontmatter_cache(self.skills_dir, seen)
 
-        Args:
-            path: SKILL.md file path
-
-        Returns:
-            Parsed metadata dictionary
-
-        Raises:
-            Exception: Raised when parsing fails
-        """
-        content = path.read_text(encoding='utf-8')
-
-        # Check frontmatter start
-        if not content.startswith('---'):
-            raise Exception("File does not start with '---', missing YAML frontmatter")
-
-        # Split to get YAML section
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            raise Exception("YAML frontmatter format error, missing closing '---'")
-
-        yaml_content = parts[1].strip()
-
-        # Parse YAML
-        try:
-            data = yaml.safe_load(yaml_content)
-        except yaml.YAMLError as e:
-            raise Exception(f"YAML parsing failed: {e}")
-
-        if not isinstance(data, dict):
-            raise Exception("YAML frontmatter must be in dictionary format")
-
-        return data
+    def _parse_skill_md(self, path: Path) -> dict:
+        """Parse YAML frontmatter of SKILL.md file (uncached, see parse_skill_md)"""
+        return parse_skill_md(path)
 
     def list_all(self) -> list[Skill]:
         """Get list of all valid skills (sorted by name)"""
@@ -47,6 +47,24 @@ def register_broadcast_hook(hook: _Callable[[dict[str, Any]], None] | None) -> N
     _broadcast_hook = hook
 
 
+# Append listeners: in-process consumers (e.g. the materialized timeline feed)
+# that see every persisted entry. Unlike the single broadcast hook, any number
+# can be registered; each must be cheap and must not raise.
+_append_listeners: list[_Callable[[dict[str, Any]], None]] = []
+
+
+def add_append_listener(listener: _Callable[[dict[str, Any]], None]) -> None:
+    """Call ``listener(entry_dict)`` after every persisted trace entry."""
+    if listener not in _append_listeners:
+        _append_listeners.append(listener)
+
+
+def remove_append_listener(listener: _Callable[[dict[str, Any]], None]) -> None:
+    """Undo :func:`add_append_listener` (no-op if not registered)."""
+    if listener in _append_listeners:
+        _append_listeners.remove(listener)
+
+
 # ---------------------------------------------------------------------------
 # ULID — 26-char lexicographically sortable id (Crockford base32)
 # ---------------------------------------------------------------------------
@@ -153,10 +171,15 @@ def _append_entry(entry: TimelineEntry) -> None:
     except Exception:
         pass
 
+    import contextlib
+
+    for listener in list(_append_listeners):
+        with contextlib.suppress(Exception):
+            listener(entry.to_dict())
+
     # Broadcast to WS subscribers (additive; errors swallowed)
     hook = _broadcast_hook
     if hook is not None:
-        import contextlib
         with contextlib.suppress(Exception):
             hook(entry.to_dict())
 
@@ -379,32 +402,45 @@ def load_trace_events(
     # Pass 2: filter to data-bearing entries and resolve msg_id
     entries: list[dict[str, Any]] = []
     for _ts, entry in raw_lines:
-        if not entry.get("data"):
-            continue
-        raw_data = entry["data"]
-        event_type = raw_data.pop("event_type", "")
-
-        # Resolve msg_id: data field > top-level > task_id lookup
-        if "msg_id" not in raw_data or not raw_data.get("msg_id"):
-            mid = entry.get("msg_id", "")
-            if not mid:
-                tid = entry.get("task_id", "") or raw_data.get("task_id", "")
-                mid = task_msg_map.get(tid, "")
-            if mid:
-                raw_data["msg_id"] = mid
-
-        if "task_id" not in raw_data and entry.get("task_id"):
-            raw_data["task_id"] = entry["task_id"]
-
-        entries.append({
-            "timestamp": entry["ts"],
-            "event_type": event_type,
-            "data": raw_data,
-        })
+        event = timeline_event_from_entry(entry, task_msg_map)
+        if event is not None:
+            entries.append(event)
 
     return entries[-limit:]
 
 
+def timeline_event_from_entry(
+    entry: dict[str, Any], task_msg_map: dict[str, str]
+) -> dict[str, Any] | None:
+    """Convert one raw trace entry to the pa_events-compatible timeline shape.
+
+    Returns None for entries without data. ``task_msg_map`` (task_id → msg_id)
+    resolves the msg_id of entries that lost it; the entry is not modified.
+    """
+    if not entry.get("data"):
+        return None
+    raw_data = dict(entry["data"])
+    event_type = raw_data.pop("event_type", "")
+
+    # Resolve msg_id: data field > top-level > task_id lookup
+    if "msg_id" not in raw_data or not raw_data.get("msg_id"):
+        mid = entry.get("msg_id", "")
+        if not mid:
+            tid = entry.get("task_id", "") or raw_data.get("task_id", "")
+            mid = task_msg_map.get(tid, "")
+        if mid:
+            raw_data["msg_id"] = mid
+
+    if "task_id" not in raw_data and entry.get("task_id"):
+        raw_data["task_id"] = entry["task_id"]
+
+    return {
+        "timestamp": entry["ts"],
+        "event_type": event_type,
+        "data": raw_data,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Conversation turn extraction for PA reborn context injection
 # ---------------------------------------------------------------------------
@@ -11,15 +11,40 @@ sorting, prefix-id resolution and file CRUD. The CLI in
 The todo directory defaults to ``~/.frago/todo/`` but honours the
 ``FRAGO_TODO_DIR`` environment variable so tests and manual verification can
 run fully isolated from the real directory.
+
+The JSON files stay the source of truth; queries are answered from a SQLite
+index under ``.index/`` (ids, status, priority, due date and the parsed todo),
+so ``list`` / ``next`` / prefix resolution no longer parse every file ever
+written. The index is a cache and is rebuilt from the files whenever it is
+missing or unreadable:
+
+- The hot directory is listed on every query and each file's (mtime, size)
+  compared with the index, so only new or changed files are parsed — a todo
+  rewritten in place by hand included. Listing stays cheap because closed
+  todos move out to the archive (below).
+- The archive only changes by renames, which move its directory's mtime, so
+  there a query costs one ``stat`` unless something changed. Directory mtimes
+  younger than :data:`RACY_WINDOW_NS` are not trusted (filesystem timestamps
+  are coarser than back-to-back writes).
+- The store writes files atomically (temp file + rename). An archived file
+  rewritten in place by hand is re-read by ``get`` / ``show``; ``reindex``
+  picks up the rest.
+- Done/dropped todos closed more than :data:`ARCHIVE_AFTER_DAYS` ago move to
+  ``archive/`` (once a day), out of the hot directory and out of ``list``
+  unless ``archived=True``. ``get`` / ``resolve_id`` still find them.
 """
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import sqlite3
 import sys
+import threading
+import time
 from dataclasses import asdict, dataclass, field, fields
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
 
 from slugify import slugify
@@ -29,6 +54,7 @@ from slugify import slugify
 STATUSES = ("todo", "doing", "done", "dropped")
 PRIORITIES = ("low", "normal", "high")
 _ACTIVE = ("todo", "doing")
+_CLOSED = ("done", "dropped")
 # next/list sort priority by semantic order (NOT lexical — high>normal>low)
 _PRIORITY_ORDER = {"high": 0, "normal": 1, "low": 2}
 
@@ -37,6 +63,9 @@ _PRIORITY_ORDER = {"high": 0, "normal": 1, "low": 2}
 TODO_SCHEMA = {
     "filename": "<YYYYMMDD>-<slug>.json under ~/.frago/todo/ (FRAGO_TODO_DIR overrides)",
     "sort": "priority(high>normal>low) then created(asc); `next` picks first active (todo/doing)",
+    "archive": "done/dropped todos closed >30 days ago move to archive/; `list --archived` includes them",
+    "index": "queries use an index kept in sync with the files; run `frago todo reindex` after "
+             "editing an archived todo file in place",
     "fields": [
         {"name": "id", "type": "string", "auto": True,
          "description": "filename without .json; reference handle (prefix-resolvable)"},
@@ -49,6 +78,7 @@ TODO_SCHEMA = {
         {"name": "created", "type": "date", "auto": True, "description": "ISO date, set on add"},
         {"name": "updated", "type": "date", "auto": True, "description": "ISO date, refreshed on edit"},
         {"name": "done_at", "type": "date|null", "auto": True, "description": "stamped when status->done"},
+        {"name": "due", "type": "date|null", "description": "ISO due date (YYYY-MM-DD)"},
         {"name": "context", "type": "string|null", "description": "background / why"},
         {"name": "steps", "type": "list[str]", "default": [], "description": "implementation steps"},
         {"name": "done_when", "type": "list[str]", "default": [], "description": "completion conditions"},
@@ -70,6 +100,7 @@ class Todo:
     created: str = ""
     updated: str = ""
     done_at: str | None = None
+    due: str | None = None
     context: str | None = None
     steps: list[str] = field(default_factory=list)
     done_when: list[str] = field(default_factory=list)
@@ -78,6 +109,15 @@ class Todo:
 
 # ── Paths & ids ─────────────────────────────────────────────────────────
 
+ARCHIVE_DIRNAME = "archive"
+INDEX_DIRNAME = ".index"
+# done/dropped todos closed longer ago than this move to the archive tier
+ARCHIVE_AFTER_DAYS = 30
+# directory mtimes younger than this are rescanned on the next query
+RACY_WINDOW_NS = 2_000_000_000
+
+_HOT, _ARCHIVED = 0, 1
+
 
 def todo_dir() -> Path:
     """Return the todo directory (creating it if needed).
@@ -94,14 +134,18 @@ def _today() -> str:
     return date.today().isoformat()
 
 
-def _path_for(todo_id: str) -> Path:
-    return todo_dir() / f"{todo_id}.json"
+def _tier_dir(base: Path, tier: int) -> Path:
+    return base / ARCHIVE_DIRNAME if tier == _ARCHIVED else base
+
+
+def _path_for(todo_id: str, tier: int = _HOT) -> Path:
+    return _tier_dir(todo_dir(), tier) / f"{todo_id}.json"
 
 
 SLUG_MAX_LENGTH = 32
 
 
-def _make_id(title: str) -> str:
+def _make_id(conn: sqlite3.Connection, title: str) -> str:
     """Build a unique ``<YYYYMMDD>-<slug>`` id from the title.
 
     Slug generation is delegated to ``python-slugify`` (already a project
@@ -114,7 +158,8 @@ def _make_id(title: str) -> str:
     it SHORT via ``max_length`` + ``word_boundary`` instead of trying to make it
     pretty. The filename is only a handle — the real title lives in the JSON and
     is shown by ``list`` / ``show``. Empty slug (un-transliterable input)
-    degrades to the bare date; uniqueness is preserved by the ``-N`` suffix.
+    degrades to the bare date; uniqueness is preserved by the ``-N`` suffix
+    (checked against both tiers, so an archived id is never reused).
     """
     stem = date.today().strftime("%Y%m%d")
     slug = slugify(title, max_length=SLUG_MAX_LENGTH, word_boundary=True, save_order=True)
@@ -122,7 +167,7 @@ def _make_id(title: str) -> str:
         stem = f"{stem}-{slug}"
     candidate = stem
     n = 2
-    while _path_for(candidate).exists():
+    while _tier_of(conn, candidate) is not None or _path_for(candidate).exists():
         candidate = f"{stem}-{n}"
         n += 1
     return candidate
@@ -133,13 +178,30 @@ def resolve_id(ref: str) -> str:
 
     Raises ``KeyError`` when nothing matches and ``ValueError`` when the prefix
     is ambiguous (listing the candidates) — we never silently pick one.
+    Archived todos resolve too.
     """
-    if _path_for(ref).exists():
+    with _index() as conn:
+        return _resolve(conn, ref)
+
+
+# Sorts after every character, so [ref, ref + _MAX_CHAR) is the prefix range.
+_MAX_CHAR = "\U0010ffff"
+
+
+def _resolve(conn: sqlite3.Connection, ref: str) -> str:
+    if _tier_of(conn, ref) is not None:
         return ref
-    matches = sorted(p.stem for p in todo_dir().glob("*.json") if p.stem.startswith(ref))
+    # Range scan on the primary key: O(log n) to find, LIMIT 2 to decide.
+    span = (ref, ref + _MAX_CHAR)
+    matches = [r[0] for r in conn.execute(
+        "SELECT id FROM todos WHERE id >= ? AND id < ? ORDER BY id LIMIT 2", span
+    )]
     if not matches:
         raise KeyError(f"no todo matching {ref!r}; run `frago todo list`")
     if len(matches) > 1:
+        matches = [r[0] for r in conn.execute(
+            "SELECT id FROM todos WHERE id >= ? AND id < ? ORDER BY id", span
+        )]
         raise ValueError(f"ambiguous ref {ref!r} matches: {', '.join(matches)}")
     return matches[0]
 
@@ -147,10 +209,17 @@ def resolve_id(ref: str) -> str:
 # ── Serialization ───────────────────────────────────────────────────────
 
 
-def _write(todo: Todo) -> None:
-    _path_for(todo.id).write_text(
+def _write(conn: sqlite3.Connection, todo: Todo, tier: int = _HOT) -> None:
+    """Write the todo file atomically and record it in the index."""
+    path = _path_for(todo.id, tier)
+    path.parent.mkdir(exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(
         json.dumps(asdict(todo), ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
     )
+    os.replace(tmp, path)
+    st = path.stat()
+    _put(conn, todo, tier, (st.st_mtime_ns, st.st_size))
 
 
 def _load_file(path: Path) -> Todo:
@@ -170,6 +239,281 @@ def _load_file(path: Path) -> Todo:
     return Todo(**data)
 
 
+def _check_due(due: str) -> str:
+    try:
+        return date.fromisoformat(due).isoformat()
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid due date {due!r}; expected YYYY-MM-DD") from None
+
+
+# ── Index ───────────────────────────────────────────────────────────────
+
+_INDEX_VERSION = "1"
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS todos (
+    id TEXT PRIMARY KEY,
+    tier INTEGER NOT NULL,
+    status TEXT,
+    priority TEXT,
+    rank INTEGER NOT NULL,
+    created TEXT,
+    due TEXT,
+    closed TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    data TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS todos_status ON todos (status, closed);
+CREATE INDEX IF NOT EXISTS todos_due ON todos (due) WHERE due IS NOT NULL;
+CREATE INDEX IF NOT EXISTS todos_order ON todos (tier, rank, created, id);
+CREATE INDEX IF NOT EXISTS todos_next ON todos (rank, created, id)
+    WHERE status IN ('todo', 'doing');
+CREATE TABLE IF NOT EXISTS malformed (
+    tier INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    error TEXT NOT NULL,
+    PRIMARY KEY (tier, name)
+) WITHOUT ROWID;
+"""
+
+_index_lock = threading.RLock()
+_index_conn: sqlite3.Connection | None = None
+_index_base: Path | None = None
+
+
+@contextlib.contextmanager
+def _index():
+    """Yield the synced index of :func:`todo_dir` inside one transaction."""
+    base = todo_dir()
+    with _index_lock:
+        conn = _connect(base)
+        with conn:
+            _sync(conn, base)
+            yield conn
+
+
+def _connect(base: Path) -> sqlite3.Connection:
+    """The index connection for ``base``, (re)built if missing or unreadable.
+
+    The index lives in its own subdirectory: SQLite's journal files would
+    otherwise bump the todo directory's mtime on every transaction.
+    """
+    global _index_conn, _index_base
+    if _index_conn is not None and _index_base == base:
+        return _index_conn
+    if _index_conn is not None:
+        _index_conn.close()
+        _index_conn = None
+    index_dir = base / INDEX_DIRNAME
+    index_dir.mkdir(exist_ok=True)
+    path = index_dir / "todos.sqlite3"
+    try:
+        conn = _open(path)
+    except sqlite3.DatabaseError:
+        path.unlink(missing_ok=True)
+        conn = _open(path)
+    _index_conn, _index_base = conn, base
+    return conn
+
+
+def _open(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+    try:
+        # A derived cache: a torn write is repaired by the rebuild above.
+        conn.execute("PRAGMA synchronous = OFF")
+        row = conn.execute(
+            "SELECT value FROM meta WHERE key = 'version'"
+        ).fetchone() if _has_meta(conn) else None
+        if row is None or row[0] != _INDEX_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS meta; DROP TABLE IF EXISTS todos;"
+                "DROP TABLE IF EXISTS malformed;"
+            )
+        conn.executescript(_INDEX_SCHEMA)
+        with conn:
+            _set_meta(conn, "version", _INDEX_VERSION)
+    except sqlite3.DatabaseError:
+        conn.close()
+        raise
+    return conn
+
+
+def _has_meta(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meta'"
+    ).fetchone() is not None
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> str | None:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: str | None) -> None:
+    if value is None:
+        conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+    else:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _tier_of(conn: sqlite3.Connection, todo_id: str) -> int | None:
+    row = conn.execute("SELECT tier FROM todos WHERE id = ?", (todo_id,)).fetchone()
+    return row[0] if row else None
+
+
+def _put(conn: sqlite3.Connection, todo: Todo, tier: int, stamp: tuple[int, int]) -> None:
+    closed = (todo.done_at or todo.updated or todo.created) if todo.status in _CLOSED else None
+    conn.execute(
+        "INSERT OR REPLACE INTO todos "
+        "(id, tier, status, priority, rank, created, due, closed, mtime_ns, size, data) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            todo.id, tier, todo.status, todo.priority,
+            _PRIORITY_ORDER.get(todo.priority, 1), todo.created, todo.due, closed,
+            *stamp, json.dumps(asdict(todo), ensure_ascii=False),
+        ),
+    )
+    conn.execute("DELETE FROM malformed WHERE name = ?", (f"{todo.id}.json",))
+
+
+def _index_file(conn: sqlite3.Connection, tier: int, path: Path, stamp: tuple[int, int]) -> None:
+    try:
+        todo = _load_file(path)
+    except (json.JSONDecodeError, ValueError, TypeError) as e:
+        conn.execute("DELETE FROM todos WHERE id = ? AND tier = ?", (path.stem, tier))
+        conn.execute(
+            "INSERT OR REPLACE INTO malformed (tier, name, mtime_ns, size, error) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (tier, path.name, *stamp, str(e)),
+        )
+    except OSError:
+        return  # vanished mid-scan; the directory's next mtime change catches up
+    else:
+        _put(conn, todo, tier, stamp)
+
+
+def _sync(conn: sqlite3.Connection, base: Path) -> None:
+    for tier in (_HOT, _ARCHIVED):
+        _sync_tier(conn, tier, _tier_dir(base, tier))
+    today = _today()
+    if _get_meta(conn, "archived_on") != today:
+        _archive(conn, base, ARCHIVE_AFTER_DAYS)
+        _set_meta(conn, "archived_on", today)
+
+
+def _sync_tier(conn: sqlite3.Connection, tier: int, directory: Path) -> None:
+    """Bring a tier's rows up to date; parse only files whose stamp moved.
+
+    The hot tier is listed on every query and each file's (mtime, size)
+    compared: a todo rewritten in place does not move its directory's mtime.
+    Files reach the archive by rename, so there an unchanged directory mtime
+    is enough to skip the listing.
+    """
+    key = f"mtime:{tier}"
+    try:
+        # mtime first: a change during the scan leaves it stale, so the
+        # directory is rescanned on the next query rather than missed.
+        mtime_ns: int | None = os.stat(directory).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if tier != _HOT and mtime_ns is not None and _get_meta(conn, key) == str(mtime_ns):
+        return
+
+    known = {r[0]: (r[1], r[2]) for r in conn.execute(
+        "SELECT id, mtime_ns, size FROM todos WHERE tier = ?", (tier,)
+    )}
+    bad = {r[0]: (r[1], r[2]) for r in conn.execute(
+        "SELECT name, mtime_ns, size FROM malformed WHERE tier = ?", (tier,)
+    )}
+    seen: set[str] = set()
+    if mtime_ns is not None:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Only *.json — legacy .md todos, temp files and the index are skipped.
+                if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                stamp = (st.st_mtime_ns, st.st_size)
+                seen.add(entry.name)
+                if known.get(entry.name[:-5]) == stamp or bad.get(entry.name) == stamp:
+                    continue
+                _index_file(conn, tier, Path(entry.path), stamp)
+
+    gone = [(todo_id, tier) for todo_id in known if f"{todo_id}.json" not in seen]
+    conn.executemany("DELETE FROM todos WHERE id = ? AND tier = ?", gone)
+    conn.executemany(
+        "DELETE FROM malformed WHERE tier = ? AND name = ?",
+        [(tier, name) for name in bad if name not in seen],
+    )
+    racy = mtime_ns is None or time.time_ns() - mtime_ns < RACY_WINDOW_NS
+    _set_meta(conn, key, None if racy else str(mtime_ns))
+
+
+def _archive(conn: sqlite3.Connection, base: Path, older_than_days: int) -> list[str]:
+    cutoff = (date.today() - timedelta(days=older_than_days)).isoformat()
+    rows = conn.execute(
+        "SELECT id FROM todos WHERE status IN ('done', 'dropped') AND closed <= ? AND tier = ?",
+        (cutoff, _HOT),
+    ).fetchall()
+    archived = []
+    for (todo_id,) in rows:
+        src = _tier_dir(base, _HOT) / f"{todo_id}.json"
+        dst = _tier_dir(base, _ARCHIVED) / f"{todo_id}.json"
+        dst.parent.mkdir(exist_ok=True)
+        try:
+            os.replace(src, dst)
+            st = dst.stat()
+        except FileNotFoundError:
+            conn.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
+            continue
+        conn.execute(
+            "UPDATE todos SET tier = ?, mtime_ns = ?, size = ? WHERE id = ?",
+            (_ARCHIVED, st.st_mtime_ns, st.st_size, todo_id),
+        )
+        archived.append(todo_id)
+    return archived
+
+
+def _from_row(data: str) -> Todo:
+    return Todo(**json.loads(data))
+
+
+def reindex() -> int:
+    """Rebuild the index from the todo files; return the number of todos.
+
+    Needed only after an archived file was rewritten in place (the archive's
+    mtime does not move, so the change is otherwise seen by ``get`` alone).
+    """
+    base = todo_dir()
+    with _index_lock:
+        conn = _connect(base)
+        with conn:
+            conn.execute("DELETE FROM todos")
+            conn.execute("DELETE FROM malformed")
+            conn.execute("DELETE FROM meta WHERE key LIKE 'mtime:%'")
+            _sync(conn, base)
+            return conn.execute("SELECT count(*) FROM todos").fetchone()[0]
+
+
+def archive_completed(older_than_days: int = ARCHIVE_AFTER_DAYS) -> list[str]:
+    """Move done/dropped todos closed at least ``older_than_days`` ago to the archive.
+
+    Runs automatically once a day with :data:`ARCHIVE_AFTER_DAYS`; returns the
+    archived ids.
+    """
+    with _index() as conn:
+        return _archive(conn, todo_dir(), older_than_days)
+
+
 # ── CRUD ────────────────────────────────────────────────────────────────
 
 
@@ -180,6 +524,7 @@ def add(
     priority: str = "normal",
     status: str = "todo",
     tags: list[str] | None = None,
+    due: str | None = None,
     context: str | None = None,
     steps: list[str] | None = None,
     done_when: list[str] | None = None,
@@ -192,105 +537,167 @@ def add(
         raise ValueError(f"invalid priority {priority!r}; must be one of {PRIORITIES}")
     if status not in STATUSES:
         raise ValueError(f"invalid status {status!r}; must be one of {STATUSES}")
+    if due is not None:
+        due = _check_due(due)
 
     today = _today()
-    todo = Todo(
-        id=_make_id(title),
-        title=title.strip(),
-        summary=summary,
-        status=status,
-        priority=priority,
-        tags=list(tags or []),
-        created=today,
-        updated=today,
-        done_at=today if status == "done" else None,
-        context=context,
-        steps=list(steps or []),
-        done_when=list(done_when or []),
-        links=list(links or []),
-    )
-    _write(todo)
+    with _index() as conn:
+        todo = Todo(
+            id=_make_id(conn, title),
+            title=title.strip(),
+            summary=summary,
+            status=status,
+            priority=priority,
+            tags=list(tags or []),
+            created=today,
+            updated=today,
+            done_at=today if status == "done" else None,
+            due=due,
+            context=context,
+            steps=list(steps or []),
+            done_when=list(done_when or []),
+            links=list(links or []),
+        )
+        _write(conn, todo)
     return todo
 
 
 def list_todos(
-    *, status: str | None = None, priority: str | None = None, tag: str | None = None
+    *,
+    status: str | None = None,
+    priority: str | None = None,
+    tag: str | None = None,
+    due_before: str | None = None,
+    archived: bool = False,
 ) -> list[Todo]:
     """List todos, optionally filtered, sorted by (priority, created, id).
 
     Only ``*.json`` files are considered — legacy ``.md`` todos are ignored.
     Malformed files are skipped with a stderr warning, never aborting the list.
+    ``due_before`` keeps todos due on or before that date; archived todos are
+    included only with ``archived=True``.
     """
-    todos: list[Todo] = []
-    for p in sorted(todo_dir().glob("*.json")):
-        try:
-            todos.append(_load_file(p))
-        except (json.JSONDecodeError, ValueError, TypeError) as e:
-            print(f"warning: skipping malformed todo {p.name}: {e}", file=sys.stderr)
-
+    clauses: list[str] = []
+    params: list = []
+    if not archived:
+        clauses.append("tier = ?")
+        params.append(_HOT)
     if status:
-        todos = [t for t in todos if t.status == status]
+        clauses.append("status = ?")
+        params.append(status)
     if priority:
-        todos = [t for t in todos if t.priority == priority]
+        clauses.append("priority = ?")
+        params.append(priority)
+    if due_before:
+        clauses.append("due IS NOT NULL AND due <= ?")
+        params.append(_check_due(due_before))
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    with _index() as conn:
+        bad = conn.execute(
+            "SELECT name, error FROM malformed" + ("" if archived else " WHERE tier = ?"),
+            () if archived else (_HOT,),
+        ).fetchall()
+        rows = conn.execute(
+            f"SELECT data FROM todos {where} ORDER BY rank, created, id", params
+        ).fetchall()
+    for name, error in bad:
+        print(f"warning: skipping malformed todo {name}: {error}", file=sys.stderr)
+
+    todos = [_from_row(data) for (data,) in rows]
     if tag:
         todos = [t for t in todos if tag in t.tags]
-
-    todos.sort(key=lambda t: (_PRIORITY_ORDER.get(t.priority, 1), t.created, t.id))
     return todos
 
 
+def _get(conn: sqlite3.Connection, ref: str) -> tuple[Todo, int]:
+    """Load a todo from its file (re-indexing it if it changed); return it and its tier."""
+    todo_id = _resolve(conn, ref)
+    tier, mtime_ns, size = conn.execute(
+        "SELECT tier, mtime_ns, size FROM todos WHERE id = ?", (todo_id,)
+    ).fetchone()
+    path = _path_for(todo_id, tier)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        conn.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
+        raise KeyError(f"no todo matching {ref!r}; run `frago todo list`") from None
+    todo = _load_file(path)
+    if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+        _put(conn, todo, tier, (st.st_mtime_ns, st.st_size))
+    return todo, tier
+
+
 def get(ref: str) -> Todo:
     """Load a single todo by id or unique prefix."""
-    return _load_file(_path_for(resolve_id(ref)))
+    with _index() as conn:
+        return _get(conn, ref)[0]
 
 
-_EDITABLE = {"title", "summary", "status", "priority", "tags", "context", "steps", "done_when", "links"}
+_EDITABLE = {
+    "title", "summary", "status", "priority", "tags", "due", "context", "steps", "done_when", "links",
+}
 
 
 def update(ref: str, **changes) -> Todo:
     """Apply field changes (None values are ignored), refresh ``updated``.
 
     Setting ``status`` to ``done`` stamps ``done_at`` if not already set.
+    Reopening an archived todo moves it back out of the archive.
     """
-    todo = get(ref)
-    for key, value in changes.items():
-        if value is None:
-            continue
-        if key not in _EDITABLE:
-            raise ValueError(f"field not editable: {key}")
-        if key == "status" and value not in STATUSES:
-            raise ValueError(f"invalid status {value!r}; must be one of {STATUSES}")
-        if key == "priority" and value not in PRIORITIES:
-            raise ValueError(f"invalid priority {value!r}; must be one of {PRIORITIES}")
-        setattr(todo, key, value)
-
-    todo.updated = _today()
-    if changes.get("status") == "done" and not todo.done_at:
-        todo.done_at = _today()
-    _write(todo)
+    with _index() as conn:
+        todo, tier = _get(conn, ref)
+        for key, value in changes.items():
+            if value is None:
+                continue
+            if key not in _EDITABLE:
+                raise ValueError(f"field not editable: {key}")
+            if key == "status" and value not in STATUSES:
+                raise ValueError(f"invalid status {value!r}; must be one of {STATUSES}")
+            if key == "priority" and value not in PRIORITIES:
+                raise ValueError(f"invalid priority {value!r}; must be one of {PRIORITIES}")
+            if key == "due":
+                value = _check_due(value)
+            setattr(todo, key, value)
+
+        todo.updated = _today()
+        if changes.get("status") == "done" and not todo.done_at:
+            todo.done_at = _today()
+        new_tier = _HOT if todo.status in _ACTIVE else tier
+        _write(conn, todo, new_tier)
+        if new_tier != tier:
+            _path_for(todo.id, tier).unlink(missing_ok=True)
     return todo
 
 
 def mark_done(ref: str) -> Todo:
     """Mark a todo done (idempotent — keeps the original ``done_at``)."""
-    todo = get(ref)
-    if todo.status == "done":
-        return todo
-    todo.status = "done"
-    todo.done_at = _today()
-    todo.updated = _today()
-    _write(todo)
+    with _index() as conn:
+        todo, tier = _get(conn, ref)
+        if todo.status == "done":
+            return todo
+        todo.status = "done"
+        todo.done_at = _today()
+        todo.updated = _today()
+        _write(conn, todo, tier)
     return todo
 
 
 def remove(ref: str) -> str:
     """Delete a todo file; return the resolved id."""
-    todo_id = resolve_id(ref)
-    _path_for(todo_id).unlink()
+    with _index() as conn:
+        todo_id = _resolve(conn, ref)
+        _path_for(todo_id, _tier_of(conn, todo_id)).unlink(missing_ok=True)
+        conn.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
     return todo_id
 
 
 def next_todo() -> Todo | None:
     """Return the most urgent active todo (highest priority, oldest), or None."""
-    active = [t for t in list_todos() if t.status in _ACTIVE]
-    return active[0] if active else None
+    with _index() as conn:
+        # Served by the partial index todos_next: the first entry is the answer.
+        row = conn.execute(
+            "SELECT data FROM todos WHERE status IN ('todo', 'doing') "
+            "ORDER BY rank, created, id LIMIT 1"
+        ).fetchone()
+    return _from_row(row[0]) if row else None
@@ -37,11 +37,14 @@ logger = logging.getLogger(__name__)
 
 
 class _DispatchHandler(FileSystemEventHandler):
-    """Per-directory event handler that fans out to registered WatchTargets.
-
-    One handler is created for each distinct watched directory path.
-    When a file-system event arrives the handler finds every WatchTarget
-    whose patterns match the affected file and calls the relevant callback.
+    """Per-watch event handler that fans out to registered WatchTargets.
+
+    One handler is created for each scheduled watch. Targets inside a
+    directory that is already watched recursively share that handler
+    rather than scheduling a watch of their own, so each target carries
+    its own scope: when a file-system event arrives the handler finds
+    every WatchTarget whose directory covers the affected file and whose
+    patterns match it, and calls the relevant callback.
     """
 
     def __init__(self, watched_path: str) -> None:
@@ -60,11 +63,25 @@ class _DispatchHandler(FileSystemEventHandler):
         with self._lock:
             self._targets.remove(target)
 
+    @property
+    def targets(self) -> list[WatchTarget]:
+        with self._lock:
+            return list(self._targets)
+
     @property
     def target_count(self) -> int:
         with self._lock:
             return len(self._targets)
 
+    @property
+    def recursive(self) -> bool:
+        """Whether a target asked for this directory's whole subtree."""
+        with self._lock:
+            return any(
+                t.recursive and os.path.abspath(t.path) == self._watched_path
+                for t in self._targets
+            )
+
     # ---- event dispatch ----------------------------------------------------
 
     def _matches(self, target: WatchTarget, file_name: str) -> bool:
@@ -73,6 +90,16 @@ class _DispatchHandler(FileSystemEventHandler):
             return True
         return any(fnmatch.fnmatch(file_name, p) for p in target.patterns)
 
+    @staticmethod
+    def _in_scope(target: WatchTarget, file_path: str) -> bool:
+        """Whether an event on *file_path* is one *target* asked to hear about."""
+        scope = os.path.abspath(target.path)
+        if not target.recursive:
+            # The directory may be watched recursively for another target; a
+            # non-recursive one still only hears about its own directory.
+            return os.path.dirname(file_path) == scope
+        return _covers(scope, file_path)
+
     def _dispatch(self, event_type: str, file_path: str, is_directory: bool,
                   src_path: str | None = None) -> None:
         file_name = os.path.basename(file_path)
@@ -87,6 +114,8 @@ class _DispatchHandler(FileSystemEventHandler):
             targets_snapshot = list(self._targets)
 
         for target in targets_snapshot:
+            if not self._in_scope(target, file_path):
+                continue
             if not self._matches(target, file_name):
                 continue
             cb: Callable[[FileEvent], None] | None = {
@@ -144,6 +173,7 @@ class WatchdogObserverService:
     def __init__(self) -> None:
         self._observer: Any = None
         self._handlers: dict[str, _DispatchHandler] = {}  # abspath → handler
+        self._watches: dict[str, Any] = {}  # abspath → ObservedWatch
         self._running: bool = False
         self._state_lock = threading.Lock()
 
@@ -178,14 +208,12 @@ class WatchdogObserverService:
                 return  # already started externally
 
             observer: Any = Observer()
+            self._observer = observer
             # Schedule any handlers that were registered before start()
-            for path, handler in self._handlers.items():
-                observer.schedule(handler, path, recursive=any(
-                    t.recursive for t in handler._targets  # noqa: SLF001
-                ))
+            for path in self._handlers:
+                self._schedule(path)
 
             observer.start()
-            self._observer = observer
             self._running = True
             logger.debug("WatchdogObserverService started (%d paths watched)",
                          len(self._handlers))
@@ -200,6 +228,7 @@ class WatchdogObserverService:
             observer = self._observer
             self._observer = None
             self._running = False
+            self._watches.clear()
 
         observer.stop()
         observer.join(timeout=3)
@@ -212,45 +241,90 @@ class WatchdogObserverService:
 
         Safe to call before or after ``start()``.  If the Observer is
         already running the new handler is scheduled immediately.
-        """
-        abspath = os.path.abspath(target.path)
 
+        Each scheduled watch costs an inotify instance, and a recursive one
+        an inotify watch per subdirectory, so overlapping watches are
+        shared: a target inside a directory already watched recursively
+        joins that watch, and a recursive target takes over the watches
+        below it.
+        """
         with self._state_lock:
-            if abspath not in self._handlers:
-                self._handlers[abspath] = _DispatchHandler(abspath)
-                # If Observer already running, schedule the new handler now
-                if self._observer is not None:
-                    self._observer.schedule(
-                        self._handlers[abspath],
-                        abspath,
-                        recursive=target.recursive,
-                    )
+            self._add_locked(target)
 
-            self._handlers[abspath].add_target(target)
-
-        logger.debug("WatchdogObserverService: added target for %s", abspath)
+        logger.debug("WatchdogObserverService: added target for %s",
+                     os.path.abspath(target.path))
 
     def remove(self, target: WatchTarget) -> None:
         """Unregister a watch target.
 
-        When the last target for a directory is removed the underlying
-        handler is unscheduled.
+        When the last target for a watch is removed the underlying handler
+        is unscheduled; when the target that made a watch recursive goes,
+        the targets that were sharing it get watches of their own again.
         """
-        abspath = os.path.abspath(target.path)
-
         with self._state_lock:
-            handler = self._handlers.get(abspath)
-            if handler is None:
+            path = next(
+                (p for p, h in self._handlers.items() if target in h.targets), None
+            )
+            if path is None:
                 return
-
+            handler = self._handlers[path]
+            was_recursive = handler.recursive
             handler.remove_target(target)
 
-            if handler.target_count == 0:
-                self._handlers.pop(abspath, None)
-                logger.debug(
-                    "WatchdogObserverService: removed last target for %s",
-                    abspath,
-                )
+            if handler.target_count and handler.recursive == was_recursive:
+                return
+            self._handlers.pop(path, None)
+            self._unschedule(path)
+            # Re-home what was sharing the watch, outermost recursive first,
+            # so a nested recursive target picks the rest back up.
+            rest = sorted(
+                handler.targets,
+                key=lambda t: (not t.recursive, len(os.path.abspath(t.path))),
+            )
+            for remaining in rest:
+                self._add_locked(remaining)
+            logger.debug(
+                "WatchdogObserverService: removed target for %s", os.path.abspath(target.path)
+            )
+
+    def _add_locked(self, target: WatchTarget) -> None:
+        abspath = os.path.abspath(target.path)
+        for path, handler in self._handlers.items():
+            if handler.recursive and _covers(path, abspath):
+                handler.add_target(target)
+                return
+
+        handler = self._handlers.get(abspath)
+        if handler is None:
+            handler = self._handlers[abspath] = _DispatchHandler(abspath)
+        handler.add_target(target)
+        if target.recursive:
+            for path in [p for p in self._handlers if p != abspath and _covers(abspath, p)]:
+                for moved in self._handlers.pop(path).targets:
+                    handler.add_target(moved)
+                self._unschedule(path)
+        self._schedule(abspath)
+
+    def _schedule(self, path: str) -> None:
+        """(Re)schedule the watch for *path* to match its handler's targets."""
+        if self._observer is None:
+            return
+        handler = self._handlers[path]
+        watch = self._watches.get(path)
+        if watch is not None:
+            if watch.is_recursive == handler.recursive:
+                return
+            with contextlib.suppress(Exception):
+                self._observer.unschedule(watch)
+        self._watches[path] = self._observer.schedule(
+            handler, path, recursive=handler.recursive
+        )
+
+    def _unschedule(self, path: str) -> None:
+        watch = self._watches.pop(path, None)
+        if watch is not None and self._observer is not None:
+            with contextlib.suppress(Exception):
+                self._observer.unschedule(watch)
 
     # ---- query -------------------------------------------------------------
 
@@ -261,6 +335,11 @@ class WatchdogObserverService:
 
     @property
     def watch_count(self) -> int:
-        """How many directories are currently being watched."""
+        """How many watches are scheduled (or will be, once started)."""
         with self._state_lock:
             return len(self._handlers)
+
+
+def _covers(ancestor: str, path: str) -> bool:
+    """Whether *path* is *ancestor* or lies below it."""
+    return path == ancestor or path.startswith(ancestor.rstrip(os.sep) + os.sep)
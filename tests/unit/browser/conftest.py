@@ -0,0 +1,66 @@
+"""Fixtures for tests that drive a real headless Chrome when one is installed."""
+
+from __future__ import annotations
+
+import contextlib
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from frago.browser.cdp.config import CDPConfig
+from frago.browser.cdp.session import CDPSession
+
+
+@pytest.fixture
+def chrome_path() -> str:
+    """The installed Chrome/Chromium binary; skips the test when there is none."""
+    from frago.browser.cdp.browser_detection import get_default_browser
+
+    try:
+        _, path = get_default_browser()
+    except Exception:
+        path = None
+    path = path or shutil.which("chromium") or shutil.which("google-chrome")
+    if path is None:
+        pytest.skip("no Chrome/Chromium installed")
+    return path
+
+
+@pytest.fixture
+def headless_session(tmp_path: Path, chrome_path: str):
+    """Open a connected CDPSession on a headless Chrome showing some HTML.
+
+    Usage: ``with headless_session("<h1>hi</h1>") as session: ...``
+    """
+
+    @contextlib.contextmanager
+    def open_page(html: str):
+        profile = tmp_path / "profile"
+        page = tmp_path / "page.html"
+        page.write_text(html, encoding="utf-8")
+        proc = subprocess.Popen(
+            [chrome_path, "--headless=new", "--remote-debugging-port=0", "--no-first-run",
+             f"--user-data-dir={profile}", page.as_uri()],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            port_file = profile / "DevToolsActivePort"
+            deadline = time.monotonic() + 20
+            while not port_file.exists() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            port = int(port_file.read_text().split()[0])
+
+            session = CDPSession(CDPConfig(port=port))
+            session.connect()
+            try:
+                yield session
+            finally:
+                session.disconnect()
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    return open_page
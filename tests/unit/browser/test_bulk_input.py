@@ -0,0 +1,187 @@
+"""Bulk CDP typing: strategy planning, pipelined sends, and throughput.
+
+The transport tests run against a fake WebSocket that answers every command
+after a fixed round-trip delay, the way a local Chrome does. The headless
+benchmark at the bottom drives a real Chrome when one is installed.
+"""
+
+import json
+import queue
+import threading
+import time
+
+import pytest
+
+from frago.browser.cdp.commands.input import (
+    INSERT_CHUNK_CHARS,
+    TYPE_AUTO,
+    TYPE_INSERT,
+    TYPE_KEYS,
+    TYPE_KEYSTROKE,
+    TYPE_MODES,
+    InputCommands,
+    plan_typing,
+)
+from frago.browser.cdp.config import CDPConfig
+from frago.browser.cdp.exceptions import CDPError
+from frago.browser.cdp.logger import get_logger
+from frago.browser.cdp.session import CDPSession
+from frago.browser.cdp.transport import CDPTransport
+
+
+class FakeChrome:
+    """Answers each command ``latency`` seconds after it was sent, in order."""
+
+    def __init__(self, inbox: queue.Queue, latency: float = 0.0, fail_on: str | None = None):
+        self.inbox = inbox
+        self.latency = latency
+        self.fail_on = fail_on
+        self.sent: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._due: queue.Queue = queue.Queue()
+        threading.Thread(target=self._answer, daemon=True).start()
+
+    def send(self, frame: str) -> None:
+        request = json.loads(frame)
+        with self._lock:
+            self.sent.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self._due.put((time.perf_counter() + self.latency, request))
+
+    def _answer(self) -> None:
+        while True:
+            due, request = self._due.get()
+            wait = due - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            if self.fail_on and request["params"].get("text") == self.fail_on:
+                reply = {"id": request["id"], "error": {"code": -32000, "message": "boom"}}
+            else:
+                reply = {"id": request["id"], "result": {}}
+            with self._lock:
+                self.in_flight -= 1
+            self.inbox.put(json.dumps(reply))
+
+
+def _transport(latency: float = 0.0, fail_on: str | None = None) -> tuple[CDPTransport, FakeChrome]:
+    transport = CDPTransport(CDPConfig(command_timeout=5.0), get_logger())
+    fake = FakeChrome(transport._message_queue, latency, fail_on)
+    transport.ws = fake
+    transport._connected = True
+    return transport, fake
+
+
+def _input(latency: float = 0.0) -> tuple[InputCommands, FakeChrome]:
+    transport, fake = _transport(latency)
+    session = CDPSession(CDPConfig(command_timeout=5.0))
+    session._transport = transport
+    return InputCommands(session), fake
+
+
+class TestPlan:
+    def test_plain_text_is_one_insert(self):
+        assert plan_typing("hello world") == [("Input.insertText", {"text": "hello world"})]
+
+    def test_long_text_is_chunked(self):
+        commands = plan_typing("x" * (INSERT_CHUNK_CHARS * 2 + 1), TYPE_INSERT)
+        assert [len(p["text"]) for _, p in commands] == [INSERT_CHUNK_CHARS, INSERT_CHUNK_CHARS, 1]
+
+    def test_auto_presses_enter_between_runs(self):
+        commands = plan_typing("a\r\nb", TYPE_AUTO)
+        kinds = [p.get("type") or p["text"] for _, p in commands]
+        assert kinds == ["a", "keyDown", "keyUp", "b"]
+        assert commands[1][1]["key"] == "Enter"
+        assert commands[1][1]["text"] == "\r"
+
+    def test_key_modes_send_a_down_and_up_per_character(self):
+        for mode in (TYPE_KEYS, TYPE_KEYSTROKE):
+            commands = plan_typing("ab\t", mode)
+            assert [p["type"] for _, p in commands] == [
+                "keyDown", "keyUp", "keyDown", "keyUp", "rawKeyDown", "keyUp",
+            ]
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            plan_typing("x", "telepathy")
+
+
+class TestPipelining:
+    def test_replies_come_back_in_command_order(self):
+        transport, fake = _transport(latency=0.002)
+        commands = [("Input.insertText", {"text": str(i)}) for i in range(200)]
+
+        replies = transport.send_commands(commands, window=16)
+
+        assert [r["id"] for r in replies] == [r["id"] for r in fake.sent]
+        assert [r["params"]["text"] for r in fake.sent] == [str(i) for i in range(200)]
+        assert 1 < fake.max_in_flight <= 16
+
+    def test_an_error_stops_further_sends(self):
+        transport, fake = _transport(fail_on="3")
+        commands = [("Input.insertText", {"text": str(i)}) for i in range(500)]
+
+        with pytest.raises(CDPError, match="boom"):
+            transport.send_commands(commands, window=4)
+        assert len(fake.sent) < 500
+
+    def test_events_in_between_are_dispatched(self):
+        transport, fake = _transport(latency=0.01)
+        seen = []
+        transport.on_event("Page.loadEventFired")(seen.append)
+        transport._message_queue.put(json.dumps({"method": "Page.loadEventFired", "params": {"t": 1}}))
+
+        transport.send_commands([("Input.insertText", {"text": "x"})])
+
+        assert seen == [{"t": 1}]
+
+    def test_keystroke_mode_waits_for_every_reply(self):
+        commands, fake = _input()
+        result = commands.type("abc", mode=TYPE_KEYSTROKE)
+        assert fake.max_in_flight == 1
+        assert result["commands"] == 6
+
+
+def _throughput(mode: str, text: str, latency: float) -> float:
+    commands, _ = _input(latency)
+    started = time.perf_counter()
+    commands.type(text, mode=mode)
+    return len(text) / (time.perf_counter() - started)
+
+
+@pytest.mark.perf
+def test_bulk_strategies_outpace_keystrokes(record_property):
+    """0.5 ms per round-trip, roughly a local Chrome: characters per second per strategy."""
+    text = ("lorem ipsum dolor sit amet\n" * 40)[:1000]
+    rates = {mode: _throughput(mode, text, 0.0005) for mode in TYPE_MODES}
+    for mode, rate in rates.items():
+        record_property(f"{mode}_chars_per_sec", round(rate))
+
+    assert rates[TYPE_KEYS] > rates[TYPE_KEYSTROKE] * 5
+    assert rates[TYPE_AUTO] > rates[TYPE_KEYS]
+    assert rates[TYPE_INSERT] > rates[TYPE_KEYS]
+
+
+@pytest.mark.perf
+def test_headless_throughput(headless_session, record_property):
+    """Type 5 KB into a textarea of a headless page with each strategy."""
+    text = ("the quick brown fox jumps over the lazy dog " * 120)[:5000]
+    rates = {}
+    with headless_session("<textarea id=t autofocus></textarea>") as session:
+        for mode in (TYPE_INSERT, TYPE_AUTO, TYPE_KEYS, TYPE_KEYSTROKE):
+            sample = text if mode != TYPE_KEYSTROKE else text[:500]
+            session.send_command("Runtime.evaluate", {
+                "expression": "const t = document.getElementById('t'); t.value = ''; t.focus()",
+            })
+            started = time.perf_counter()
+            session.input.type(sample, mode=mode)
+            rates[mode] = len(sample) / (time.perf_counter() - started)
+            value = session.evaluate("document.getElementById('t').value")
+            assert value == sample, mode
+
+    for mode, rate in rates.items():
+        record_property(f"{mode}_chars_per_sec", round(rate))
+    for mode in (TYPE_INSERT, TYPE_AUTO, TYPE_KEYS):
+        assert rates[mode] > rates[TYPE_KEYSTROKE], mode
@@ -0,0 +1,158 @@
+"""Launch readiness from Chrome's stderr announcement and concurrent post-launch steps."""
+
+import stat
+import sys
+import textwrap
+import time
+from unittest.mock import patch
+
+import pytest
+
+from frago.browser.cdp.browser_detection import BrowserType
+from frago.browser.cdp.launcher import ChromeLauncher
+
+# A stand-in browser: serves /json/version on --remote-debugging-port (0 picks
+# a free port) and announces itself on stderr the way Chrome does.
+#   FAKE_CHROME_DELAY   seconds before listening
+#   FAKE_CHROME_SILENT  never print the announcement
+#   FAKE_CHROME_EXIT    exit right away without listening
+FAKE_CHROME = textwrap.dedent('''\
+    import http.server, json, os, sys, time
+
+    if os.environ.get("FAKE_CHROME_EXIT"):
+        sys.exit(0)
+    port = int(next(a.split("=", 1)[1] for a in sys.argv if a.startswith("--remote-debugging-port=")))
+    time.sleep(float(os.environ.get("FAKE_CHROME_DELAY", "0")))
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps({"Browser": "Fake/1.0"} if self.path == "/json/version" else []).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", port), Handler)
+    if not os.environ.get("FAKE_CHROME_SILENT"):
+        sys.stderr.write("[0101/000000.000:WARNING] some noise\\n")
+        sys.stderr.write(f"DevTools listening on ws://127.0.0.1:{server.server_port}/devtools/browser/fake\\n")
+        sys.stderr.flush()
+    server.serve_forever()
+''')
+
+
+@pytest.fixture
+def fake_chrome(tmp_path, monkeypatch):
+    script = tmp_path / "fake-chrome"
+    script.write_text(f"#!{sys.executable}\n{FAKE_CHROME}")
+    script.chmod(script.stat().st_mode | stat.S_IXUSR)
+    for name in ("FAKE_CHROME_DELAY", "FAKE_CHROME_SILENT", "FAKE_CHROME_EXIT"):
+        monkeypatch.delenv(name, raising=False)
+    with patch.object(
+        ChromeLauncher, "_resolve_browser", return_value=(BrowserType.CHROME, str(script))
+    ):
+        yield script
+
+
+@pytest.fixture
+def launchers():
+    started: list[ChromeLauncher] = []
+    yield started
+    for launcher in started:
+        launcher.stop()
+
+
+def _launcher(tmp_path, launchers, port=0, **kwargs) -> ChromeLauncher:
+    launcher = ChromeLauncher(
+        headless=True, port=port, profile_dir=tmp_path / f"profile-{len(launchers)}", **kwargs,
+    )
+    launchers.append(launcher)
+    return launcher
+
+
+@pytest.mark.usefixtures("fake_chrome")
+class TestReadiness:
+    def test_ready_as_soon_as_announced(self, tmp_path, launchers, monkeypatch):
+        monkeypatch.setenv("FAKE_CHROME_DELAY", "0.2")
+        launcher = _launcher(tmp_path, launchers)
+
+        assert launcher.launch(kill_existing=False)
+
+        # The old launch slept 2 s before its first probe.
+        assert launcher.timings["total"] < 2000
+        assert launcher.timings["ready"] >= 200
+        assert set(launcher.timings) >= {"profile", "spawn", "ready", "post_launch", "total"}
+
+    def test_port_zero_is_read_from_the_announcement(self, tmp_path, launchers):
+        launcher = _launcher(tmp_path, launchers)
+        assert launcher.launch(kill_existing=False)
+        assert launcher.debugging_port > 0
+        assert launcher.browser_ws_url == (
+            f"ws://127.0.0.1:{launcher.debugging_port}/devtools/browser/fake"
+        )
+        assert launcher.get_status()["browser"] == "Fake/1.0"
+
+    def test_falls_back_to_http_when_stderr_is_silent(self, tmp_path, launchers, monkeypatch):
+        import socket
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        monkeypatch.setenv("FAKE_CHROME_SILENT", "1")
+        launcher = _launcher(tmp_path, launchers, port=port)
+
+        assert launcher.launch(kill_existing=False)
+        assert launcher.browser_ws_url is None
+
+    def test_an_exited_browser_fails_fast(self, tmp_path, launchers, monkeypatch):
+        monkeypatch.setenv("FAKE_CHROME_EXIT", "1")
+        launcher = _launcher(tmp_path, launchers)
+
+        assert not launcher.launch(kill_existing=False)
+        assert launcher.timings["ready"] < 2000
+
+
+def test_post_launch_steps_overlap_but_stealth_precedes_navigation(mock_home):
+    with patch.object(ChromeLauncher, "_resolve_browser", return_value=(BrowserType.CHROME, "/fake")):
+        launcher = ChromeLauncher(port=9555)
+    events: list[str] = []
+
+    def stealth(target=None):
+        time.sleep(0.3)
+        events.append("stealth")
+
+    def init_tabs(page_tabs=None, before_navigate=None):
+        events.append("close-extra-tabs")
+        before_navigate()
+        events.append("navigate")
+
+    def reconcile():
+        time.sleep(0.3)
+        events.append("reconcile")
+
+    with (
+        patch.object(launcher, "_page_targets", return_value=[]),
+        patch.object(launcher, "inject_stealth_scripts", side_effect=stealth),
+        patch.object(launcher, "_initialize_tabs", side_effect=init_tabs),
+        patch.object(launcher, "_reconcile_tab_groups", side_effect=reconcile),
+    ):
+        started = time.perf_counter()
+        launcher._post_launch()
+        elapsed = time.perf_counter() - started
+
+    assert events.index("close-extra-tabs") < events.index("stealth") < events.index("navigate")
+    assert events[-1] == "reconcile"
+    assert elapsed < 0.9
+
+
+def test_time_to_first_command_with_a_real_browser(tmp_path, launchers, chrome_path):
+    with patch.object(
+        ChromeLauncher, "_resolve_browser", return_value=(BrowserType.CHROME, chrome_path)
+    ):
+        launcher = _launcher(tmp_path, launchers)
+        assert launcher.launch(kill_existing=False)
+    assert launcher.browser_ws_url
+    assert launcher.get_status()["running"]
@@ -0,0 +1,29 @@
+"""Incremental perception against a real headless Chrome, when one is installed."""
+
+from __future__ import annotations
+
+import json
+
+from frago.run.perception import BASELINE, DELTA, UNCHANGED, perceive
+
+
+def test_perception_against_a_headless_page(headless_session):
+    html = "<h1 id=h>Hello</h1><ul id=l><li>one</li></ul><button>Go</button>"
+    with headless_session(html) as session:
+        assert perceive(session)["perception"] == BASELINE
+        assert perceive(session)["perception"] == UNCHANGED
+
+        session.evaluate(
+            "document.getElementById('h').firstChild.data = 'Bye';"
+            "document.getElementById('l').insertAdjacentHTML('beforeend', '<li>two</li>');"
+            "document.body.insertAdjacentHTML('beforeend', '<button>Stop</button>')"
+        )
+        delta = perceive(session)
+        assert perceive(session)["perception"] == UNCHANGED
+
+    assert delta["perception"] == DELTA
+    assert delta["changed"] == {"buttons": [1, 2]}
+    kinds = {(c["kind"], c.get("text")) for c in delta["changes"]}
+    assert ("text", "Bye") in kinds
+    assert ("added", "two") in kinds
+    assert "visible_content" not in delta, json.dumps(delta)
@@ -0,0 +1,275 @@
+"""Tiled full-page screenshots: streaming PNG stitching, per-tile results, screencast."""
+
+import base64
+import io
+import random
+import struct
+import tracemalloc
+import zlib
+
+import pytest
+
+from frago.browser.cdp.commands import screenshot
+from frago.browser.cdp.commands.screenshot import ScreenshotCommands
+from frago.browser.cdp.exceptions import CDPError
+from frago.browser.cdp.png_stream import PNG_SIGNATURE, PNGStitcher, PNGStitchError
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def _filter(kind: int, row: bytes, prior: bytes, bpp: int) -> bytes:
+    out = bytearray([kind])
+    for i, x in enumerate(row):
+        a = row[i - bpp] if i >= bpp else 0
+        b = prior[i]
+        c = prior[i - bpp] if i >= bpp else 0
+        pred = (0, a, b, (a + b) // 2, _paeth(a, b, c))[kind]
+        out.append((x - pred) & 0xFF)
+    return bytes(out)
+
+
+def _unfilter(data: bytes, width: int, height: int, bpp: int) -> list[bytes]:
+    stride = width * bpp
+    rows, prior = [], bytes(stride)
+    for r in range(height):
+        line = data[r * (stride + 1):(r + 1) * (stride + 1)]
+        kind, raw, row = line[0], line[1:], bytearray(stride)
+        for i in range(stride):
+            a = row[i - bpp] if i >= bpp else 0
+            b = prior[i]
+            c = prior[i - bpp] if i >= bpp else 0
+            pred = (0, a, b, (a + b) // 2, _paeth(a, b, c))[kind]
+            row[i] = (raw[i] + pred) & 0xFF
+        rows.append(bytes(row))
+        prior = bytes(row)
+    return rows
+
+
+def _chunk(kind: bytes, payload: bytes) -> bytes:
+    return (struct.pack(">I", len(payload)) + kind + payload
+            + struct.pack(">I", zlib.crc32(kind + payload) & 0xFFFFFFFF))
+
+
+def _png(rows: list[bytes], width: int, bpp: int = 4, idat_size: int = 97) -> bytes:
+    """Encode RGBA rows, cycling through every filter type, over several IDATs."""
+    prior = bytes(width * bpp)
+    raw = b""
+    for i, row in enumerate(rows):
+        raw += _filter(i % 5, row, prior, bpp)
+        prior = row
+    packed = zlib.compress(raw)
+    color = {3: 2, 4: 6}[bpp]
+    out = PNG_SIGNATURE + _chunk(b"IHDR", struct.pack(">IIBBBBB", width, len(rows), 8, color, 0, 0, 0))
+    out += _chunk(b"sRGB", b"\x00")
+    for i in range(0, len(packed), idat_size):
+        out += _chunk(b"IDAT", packed[i:i + idat_size])
+    return out + _chunk(b"IEND", b"")
+
+
+def _decode(png: bytes) -> tuple[int, int, list[bytes]]:
+    pos, idat, header = 8, b"", None
+    while pos < len(png):
+        length, kind = struct.unpack(">I4s", png[pos:pos + 8])
+        payload = png[pos + 8:pos + 8 + length]
+        crc = struct.unpack(">I", png[pos + 8 + length:pos + 12 + length])[0]
+        assert crc == zlib.crc32(kind + payload) & 0xFFFFFFFF, kind
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", payload)
+        elif kind == b"IDAT":
+            idat += payload
+        pos += 12 + length
+    width, height = header[0], header[1]
+    bpp = {2: 3, 6: 4}[header[3]]
+    return width, height, _unfilter(zlib.decompress(idat), width, height, bpp)
+
+
+def _rows(count: int, width: int, seed: int, bpp: int = 4) -> list[bytes]:
+    rng = random.Random(seed)
+    return [bytes(rng.randrange(256) for _ in range(width * bpp)) for _ in range(count)]
+
+
+class TestStitcher:
+    @pytest.mark.parametrize("bpp", [3, 4])
+    def test_stitched_pixels_equal_the_tiles_stacked(self, bpp):
+        width = 7
+        tiles = [_rows(n, width, seed, bpp) for seed, n in enumerate((6, 5, 1, 9))]
+        out = io.BytesIO()
+        stitcher = PNGStitcher(out)
+        for rows in tiles:
+            assert stitcher.add(_png(rows, width, bpp)) == (width, len(rows))
+        stitcher.finish()
+
+        w, h, pixels = _decode(out.getvalue())
+        assert (w, h) == (width, 21)
+        assert pixels == [row for rows in tiles for row in rows]
+
+    def test_the_first_tiles_ancillary_chunks_are_kept(self):
+        out = io.BytesIO()
+        stitcher = PNGStitcher(out)
+        stitcher.add(_png(_rows(2, 3, 0), 3))
+        stitcher.finish()
+        assert b"sRGB" in out.getvalue()
+
+    def test_tiles_of_another_width_are_refused(self):
+        stitcher = PNGStitcher(io.BytesIO())
+        stitcher.add(_png(_rows(2, 3, 0), 3))
+        with pytest.raises(PNGStitchError):
+            stitcher.add(_png(_rows(2, 4, 0), 4))
+
+
+class FakePage:
+    """Serves layout metrics and clip-sized PNG tiles; one row per 64 CSS px."""
+
+    ROW = 64
+
+    def __init__(self, height: int, width: int = 5):
+        self.height = height
+        self.width = width
+        self.captures: list[dict] = []
+        self.commands: list[str] = []
+        self.handlers: dict = {}
+        self.frames: list[dict] = []
+        self.row_cache: dict[int, bytes] = {}
+
+    def row(self, index: int) -> bytes:
+        if index not in self.row_cache:
+            self.row_cache[index] = _rows(1, self.width, index)[0]
+        return self.row_cache[index]
+
+    def send_command(self, method, params=None):
+        self.commands.append(method)
+        if method == "Page.getLayoutMetrics":
+            return {"result": {"cssContentSize": {"width": 800, "height": self.height}}}
+        if method == "Page.captureScreenshot":
+            self.captures.append(params)
+            clip = params.get("clip") or {"y": 0, "height": self.height}
+            first = clip["y"] // self.ROW
+            rows = [self.row(first + i) for i in range(max(1, clip["height"] // self.ROW))]
+            return {"result": {"data": base64.b64encode(_png(rows, self.width)).decode()}}
+        return {"result": {}}
+
+    def on_event(self, name):
+        def register(handler):
+            self.handlers[name] = handler
+            return handler
+        return register
+
+    def poll_events(self, timeout):
+        if self.frames:
+            self.handlers["Page.screencastFrame"](self.frames.pop(0))
+            return 1
+        return 0
+
+
+class TestTiledCapture:
+    def test_a_tall_page_is_captured_in_clipped_tiles(self, tmp_path):
+        page = FakePage(height=64 * 40)
+        out = tmp_path / "shots" / "full.png"
+
+        result = ScreenshotCommands(page).capture(str(out), full_page=True, tile_height=64 * 16)
+
+        assert [c["clip"]["y"] for c in page.captures] == [0, 1024, 2048]
+        assert [t["height"] for t in result["tiles"]] == [1024, 1024, 512]
+        assert all(t["bytes"] > 0 and "ms" in t for t in result["tiles"])
+        _, h, pixels = _decode(out.read_bytes())
+        assert h == 40
+        assert pixels == [page.row(i) for i in range(40)]
+        assert list(tmp_path.glob("shots/.*.tmp")) == []
+
+    def test_a_short_page_is_one_capture(self, tmp_path):
+        page = FakePage(height=600)
+        result = ScreenshotCommands(page).capture(str(tmp_path / "a.png"), full_page=True)
+        assert "tiles" not in result
+        assert len(page.captures) == 1
+        assert page.captures[0]["captureBeyondViewport"] is True
+
+    def test_viewport_shots_are_untouched(self, tmp_path):
+        page = FakePage(height=64 * 100)
+        ScreenshotCommands(page).capture(str(tmp_path / "a.png"))
+        assert page.commands == ["Page.captureScreenshot"]
+
+    def test_jpeg_tiles_are_written_side_by_side(self, tmp_path):
+        page = FakePage(height=64 * 20)
+        result = ScreenshotCommands(page).capture(
+            str(tmp_path / "page.jpg"), full_page=True, format="jpeg", tile_height=640
+        )
+        assert [t["file"] for t in result["tiles"]] == [
+            str(tmp_path / "page.tile-000.jpg"), str(tmp_path / "page.tile-001.jpg"),
+        ]
+        assert "file" not in result
+
+    def test_a_page_past_the_height_cap_is_reported_as_truncated(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(screenshot, "MAX_CAPTURE_HEIGHT", 64 * 20)
+        page = FakePage(height=64 * 30)
+
+        result = ScreenshotCommands(page).capture(
+            str(tmp_path / "a.png"), full_page=True, tile_height=640
+        )
+
+        assert sum(t["height"] for t in result["tiles"]) == result["height"] == 64 * 20
+        assert result["truncated"] is True
+        assert result["page_height"] == 64 * 30
+
+    def test_a_page_under_the_cap_is_not_truncated(self, tmp_path):
+        page = FakePage(height=64 * 20)
+        result = ScreenshotCommands(page).capture(str(tmp_path / "a.png"), full_page=True, tile_height=640)
+        assert "truncated" not in result
+
+    def test_a_broken_tile_leaves_no_partial_file(self, tmp_path):
+        page = FakePage(height=64 * 20)
+        real = page.send_command
+
+        def broken(method, params=None):
+            response = real(method, params)
+            if params and params.get("clip", {}).get("y"):
+                response["result"]["data"] = base64.b64encode(b"not a png").decode()
+            return response
+
+        page.send_command = broken
+        with pytest.raises(CDPError):
+            ScreenshotCommands(page).capture(str(tmp_path / "x.png"), full_page=True, tile_height=640)
+        assert list(tmp_path.iterdir()) == []
+
+
+def test_screencast_writes_and_acknowledges_each_frame(tmp_path):
+    page = FakePage(height=100)
+    page.frames = [
+        {"data": base64.b64encode(b"frame%d" % i).decode(), "sessionId": i,
+         "metadata": {"timestamp": 1000.0 + i}}
+        for i in range(5)
+    ]
+
+    result = ScreenshotCommands(page).screencast(str(tmp_path), max_frames=3, duration=2)
+
+    assert [f["file"] for f in result["frames"]] == [
+        str(tmp_path / f"frame-{i:03d}.jpg") for i in range(3)
+    ]
+    assert (tmp_path / "frame-001.jpg").read_bytes() == b"frame1"
+    assert page.commands.count("Page.screencastFrameAck") == 3
+    assert page.commands[-1] == "Page.stopScreencast"
+
+
+@pytest.mark.perf
+def test_peak_memory_is_bounded_by_a_tile(tmp_path):
+    """80 tiles of ~1 MB raw each: the stitcher never holds more than a few of them."""
+    width, rows_per_tile = 512, 512
+    tile_rows = _rows(rows_per_tile, width, 1)
+    tile = _png(tile_rows, width, idat_size=64 * 1024)
+    raw_tile = width * 4 * rows_per_tile
+
+    tracemalloc.start()
+    with open(tmp_path / "big.png", "wb") as out:
+        stitcher = PNGStitcher(out)
+        for _ in range(80):
+            stitcher.add(tile)
+        stitcher.finish()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < raw_tile * 4, f"peak {peak / 1e6:.1f} MB for {raw_tile * 80 / 1e6:.0f} MB of pixels"
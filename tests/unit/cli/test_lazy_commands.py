@@ -0,0 +1,101 @@
+"""Top-level commands are imported on first use, not at startup.
+
+`frago browser exec-js` and `frago recipe run` are called hundreds of times per
+agent session; each call used to import every command module — the CDP stack,
+the server's services, the recipe installer — before doing anything. These
+tests pin the startup import graph so that cost cannot creep back in.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+
+from frago.cli.main import LAZY_COMMAND_SPECS, cli
+
+SRC = Path(__file__).resolve().parents[3] / "src"
+
+# Modules that only specific subcommands need. None of them may be imported
+# just because the CLI entry point was.
+HEAVY_MODULES = (
+    "frago.browser.cdp",
+    "frago.server.app",
+    "frago.server.services",
+    "frago.recipes.installer",
+    "frago.session.search",
+    "fastapi",
+    "websocket",
+)
+
+
+def _imported_modules(code: str) -> dict[str, int]:
+    """Run ``code`` in a fresh interpreter under -X importtime.
+
+    Returns {module: cumulative microseconds}.
+    """
+    env = {**os.environ, "PYTHONPATH": str(SRC), "FRAGO_ALLOW_CHECKOUT_CLI": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+    modules: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative.strip())
+    return modules
+
+
+def _heavy(modules: dict[str, int]) -> list[str]:
+    return sorted(
+        m for m in modules
+        if any(m == h or m.startswith(h + ".") for h in HEAVY_MODULES)
+    )
+
+
+def test_entry_point_imports_no_command_modules():
+    modules = _imported_modules("import frago.cli.main")
+    assert _heavy(modules) == []
+    loaded_commands = {m for m in modules if m.startswith("frago.cli.") and m.endswith(
+        ("_commands", "_command"))}
+    assert loaded_commands == set()
+
+
+def test_resolving_one_command_imports_only_its_module():
+    # Read sys.modules rather than -X importtime: importlib.import_module goes
+    # through the pure-Python import path, which importtime does not report.
+    env = {**os.environ, "PYTHONPATH": str(SRC), "FRAGO_ALLOW_CHECKOUT_CLI": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, click\n"
+         "from frago.cli.main import cli\n"
+         "cli.get_command(click.Context(cli), 'todo')\n"
+         "print('\\n'.join(sys.modules))\n"],
+        capture_output=True, text=True, env=env, timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+    modules = set(proc.stdout.split())
+    assert "frago.cli.todo_commands" in modules
+    assert "frago.cli.recipe_commands" not in modules
+    assert "frago.cli.browser_commands" not in modules
+
+
+def test_every_lazy_command_resolves():
+    ctx = click.Context(cli)
+    for name, _module, _attr in LAZY_COMMAND_SPECS:
+        cmd = cli.get_command(ctx, name)
+        assert isinstance(cmd, click.Command), name
+    assert set(cli.list_commands(ctx)) >= {n for n, _m, _a in LAZY_COMMAND_SPECS}
+
+
+@pytest.mark.perf
+def test_entry_point_import_time_budget():
+    """`import frago.cli.main` stays well under the ~0.8s it cost when eager."""
+    modules = _imported_modules("import frago.cli.main")
+    assert modules["frago.cli.main"] < 250_000, f"{modules['frago.cli.main'] / 1000:.0f}ms"
@@ -65,3 +65,15 @@ def test_recipe_publish_is_still_the_state_publisher():
     publish = recipe.get_command(click.Context(recipe), "publish")
     params = {p.name for p in publish.params}
     assert "state_file" in params, "frago recipe publish 不再是发布页面状态的那个命令"
+
+
+def test_lazy_command_table_has_no_duplicates():
+    """顶层命令改成按需导入后，注册表在第一次解析前是空的，上面那条查不到它。
+
+    重名的风险原样搬进了 `LAZY_COMMAND_SPECS` 这张表——所以它得单独查一遍。
+    """
+    from frago.cli.main import LAZY_COMMAND_SPECS
+
+    names = [name for name, _module, _attr in LAZY_COMMAND_SPECS]
+    duplicated = sorted({n for n in names if names.count(n) > 1})
+    assert not duplicated, f"命令重名：{duplicated}"
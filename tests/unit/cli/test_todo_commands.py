@@ -124,3 +124,21 @@ def test_edit_without_options_errors(runner):
     res = runner.invoke(todo_group, ["edit", todo_id])
     assert res.exit_code != 0
     assert "nothing to edit" in res.output.lower()
+
+
+def test_due_dates_and_reindex(runner):
+    res = _add(runner, "--title", "due soon", "--due", "2026-03-01")
+    assert res.exit_code == 0, res.output
+    _add(runner, "--title", "no due date")
+
+    res = runner.invoke(todo_group, ["list", "--due-before", "2026-06-30"])
+    assert "due-soon" in res.output
+    assert "(1 todos)" in res.output
+
+    res = runner.invoke(todo_group, ["list", "--due-before", "someday"])
+    assert res.exit_code != 0
+    assert "invalid due date" in res.output
+
+    res = runner.invoke(todo_group, ["reindex"])
+    assert res.exit_code == 0
+    assert "Indexed 2 todos" in res.output
@@ -115,11 +115,12 @@ class TestExecutionStore:
         loaded = store.get(ex.id)
         assert loaded.data.get("_truncated") is True
 
-    def test_index_file_created(self, store):
+    def test_index_log_created(self, store):
         store.create(recipe_name="test", params={})
-        assert store.index_file.exists()
-        index = json.loads(store.index_file.read_text())
-        assert len(index) == 1
+        assert store.log_file.exists()
+        lines = store.log_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["recipe_name"] == "test"
 
     def test_cleanup(self, store):
         for i in range(10):
@@ -130,6 +131,7 @@ class TestExecutionStore:
 
         index = json.loads(store.index_file.read_text())
         assert len(index) == 5
+        assert store.log_file.read_text() == ""
 
     def test_auto_cleanup_triggers_periodically(self, store):
         # Verify _maybe_cleanup is called from create() by checking counter
@@ -154,12 +156,12 @@ class TestExecutionStore:
 
     def test_index_includes_workflow_id(self, store):
         store.create(recipe_name="step1", params={}, workflow_id="exec_wf001")
-        index = json.loads(store.index_file.read_text())
+        index = store._load_index()
         assert index[0]["workflow_id"] == "exec_wf001"
 
     def test_index_workflow_id_null_when_not_set(self, store):
         store.create(recipe_name="standalone", params={})
-        index = json.loads(store.index_file.read_text())
+        index = store._load_index()
         assert index[0]["workflow_id"] is None
 
     def test_list_by_workflow(self, store):
@@ -191,3 +193,73 @@ class TestExecutionStore:
         assert results[0].step_index == 0
         assert results[1].step_index == 1
         assert results[2].step_index is None
+
+
+class TestIndexLog:
+    """The index is an append-only log folded into a snapshot now and then."""
+
+    def test_state_changes_append_instead_of_rewriting(self, store):
+        ex = store.create(recipe_name="test", params={})
+        store.transition(ex.id, ExecutionStatus.RUNNING)
+        store.complete(ex.id, status=ExecutionStatus.SUCCEEDED, exit_code=0, duration_ms=1)
+
+        lines = [json.loads(line) for line in store.log_file.read_text().splitlines()]
+        assert [e["status"] for e in lines] == ["pending", "running", "succeeded"]
+        assert not store.index_file.exists()
+        assert store._load_index()[0]["status"] == "succeeded"
+
+    def test_another_process_sees_appends(self, store, tmp_path):
+        from frago.recipes import execution_store
+
+        ex = store.create(recipe_name="test", params={})
+        # A fresh process starts with no in-memory index at all.
+        execution_store._INDEXES.clear()
+        other = ExecutionStore(store_dir=store.store_dir)
+        assert [e["id"] for e in other._load_index()] == [ex.id]
+
+        store.transition(ex.id, ExecutionStatus.RUNNING)
+        assert other.list_recent(status=ExecutionStatus.RUNNING)[0].id == ex.id
+
+    def test_compaction_folds_log_into_snapshot(self, store, monkeypatch):
+        from frago.recipes import execution_store
+
+        monkeypatch.setattr(execution_store, "COMPACT_AFTER_LINES", 4)
+        ids = [store.create(recipe_name=f"r{i}", params={}).id for i in range(5)]
+
+        snapshot = json.loads(store.index_file.read_text())
+        assert [e["id"] for e in snapshot] == list(reversed(ids[:4]))
+        assert len(store.log_file.read_text().splitlines()) == 1
+        assert [e["id"] for e in store._load_index()] == list(reversed(ids))
+
+    def test_legacy_index_json_is_read(self, store):
+        store.store_dir.mkdir(parents=True)
+        store.index_file.write_text(json.dumps([
+            {"id": "exec_new", "recipe_name": "a", "status": "succeeded",
+             "created_at": "2026-01-02T00:00:00", "workflow_id": None},
+            {"id": "exec_old", "recipe_name": "b", "status": "failed",
+             "created_at": "2026-01-01T00:00:00", "workflow_id": "exec_wf"},
+        ]))
+        assert [e["id"] for e in store._load_index()] == ["exec_new", "exec_old"]
+        from frago.recipes import execution_store
+
+        assert execution_store._INDEXES[store.store_dir].by_workflow == {"exec_wf": {"exec_old"}}
+
+    def test_partial_trailing_line_is_not_consumed(self, store):
+        ex = store.create(recipe_name="test", params={})
+        with open(store.log_file, "ab") as f:
+            f.write(b'{"id": "exec_half"')
+        assert [e["id"] for e in store._load_index()] == [ex.id]
+
+    def test_append_after_an_interrupted_write_drops_the_fragment(self, store):
+        from frago.recipes import execution_store
+
+        ex = store.create(recipe_name="test", params={})
+        with open(store.log_file, "ab") as f:
+            f.write(b'{"id": "exec_half"')
+
+        store.transition(ex.id, ExecutionStatus.RUNNING)
+
+        lines = store.log_file.read_bytes().splitlines()
+        assert [json.loads(line)["status"] for line in lines] == ["pending", "running"]
+        execution_store._INDEXES.clear()
+        assert ExecutionStore(store_dir=store.store_dir)._load_index()[0]["status"] == "running"
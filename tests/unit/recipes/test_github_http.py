@@ -0,0 +1,247 @@
+"""Community recipes against a local mock of the GitHub API.
+
+The mock counts requests, the client connections they arrived on, and honours
+``If-None-Match`` the way api.github.com does.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from frago.recipes import github_http
+from frago.recipes.exceptions import RecipeInstallError
+from frago.recipes.github_rate_limit import GitHubRateLimitManager
+from frago.recipes.installer import RecipeInstaller
+
+REPO = "owner/recipes"
+SHA = "c0ffee0000000000000000000000000000000000"
+TOP = f"owner-recipes-{SHA[:7]}"
+
+
+def _recipe_md(name: str, version: str = "1.0") -> str:
+    return (
+        f"---\nname: {name}\ntype: atomic\nruntime: python\nversion: '{version}'\n"
+        f"description: {name} recipe\nuse_cases: [demo]\noutput_targets: [stdout]\n"
+        f"tags: [demo]\n---\n\n# {name}\n"
+    )
+
+
+def _tarball(files: dict[str, bytes], extra: list[tarfile.TarInfo] = ()) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for path, data in files.items():
+            info = tarfile.TarInfo(f"{TOP}/{path}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        for info in extra:
+            tar.addfile(info)
+    return buf.getvalue()
+
+
+class MockGitHub:
+    """Routes → (body, etag). ETags are content hashes, as GitHub's are."""
+
+    def __init__(self):
+        self.routes: dict[str, bytes] = {}
+        self.log: list[tuple[str, int]] = []
+        self.peers: set[tuple] = set()
+        self.tree_sha = {"alpha": "t-alpha-1", "beta": "t-beta-1"}
+        self.files = {
+            "alpha": _recipe_md("alpha"),
+            "beta": _recipe_md("beta"),
+        }
+        self.rebuild()
+
+    def rebuild(self):
+        base = f"/repos/{REPO}/contents/community-recipes/recipes"
+        listing = [
+            {"type": "dir", "name": n, "html_url": f"https://example/{n}",
+             "sha": self.tree_sha[n]}
+            for n in self.files
+        ]
+        self.routes = {f"{base}?ref=main": json.dumps(listing).encode()}
+        for name, text in self.files.items():
+            payload = {"content": base64.b64encode(text.encode()).decode()}
+            self.routes[f"{base}/{name}/recipe.md?ref=main"] = json.dumps(payload).encode()
+        self.routes[f"/repos/{REPO}/branches/main"] = json.dumps(
+            {"commit": {"sha": SHA}}
+        ).encode()
+
+    def count(self, fragment: str) -> int:
+        return sum(1 for path, _ in self.log if fragment in path)
+
+    def handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                mock.peers.add(self.client_address)
+                body = mock.routes.get(self.path)
+                if body is None:
+                    mock.log.append((self.path, 404))
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    mock.log.append((self.path, 304))
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                mock.log.append((self.path, 200))
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def github(tmp_path, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setattr(github_http, "CACHE_DIR", tmp_path / "http-cache")
+    github_http.reset_session()
+    github_http.reset_stats()
+    GitHubRateLimitManager.reset_instance()
+
+    mock = MockGitHub()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), mock.handler())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    mock.base = f"http://127.0.0.1:{server.server_address[1]}"
+    yield mock
+    server.shutdown()
+    server.server_close()
+    github_http.reset_session()
+    GitHubRateLimitManager.reset_instance()
+
+
+@pytest.fixture
+def installer(github, tmp_path):
+    inst = RecipeInstaller()
+    inst.community_repo = REPO
+    inst.GITHUB_API_BASE = github.base
+    inst.community_dir = tmp_path / "community"
+    inst.manifest_path = inst.community_dir / ".installed" / "manifest.json"
+    inst.archive_dir = tmp_path / "archives"
+    return inst
+
+
+class TestSearch:
+    def test_an_unchanged_listing_costs_one_conditional_request(self, github, installer):
+        first = installer.search_community()
+        assert github.count("/contents/") == 3
+
+        second = installer.search_community()
+
+        assert second == first
+        assert first[0]["version"] == "1.0"
+        # Listing answered 304; both tree hashes held, so no recipe.md request.
+        assert github.log[3:] == [(github.log[0][0], 304)]
+        assert github_http.stats()["not_modified"] == 1
+
+    def test_only_a_moved_recipe_is_fetched_again(self, github, installer):
+        installer.search_community()
+        github.files["beta"] = _recipe_md("beta", "2.0")
+        github.tree_sha["beta"] = "t-beta-2"
+        github.rebuild()
+        github.log.clear()
+
+        results = {r["name"]: r for r in installer.search_community()}
+
+        assert results["beta"]["version"] == "2.0"
+        assert github.count("/alpha/") == 0
+        assert github.count("/beta/") == 1
+
+    def test_requests_share_one_pooled_connection(self, github, installer):
+        installer.search_community()
+        installer.search_community()
+        assert len(github.log) == 4
+        assert len(github.peers) == 1
+
+    def test_the_cache_outlives_the_process(self, github, installer):
+        installer.search_community()
+        github_http.reset_session()  # a restart: memory gone, disk kept
+        github.log.clear()
+
+        installer.search_community()
+
+        assert [status for _, status in github.log] == [304]
+
+
+class TestInstall:
+    @pytest.fixture
+    def tarball(self, github):
+        escape = tarfile.TarInfo(f"{TOP}/community-recipes/recipes/alpha/../../../evil.txt")
+        escape.size = 0
+        link = tarfile.TarInfo(f"{TOP}/community-recipes/recipes/alpha/passwd")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "/etc/passwd"
+        github.routes[f"/repos/{REPO}/tarball/{SHA}"] = _tarball(
+            {
+                "README.md": b"repo readme",
+                "community-recipes/recipes/alpha/recipe.md": _recipe_md("alpha").encode(),
+                "community-recipes/recipes/alpha/recipe.py": b"print('alpha')\n",
+                "community-recipes/recipes/alpha/examples/one.json": b"{}",
+                "community-recipes/recipes/beta/recipe.md": _recipe_md("beta").encode(),
+            },
+            extra=[escape, link],
+        )
+
+    def test_one_archive_request_installs_only_the_subtree(self, github, installer, tarball):
+        assert installer.install("community:alpha") == "alpha"
+
+        installed = installer.community_dir / "atomic" / "system" / "alpha"
+        files = sorted(p.relative_to(installed).as_posix()
+                       for p in installed.rglob("*") if p.is_file())
+        assert files == ["examples/one.json", "recipe.md", "recipe.py"]
+        assert github.count("/tarball/") == 1
+        assert github.count("/contents/") == 0
+        assert not (installer.community_dir / "evil.txt").exists()
+
+    def test_installs_at_one_commit_share_the_archive(self, github, installer, tarball):
+        installer.install("community:alpha")
+        installer.install("community:beta")
+        installer.update("alpha")
+
+        assert github.count("/tarball/") == 1
+        assert [s for p, s in github.log if "/branches/" in p] == [200, 304, 304]
+
+    def test_a_missing_recipe_is_reported(self, github, installer, tarball):
+        with pytest.raises(RecipeInstallError, match="not found"):
+            installer.install("community:gamma")
+
+
+@pytest.mark.perf
+def test_repeat_polls_are_cheap(github, installer):
+    for name in (f"r{i}" for i in range(30)):
+        github.files[name] = _recipe_md(name)
+        github.tree_sha[name] = f"t-{name}"
+    github.rebuild()
+
+    installer.search_community()
+    cold = github_http.stats()
+    github_http.reset_stats()
+    for _ in range(5):
+        installer.search_community()
+    warm = github_http.stats()
+
+    assert cold["requests"] == 33
+    assert warm["requests"] == 5
+    assert warm["not_modified"] == 5
@@ -187,6 +187,87 @@ output_targets:
         assert "no-script" not in registry.recipes
 
 
+class TestMetadataCache:
+    """Unchanged recipes are not re-parsed, within a process or across them."""
+
+    RECIPE_MD = """---
+name: cached-recipe
+description: {description}
+type: atomic
+runtime: python
+version: "1.0.0"
+use_cases:
+  - Testing
+output_targets:
+  - stdout
+---
+"""
+
+    @pytest.fixture
+    def recipes_dir(self, tmp_path: Path) -> Path:
+        recipes = tmp_path / ".frago" / "recipes"
+        recipe_dir = recipes / "atomic" / "system" / "cached-recipe"
+        recipe_dir.mkdir(parents=True)
+        (recipe_dir / "recipe.md").write_text(self.RECIPE_MD.format(description="first"))
+        (recipe_dir / "recipe.py").write_text("# python")
+        return recipes
+
+    def _registry(self, recipes_dir: Path) -> RecipeRegistry:
+        with patch.object(RecipeRegistry, "_setup_search_paths"):
+            reg = RecipeRegistry()
+        reg.search_paths = [recipes_dir]
+        return reg
+
+    def _count_parses(self):
+        from frago.recipes import registry as registry_module
+
+        return patch.object(
+            registry_module, "parse_metadata_file", wraps=registry_module.parse_metadata_file
+        )
+
+    def test_second_scan_does_not_parse(self, recipes_dir: Path):
+        with self._count_parses() as parse:
+            self._registry(recipes_dir).scan()
+            reg = self._registry(recipes_dir)
+            reg.scan()
+        assert parse.call_count == 1
+        assert reg.find("cached-recipe").metadata.description == "first"
+
+    def test_edit_is_reparsed(self, recipes_dir: Path):
+        import os
+
+        self._registry(recipes_dir).scan()
+        md = recipes_dir / "atomic" / "system" / "cached-recipe" / "recipe.md"
+        md.write_text(self.RECIPE_MD.format(description="second"))
+        st = md.stat()
+        os.utime(md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        reg = self._registry(recipes_dir)
+        reg.scan()
+        assert reg.find("cached-recipe").metadata.description == "second"
+
+    def test_cold_process_uses_disk_cache(self, recipes_dir: Path):
+        from frago.recipes import registry as registry_module
+
+        self._registry(recipes_dir).scan()
+        assert registry_module.METADATA_CACHE_FILE.exists()
+
+        registry_module._metadata_cache.clear()
+        with self._count_parses() as parse:
+            reg = self._registry(recipes_dir)
+            reg.scan()
+        assert parse.call_count == 0
+        assert reg.find("cached-recipe").script_path.name == "recipe.py"
+
+    def test_removed_script_unregisters(self, recipes_dir: Path):
+        self._registry(recipes_dir).scan()
+        (recipes_dir / "atomic" / "system" / "cached-recipe" / "recipe.py").unlink()
+
+        reg = self._registry(recipes_dir)
+        reg.scan()
+        assert "cached-recipe" not in reg.recipes
+
+
 class TestFindScriptFile:
     """Test _find_script_file() method."""
 
@@ -0,0 +1,158 @@
+"""Tests for the opt-in recipe result cache."""
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from frago.recipes import result_cache
+from frago.recipes.context import VISITOR, InvocationContext
+from frago.recipes.metadata import RecipeMetadata, validate_metadata
+from frago.recipes.result_cache import RecipeResultCache, cache_policy, make_key
+from frago.recipes.runner import RecipeRunner
+
+
+def _metadata(**overrides):
+    fields = {
+        "name": "fetch_page",
+        "type": "atomic",
+        "runtime": "python",
+        "version": "1.0",
+        "description": "Fetch a page",
+        "use_cases": ["fetch"],
+        "output_targets": ["stdout"],
+        "inputs": {
+            "url": {"type": "string", "required": True},
+            "verbose": {"type": "boolean", "required": False},
+        },
+    }
+    fields.update(overrides)
+    return RecipeMetadata(**fields)
+
+
+@pytest.fixture
+def script(tmp_path):
+    path = tmp_path / "recipe.py"
+    path.write_text("print('{}')\n", encoding="utf-8")
+    return path
+
+
+class TestPolicy:
+    def test_absent_ttl_is_not_cacheable(self):
+        assert cache_policy(_metadata()) is None
+
+    def test_mock_metadata_is_not_cacheable(self):
+        assert cache_policy(MagicMock()) is None
+
+    def test_declared_ttl_and_fields(self):
+        assert cache_policy(_metadata(cache_ttl=60, cache_key=["url"])) == (60, ["url"])
+
+    def test_validation_rejects_undeclared_key_field(self):
+        from frago.recipes.exceptions import RecipeValidationError
+
+        with pytest.raises(RecipeValidationError):
+            validate_metadata(_metadata(cache_ttl=60, cache_key=["nope"]))
+
+    def test_validation_rejects_negative_ttl(self):
+        from frago.recipes.exceptions import RecipeValidationError
+
+        with pytest.raises(RecipeValidationError):
+            validate_metadata(_metadata(cache_ttl=-1))
+
+
+class TestKey:
+    def test_key_fields_ignore_other_params(self, script):
+        a = make_key("r", script, {"url": "x", "verbose": True}, ["url"])
+        b = make_key("r", script, {"url": "x", "verbose": False}, ["url"])
+        assert a == b
+
+    def test_all_params_by_default(self, script):
+        assert make_key("r", script, {"url": "x"}) != make_key("r", script, {"url": "y"})
+
+    def test_script_edit_changes_key(self, script):
+        before = make_key("r", script, {"url": "x"})
+        script.write_text("print('changed')\n", encoding="utf-8")
+        st = script.stat()
+        os.utime(script, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert make_key("r", script, {"url": "x"}) != before
+
+
+class TestStore:
+    def test_round_trip(self, tmp_path):
+        cache = RecipeResultCache(tmp_path / "c")
+        cache.put("k", {"data": {"n": 1}}, ttl=60)
+        assert cache.get("k") == {"data": {"n": 1}}
+
+    def test_expired_entry_is_dropped(self, tmp_path):
+        cache = RecipeResultCache(tmp_path / "c")
+        cache.put("k", {"data": 1}, ttl=60)
+        with patch.object(result_cache.time, "time", return_value=time.time() + 120):
+            assert cache.get("k") is None
+        assert not (tmp_path / "c" / "k.json").exists()
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        cache = RecipeResultCache(tmp_path / "c", max_bytes=10_000)
+        blob = "x" * 3000
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, {"data": blob}, ttl=60)
+            os.utime(tmp_path / "c" / f"{key}.json", (1000 + i, 1000 + i))
+        # Touch "a" so "b" is now the least recently used.
+        assert cache.get("a") is not None
+        cache.put("d", {"data": blob}, ttl=60)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("d") is not None
+
+
+class TestRunner:
+    @pytest.fixture
+    def runner(self, tmp_path, script):
+        recipe = SimpleNamespace(
+            metadata=_metadata(cache_ttl=60, cache_key=["url"]),
+            script_path=script,
+        )
+        registry = MagicMock()
+        registry.find.return_value = recipe
+        runner = RecipeRunner(registry=registry, project_root=tmp_path)
+        runner.store = MagicMock()
+        runner.store.create.return_value = SimpleNamespace(id="exec_1")
+        runner.result_cache = RecipeResultCache(tmp_path / "cache")
+        return runner
+
+    def _fake_run(self):
+        return MagicMock(return_value={"success": True, "data": {"title": "T"}, "execution_id": "exec_1"})
+
+    def test_repeat_call_is_served_from_cache(self, runner):
+        fake = self._fake_run()
+        with patch.object(runner, "_run_with_execution", fake):
+            first = runner.run("fetch_page", {"url": "x"})
+            second = runner.run("fetch_page", {"url": "x", "verbose": True})
+
+        assert fake.call_count == 1
+        assert first.get("cached") is None
+        assert second["cached"] is True
+        assert second["data"] == {"title": "T"}
+
+    def test_no_cache_always_executes(self, runner):
+        fake = self._fake_run()
+        with patch.object(runner, "_run_with_execution", fake):
+            runner.run("fetch_page", {"url": "x"})
+            runner.run("fetch_page", {"url": "x"}, use_cache=False)
+        assert fake.call_count == 2
+
+    def test_visitor_runs_bypass_cache(self, runner):
+        fake = self._fake_run()
+        visitor = InvocationContext(caller=VISITOR)
+        with patch.object(runner, "_run_with_execution", fake):
+            runner.run("fetch_page", {"url": "x"}, ctx=visitor)
+            runner.run("fetch_page", {"url": "x"}, ctx=visitor)
+        assert fake.call_count == 2
+
+    def test_open_url_results_are_not_cached(self, runner):
+        fake = MagicMock(return_value={"success": True, "data": {"open_url": "http://x"}})
+        with patch.object(runner, "_run_with_execution", fake):
+            runner.run("fetch_page", {"url": "x"})
+            runner.run("fetch_page", {"url": "x"})
+        assert fake.call_count == 2
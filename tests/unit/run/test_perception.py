@@ -0,0 +1,91 @@
+"""Incremental perception: baseline, delta and the unchanged fast path."""
+
+from __future__ import annotations
+
+import pytest
+
+from frago.run import perception
+from frago.run.perception import BASELINE, DELTA, UNCHANGED, perceive
+
+
+class FakeSession:
+    """Answers the perception script with queued results and counts screenshots."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.scripts: list[str] = []
+        self.screenshots = 0
+
+    def evaluate(self, script, return_by_value=True):
+        self.scripts.append(script)
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def shots(monkeypatch):
+    taken = []
+    monkeypatch.setattr(
+        perception, "take_perception_screenshot",
+        lambda session, d, desc="page": taken.append(desc) or str(d / f"{len(taken)}.png"),
+    )
+    return taken
+
+
+def _delta(**fields):
+    return {"perception": DELTA, "title": "t", "url": "u", "scroll_y": 0,
+            "changed": {}, "changes": [], "overflow": 0, **fields}
+
+
+def test_an_unchanged_page_takes_no_screenshot(tmp_path, shots):
+    session = FakeSession({"perception": UNCHANGED, "title": "t", "url": "u", "scroll_y": 0})
+    result = perceive(session, screenshots_dir=tmp_path)
+    assert result["perception"] == UNCHANGED
+    assert "screenshot" not in result
+    assert shots == []
+
+
+def test_a_delta_takes_a_screenshot(tmp_path, shots):
+    change = {"kind": "text", "node": "span#n", "text": "2", "before": "1"}
+    session = FakeSession(_delta(changes=[change]))
+    result = perceive(session, screenshots_dir=tmp_path, description="click")
+    assert result["changes"] == [change]
+    assert result["screenshot"] == str(tmp_path / "1.png")
+    assert shots == ["click"]
+
+
+def test_a_rerender_with_the_same_content_is_unchanged():
+    same = {"node": "li.item", "text": "Apples"}
+    session = FakeSession(_delta(changes=[
+        {"kind": "removed", **same}, {"kind": "added", **same},
+    ]))
+    assert perceive(session)["perception"] == UNCHANGED
+
+
+def test_only_real_changes_survive_coalescing():
+    session = FakeSession(_delta(changes=[
+        {"kind": "removed", "node": "li", "text": "a"},
+        {"kind": "added", "node": "li", "text": "a"},
+        {"kind": "added", "node": "li", "text": "b"},
+    ]))
+    assert perceive(session)["changes"] == [{"kind": "added", "node": "li", "text": "b"}]
+
+
+def test_changes_are_capped_and_the_rest_counted():
+    many = [{"kind": "added", "node": "li", "text": str(i)}
+            for i in range(perception.MAX_REPORTED_CHANGES + 5)]
+    session = FakeSession(_delta(changes=many, overflow=7))
+    result = perceive(session)
+    assert len(result["changes"]) == perception.MAX_REPORTED_CHANGES
+    assert result["more_changes"] == 12
+
+
+def test_full_asks_the_page_for_a_new_baseline():
+    session = FakeSession({"perception": BASELINE})
+    perceive(session, full=True)
+    assert session.scripts[0].rstrip().endswith("(true)")
+
+
+def test_falls_back_to_a_plain_extraction(monkeypatch):
+    monkeypatch.setattr(perception, "get_dom_features", lambda s: {"title": "plain"})
+    result = perceive(FakeSession(None))
+    assert result == {"title": "plain", "perception": BASELINE}
@@ -0,0 +1,182 @@
+"""Run search served from the persistent, incrementally updated search index."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from frago.run import search_index
+from frago.run.discovery import RunDiscovery
+from frago.run.logger import RunLogger
+from frago.run.manager import RunManager
+from frago.run.models import ActionType, ExecutionMethod, LogStatus
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> RunManager:
+    return RunManager(tmp_path / "projects")
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Count log lines the index parses."""
+    calls = []
+    real = search_index.LogEntry.from_dict
+
+    def counting(data):
+        calls.append(data.get("step"))
+        return real(data)
+
+    monkeypatch.setattr(search_index.LogEntry, "from_dict", staticmethod(counting))
+    return calls
+
+
+def _run(manager: RunManager, run_id: str, theme: str, steps=(), purpose=None) -> Path:
+    manager.create_run(theme, run_id=run_id)
+    run_dir = manager.projects_dir / run_id
+    if purpose:
+        (run_dir / ".metadata.json").write_text(
+            json.dumps({"purpose": purpose}), encoding="utf-8"
+        )
+    for step in steps:
+        _log(run_dir, step)
+    return run_dir
+
+
+def _log(run_dir: Path, step: str) -> None:
+    RunLogger(run_dir).write_log(
+        step, LogStatus.SUCCESS, ActionType.NAVIGATION, ExecutionMethod.COMMAND, {}
+    )
+
+
+def test_theme_and_step_layers(manager):
+    _run(manager, "twitter", "twitter trending topics", ["open home page"])
+    _run(manager, "upwork", "upwork job search", ["login", "open job feed", "open job detail"])
+
+    results = RunDiscovery(manager).search_runs("job feed")
+
+    by_id = {r["run_id"]: r for r in results}
+    assert by_id["upwork"]["match_source"] == "id"
+    assert by_id["upwork"]["log_count"] == 3
+
+    steps = RunDiscovery(manager).search_runs("HOME PAGE")
+    assert [(r["run_id"], r["match_source"], r["matched_steps"]) for r in steps] == [
+        ("twitter", "log", ["open home page"])
+    ]
+    assert steps[0]["similarity"] == 50
+
+
+def test_purpose_is_searchable_and_reported(manager):
+    _run(manager, "alpha", "alpha", purpose="collect quarterly invoices")
+    results = RunDiscovery(manager).search_runs("quarterly invoices")
+    assert results[0]["run_id"] == "alpha"
+    assert results[0]["match_source"] == "purpose"
+    assert results[0]["purpose"] == "collect quarterly invoices"
+
+
+def test_blank_keyword_returns_nothing(manager):
+    _run(manager, "alpha", "alpha")
+    assert RunDiscovery(manager).search_runs("  ") == []
+
+
+def test_appended_steps_come_from_the_journal(manager, parsed):
+    run_dir = _run(manager, "shop", "shopping cart", ["add item"])
+    discovery = RunDiscovery(manager)
+    discovery.search_runs("item")
+    parsed.clear()
+
+    _log(run_dir, "checkout with coupon")
+
+    results = discovery.search_runs("coupon")
+    assert results[0]["matched_steps"] == ["checkout with coupon"]
+    assert parsed == []  # the log was not read again
+    assert (manager.projects_dir / search_index.JOURNAL_FILENAME).read_text() == ""
+
+
+def test_a_fresh_process_loads_the_index_without_reading_logs(manager, parsed):
+    _run(manager, "shop", "shopping cart", ["add item", "pay"])
+    RunDiscovery(manager).search_runs("pay")
+    parsed.clear()
+
+    results = RunDiscovery(RunManager(manager.projects_dir)).search_runs("pay")
+    assert results[0]["run_id"] == "shop"
+    assert parsed == []
+
+
+def test_log_growth_without_a_journal_reads_only_the_tail(manager, parsed):
+    run_dir = _run(manager, "shop", "shopping cart", ["add item"])
+    discovery = RunDiscovery(manager)
+    discovery.search_runs("item")
+    parsed.clear()
+
+    log = run_dir / "logs" / "execution.jsonl"
+    line = log.read_text(encoding="utf-8").splitlines()[0]
+    entry = json.loads(line)
+    entry["step"] = "written by another tool"
+    with log.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+    assert discovery.search_runs("another tool")[0]["matched_steps"] == ["written by another tool"]
+    assert parsed == ["written by another tool"]
+
+
+def test_rewritten_logs_and_removed_runs_are_reindexed(manager):
+    import shutil
+
+    run_dir = _run(manager, "shop", "shopping cart", ["add item"])
+    _run(manager, "gone", "temporary", ["add item"])
+    discovery = RunDiscovery(manager)
+    assert {r["run_id"] for r in discovery.search_runs("add item")} == {"shop", "gone"}
+
+    shutil.rmtree(manager.projects_dir / "gone")
+    (run_dir / "logs" / "execution.jsonl").unlink()
+    _log(run_dir, "replaced")
+
+    assert discovery.search_runs("add item") == []
+    assert discovery.search_runs("replaced")[0]["run_id"] == "shop"
+
+
+def test_theme_change_updates_the_postings(manager):
+    _run(manager, "alpha", "weather forecast")
+    discovery = RunDiscovery(manager)
+    assert discovery.search_runs("weather forecast")
+
+    time.sleep(0.01)
+    manager.create_run("stock prices dashboard", run_id="alpha")
+    assert discovery.search_runs("weather forecast") == []
+    assert discovery.search_runs("stock prices")[0]["run_id"] == "alpha"
+
+
+@pytest.mark.perf
+def test_query_latency_does_not_follow_log_volume(manager, record_property):
+    def timed(discovery, query):
+        started = time.perf_counter()
+        discovery.search_runs(query)
+        return time.perf_counter() - started
+
+    words = ["login", "scroll", "extract", "click", "paginate", "download"]
+    for i in range(150):
+        run_dir = manager.projects_dir / f"run-{i:03d}"
+        manager.create_run(f"task {i} {words[i % 6]} report", run_id=f"run-{i:03d}")
+        lines = "".join(
+            json.dumps({
+                "timestamp": "2026-01-01T00:00:00", "step": f"{words[j % 6]} page {j}",
+                "status": "success", "action_type": "navigation",
+                "execution_method": "command", "data": {},
+            }) + "\n"
+            for j in range(300)
+        )
+        (run_dir / "logs").mkdir(exist_ok=True)
+        (run_dir / "logs" / "execution.jsonl").write_text(lines, encoding="utf-8")
+
+    discovery = RunDiscovery(manager)
+    cold = timed(discovery, "paginate page 77")
+    warm = min(timed(discovery, "paginate page 77") for _ in range(3))
+    reloaded = timed(RunDiscovery(RunManager(manager.projects_dir)), "download report")
+    record_property("cold_ms", round(cold * 1000))
+    record_property("warm_ms", round(warm * 1000, 1))
+    record_property("new_process_ms", round(reloaded * 1000))
+    assert warm < cold / 5
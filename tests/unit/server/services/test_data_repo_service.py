@@ -301,3 +301,231 @@ class TestCredentialsAreNamedNotJustCategorized:
     def test_selective_mode_carries_the_same_guard(self):
         """圈定范围不该把凭据那道闸一起圈掉。"""
         assert "server-token" in build_sync_prompt("selective", "把根目录下的东西传上去")
+
+
+class TestSnapshot:
+    """每次轮询都把几万个文件重扫一遍，只为发现什么都没变——快照就是为了不这么干。"""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path, monkeypatch):
+        (tmp_path / ".git").mkdir()
+        monkeypatch.setattr(svc, "repo_path", lambda: tmp_path)
+        # 事件在用例里手工喂，不起真的观察者。
+        monkeypatch.setattr(svc.StatusSnapshot, "watch", lambda self: True)
+        svc.reset_snapshot()
+        yield tmp_path
+        svc.reset_snapshot()
+
+    @staticmethod
+    def _git(monkeypatch, full: str, partial: str = ""):
+        calls: list[tuple] = []
+        fake = _fake_git(full)
+
+        def run(*args, **kwargs):
+            calls.append(args)
+            if args[0] == "status" and "--" in args:
+                result = fake(*args, **kwargs)
+                result.stdout = partial
+                return result
+            return fake(*args, **kwargs)
+
+        monkeypatch.setattr(svc, "_git", run)
+        return calls
+
+    @staticmethod
+    def _event(root: Path, rel: str, event_type: str = "modified", is_directory: bool = False):
+        from frago.watcher import FileEvent
+
+        return FileEvent(path=str(root / rel), event_type=event_type, is_directory=is_directory)
+
+    def test_an_unchanged_repo_is_answered_without_git(self, repo, monkeypatch):
+        calls = self._git(monkeypatch, _porcelain(" M books/a.md", "?? data/b.json"))
+        first = get_status()
+        calls.clear()
+
+        again = get_status()
+
+        assert calls == []
+        assert again["pending_total"] == first["pending_total"] == 2
+        assert again["rollup"] == first["rollup"]
+
+    def test_changed_paths_are_asked_about_one_by_one(self, repo, monkeypatch):
+        calls = self._git(
+            monkeypatch,
+            _porcelain(" M books/a.md", "?? data/b.json"),
+            partial=_porcelain("?? data/new.json"),
+        )
+        get_status()
+        calls.clear()
+
+        # books/a.md 改回了原样，data/new.json 是新的。
+        svc._snapshot._on_event(self._event(repo, "books/a.md"))
+        svc._snapshot._on_event(self._event(repo, "data/new.json", "created"))
+        result = get_status()
+
+        assert [c for c in calls if c[0] == "status"] == [
+            ("status", "--porcelain", "-uall", "-z", "--",
+             ":(literal)books/a.md", ":(literal)data/new.json"),
+        ]
+        assert result["pending_total"] == 2
+        assert result["counts"] == {"untracked": 2}
+        assert {row["area"]: row["count"] for row in result["rollup"]} == {"data/": 2}
+
+    def test_a_removed_directory_takes_its_files_with_it(self, repo, monkeypatch):
+        self._git(monkeypatch, _porcelain("?? tmp/a", "?? tmp/b", " M books/c.md"))
+        get_status()
+
+        svc._snapshot._on_event(self._event(repo, "tmp", "deleted", is_directory=True))
+        result = get_status()
+
+        assert result["pending_total"] == 1
+        assert result["files"] == [{"path": "books/c.md", "status": "modified"}]
+
+    def test_git_internals_and_directory_touches_are_not_changes(self, repo, monkeypatch):
+        calls = self._git(monkeypatch, _porcelain(" M books/a.md"))
+        get_status()
+        calls.clear()
+
+        svc._snapshot._on_event(self._event(repo, ".git/index.lock", "created"))
+        svc._snapshot._on_event(self._event(repo, "data", "modified", is_directory=True))
+        get_status()
+
+        assert calls == []
+
+    def test_an_index_change_means_a_full_rescan(self, repo, monkeypatch):
+        calls = self._git(monkeypatch, _porcelain(" M books/a.md"))
+        get_status()
+        calls.clear()
+
+        (repo / ".git" / "index").write_bytes(b"DIRC")
+        get_status()
+
+        assert ("status", "--porcelain", "-uall", "-z") in calls
+
+    def test_a_burst_of_changes_falls_back_to_one_full_scan(self, repo, monkeypatch):
+        calls = self._git(monkeypatch, "")
+        get_status()
+        calls.clear()
+
+        for i in range(svc.MAX_DIRTY_PATHS + 1):
+            svc._snapshot._on_event(self._event(repo, f"data/f{i}.json", "created"))
+        get_status()
+
+        assert [c for c in calls if c[0] == "status"] == [("status", "--porcelain", "-uall", "-z")]
+
+    def test_refresh_forces_a_rescan(self, repo, monkeypatch):
+        calls = self._git(monkeypatch, "")
+        get_status()
+        calls.clear()
+
+        get_status(refresh=True)
+
+        assert ("status", "--porcelain", "-uall", "-z") in calls
+        assert any(c[0] == "rev-list" for c in calls)
+
+    def test_a_timeout_is_not_cached(self, repo, monkeypatch):
+        wedged = MagicMock(side_effect=subprocess.TimeoutExpired("git", 30))
+        monkeypatch.setattr(svc, "_git", wedged)
+        assert "超时" in get_status()["error"]
+
+        self._git(monkeypatch, _porcelain(" M books/a.md"))
+        assert get_status()["pending_total"] == 1
+
+
+def _real_git(root: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(root), *args], check=True, capture_output=True)
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    import time
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def real_repo(tmp_path: Path, monkeypatch):
+    root = tmp_path / "frago-home"
+    root.mkdir()
+    _real_git(root, "init", "-q", "-b", "main")
+    _real_git(root, "config", "user.email", "t@example.com")
+    _real_git(root, "config", "user.name", "t")
+    monkeypatch.setattr(svc, "repo_path", lambda: root)
+    svc.reset_snapshot()
+    yield root
+    svc.reset_snapshot()
+
+
+def test_a_real_edit_reaches_the_snapshot_without_a_full_scan(real_repo):
+    (real_repo / "books").mkdir()
+    (real_repo / "books" / "a.md").write_text("一", encoding="utf-8")
+    _real_git(real_repo, "add", ".")
+    _real_git(real_repo, "commit", "-q", "-m", "init")
+    assert get_status()["pending_total"] == 0
+    scans = svc._snapshot.full_scans
+
+    (real_repo / "books" / "a.md").write_text("二", encoding="utf-8")
+    (real_repo / "books" / "b.md").write_text("新", encoding="utf-8")
+
+    assert _wait_for(lambda: get_status()["pending_total"] == 2)
+    assert get_status()["counts"] == {"modified": 1, "untracked": 1}
+    assert svc._snapshot.full_scans == scans
+
+
+def test_only_directories_git_keeps_are_watched(real_repo):
+    """浏览器 profile、会话、缓存占了 ~/.frago 的大半目录，不该每个都耗一个 inotify watch。"""
+    (real_repo / ".gitignore").write_text("/sessions/\n", encoding="utf-8")
+    (real_repo / "sessions" / "deep").mkdir(parents=True)
+    (real_repo / "books").mkdir()
+    (real_repo / "books" / "a.md").write_text("一", encoding="utf-8")
+    _real_git(real_repo, "add", ".")
+    _real_git(real_repo, "commit", "-q", "-m", "init")
+    assert get_status()["pending_total"] == 0
+    snapshot = svc._snapshot
+    assert set(snapshot._subtrees) == {"books"}
+    assert snapshot._target.recursive is False
+    scans = snapshot.full_scans
+
+    # A new top-level directory is picked up, and so is what lands in it later.
+    (real_repo / "data").mkdir()
+    (real_repo / "data" / "b.json").write_text("{}", encoding="utf-8")
+    assert _wait_for(lambda: get_status()["pending_total"] == 1)
+    assert "data" in snapshot._subtrees
+    (real_repo / "data" / "c.json").write_text("{}", encoding="utf-8")
+    assert _wait_for(lambda: get_status()["pending_total"] == 2)
+    assert snapshot.full_scans == scans
+
+
+@pytest.mark.perf
+def test_a_cached_poll_on_a_50k_file_repo_takes_milliseconds(real_repo):
+    """五万个文件：首扫交给 git，之后每次轮询只读内存。"""
+    import time
+
+    for area in range(50):
+        directory = real_repo / f"area{area:02d}"
+        directory.mkdir()
+        for i in range(1000):
+            (directory / f"f{i}.md").write_text(str(i), encoding="utf-8")
+    # 一半提交、一半留作未跟踪，两种都要分类。
+    _real_git(real_repo, "add", *[f"area{a:02d}" for a in range(25)])
+    _real_git(real_repo, "commit", "-q", "-m", "half")
+
+    started = time.perf_counter()
+    first = get_status()
+    cold = time.perf_counter() - started
+    assert first["pending_total"] == 25_000
+
+    samples = []
+    for _ in range(20):
+        started = time.perf_counter()
+        result = get_status()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    warm = samples[len(samples) // 2]
+
+    assert result["pending_total"] == 25_000
+    assert warm < 0.02, f"cold {cold * 1000:.0f}ms, warm {warm * 1000:.1f}ms"
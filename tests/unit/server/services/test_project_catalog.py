@@ -0,0 +1,191 @@
+"""Tests for ProjectCatalog — cached project listing and sizes."""
+
+import json
+import os
+import time
+
+import pytest
+
+from frago.server.services import project_catalog
+from frago.server.services.file_service import FileService
+from frago.server.services.project_catalog import ProjectCatalog
+
+
+@pytest.fixture
+def projects(tmp_path, monkeypatch):
+    monkeypatch.setattr("frago.server.services.file_service.PROJECTS_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def metadata_reads(monkeypatch):
+    reads = []
+    real = project_catalog._read_metadata
+
+    def counting(path):
+        reads.append(path)
+        return real(path)
+
+    monkeypatch.setattr(project_catalog, "_read_metadata", counting)
+    return reads
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    scanned = []
+    real = project_catalog.scan_dir
+
+    def counting(path):
+        scanned.append(path)
+        return real(path)
+
+    monkeypatch.setattr(project_catalog, "scan_dir", counting)
+    return scanned
+
+
+def _project(root, name, files=(), **metadata):
+    project_dir = root / name
+    project_dir.mkdir()
+    (project_dir / ".metadata.json").write_text(json.dumps({"run_id": name, **metadata}))
+    for rel, content in files:
+        path = project_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return project_dir
+
+
+def _bump(path):
+    """Move a path's mtime forward; mtime granularity can be coarser than the test."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestListing:
+    def test_metadata_is_read_once_until_it_changes(self, projects, metadata_reads):
+        project_dir = _project(projects, "a", last_accessed="2025-01-01T00:00:00")
+        _project(projects, "b", last_accessed="2025-01-02T00:00:00")
+
+        assert [p.run_id for p in FileService.list_projects()] == ["b", "a"]
+        assert [p.run_id for p in FileService.list_projects()] == ["b", "a"]
+        assert len(metadata_reads) == 2
+
+        (project_dir / ".metadata.json").write_text(
+            json.dumps({"run_id": "a", "last_accessed": "2025-02-01T00:00:00"})
+        )
+        assert [p.run_id for p in FileService.list_projects()] == ["a", "b"]
+        assert len(metadata_reads) == 3
+
+    def test_added_and_removed_projects(self, projects):
+        import shutil
+
+        _project(projects, "a")
+        assert len(FileService.list_projects()) == 1
+
+        _project(projects, "b")
+        _bump(projects)
+        assert {p.run_id for p in FileService.list_projects()} == {"a", "b"}
+
+        shutil.rmtree(projects / "a")
+        _bump(projects)
+        assert [p.run_id for p in FileService.list_projects()] == ["b"]
+
+    def test_invalid_metadata_is_skipped(self, projects):
+        (projects / "broken").mkdir()
+        (projects / "broken" / ".metadata.json").write_text("[1, 2]")
+        assert FileService.list_projects() == []
+
+    def test_refresh_rereads_everything(self, projects, metadata_reads):
+        _project(projects, "a")
+        FileService.list_projects()
+        FileService.refresh_projects()
+        assert len(metadata_reads) == 2
+
+
+class TestDetail:
+    def test_matches_the_recursive_walk(self, projects):
+        project_dir = _project(projects, "a", [
+            ("top.txt", "1234"),
+            ("shots/one.png", "x" * 10),
+            ("shots/deep/two.png", "y" * 20),
+            (".hidden/skip.txt", "nope"),
+            ("shots/.skip", "nope"),
+        ])
+        (project_dir / "linked").symlink_to(project_dir / "shots")
+
+        detail = FileService.get_project("a")
+
+        assert detail.file_count == 3
+        assert detail.total_size == 34
+        assert detail.subdirectories == ["linked", "shots"]
+        assert detail.last_modified
+
+    def test_only_changed_directories_are_rescanned(self, projects, scans):
+        project_dir = _project(projects, "a", [
+            ("logs/run.jsonl", "{}"), ("shots/1.png", "1"), ("outputs/r.md", "r"),
+        ])
+        assert FileService.get_project("a").file_count == 3
+        scans.clear()
+
+        assert FileService.get_project("a").file_count == 3
+        assert scans == []
+
+        (project_dir / "shots" / "2.png").write_text("22")
+        _bump(project_dir / "shots")
+        detail = FileService.get_project("a")
+        assert scans == [str(project_dir / "shots")]
+        assert (detail.file_count, detail.total_size) == (4, 6)
+
+    def test_removed_subdirectories_drop_out(self, projects):
+        import shutil
+
+        project_dir = _project(projects, "a", [("shots/1.png", "1"), ("shots/x/2.png", "2")])
+        assert FileService.get_project("a").file_count == 2
+
+        shutil.rmtree(project_dir / "shots" / "x")
+        _bump(project_dir / "shots")
+        assert FileService.get_project("a").file_count == 1
+
+    def test_in_place_rewrites_need_an_event_or_a_full_reconcile(self, projects):
+        project_dir = _project(projects, "a", [("logs/run.jsonl", "{}")])
+        catalog = ProjectCatalog(projects)
+        assert catalog.project("a").total_size == 2
+
+        (project_dir / "logs" / "run.jsonl").write_text("{}\n{}\n")
+        assert catalog.project("a").total_size == 2  # directory mtime unchanged
+
+        catalog.mark_dirty(str(project_dir / "logs" / "run.jsonl"))
+        assert catalog.project("a").total_size == 6
+
+        (project_dir / "logs" / "run.jsonl").write_text("{}")
+        catalog.reconcile(full=True)
+        assert catalog.project("a").total_size == 2
+
+    def test_a_missing_project_is_none(self, projects):
+        assert FileService.get_project("nope") is None
+
+
+@pytest.mark.perf
+def test_listing_and_details_do_not_walk_the_tree(projects, record_property):
+    """1k projects x 40 files (the full 1k x 1k takes minutes just to create)."""
+    for i in range(1000):
+        project_dir = _project(projects, f"run-{i:04d}", last_accessed=f"2025-01-01T00:{i // 60 % 60:02d}:00")
+        for sub in ("logs", "screenshots", "outputs", "scripts"):
+            (project_dir / sub).mkdir()
+            for j in range(10):
+                (project_dir / sub / f"f{j}").write_bytes(b"x" * j)
+
+    def timed(fn):
+        started = time.perf_counter()
+        fn()
+        return time.perf_counter() - started
+
+    catalog = project_catalog.get_catalog(projects)
+    cold = timed(lambda: catalog.reconcile(full=True))
+    listing = min(timed(FileService.list_projects) for _ in range(3))
+    details = timed(lambda: [FileService.get_project(f"run-{i:04d}") for i in range(0, 1000, 10)])
+
+    record_property("cold_walk_ms", round(cold * 1000))
+    record_property("listing_ms", round(listing * 1000, 1))
+    record_property("details_x100_ms", round(details * 1000, 1))
+    assert listing < cold / 5
+    assert details < cold / 5
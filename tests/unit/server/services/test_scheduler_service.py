@@ -1,16 +1,21 @@
 """Unit tests for SchedulerService pure logic and CRUD.
 
 Covers module-level helpers (_parse_interval, _parse_dt) and the
-SchedulerService methods _migrate_schedule + add/remove/toggle/list.
+SchedulerService methods _migrate_schedule + add/remove/toggle/list, and the
+cached schedule table / deadline heap that drive the loop.
 Persistence is redirected to tmp_path so the real ~/.frago/schedules.json
 is never touched.
 """
 
-from datetime import datetime
+import asyncio
+import time
+from datetime import datetime, timedelta
 
 import pytest
 
+from frago.server.services import scheduler_service
 from frago.server.services.scheduler_service import (
+    RETRY_DELAY,
     SchedulerService,
     _parse_dt,
     _parse_interval,
@@ -179,3 +184,132 @@ def test_crud_survives_reload(svc):
     listed = other.list_schedules()
     assert len(listed) == 1
     assert listed[0]["name"] == "persisted"
+
+
+# --- cached table + deadline heap ---
+
+def test_load_skips_reread_when_file_unchanged(svc, monkeypatch):
+    svc.add_schedule(name="a", interval_seconds=60)
+    reads = []
+    real = type(svc._schedules_path).read_text
+    monkeypatch.setattr(
+        type(svc._schedules_path), "read_text",
+        lambda self, *a, **k: reads.append(1) or real(self, *a, **k),
+    )
+    svc.list_schedules()
+    svc.list_schedules()
+    assert reads == []
+
+
+def test_load_picks_up_an_external_edit(svc):
+    svc.add_schedule(name="a", interval_seconds=60)
+    other = SchedulerService()
+    other._schedules_path = svc._schedules_path
+    other.add_schedule(name="b", interval_seconds=60)
+    assert [s["name"] for s in svc.list_schedules()] == ["a", "b"]
+
+
+def _past(seconds: int) -> str:
+    return (datetime.now() - timedelta(seconds=seconds)).isoformat()
+
+
+def test_deadline_follows_interval_start_and_end(svc):
+    fresh = svc.add_schedule(name="x", interval_seconds=600)
+    fresh["last_run_at"] = datetime.now().isoformat()
+    assert svc._deadline(fresh) == pytest.approx(time.time() + 600, abs=2)
+
+    fresh["enabled"] = False
+    assert svc._deadline(fresh) is None
+
+    later = (datetime.now() + timedelta(hours=1)).replace(microsecond=0)
+    starting = svc.add_schedule(name="y", interval_seconds=60, start_at=later.isoformat())
+    assert svc._deadline(starting) == later.timestamp()
+
+    ending = svc.add_schedule(name="z", interval_seconds=3600, end_at=_past(-60))
+    ending["last_run_at"] = datetime.now().isoformat()
+    assert svc._deadline(ending) < time.time() + 61
+
+
+def test_run_due_only_touches_due_schedules(svc, monkeypatch):
+    due = svc.add_schedule(name="due", interval_seconds=60)
+    due["last_run_at"] = _past(120)
+    idle = svc.add_schedule(name="idle", interval_seconds=3600)
+    idle["last_run_at"] = _past(10)
+    ran = []
+
+    async def fake_execute(schedule):
+        ran.append(schedule["name"])
+        schedule["last_run_at"] = datetime.now().isoformat()
+
+    monkeypatch.setattr(svc, "_execute", fake_execute)
+    svc._rebuild_heap()
+    asyncio.run(svc._run_due())
+    asyncio.run(svc._run_due())
+
+    assert ran == ["due"]
+    assert svc._heap[0][0] == pytest.approx(time.time() + 60, abs=2)
+
+
+def test_a_skipped_schedule_is_not_retried_in_a_hot_loop(svc, monkeypatch):
+    sch = svc.add_schedule(name="busy", interval_seconds=60)
+    sch["last_run_at"] = _past(120)
+    svc._active_schedule_ids.add(sch["id"])  # overlap=skip keeps it from running
+    svc._rebuild_heap()
+    asyncio.run(svc._run_due())
+    assert svc._heap[0][0] >= time.time() + RETRY_DELAY - 1
+
+
+def test_loop_sleeps_until_woken_by_an_edit(svc, monkeypatch):
+    monkeypatch.setattr(scheduler_service, "INITIAL_DELAY", 0)
+    monkeypatch.setattr(svc, "_watch_file", lambda: None)
+    ran = []
+
+    async def fake_execute(schedule):
+        ran.append(schedule["name"])
+        schedule["last_run_at"] = datetime.now().isoformat()
+
+    monkeypatch.setattr(svc, "_execute", fake_execute)
+
+    async def scenario():
+        await svc.start()
+        await asyncio.sleep(0.05)
+        assert ran == []
+        svc.add_schedule(name="new", interval_seconds=3600)
+        await asyncio.sleep(0.05)
+        await svc.stop()
+
+    asyncio.run(scenario())
+    assert ran == ["new"]
+
+
+@pytest.mark.perf
+def test_ten_thousand_idle_schedules_cost_no_cpu(svc, monkeypatch):
+    """堆顶在一小时后：一秒钟里循环该一下都不醒。"""
+    monkeypatch.setattr(scheduler_service, "INITIAL_DELAY", 0)
+    monkeypatch.setattr(svc, "_watch_file", lambda: None)
+    monkeypatch.setattr(svc, "_check_staleness", _no_staleness)
+    now = datetime.now().isoformat()
+    svc._schedules = []
+    for i in range(10_000):
+        sch = SchedulerService._migrate_schedule({
+            "id": f"sch_{i:05d}", "interval_seconds": 3600, "enabled": True,
+            "last_run_at": now, "created_at": now,
+        })
+        svc._schedules.append(sch)
+    svc._save()
+
+    async def scenario():
+        await svc.start()
+        await asyncio.sleep(0.3)  # first pass builds the heap
+        before = time.process_time()
+        await asyncio.sleep(1.0)
+        spent = time.process_time() - before
+        await svc.stop()
+        return spent
+
+    spent = asyncio.run(scenario())
+    assert spent < 0.05, f"{spent * 1000:.1f}ms CPU while idle"
+
+
+async def _no_staleness():
+    return None
@@ -3,8 +3,13 @@
 Tests skill loading from ~/.claude/skills/ directory.
 """
 
+import asyncio
+from types import SimpleNamespace
 
-from frago.server.services.skill_service import SkillService
+import pytest
+
+from frago.server.services import skill_service
+from frago.server.services.skill_service import SkillService, SkillWatchService
 
 
 class TestSkillServiceGetSkills:
@@ -52,6 +57,36 @@ description: A test skill
         assert result[0]["name"] == "fallback-skill"
         assert result[0]["description"] is None
 
+    @pytest.mark.parametrize("content", [
+        b"---\nname: odd-skill\ndescription: one --- two\n---\n",
+        b"\n---\nname: odd-skill\ndescription: one --- two\n---\n",
+        b"\xef\xbb\xbf---\r\nname: odd-skill\r\ndescription: one --- two\r\n---\r\n",
+    ], ids=["dashes-in-value", "leading-newline", "bom-crlf"])
+    def test_reads_frontmatter_as_editors_save_it(self, mock_home, content):
+        skill_dir = mock_home / ".claude" / "skills" / "odd"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_bytes(content)
+
+        result = SkillService.get_skills()
+
+        assert result[0]["name"] == "odd-skill"
+        assert result[0]["description"] == "one --- two"
+
+    def test_a_broken_skill_is_warned_about_once_per_edit(self, mock_home, caplog):
+        skill_md = mock_home / ".claude" / "skills" / "broken" / "SKILL.md"
+        skill_md.parent.mkdir()
+        skill_md.write_text("Not valid frontmatter")
+
+        with caplog.at_level("WARNING", logger=skill_service.logger.name):
+            SkillService.get_skills()
+            SkillService.get_skills()
+            assert len(caplog.records) == 1
+
+            skill_md.write_text("Still not valid frontmatter")
+            SkillService.get_skills()
+            assert len(caplog.records) == 2
+        assert "broken" in caplog.records[0].getMessage()
+
     def test_skips_non_directories(self, mock_home):
         """Should skip files in skills directory."""
         skills_dir = mock_home / ".claude" / "skills"
@@ -112,3 +147,66 @@ description: test
         # Both should work and return same data
         assert len(result1) == 1
         assert len(result2) == 1
+
+
+class TestSkillWatchService:
+    """Watcher events on the skills tree refresh StateManager's skills."""
+
+    @pytest.fixture
+    def refreshes(self, monkeypatch):
+        calls = []
+
+        class FakeStateManager:
+            def is_initialized(self):
+                return True
+
+            async def refresh_skills(self, broadcast=True):
+                calls.append(broadcast)
+
+        monkeypatch.setattr(
+            "frago.server.state.StateManager.get_instance", lambda: FakeStateManager()
+        )
+        monkeypatch.setattr(skill_service, "REFRESH_DEBOUNCE_SECONDS", 0.05)
+        return calls
+
+    @staticmethod
+    def _event(path, src_path=None):
+        return SimpleNamespace(path=str(path), src_path=src_path and str(src_path))
+
+    @pytest.mark.asyncio
+    async def test_bursts_of_relevant_events_refresh_once(self, mock_home, refreshes, monkeypatch):
+        service = SkillWatchService()
+        monkeypatch.setattr(service, "_watch", lambda: None)
+        await service.start()
+        try:
+            skills_dir = service.skills_dir
+            service._on_event(self._event(skills_dir / "new-skill"))
+            service._on_event(self._event(skills_dir / "new-skill" / "SKILL.md"))
+            await asyncio.sleep(0.2)
+            assert refreshes == [True]
+
+            # Files other than SKILL.md inside a skill do not matter.
+            service._on_event(self._event(skills_dir / "new-skill" / "scripts" / "run.py"))
+            service._on_event(self._event(skills_dir / "new-skill" / "notes.md"))
+            await asyncio.sleep(0.2)
+            assert refreshes == [True]
+
+            service._on_event(self._event(skills_dir / "renamed", skills_dir / "new-skill"))
+            await asyncio.sleep(0.2)
+            assert refreshes == [True, True]
+        finally:
+            await service.stop()
+
+    def test_listing_reuses_parsed_frontmatter(self, mock_home, monkeypatch):
+        from frago.skills import registry
+
+        skill_dir = mock_home / ".claude" / "skills" / "cached"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("---\nname: cached\ndescription: once\n---\n")
+        SkillService.get_skills()
+
+        parses = []
+        real = registry.parse_skill_md
+        monkeypatch.setattr(registry, "parse_skill_md", lambda p: parses.append(p) or real(p))
+        assert SkillService.get_skills()[0]["description"] == "once"
+        assert parses == []
@@ -0,0 +1,168 @@
+"""Tests for TimelineFeed — 物化时间线：环形缓冲、检查点、推送。"""
+
+import json
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from frago.server.services import timeline_service
+from frago.server.services.timeline_service import (
+    TimelineFeed,
+    get_feed,
+    get_timeline,
+    stop_feed,
+)
+from frago.telemetry import trace
+
+
+def _entry(i: int, **extra) -> dict:
+    return {
+        "id": f"e{i}", "msg_id": f"m{i}", "task_id": f"t{i}", "role": "scheduler",
+        "event": "test", "ts": f"2025-06-01T10:{i // 60:02d}:{i % 60:02d}",
+        "data": {"event_type": "pa_ingestion", "channel": "feishu", "prompt": f"hello {i}"},
+        **extra,
+    }
+
+
+def _trace_file(trace_dir):
+    return trace_dir / f"trace-{datetime.now().strftime('%Y-%m-%d')}.jsonl"
+
+
+def _write(trace_dir, entries) -> None:
+    with _trace_file(trace_dir).open("a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+@pytest.fixture
+def trace_dir(tmp_path):
+    trace_dir = tmp_path / "traces"
+    trace_dir.mkdir()
+    with patch("frago.telemetry.trace.TRACE_DIR", trace_dir):
+        yield trace_dir
+        stop_feed()
+
+
+class TestFeed:
+    def test_bootstrap_matches_the_scan(self, trace_dir):
+        _write(trace_dir, [_entry(i) for i in range(30)])
+
+        assert get_timeline(limit=10) == timeline_service._scan_timeline(None, 10)
+        since = "2025-06-01T10:00:19"
+        assert get_timeline(since=since, limit=50) == timeline_service._scan_timeline(since, 50)
+        assert [e["title"] for e in get_timeline(since=since, limit=3)] == [
+            e["title"] for e in timeline_service._scan_timeline(since, 3)
+        ]
+
+    def test_msg_id_is_resolved_from_an_earlier_entry(self, trace_dir):
+        reply = _entry(2, msg_id="", task_id="t1")
+        reply["data"] = {"event_type": "pa_reply", "channel": "feishu", "reply_text": "ok"}
+        _write(trace_dir, [_entry(1), reply])
+
+        events = get_timeline(limit=10)
+        assert events[-1]["msg_id"] == "m1"
+
+    def test_new_entries_arrive_through_the_trace_writer(self, trace_dir):
+        feed = get_feed()
+        trace.trace_entry(
+            origin="internal", subkind="scheduler", data_type="decision",
+            msg_id="m9", task_id="t9",
+            data={"event_type": "pa_decision", "action": "reply"},
+        )
+
+        events = feed.query(limit=10)
+        assert len(events) == 1
+        assert events[0]["event_type"] == "pa_decision"
+        assert events[0]["msg_id"] == "m9"
+
+    def test_subscribers_are_pushed_new_events(self, trace_dir):
+        feed = get_feed()
+        received = []
+        unsubscribe = feed.subscribe(received.append)
+
+        feed._on_append(_entry(1))
+        feed._on_append(_entry(1))  # duplicate: not pushed twice
+        unsubscribe()
+        feed._on_append(_entry(2))
+
+        assert [e["id"] for e in received] == ["pa-pa_ingestion-2025-06-01T10:00:01"]
+
+    def test_out_of_order_appends_stay_sorted(self, trace_dir):
+        feed = get_feed()
+        for i in (5, 1, 3):
+            feed._on_append(_entry(i))
+        stamps = [e["timestamp"] for e in feed.query(limit=10)]
+        assert stamps == sorted(stamps)
+
+    def test_queries_past_the_ring_fall_back_to_the_scan(self, trace_dir):
+        _write(trace_dir, [_entry(i) for i in range(30)])
+        feed = TimelineFeed(trace_dir, capacity=10).start()
+        with patch.object(timeline_service, "get_feed", return_value=feed):
+            assert feed.query(limit=5) is not None
+            assert feed.query(limit=20) is None
+            assert len(get_timeline(limit=20)) == 20
+            assert len(get_timeline(since="2025-06-01T10:00:27", limit=20)) == 2
+        feed.stop()
+
+
+class TestCheckpoint:
+    def test_restart_reads_only_the_trace_tail(self, trace_dir):
+        _write(trace_dir, [_entry(i) for i in range(20)])
+        feed = TimelineFeed(trace_dir).start()
+        feed.stop()
+        assert (trace_dir / timeline_service.CHECKPOINT_FILENAME).exists()
+
+        covered = _trace_file(trace_dir).stat().st_size
+        _write(trace_dir, [_entry(i) for i in range(20, 25)])
+        tail = _trace_file(trace_dir).stat().st_size - covered
+        seeks = []
+        real_open = open
+
+        def recording_open(path, mode="r", *args, **kwargs):
+            f = real_open(path, mode, *args, **kwargs)
+            real_seek = f.seek
+            f.seek = lambda offset, *a: seeks.append(offset) or real_seek(offset, *a)
+            return f
+
+        with (
+            patch.object(timeline_service, "CHECKPOINT_REWIND", 64),
+            patch("builtins.open", recording_open),
+        ):
+            restarted = TimelineFeed(trace_dir).start()
+        events = restarted.query(limit=100)
+        restarted.stop()
+
+        assert len(events) == 25
+        assert len({e["id"] for e in events}) == 25
+        assert seeks == [covered - 64]
+        assert tail > 64
+
+    def test_a_corrupt_checkpoint_is_rebuilt_from_the_traces(self, trace_dir):
+        _write(trace_dir, [_entry(i) for i in range(3)])
+        (trace_dir / timeline_service.CHECKPOINT_FILENAME).write_text("{not json")
+
+        feed = TimelineFeed(trace_dir).start()
+        assert len(feed.query(limit=10)) == 3
+        feed.stop()
+
+
+@pytest.mark.perf
+def test_polling_no_longer_rescans_the_traces(trace_dir, record_property):
+    _write(trace_dir, [_entry(i % 3600, ts=f"2025-06-01T{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}")
+                       for i in range(20_000)])
+
+    started = time.perf_counter()
+    timeline_service._scan_timeline(None, 50)
+    scan = time.perf_counter() - started
+
+    get_timeline(limit=50)  # bootstrap
+    started = time.perf_counter()
+    for i in range(100):
+        get_timeline(since=f"2025-05-01T{i % 24:02d}:00:00", limit=50)
+    polled = (time.perf_counter() - started) / 100
+
+    record_property("scan_ms", round(scan * 1000))
+    record_property("feed_query_ms", round(polled * 1000, 2))
+    assert polled < scan / 20
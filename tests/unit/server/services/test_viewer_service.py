@@ -2,9 +2,11 @@
 
 Tests content preview and viewer functionality.
 """
+import os
 import time
 from pathlib import Path
 
+import pytest
 
 from frago.server.services.viewer_service import (
     AUDIO_EXTENSIONS,
@@ -302,3 +304,138 @@ class TestViewerServiceGetContentPath:
 
         result = ViewerService.get_content_path("is-a-file")
         assert result is None
+
+
+class TestRenderCache:
+    """Re-opening an unchanged document is a lookup, not a render."""
+
+    @pytest.fixture
+    def viewer(self, tmp_path, monkeypatch):
+        from frago.server.services import viewer_service
+
+        package = tmp_path / "package"
+        (package / "highlight").mkdir(parents=True)
+        (package / "highlight" / "highlight.js").write_text("/* hl */")
+        monkeypatch.setattr(viewer_service, "CONTENT_DIR", tmp_path / "viewer" / "content")
+        monkeypatch.setattr(viewer_service, "RESOURCES_DIR", tmp_path / "viewer" / "resources")
+        monkeypatch.setattr(viewer_service, "get_package_resources_path", lambda: package)
+        return viewer_service
+
+    @pytest.fixture
+    def doc(self, tmp_path):
+        source = tmp_path / "docs"
+        (source / "images").mkdir(parents=True)
+        (source / "images" / "chart.png").write_bytes(b"\x89PNG" + b"0" * 64)
+        path = source / "report.md"
+        path.write_text("# Report\n\n![chart](images/chart.png)\n")
+        return path
+
+    @staticmethod
+    def _count(monkeypatch, owner, name):
+        calls: list = []
+        real = getattr(owner, name)
+        monkeypatch.setattr(owner, name, lambda *a, **k: calls.append(a) or real(*a, **k))
+        return calls
+
+    def test_an_unchanged_file_is_neither_hashed_nor_rendered(self, viewer, doc, monkeypatch):
+        first = ViewerService.prepare_content(doc)
+        hashed = self._count(monkeypatch, ViewerService, "_content_digest")
+        rendered = self._count(monkeypatch, ViewerService, "_render_into")
+
+        assert ViewerService.prepare_content(doc) == first
+        assert ViewerService.prepare_content(doc) == first
+        assert hashed == []
+        assert rendered == []
+
+    def test_a_touched_file_is_hashed_but_not_rendered_again(self, viewer, doc, monkeypatch):
+        first = ViewerService.prepare_content(doc)
+        later = time.time() + 5
+        os.utime(doc, (later, later))
+        rendered = self._count(monkeypatch, ViewerService, "_render_into")
+
+        assert ViewerService.prepare_content(doc) == first
+        assert rendered == []
+
+    def test_an_edited_file_gets_a_new_render(self, viewer, doc):
+        first = ViewerService.prepare_content(doc)
+        doc.write_text("# Report, revised\n")
+        second = ViewerService.prepare_content(doc)
+
+        assert second != first
+        html = (viewer.CONTENT_DIR / second / "index.html").read_text()
+        assert "revised" in html
+
+    def test_options_are_part_of_the_key(self, viewer, doc):
+        assert ViewerService.prepare_content(doc, theme="github-dark") != (
+            ViewerService.prepare_content(doc, theme="github")
+        )
+
+    def test_resources_are_linked_not_copied(self, viewer, doc, tmp_path):
+        content_id = ViewerService.prepare_content(doc)
+        linked = viewer.CONTENT_DIR / content_id / "images" / "chart.png"
+        assert linked.stat().st_ino == (doc.parent / "images" / "chart.png").stat().st_ino
+        shared = viewer.RESOURCES_DIR / "highlight" / "highlight.js"
+        packaged = tmp_path / "package" / "highlight" / "highlight.js"
+        assert shared.stat().st_ino == packaged.stat().st_ino
+
+    def test_media_is_linked_into_its_page(self, viewer, tmp_path):
+        clip = tmp_path / "clip.mp4"
+        clip.write_bytes(b"\x00" * 4096)
+        content_id = ViewerService.prepare_content(clip)
+        assert (viewer.CONTENT_DIR / content_id / "source.mp4").stat().st_ino == clip.stat().st_ino
+
+    def test_a_fresh_process_finds_the_render(self, viewer, doc, monkeypatch):
+        first = ViewerService.prepare_content(doc)
+        monkeypatch.setattr(viewer, "_render_index", viewer._RenderIndex())
+        rendered = self._count(monkeypatch, ViewerService, "_render_into")
+
+        assert ViewerService.prepare_content(doc) == first
+        assert rendered == []
+
+    def test_least_recently_used_renders_go_first_over_budget(self, viewer, tmp_path, monkeypatch):
+        docs = []
+        for i in range(3):
+            path = tmp_path / f"note{i}.md"
+            path.write_text(f"# Note {i}\n")
+            docs.append(path)
+        monkeypatch.setattr(viewer, "USED_WRITE_INTERVAL", 0.0)
+        ids = [ViewerService.prepare_content(p) for p in docs[:2]]
+        size = sum(f.stat().st_size for f in (viewer.CONTENT_DIR / ids[0]).rglob("*"))
+        monkeypatch.setattr(viewer, "CONTENT_BUDGET_BYTES", int(size * 2.5))
+
+        ViewerService.prepare_content(docs[0])  # now the most recently used
+        third = ViewerService.prepare_content(docs[2])
+
+        assert (viewer.CONTENT_DIR / ids[0]).is_dir()
+        assert not (viewer.CONTENT_DIR / ids[1]).exists()
+        assert (viewer.CONTENT_DIR / third).is_dir()
+        # Evicted means gone from the index too: re-opening renders again.
+        assert ViewerService.prepare_content(docs[1]) == ids[1]
+        assert (viewer.CONTENT_DIR / ids[1] / "index.html").is_file()
+
+    def test_a_hit_in_one_process_counts_for_eviction_in_another(self, viewer, tmp_path, monkeypatch):
+        monkeypatch.setattr(viewer, "USED_WRITE_INTERVAL", 0.0)
+        docs = []
+        for i in range(3):
+            path = tmp_path / f"note{i}.md"
+            path.write_text(f"# Note {i}\n")
+            docs.append(path)
+        ids = [ViewerService.prepare_content(p) for p in docs[:2]]
+        size = sum(f.stat().st_size for f in (viewer.CONTENT_DIR / ids[0]).rglob("*"))
+        monkeypatch.setattr(viewer, "CONTENT_BUDGET_BYTES", int(size * 2.5))
+
+        # `frago view` re-opens the first note; the server renders the third.
+        monkeypatch.setattr(viewer, "_render_index", viewer._RenderIndex())
+        ViewerService.prepare_content(docs[0])
+        monkeypatch.setattr(viewer, "_render_index", viewer._RenderIndex())
+        ViewerService.prepare_content(docs[2])
+
+        assert (viewer.CONTENT_DIR / ids[0]).is_dir()
+        assert not (viewer.CONTENT_DIR / ids[1]).exists()
+
+    def test_hits_rewrite_the_index_at_most_once_per_interval(self, viewer, doc, monkeypatch):
+        ViewerService.prepare_content(doc)
+        saves = self._count(monkeypatch, viewer._render_index, "_save")
+        for _ in range(5):
+            ViewerService.prepare_content(doc)
+        assert saves == []
@@ -0,0 +1,172 @@
+"""WorkbenchStreamBridge 的引用计数与空闲回收。
+
+会话流的寿命跟着「此刻有没有人在看」走：WebSocket 订阅者算引用，记录接口的
+一次拉取算一段租期；两样都没了，过了宽限期就停。
+"""
+
+from pathlib import Path
+
+import pytest
+
+from frago.server.services import workbench_stream_bridge as wsb
+from frago.server.websocket import manager
+
+
+class FakeStream:
+    def __init__(self, **kwargs):
+        self.running = False
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        self.running = False
+
+    def watch_session(self, sid):
+        pass
+
+    def unwatch_session(self, sid):
+        pass
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    monkeypatch.setattr(wsb, "SessionStream", FakeStream)
+    monkeypatch.setattr(wsb, "OpencodeStream", FakeStream)
+    monkeypatch.setattr(wsb, "find_session_file", lambda sid: Path(f"/tmp/{sid}.jsonl"))
+    monkeypatch.setattr(wsb, "_read_cwd_from_jsonl", lambda path: f"/proj/{path.stem[:1]}")
+    monkeypatch.setenv("FRAGO_WORKBENCH_STREAM_GRACE", "60")
+    wsb.WorkbenchStreamBridge.reset_instance()
+    instance = wsb.WorkbenchStreamBridge.get_instance()
+    yield instance
+    wsb.WorkbenchStreamBridge.reset_instance()
+
+
+def _later(seconds: float) -> float:
+    return wsb.time.monotonic() + seconds
+
+
+def test_a_repeat_request_reuses_the_running_stream(bridge):
+    assert bridge.ensure_watching("a1") == "workbench:/proj/a"
+    assert bridge.ensure_watching("a2") == "workbench:/proj/a"
+    assert len(bridge.stats()["streams"]) == 1
+
+
+def test_an_unviewed_stream_stops_once_its_grace_is_up(bridge):
+    bridge.ensure_watching("a1")
+    stream = bridge._streams["workbench:/proj/a"].stream
+
+    assert bridge.reap_idle(now=_later(30)) == []
+    assert bridge.reap_idle(now=_later(61)) == ["workbench:/proj/a"]
+    assert stream.running is False
+    assert bridge.stats()["streams"] == []
+
+
+def test_a_subscriber_holds_the_stream_past_its_grace(bridge):
+    bridge.ensure_watching("a1")
+    bridge._on_topic_subscribers("workbench:/proj/a", 1)
+
+    assert bridge.reap_idle(now=_later(3600)) == []
+    assert bridge.stats()["streams"][0]["refs"] == 1
+
+
+def test_the_last_unsubscribe_starts_the_grace_from_then(bridge, monkeypatch):
+    bridge.ensure_watching("a1")
+    bridge._on_topic_subscribers("workbench:/proj/a", 1)
+    # Long after the fetch lease, the last tab goes away.
+    base = wsb.time.monotonic() + 1000
+    monkeypatch.setattr(wsb.time, "monotonic", lambda: base)
+    bridge._on_topic_subscribers("workbench:/proj/a", 0)
+
+    assert bridge.reap_idle(now=base + 30) == []
+    assert bridge.reap_idle(now=base + 61) == ["workbench:/proj/a"]
+
+
+def test_the_stream_stops_when_the_last_websocket_subscriber_leaves(bridge, monkeypatch):
+    """两个标签页经由真实的连接管理器订阅同一项目；走掉一个流还在，两个都走了才停。"""
+    import asyncio
+
+    from frago.server.websocket import ConnectionManager
+
+    mgr = ConnectionManager()
+    mgr.add_topic_listener(bridge._on_topic_subscribers)
+
+    class Socket:
+        async def accept(self):
+            pass
+
+        async def send_text(self, text):
+            pass
+
+    topic = bridge.ensure_watching("a1")
+    stream = bridge._streams[topic].stream
+    first, second = Socket(), Socket()
+
+    async def scenario():
+        await mgr.connect(first)
+        await mgr.connect(second)
+        await mgr.subscribe(first, [topic])
+        await mgr.subscribe(second, [topic])
+        assert bridge.refs(topic) == 2
+        await mgr.unsubscribe(first, [topic])
+        assert bridge.reap_idle(now=_later(3600)) == []
+        await mgr.disconnect(second)
+
+    asyncio.run(scenario())
+
+    assert bridge.refs(topic) == 0
+    assert bridge.reap_idle(now=_later(61)) == [topic]
+    assert stream.running is False
+
+
+def test_opencode_stream_goes_with_its_last_session(bridge):
+    assert bridge.ensure_watching("ses_1") == wsb.OPENCODE_TOPIC
+    assert bridge.stats()["opencode_running"] is True
+
+    assert bridge.reap_idle(now=_later(61)) == [wsb.OPENCODE_TOPIC]
+    assert bridge.stats()["opencode_running"] is False
+
+
+def test_a_stream_started_as_the_reaper_retires_gets_a_reaper(bridge, monkeypatch):
+    """The reaper finds nothing to watch and exits; a subscribe lands in between."""
+    lock = bridge._lock
+
+    class HookedLock:
+        """Runs ``after_release`` once, the next time the lock is let go."""
+
+        after_release = None
+
+        def __enter__(self):
+            return lock.__enter__()
+
+        def __exit__(self, *exc):
+            lock.__exit__(*exc)
+            hook, HookedLock.after_release = HookedLock.after_release, None
+            if hook is not None:
+                hook()
+
+    def reap_idle(now=None):
+        # The emptiness check that follows is the reaper's last look.
+        HookedLock.after_release = lambda: bridge.ensure_watching("a1")
+        return []
+
+    # Record what the new stream sees instead of starting a real thread.
+    reaper_seen: list = []
+    monkeypatch.setattr(bridge, "_lock", HookedLock())
+    monkeypatch.setattr(bridge, "reap_idle", reap_idle)
+    monkeypatch.setattr(bridge._reaper_stop, "wait", lambda timeout: False)
+    monkeypatch.setattr(bridge, "_ensure_reaper", lambda: reaper_seen.append(bridge._reaper))
+    bridge._reaper = wsb.threading.current_thread()
+
+    bridge._reap_loop()
+
+    assert "workbench:/proj/a" in bridge._streams
+    # The retiring reaper had already stepped down, so the new stream found
+    # no reaper and started one.
+    assert reaper_seen == [None]
+
+
+def test_the_bridge_listens_to_real_subscription_changes(bridge):
+    assert bridge._on_topic_subscribers in manager._topic_listeners
+    wsb.WorkbenchStreamBridge.reset_instance()
+    assert bridge._on_topic_subscribers not in manager._topic_listeners
@@ -189,6 +189,154 @@ class TestFreshness:
         assert client.get(f"/app/{RECIPE}/app.js").text != first
 
 
+class TestValidators:
+    """A reload of an unchanged page costs a 304 per file, not the file."""
+
+    def test_an_unchanged_asset_answers_304(self, client):
+        first = client.get(f"/app/{RECIPE}/app.js")
+        etag = first.headers["etag"]
+        again = client.get(f"/app/{RECIPE}/app.js", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+        assert again.headers["cache-control"] == "no-cache"
+
+    def test_the_tag_is_strong_and_follows_the_content(self, client, recipe_dir):
+        etag = client.get(f"/app/{RECIPE}/app.js").headers["etag"]
+        assert not etag.startswith("W/")
+        (recipe_dir / "assets" / "app.js").write_text("// edited", encoding="utf-8")
+        response = client.get(f"/app/{RECIPE}/app.js", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_the_tag_is_not_recomputed_for_an_unchanged_file(self, client, monkeypatch):
+        from frago.recipes import asset_variants
+
+        client.get(f"/app/{RECIPE}/app.js")
+        hashed: list = []
+        real = asset_variants._digest
+        monkeypatch.setattr(asset_variants, "_digest", lambda p: hashed.append(p) or real(p))
+        for _ in range(3):
+            client.get(f"/app/{RECIPE}/app.js")
+        assert hashed == []
+
+    def test_config_answers_304_until_the_slot_changes(self, client):
+        app_state.publish(RECIPE, {"title": "Q3"})
+        etag = client.get(f"/app/{RECIPE}/config.json").headers["etag"]
+        held = {"If-None-Match": etag}
+        assert client.get(f"/app/{RECIPE}/config.json", headers=held).status_code == 304
+        app_state.publish(RECIPE, {"title": "Q4"})
+        assert client.get(f"/app/{RECIPE}/config.json", headers=held).status_code == 200
+
+    def test_data_files_are_validated_too(self, client, tmp_path):
+        data = tmp_path / "board-data"
+        data.mkdir()
+        (data / "rows.json").write_text("[1, 2, 3]", encoding="utf-8")
+        app_state.publish(RECIPE, {"dataDir": str(data)})
+        etag = client.get(f"/app/{RECIPE}/data/rows.json").headers["etag"]
+        response = client.get(f"/app/{RECIPE}/data/rows.json", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+class TestCompression:
+    @pytest.fixture
+    def bundle(self, recipe_dir):
+        body = "".join(f"console.log('line {i}');\n" for i in range(400))
+        (recipe_dir / "assets" / "bundle.js").write_text(body, encoding="utf-8")
+        return body
+
+    def test_a_gzip_client_gets_the_compressed_variant(self, client, bundle):
+        response = client.get(f"/app/{RECIPE}/bundle.js", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(bundle)
+        assert response.text == bundle
+
+    def test_a_client_without_gzip_gets_the_file_itself(self, client, bundle):
+        response = client.get(f"/app/{RECIPE}/bundle.js", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.text == bundle
+
+    def test_each_coding_has_its_own_tag_and_both_revalidate(self, client, bundle):
+        plain = client.get(f"/app/{RECIPE}/bundle.js", headers={"Accept-Encoding": "identity"})
+        packed = client.get(f"/app/{RECIPE}/bundle.js", headers={"Accept-Encoding": "gzip"})
+        assert plain.headers["etag"] != packed.headers["etag"]
+        for etag in (plain.headers["etag"], packed.headers["etag"]):
+            response = client.get(f"/app/{RECIPE}/bundle.js", headers={"If-None-Match": etag})
+            assert response.status_code == 304
+
+    def test_expose_builds_the_variants_ahead_of_time(self, recipe_dir, bundle):
+        from frago.recipes import asset_variants
+
+        assert asset_variants.precompress(recipe_dir / "assets") >= 1
+        asset = asset_variants.version(recipe_dir / "assets" / "bundle.js")
+        assert asset_variants.variant(asset, "gzip", build=False) is not None
+        # Small files are left alone: the headers would outweigh the saving.
+        small = asset_variants.version(recipe_dir / "assets" / "app.js")
+        assert asset_variants.variant(small, "gzip") is None
+
+    def test_a_request_builds_only_a_fast_variant(self, client, recipe_dir, bundle):
+        from frago.recipes import asset_variants
+
+        client.get(f"/app/{RECIPE}/bundle.js", headers={"Accept-Encoding": "gzip"})
+        asset = asset_variants.version(recipe_dir / "assets" / "bundle.js")
+        assert asset_variants.variant(asset, "gzip", build=False) is None
+        assert asset_variants.variant(asset, "gzip", build=False, fast=True).name.endswith(".fast.gz")
+
+        # Expose builds the real one, and the cheap one goes.
+        assert asset_variants.precompress(recipe_dir / "assets") >= 1
+        assert ".fast." not in asset_variants.variant(asset, "gzip", build=False, fast=True).name
+        assert not list(asset_variants.variants_dir().glob("*.fast.*"))
+
+    def test_an_edited_asset_takes_its_old_variants_with_it(self, recipe_dir, bundle):
+        from frago.recipes import asset_variants
+
+        # Content of its own: a file elsewhere with the same bytes would keep them.
+        path = recipe_dir / "assets" / "bundle.js"
+        path.write_text(bundle.replace("line", "edit"), encoding="utf-8")
+        asset_variants.precompress(recipe_dir / "assets")
+        old = asset_variants.version(path)
+        assert asset_variants.variant(old, "gzip", build=False) is not None
+
+        path.write_text(bundle + "console.log('edited');\n", encoding="utf-8")
+        asset_variants.version(path)
+        assert asset_variants.variant(old, "gzip", build=False) is None
+
+    def test_prune_keeps_only_variants_of_live_assets(self, recipe_dir, bundle, tmp_path):
+        from frago.recipes import asset_variants
+
+        gone = tmp_path / "gone"
+        gone.mkdir()
+        (gone / "old.js").write_text(bundle.replace("line", "row"), encoding="utf-8")
+        asset_variants.precompress(gone)
+        asset_variants.precompress(recipe_dir / "assets")
+        live = asset_variants.version(recipe_dir / "assets" / "bundle.js")
+
+        assert asset_variants.prune([recipe_dir / "assets"]) >= 1
+        names = {p.name.partition(".")[0] for p in asset_variants.variants_dir().iterdir()}
+        assert names == {live.digest}
+
+    def test_variants_never_land_in_the_recipe(self, client, recipe_dir, bundle):
+        before = sorted(p.name for p in (recipe_dir / "assets").iterdir())
+        client.get(f"/app/{RECIPE}/bundle.js", headers={"Accept-Encoding": "gzip"})
+        assert sorted(p.name for p in (recipe_dir / "assets").iterdir()) == before
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip, deflate", ["gzip"]),
+            ("gzip;q=0", []),
+            ("*", ["gzip"]),
+            ("*, gzip;q=0", []),
+            ("", []),
+        ],
+    )
+    def test_negotiation(self, header, expected, monkeypatch):
+        from frago.recipes import asset_variants
+
+        monkeypatch.setattr(asset_variants, "brotli", None)
+        assert asset_variants.negotiate(header) == expected
+
+
 class TestConfig:
     def test_config_is_synthesized_not_a_file(self, client, recipe_dir):
         """No config.json exists in assets/; the server makes one per request."""
@@ -505,3 +653,35 @@ class TestVisitorErrorMessages:
         response = client.get(f"/app/{RECIPE}/data/rows.json")
         assert response.status_code == 404
         assert str(missing) in response.text
+
+
+class TestSlotCache:
+    def test_an_unchanged_slot_is_not_parsed_again(self, state_dir, monkeypatch):
+        app_state.publish(RECIPE, {"title": "Q3"})
+        parsed: list = []
+        real = app_state.json.loads
+        monkeypatch.setattr(app_state.json, "loads", lambda s: parsed.append(s) or real(s))
+        for _ in range(3):
+            assert app_state.read(RECIPE)["title"] == "Q3"
+        assert parsed == []
+
+    def test_a_write_from_another_process_is_seen(self, state_dir):
+        app_state.publish(RECIPE, {"title": "Q3"})
+        app_state.read(RECIPE)
+        path = app_state.slot_path(RECIPE)
+        # Same as a recipe process publishing: a new file moved into place.
+        tmp = path.with_suffix(".other")
+        tmp.write_text(json.dumps({"title": "Q4, from elsewhere"}), encoding="utf-8")
+        tmp.replace(path)
+        assert app_state.read(RECIPE)["title"] == "Q4, from elsewhere"
+
+    def test_callers_cannot_change_what_the_next_one_reads(self, state_dir):
+        app_state.publish(RECIPE, {"title": "Q3"})
+        app_state.read(RECIPE)["title"] = "scribbled"
+        assert app_state.read(RECIPE)["title"] == "Q3"
+
+    def test_a_removed_slot_reads_as_empty(self, state_dir):
+        app_state.publish(RECIPE, {"title": "Q3"})
+        app_state.read(RECIPE)
+        app_state.slot_path(RECIPE).unlink()
+        assert app_state.read(RECIPE) == {}
@@ -292,6 +292,94 @@ class TestOnDisk:
         assert ident.find_user_by_id(user.id).disabled is True
 
 
+class TestSessionCache:
+    """门禁对每个请求都要认一次 cookie，静态资源也不例外。缓存省掉的是读文件，
+    省不掉的是吊销、停用立即生效。"""
+
+    def _age_last_seen(self, token: str) -> None:
+        path = ident._session_path(ident._sid_of(token))
+        record = json.loads(path.read_text(encoding="utf-8"))
+        record["last_seen"] = "2020-01-01T00:00:00+00:00"
+        path.write_text(json.dumps(record), encoding="utf-8")
+        ident.clear_session_cache()
+
+    def test_a_repeat_request_does_not_read_the_file_again(self, monkeypatch):
+        user, _ = ident.authenticate("a@x.com", GOOD_PASSWORD)
+        token = ident.create_session(user.id)
+        assert ident.resolve_session(token) is not None
+
+        reads: list[str] = []
+        real = ident._read_session
+        monkeypatch.setattr(ident, "_read_session", lambda sid: reads.append(sid) or real(sid))
+        assert ident.resolve_session(token) is not None
+        assert reads == []
+
+    def test_a_revoke_from_another_process_is_seen_at_once(self):
+        """另一个进程的 `frago user session revoke` 只是删了文件，本进程没有
+        任何回调可拿——靠的是目录 mtime 变了。"""
+        user, _ = ident.authenticate("a@x.com", GOOD_PASSWORD)
+        token = ident.create_session(user.id)
+        assert ident.resolve_session(token) is not None
+        ident._session_path(ident._sid_of(token)).unlink()
+        assert ident.resolve_session(token) is None
+
+    def test_disabling_with_a_warm_cache_still_takes_effect_on_the_next_request(self):
+        user, _ = ident.authenticate("a@x.com", GOOD_PASSWORD)
+        token = ident.create_session(user.id)
+        assert ident.resolve_session(token) is not None
+        _mark_disabled(user.id)
+        assert ident.resolve_session(token) is None
+
+    def test_last_seen_is_written_behind_the_request(self):
+        user, _ = ident.authenticate("a@x.com", GOOD_PASSWORD)
+        token = ident.create_session(user.id)
+        self._age_last_seen(token)
+
+        ident.resolve_session(token)
+        path = ident._session_path(ident._sid_of(token))
+        assert json.loads(path.read_text(encoding="utf-8"))["last_seen"].startswith("2020")
+
+        assert ident.flush_last_seen() == 1
+        assert not json.loads(path.read_text(encoding="utf-8"))["last_seen"].startswith("2020")
+
+    def test_a_session_revoked_while_its_stamp_waits_stays_revoked(self):
+        """排队的 last_seen 写回去时如果不先看文件还在不在，就等于把刚吊销的
+        会话原样复活。"""
+        user, _ = ident.authenticate("a@x.com", GOOD_PASSWORD)
+        token = ident.create_session(user.id)
+        self._age_last_seen(token)
+        ident.resolve_session(token)
+
+        ident.revoke_session(token)
+        assert ident.flush_last_seen() == 0
+        assert ident.resolve_session(token) is None
+
+
+    def test_a_revoke_during_the_write_back_is_not_undone(self, monkeypatch):
+        """flush 读完文件、还没换名的那一刻吊销：换名不能把文件写回来。"""
+        user, _ = ident.authenticate("a@x.com", GOOD_PASSWORD)
+        token = ident.create_session(user.id)
+        self._age_last_seen(token)
+        ident.resolve_session(token)
+        path = ident._session_path(ident._sid_of(token))
+
+        real_replace = os.replace
+        revoker = threading.Thread(target=ident.revoke_session, args=(token,))
+
+        def replace_after_a_revoke(src, dst):
+            if dst == str(path) and not revoker.is_alive() and revoker.ident is None:
+                revoker.start()
+                revoker.join(timeout=0.3)
+            real_replace(src, dst)
+
+        monkeypatch.setattr(ident.os, "replace", replace_after_a_revoke)
+        ident.flush_last_seen()
+        revoker.join(timeout=5)
+
+        assert not path.exists()
+        assert ident.resolve_session(token) is None
+
+
 class TestCookieSecurity:
     @pytest.mark.parametrize(
         ("scheme", "public_https", "expected"),
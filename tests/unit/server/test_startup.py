@@ -0,0 +1,156 @@
+"""Staged server startup: dependency order, concurrency, readiness, timeline."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from frago.server.routes.system import router as system_router
+from frago.server.startup import FAILED, OK, StartupOrchestrator, set_startup
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _sleeper(seconds: float, log: list[str] | None = None, name: str = ""):
+    async def stage():
+        await asyncio.sleep(seconds)
+        if log is not None:
+            log.append(name)
+
+    return stage
+
+
+def test_independent_stages_run_concurrently():
+    async def scenario():
+        startup = StartupOrchestrator()
+        for name in ("a", "b", "c"):
+            startup.add(name, _sleeper(0.1), required=True)
+        started = time.monotonic()
+        startup.start()
+        await startup.wait_ready()
+        return time.monotonic() - started
+
+    assert _run(scenario()) < 0.25
+
+
+def test_blocking_stages_run_off_the_loop():
+    async def scenario():
+        startup = StartupOrchestrator()
+        startup.add("disk", lambda: time.sleep(0.1), required=True)
+        startup.add("net", lambda: time.sleep(0.1), required=True)
+        started = time.monotonic()
+        startup.start()
+        await startup.wait_ready()
+        return time.monotonic() - started
+
+    assert _run(scenario()) < 0.18
+
+
+def test_dependencies_run_first():
+    async def scenario():
+        log: list[str] = []
+        startup = StartupOrchestrator()
+        startup.add("state", _sleeper(0.05, log, "state"))
+        startup.add("agent", _sleeper(0, log, "agent"), after=("state",), required=True)
+        startup.start()
+        await startup.wait_ready()
+        return log
+
+    assert _run(scenario()) == ["state", "agent"]
+
+
+def test_ready_does_not_wait_for_background_stages():
+    async def scenario():
+        startup = StartupOrchestrator()
+        startup.add("core", _sleeper(0), required=True)
+        startup.add("slow", _sleeper(0.2))
+        startup.start()
+        await startup.wait_ready()
+        at_ready = startup.timeline()
+        await startup.settle()
+        return at_ready, startup.timeline()
+
+    at_ready, done = _run(scenario())
+    assert at_ready["ready"] is True
+    assert at_ready["complete"] is False
+    assert at_ready["pending"] == ["slow"]
+    assert done["complete"] is True
+    assert done["pending"] == []
+
+
+def test_a_failed_stage_does_not_hold_back_the_ones_after_it():
+    async def scenario():
+        log: list[str] = []
+
+        def broken():
+            raise RuntimeError("no plugin")
+
+        startup = StartupOrchestrator()
+        startup.add("plugin", broken)
+        startup.add("after", _sleeper(0, log, "after"), after=("plugin",), required=True)
+        startup.start()
+        await startup.wait_ready()
+        return log, {s["name"]: s for s in startup.timeline()["stages"]}
+
+    log, stages = _run(scenario())
+    assert log == ["after"]
+    assert stages["plugin"]["status"] == FAILED
+    assert stages["plugin"]["error"] == "no plugin"
+    assert stages["after"]["status"] == OK
+
+
+def test_the_critical_path_follows_what_each_stage_waited_on():
+    async def scenario():
+        startup = StartupOrchestrator()
+        startup.add("state", _sleeper(0.05))
+        startup.add("quick", _sleeper(0))
+        startup.add("agent", _sleeper(0.01), after=("state", "quick"), required=True)
+        startup.add("scheduler", _sleeper(0.05), after=("agent",))
+        startup.add("hooks", _sleeper(0.01))
+        startup.start()
+        await startup.settle()
+        return startup.timeline()
+
+    timeline = _run(scenario())
+    assert timeline["critical_path"] == ["state", "agent", "scheduler"]
+    stages = {s["name"]: s for s in timeline["stages"]}
+    assert stages["state"]["duration_ms"] >= 40
+
+
+def test_dependencies_must_be_registered_first():
+    startup = StartupOrchestrator()
+    with pytest.raises(ValueError):
+        startup.add("agent", _sleeper(0), after=("state",))
+
+
+class TestReadyRoute:
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(system_router, prefix="/api")
+        yield TestClient(app)
+        set_startup(None)
+
+    def test_503_before_any_startup(self, client):
+        assert client.get("/api/ready").status_code == 503
+
+    def test_reports_the_timeline_once_ready(self, client):
+        async def boot():
+            startup = StartupOrchestrator()
+            startup.add("state", _sleeper(0), required=True)
+            startup.start()
+            await startup.wait_ready()
+            await startup.settle()
+            return startup
+
+        set_startup(_run(boot()))
+        resp = client.get("/api/ready")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["ready"] is True
+        assert [s["name"] for s in body["stages"]] == ["state"]
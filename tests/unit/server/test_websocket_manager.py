@@ -0,0 +1,162 @@
+"""ConnectionManager 的按主题分发、每客户端发送队列与背压。
+
+一个卡住的浏览器标签页不许拖住别人的推送；只看 dashboard 的客户端也不该
+收到工作台的会话流帧。
+"""
+
+import asyncio
+import json
+
+from frago.server.websocket import ConnectionManager, create_message, topic_for
+
+
+class FakeSocket:
+    def __init__(self, gate: asyncio.Event | None = None):
+        self.sent: list[dict] = []
+        self.gate = gate
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        if self.gate is not None:
+            await self.gate.wait()
+        self.sent.append(json.loads(text))
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+async def _drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_an_unsubscribed_client_still_receives_everything():
+    """前端从没发过 subscribe——不订阅就什么都收，是老客户端赖以工作的前提。"""
+    async def scenario():
+        mgr = ConnectionManager()
+        ws = FakeSocket()
+        await mgr.connect(ws)
+        await mgr.broadcast(create_message("task_started"))
+        await mgr.broadcast(create_message("session_records_append"), topic="workbench:/p")
+        await _drain()
+        return [m["type"] for m in ws.sent]
+
+    assert _run(scenario()) == ["task_started", "session_records_append"]
+
+
+def test_a_subscribed_client_only_gets_its_topics():
+    async def scenario():
+        mgr = ConnectionManager()
+        dashboard, bench = FakeSocket(), FakeSocket()
+        await mgr.connect(dashboard)
+        await mgr.connect(bench)
+        await mgr.subscribe(dashboard, ["tasks"])
+        await mgr.subscribe(bench, ["workbench:/p"])
+        await mgr.broadcast(create_message("task_started"))
+        await mgr.broadcast(create_message("session_records_append"), topic="workbench:/p")
+        await mgr.broadcast(create_message("session_records_append"), topic="workbench:/other")
+        await _drain()
+        return [m["type"] for m in dashboard.sent], [m["type"] for m in bench.sent]
+
+    dashboard, bench = _run(scenario())
+    assert dashboard == ["task_started"]
+    assert bench == ["session_records_append"]
+
+
+def test_the_workbench_family_topic_covers_every_project():
+    async def scenario():
+        mgr = ConnectionManager()
+        ws = FakeSocket()
+        await mgr.connect(ws)
+        await mgr.subscribe(ws, ["workbench"])
+        await mgr.broadcast(create_message("session_turn_done"), topic="workbench:/a")
+        await mgr.broadcast(create_message("session_turn_done"), topic="workbench:/b")
+        await _drain()
+        return len(ws.sent)
+
+    assert _run(scenario()) == 2
+
+
+def test_an_unsubscribed_topic_is_no_longer_sent():
+    """工作台视图卸载时退订——之后那个项目的帧一帧都不该再送过来。"""
+    async def scenario():
+        mgr = ConnectionManager()
+        ws = FakeSocket()
+        await mgr.connect(ws)
+        await mgr.subscribe(ws, ["data", "workbench:/p"])
+        await mgr.broadcast(create_message("session_records_append"), topic="workbench:/p")
+        await _drain()
+        remaining = await mgr.unsubscribe(ws, ["workbench:/p"])
+        await mgr.broadcast(create_message("session_records_append"), topic="workbench:/p")
+        await mgr.broadcast(create_message("data_recipes"))
+        await _drain()
+        return remaining, [m["type"] for m in ws.sent], mgr.subscriber_count("workbench:/p")
+
+    remaining, received, count = _run(scenario())
+    assert remaining == ["data"]
+    assert received == ["session_records_append", "data_recipes"]
+    assert count == 0
+
+
+def test_a_stalled_client_does_not_hold_up_the_others():
+    async def scenario():
+        mgr = ConnectionManager()
+        stuck, healthy = FakeSocket(gate=asyncio.Event()), FakeSocket()
+        await mgr.connect(stuck)
+        await mgr.connect(healthy)
+        await asyncio.wait_for(mgr.broadcast(create_message("task_started")), timeout=1)
+        await _drain()
+        return len(healthy.sent), len(stuck.sent)
+
+    assert _run(scenario()) == (1, 0)
+
+
+def test_an_overflowing_queue_coalesces_snapshots_and_drops_the_rest():
+    """状态快照只有最新一份有意义；增量帧放不下就丢，并且记账。"""
+    async def scenario():
+        mgr = ConnectionManager(queue_size=2)
+        gate = asyncio.Event()
+        ws = FakeSocket(gate=gate)
+        await mgr.connect(ws)
+        await mgr.broadcast(create_message("task_started", {"n": 0}))
+        await _drain()  # the writer is now parked on the first send
+        for n in range(3):
+            await mgr.broadcast(create_message("data_tasks", {"n": n}))
+        for n in range(3):
+            await mgr.broadcast(create_message("task_updated", {"n": n}))
+        stats = mgr.client_stats()[0]
+        gate.set()
+        await _drain()
+        return ws.sent, stats
+
+    sent, stats = _run(scenario())
+    snapshots = [m["data"]["n"] for m in sent if m["type"] == "data_tasks"]
+    assert snapshots == [2]
+    assert stats["coalesced"] == 2
+    assert stats["dropped"] == 2
+
+
+def test_a_failed_send_removes_the_client():
+    class Broken(FakeSocket):
+        async def send_text(self, text):
+            raise RuntimeError("gone")
+
+    async def scenario():
+        mgr = ConnectionManager()
+        await mgr.connect(Broken())
+        await mgr.broadcast(create_message("task_started"))
+        await _drain()
+        return mgr.connection_count
+
+    assert _run(scenario()) == 0
+
+
+def test_message_types_map_to_topics():
+    assert topic_for({"type": "task_completed"}) == "tasks"
+    assert topic_for({"type": "agent_text_delta"}) == "agent"
+    assert topic_for({"type": "timeline_event"}) == "trace"
+    assert topic_for({"type": "data_recipes"}) == "data"
+    assert topic_for({"type": "session_records_append"}) == "workbench"
@@ -154,6 +154,14 @@ class TestSessionList:
 
 
 class TestRecords:
+    def test_the_stream_topic_rides_in_a_header(self, client, adapter, monkeypatch):
+        """页面靠这个头知道该订阅哪个主题——订阅撑着会话流，退订了流才会停。"""
+        from frago.server.routes import workbench
+
+        monkeypatch.setattr(workbench, "_ensure_watching", lambda _sid: "workbench:/p")
+        response = client.get(f"/api/workbench/sessions/{CC_SID}/records?limit=1")
+        assert response.headers[workbench.STREAM_TOPIC_HEADER] == "workbench:/p"
+
     def test_first_page_starts_at_zero(self, client, adapter):
         body = client.get(f"/api/workbench/sessions/{CC_SID}/records?after=0&limit=5").json()
         assert [row["seq"] for row in body] == [0, 1, 2, 3, 4]
@@ -13,6 +13,7 @@ from typing import Any
 
 from frago.session.adapters.claude_code_records import (
     ClaudeCodeRecordAdapter,
+    TranscriptTail,
     to_unified,
     translate_records,
     translate_with_stats,
@@ -1097,3 +1098,68 @@ def test_adapter_read_raw_refuses_error_records(tmp_path: Path) -> None:
     assert adapter.read_raw(SESSION, "u1") is not None
     assert adapter.read_raw(SESSION, "u2") is None
     assert adapter.read_raw(SESSION, "不存在的记录") is None
+
+
+# ── 增量读：只读追加的字节 ──────────────────────────────────────────
+def _tail_rows() -> list[dict[str, Any]]:
+    return [
+        _user("u1", "先看看目录", promptSource="typed"),
+        _assistant("a1", [{"type": "tool_use", "id": "t1", "name": "Bash", "input": {"command": "ls"}}]),
+        _user("u2", [{"type": "tool_result", "tool_use_id": "t1", "content": "a\nb", "is_error": False}]),
+        _assistant("a2", [{"type": "text", "text": "有两个文件"}], msg_id="msg_0002"),
+    ]
+
+
+def test_tail_matches_a_whole_file_translation(tmp_path: Path) -> None:
+    """一行一行追加着读，和写完以后整场翻，出来的记录必须一条不差。"""
+    path = tmp_path / f"{SESSION}.jsonl"
+    path.write_text("", encoding="utf-8")
+    tail = TranscriptTail(path)
+    streamed = []
+    for row in _tail_rows():
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+        streamed.extend(tail.read_appended()[1])
+
+    whole = to_unified(path)
+    assert [(r.seq, r.id, r.kind) for r in streamed] == [(r.seq, r.id, r.kind) for r in whole]
+    assert streamed[2].payload == whole[2].payload
+
+
+def test_tail_leaves_a_half_written_line_for_next_time(tmp_path: Path) -> None:
+    """没写完的半行不是「解不开的 JSON」，NEVER 为它出一条未识别记录。"""
+    path = tmp_path / f"{SESSION}.jsonl"
+    line = json.dumps(_user("u1", "一句话", promptSource="typed"), ensure_ascii=False) + "\n"
+    path.write_text(line[:20], encoding="utf-8")
+    tail = TranscriptTail(path)
+    assert tail.read_appended() == ([], [])
+
+    path.write_text(line, encoding="utf-8")
+    rows, records = tail.read_appended()
+    assert _kinds(records) == ["user.say"]
+
+
+def test_tail_keeps_a_line_whole_when_the_text_has_unicode_line_breaks(tmp_path: Path) -> None:
+    """正文里的 U+2028、\\x85 不是换行——``ensure_ascii=False`` 写出来就是原字节，照样一行。"""
+    path = tmp_path / f"{SESSION}.jsonl"
+    text = "第一段\u2028第二段\x85第三段\x0c完"
+    path.write_text(
+        json.dumps(_user("u1", text, promptSource="typed"), ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    rows, records = TranscriptTail(path).read_appended()
+    assert len(rows) == 1
+    assert _kinds(records) == ["user.say"]
+    assert [(r.kind, r.payload) for r in records] == [(r.kind, r.payload) for r in to_unified(path)]
+
+
+def test_tail_starts_over_when_the_file_is_replaced(tmp_path: Path) -> None:
+    path = tmp_path / f"{SESSION}.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in _tail_rows()), encoding="utf-8")
+    tail = TranscriptTail(path)
+    assert len(tail.read_appended()[1]) == 4
+
+    path.write_text(json.dumps(_user("n1", "新的一场", promptSource="typed")) + "\n", encoding="utf-8")
+    _, records = tail.read_appended()
+    assert tail.restarted is True
+    assert [r.seq for r in records] == [0]
@@ -0,0 +1,289 @@
+"""opencode 实时流：游标驱动，空闲的一拍不查库，每拍只翻游标之后写过的片段。
+
+库同样是临时自建的（搭建器借用翻译层单测那一份），经 ``FRAGO_OPENCODE_DB`` 指过去。
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from frago.session import opencode_store
+from frago.session.adapters import opencode_records
+from frago.session.adapters.opencode_records import PartTail
+from frago.session.opencode_store import ChangeProbe
+from frago.session.opencode_stream import OpencodeStream
+from tests.unit.session.test_opencode_records import SESSION, Builder, _tool_part
+
+
+@pytest.fixture
+def builder(tmp_path, monkeypatch):
+    path = tmp_path / "opencode.db"
+    monkeypatch.setenv("FRAGO_OPENCODE_DB", str(path))
+    b = Builder(path)
+    yield b
+    b.close()
+
+
+def _update_part(b: Builder, part_id: str, data: dict) -> None:
+    b.conn.execute(
+        "UPDATE part SET data = ?, time_updated = ? WHERE id = ?",
+        (json.dumps(data), b._tick(), part_id),
+    )
+    b.conn.commit()
+
+
+def _update_message(b: Builder, message_id: str, **fields) -> None:
+    row = b.conn.execute("SELECT data FROM message WHERE id = ?", (message_id,)).fetchone()
+    data = json.loads(row[0])
+    data.update(fields)
+    b.conn.execute("UPDATE message SET data = ? WHERE id = ?", (json.dumps(data), message_id))
+    b.conn.commit()
+
+
+def _ids(records) -> list[str]:
+    return [r.id for r in records]
+
+
+class TestPartTail:
+    def test_the_baseline_matches_a_full_translation(self, builder):
+        uid = builder.message("user")
+        builder.part(uid, {"type": "text", "text": "你好"})
+        mid = builder.message("assistant", parentID=uid)
+        builder.part(mid, {"type": "text", "text": "在"})
+        builder.event("model-switched", {"model": {"id": "m"}})
+        builder.conn.commit()
+
+        full = opencode_records.translate_session(SESSION)
+        baseline = PartTail(SESSION).read_new()
+
+        assert [(r.id, r.seq) for r in baseline] == [(r.id, r.seq) for r in full]
+
+    def test_only_parts_past_the_cursor_are_emitted(self, builder):
+        uid = builder.message("user")
+        builder.part(uid, {"type": "text", "text": "跑一下"})
+        mid = builder.message("assistant", parentID=uid)
+        text_id = builder.part(mid, {"type": "text", "text": ""})
+        builder.conn.commit()
+        tail = PartTail(SESSION)
+        assert len(tail.read_new()) == 2
+
+        # 空壳被改写：编号发过了，不再发。
+        _update_part(builder, text_id, {"type": "text", "text": "好的"})
+        assert tail.read_new() == []
+
+        tool_id = builder.part(mid, _tool_part("bash", "c1"))
+        builder.conn.commit()
+        fresh = tail.read_new()
+        assert _ids(fresh) == [tool_id, f"{tool_id}:result"]
+        assert [r.seq for r in fresh] == [2, 3]
+        assert tail.read_new() == []
+
+    def test_only_unfinished_messages_parts_are_reread(self, builder, monkeypatch):
+        uid = builder.message("user")
+        builder.part(uid, {"type": "text", "text": "跑一下"})
+        done = builder.message("assistant", parentID=uid, finish="tool-calls",
+                               time={"created": 0, "completed": 1})
+        builder.part(done, _tool_part("bash", "c1"))
+        mid = builder.message("assistant", parentID=uid)
+        open_part = builder.part(mid, _tool_part("bash", "c2", status="running", output=None))
+        builder.conn.commit()
+        tail = PartTail(SESSION)
+        tail.read_new()
+
+        calls: list[tuple] = []
+        real = opencode_store.parts_after
+        monkeypatch.setattr(
+            opencode_store, "parts_after", lambda *a: calls.append(a) or real(*a)
+        )
+        tail.read_new()
+        assert calls[-1][2] == (open_part,)
+
+        _update_message(builder, mid, finish="stop", time={"created": 0, "completed": 2})
+        tail.read_new()
+        tail.read_new()
+        assert calls[-1][2] == ()
+
+    def test_the_reread_list_is_capped_and_expires(self, builder, monkeypatch):
+        monkeypatch.setattr(opencode_records, "OPEN_MESSAGE_LIMIT", 3)
+        uid = builder.message("user")
+        stale = builder.message("assistant", parentID=uid)
+        builder.part(stale, {"type": "text", "text": "崩在半路"})
+        builder.clock += opencode_records.OPEN_MESSAGE_TTL_MS
+        for _ in range(4):
+            mid = builder.message("assistant", parentID=uid)
+            builder.part(mid, {"type": "text", "text": "…"})
+        builder.conn.commit()
+        tail = PartTail(SESSION)
+        tail.read_new()
+
+        calls: list[tuple] = []
+        real = opencode_store.parts_after
+        monkeypatch.setattr(
+            opencode_store, "parts_after", lambda *a: calls.append(a) or real(*a)
+        )
+        tail.read_new()
+
+        assert stale not in tail._open
+        assert len(tail._open) == 3
+        assert len(calls[0][2]) == 3
+
+    def test_new_messages_and_events_are_picked_up(self, builder):
+        uid = builder.message("user")
+        builder.part(uid, {"type": "text", "text": "一"})
+        builder.conn.commit()
+        tail = PartTail(SESSION)
+        tail.read_new()
+
+        eid = builder.event("agent-switched", {"agent": "plan"})
+        uid2 = builder.message("user")
+        pid = builder.part(uid2, {"type": "text", "text": "二"})
+        builder.conn.commit()
+
+        fresh = tail.read_new()
+        assert _ids(fresh) == [eid, pid]
+        assert fresh[1].kind == "user.say"
+
+    def test_a_late_abort_becomes_an_interrupt(self, builder):
+        uid = builder.message("user")
+        mid = builder.message("assistant", parentID=uid)
+        builder.part(mid, _tool_part("bash", "c1", status="running", output=None))
+        builder.conn.commit()
+        tail = PartTail(SESSION)
+        tail.read_new()
+
+        _update_message(
+            builder,
+            mid,
+            error={"name": "MessageAbortedError", "data": {"message": "stop"}},
+            time={"created": 0, "completed": builder._tick()},
+        )
+        fresh = tail.read_new()
+
+        assert _ids(fresh) == [f"{mid}:interrupt"]
+        assert fresh[0].payload["phase"] == "tool-executing"
+
+    def test_turn_done_follows_the_final_segment(self, builder):
+        uid = builder.message("user")
+        mid = builder.message("assistant", parentID=uid)
+        builder.part(mid, {"type": "text", "text": "…"})
+        builder.conn.commit()
+        tail = PartTail(SESSION)
+        tail.read_new()
+        assert tail.turn_done is False
+
+        _update_message(builder, mid, finish="tool-calls", time={"created": 0, "completed": 1})
+        tail.read_new()
+        assert tail.turn_done is False
+
+        final = builder.message("assistant", parentID=uid, finish="stop",
+                                time={"created": 0, "completed": 2})
+        builder.part(final, {"type": "text", "text": "完"})
+        builder.conn.commit()
+        tail.read_new()
+        assert tail.turn_done is True
+
+        builder.message("user")
+        builder.conn.commit()
+        tail.read_new()
+        assert tail.turn_done is False
+
+
+class TestChangeProbe:
+    def test_only_a_commit_counts_as_a_change(self, builder):
+        builder.message("user")
+        builder.conn.commit()
+        probe = ChangeProbe()
+        try:
+            assert probe.changed() is True
+            assert probe.changed() is False
+            builder.message("user")
+            builder.conn.commit()
+            assert probe.changed() is True
+            assert probe.changed() is False
+        finally:
+            probe.close()
+
+    def test_a_missing_db_never_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("FRAGO_OPENCODE_DB", str(tmp_path / "absent.db"))
+        assert ChangeProbe().changed() is False
+
+
+class TestStream:
+    def test_an_idle_tick_issues_no_query(self, builder, monkeypatch):
+        uid = builder.message("user")
+        builder.part(uid, {"type": "text", "text": "你好"})
+        builder.conn.commit()
+        batches: list[list[dict]] = []
+        stream = OpencodeStream(on_records=lambda sid, recs: batches.append(recs))
+        stream.watch_session(SESSION)
+
+        stream._process()
+        calls: list[str] = []
+        real = opencode_store.parts_after
+        monkeypatch.setattr(
+            opencode_store, "parts_after", lambda *a: calls.append("q") or real(*a)
+        )
+        stream._process()
+        stream._process()
+        assert calls == []
+
+        pid = builder.part(uid, {"type": "text", "text": "再说一句"})
+        builder.conn.commit()
+        stream._process()
+        stream._probe.close()
+
+        assert calls == ["q"]
+        assert [[r["id"] for r in batch] for batch in batches][-1] == [pid]
+
+    def test_turn_completion_fires_once(self, builder):
+        uid = builder.message("user")
+        builder.message("assistant", parentID=uid, finish="stop",
+                        time={"created": 0, "completed": 1})
+        builder.conn.commit()
+        turns: list[tuple] = []
+        stream = OpencodeStream(on_turn_complete=lambda *args: turns.append(args))
+        stream.watch_session(SESSION)
+
+        stream._process()
+        stream._process()
+        stream._probe.close()
+
+        assert turns == [(SESSION, True, "stop")]
+
+
+def _poll_cost(tmp_path, monkeypatch, history: int) -> float:
+    """有 ``history`` 个历史片段的会话上，追加一个片段后那一拍的耗时（取多次最小值）。"""
+    path = tmp_path / f"bench-{history}.db"
+    monkeypatch.setenv("FRAGO_OPENCODE_DB", str(path))
+    b = Builder(path)
+    uid = b.message("user")
+    for i in range(history // 50):
+        mid = b.message("assistant", parentID=uid, finish="tool-calls",
+                        time={"created": 0, "completed": 1})
+        for _ in range(50):
+            b.part(mid, _tool_part("bash", f"c{i}", output="x" * 200))
+    mid = b.message("assistant", parentID=uid)
+    b.conn.commit()
+    tail = PartTail(SESSION)
+    tail.read_new()
+
+    best = float("inf")
+    for _ in range(5):
+        b.part(mid, {"type": "text", "text": "新的一段"})
+        b.conn.commit()
+        started = time.perf_counter()
+        assert len(tail.read_new()) == 1
+        best = min(best, time.perf_counter() - started)
+    b.close()
+    return best
+
+
+@pytest.mark.perf
+def test_per_poll_cost_stays_flat_as_the_session_grows(tmp_path, monkeypatch):
+    """历史长二十倍，一拍的成本不该跟着涨二十倍（整场重翻时正是如此）。"""
+    small = _poll_cost(tmp_path, monkeypatch, 200)
+    large = _poll_cost(tmp_path, monkeypatch, 4000)
+    assert large < small * 5, f"{small * 1000:.2f}ms -> {large * 1000:.2f}ms"
@@ -0,0 +1,118 @@
+"""SessionStream：观察者线程上不睡觉，一阵写入只读一次，每次只读追加的部分。"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from frago.session.stream import SessionStream
+from frago.watcher import FileEvent
+
+SESSION = "ssssssss-0000-0000-0000-000000000002"
+
+
+def _line(uuid: str, rtype: str, **extra) -> str:
+    row = {"uuid": uuid, "type": rtype, "sessionId": SESSION,
+           "timestamp": "2026-07-20T10:00:00.000Z", "isSidechain": False, **extra}
+    return json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def _say(uuid: str, text: str) -> str:
+    return _line(uuid, "user", message={"role": "user", "content": text}, promptSource="typed")
+
+
+def _reply(uuid: str, stop_reason: str) -> str:
+    return _line(uuid, "assistant", requestId="req_1", message={
+        "id": "msg_1", "role": "assistant", "stop_reason": stop_reason,
+        "content": [{"type": "text", "text": "好了"}],
+    })
+
+
+def _event(path: Path) -> FileEvent:
+    return FileEvent(event_type="modified", path=str(path), is_directory=False)
+
+
+class Recorder:
+    def __init__(self):
+        self.batches: list[list[dict]] = []
+        self.turns: list[tuple] = []
+        self.fired = threading.Event()
+
+    def on_records(self, sid, records):
+        self.batches.append(records)
+        self.fired.set()
+
+    def on_turn(self, sid, done, stop_reason):
+        self.turns.append((sid, done, stop_reason))
+
+
+def _stream(rec: Recorder, debounce: float = 0.05) -> SessionStream:
+    stream = SessionStream("/tmp/x", on_records=rec.on_records,
+                           on_turn_complete=rec.on_turn, debounce_seconds=debounce)
+    stream._running = True  # skip registering with the real observer
+    return stream
+
+
+def test_the_observer_thread_is_never_put_to_sleep(tmp_path):
+    path = tmp_path / f"{SESSION}.jsonl"
+    path.write_text(_say("u1", "一句话"), encoding="utf-8")
+    rec = Recorder()
+    stream = _stream(rec, debounce=5.0)
+
+    started = time.monotonic()
+    stream._on_file_event(_event(path))
+    assert time.monotonic() - started < 0.5
+    stream.stop()
+
+
+def test_a_burst_of_events_is_read_once(tmp_path):
+    path = tmp_path / f"{SESSION}.jsonl"
+    path.write_text("", encoding="utf-8")
+    rec = Recorder()
+    stream = _stream(rec)
+
+    for i in range(5):
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write(_say(f"u{i}", f"第 {i} 句"))
+        stream._on_file_event(_event(path))
+
+    assert rec.fired.wait(2)
+    time.sleep(0.15)
+    assert len(rec.batches) == 1
+    assert [r["id"] for r in rec.batches[0]] == [f"u{i}" for i in range(5)]
+
+
+def test_only_appended_records_are_emitted(tmp_path):
+    path = tmp_path / f"{SESSION}.jsonl"
+    path.write_text(_say("u1", "第一句"), encoding="utf-8")
+    rec = Recorder()
+    stream = _stream(rec)
+
+    stream._process_file(str(path))
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(_say("u2", "第二句"))
+    stream._process_file(str(path))
+
+    assert [[r["id"] for r in batch] for batch in rec.batches] == [["u1"], ["u2"]]
+    assert rec.batches[1][0]["seq"] == 1
+
+
+def test_turn_completion_fires_once_per_flip(tmp_path):
+    path = tmp_path / f"{SESSION}.jsonl"
+    path.write_text(_reply("a1", "tool_use"), encoding="utf-8")
+    rec = Recorder()
+    stream = _stream(rec)
+
+    stream._process_file(str(path))
+    assert rec.turns == []
+
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(_reply("a2", "end_turn"))
+    stream._process_file(str(path))
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(_say("u1", "谢谢"))
+    stream._process_file(str(path))
+
+    assert rec.turns == [(SESSION, True, "end_turn")]
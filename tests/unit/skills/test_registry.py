@@ -2,10 +2,14 @@
 
 Tests skill scanning and YAML frontmatter parsing.
 """
+import os
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from frago.skills import registry as registry_module
 from frago.skills.registry import InvalidSkill, Skill, SkillRegistry
 
 
@@ -305,3 +309,130 @@ Content.
             registry._parse_skill_md(skill_md)
 
         assert "dictionary" in str(exc.value).lower()
+
+    def test_dashes_inside_a_value_do_not_close_it(self, tmp_path: Path, registry: SkillRegistry):
+        """Only a line of its own ends the frontmatter."""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_text("---\nname: test\ndescription: before --- after\n---\n\nBody\n")
+
+        assert registry._parse_skill_md(skill_md)["description"] == "before --- after"
+
+    def test_leading_blank_lines_are_skipped(self, tmp_path: Path, registry: SkillRegistry):
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_text("\n---\nname: test\ndescription: Test skill\n---\n")
+
+        assert registry._parse_skill_md(skill_md)["name"] == "test"
+
+    def test_bom_and_crlf(self, tmp_path: Path, registry: SkillRegistry):
+        """As saved by Windows editors."""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_bytes(b"\xef\xbb\xbf---\r\nname: test\r\ndescription: Test skill\r\n---\r\n")
+
+        assert registry._parse_skill_md(skill_md) == {"name": "test", "description": "Test skill"}
+
+
+class TestFrontmatterCache:
+    """Unchanged SKILL.md files are not re-parsed, within a process or across them."""
+
+    SKILL_MD = """---
+name: cached-skill
+description: {description}
+---
+"""
+
+    @pytest.fixture
+    def skills_dir(self, tmp_path: Path) -> Path:
+        skills = tmp_path / "skills"
+        (skills / "cached-skill").mkdir(parents=True)
+        (skills / "cached-skill" / "SKILL.md").write_text(self.SKILL_MD.format(description="first"))
+        return skills
+
+    def _scan(self, skills_dir: Path) -> SkillRegistry:
+        reg = SkillRegistry(skills_dir=skills_dir)
+        reg.scan()
+        return reg
+
+    def _count_parses(self):
+        return patch.object(
+            registry_module, "parse_skill_md", wraps=registry_module.parse_skill_md
+        )
+
+    def test_second_scan_does_not_parse(self, skills_dir: Path):
+        with self._count_parses() as parse:
+            self._scan(skills_dir)
+            reg = self._scan(skills_dir)
+        assert parse.call_count == 1
+        assert reg.skills[0].description == "first"
+
+    def test_edit_is_reparsed(self, skills_dir: Path):
+        self._scan(skills_dir)
+        md = skills_dir / "cached-skill" / "SKILL.md"
+        md.write_text(self.SKILL_MD.format(description="second"))
+        st = md.stat()
+        os.utime(md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert self._scan(skills_dir).skills[0].description == "second"
+
+    def test_cold_process_uses_disk_cache(self, skills_dir: Path):
+        self._scan(skills_dir)
+        assert registry_module.FRONTMATTER_CACHE_FILE.exists()
+
+        registry_module._frontmatter_cache.clear()
+        with self._count_parses() as parse:
+            reg = self._scan(skills_dir)
+        assert parse.call_count == 0
+        assert reg.skills[0].name == "cached-skill"
+
+    def test_failures_are_cached_with_their_reason(self, skills_dir: Path):
+        (skills_dir / "broken").mkdir()
+        (skills_dir / "broken" / "SKILL.md").write_text("no frontmatter")
+        self._scan(skills_dir)
+
+        registry_module._frontmatter_cache.clear()
+        with self._count_parses() as parse:
+            reg = self._scan(skills_dir)
+        assert parse.call_count == 0
+        assert "---" in reg.invalid_skills[0].reason
+
+    def test_removed_skills_are_pruned(self, skills_dir: Path):
+        import shutil
+
+        self._scan(skills_dir)
+        shutil.rmtree(skills_dir / "cached-skill")
+        self._scan(skills_dir)
+
+        registry_module._frontmatter_cache.clear()
+        registry_module._frontmatter_cache._ensure_loaded()
+        assert registry_module._frontmatter_cache._entries == {}
+
+
+@pytest.mark.perf
+def test_listing_500_skills_cold_and_warm(tmp_path: Path, record_property):
+    """Cold: no cache at all. Warm process: in-memory cache. Cold process: disk cache."""
+    skills_dir = tmp_path / "skills"
+    for i in range(500):
+        skill_dir = skills_dir / f"skill-{i:03d}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{i:03d}\ndescription: >\n  Skill number {i}, with a\n"
+            f"  folded description.\ntags: [a, b, c]\nallowed-tools: [Read, Write, Bash]\n"
+            f"---\n\n# Skill {i}\n\n" + "Body text.\n" * 50
+        )
+
+    def timed():
+        started = time.perf_counter()
+        reg = SkillRegistry(skills_dir=skills_dir)
+        reg.scan()
+        assert len(reg.list_all()) == 500
+        return time.perf_counter() - started
+
+    cold = timed()
+    warm = min(timed() for _ in range(3))
+    registry_module._frontmatter_cache.clear()
+    cold_process = timed()
+
+    record_property("cold_ms", round(cold * 1000))
+    record_property("warm_ms", round(warm * 1000, 1))
+    record_property("cold_process_ms", round(cold_process * 1000, 1))
+    assert warm < cold / 3
+    assert cold_process < cold / 3
@@ -0,0 +1,326 @@
+"""Parallel, resumable downloads against a local server that throttles and drops connections."""
+
+import hashlib
+import http.server
+import os
+import re
+import threading
+import time
+
+import pytest
+
+from frago import downloader
+from frago.downloader import ChecksumMismatch, DownloadError, download
+
+
+class FileServer:
+    """Serves one payload at ``/file``.
+
+    Args:
+        rate: Bytes per second per connection (None: unthrottled)
+        ranges: Honour ``Range`` requests
+        drops: The first ``drops`` body responses close the connection
+            after ``drop_after`` bytes
+        fail: Answer every request with a 500
+    """
+
+    def __init__(self, payload: bytes, rate=None, ranges=True, drops=0, drop_after=100_000, fail=False):
+        self.payload = payload
+        self.rate = rate
+        self.ranges = ranges
+        self.drops = drops
+        self.drop_after = drop_after
+        self.fail = fail
+        self.requests: list[str | None] = []
+        self.sent = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/file"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def handle(self, req):
+        header = req.headers.get("Range")
+        with self._lock:
+            self.requests.append(header)
+        if self.fail:
+            req.send_error(500)
+            return
+        start, end = 0, len(self.payload) - 1
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", header or "") if self.ranges else None
+        if match:
+            start = int(match[1])
+            end = min(int(match[2]), end) if match[2] else end
+            req.send_response(206)
+            req.send_header("Content-Range", f"bytes {start}-{end}/{len(self.payload)}")
+        else:
+            req.send_response(200)
+        req.send_header("Content-Length", str(end - start + 1))
+        req.send_header("ETag", '"v1"')
+        req.end_headers()
+
+        with self._lock:
+            probe = header == f"bytes=0-{downloader.RACE_BYTES - 1}"
+            drop = self.drops > 0 and not probe and end - start + 1 > self.drop_after
+            if drop:
+                self.drops -= 1
+        body = self.payload[start:end + 1]
+        if drop:
+            body = body[:self.drop_after]
+        try:
+            for i in range(0, len(body), 16 * 1024):
+                chunk = body[i:i + 16 * 1024]
+                req.wfile.write(chunk)
+                with self._lock:
+                    self.sent += len(chunk)
+                if self.rate:
+                    time.sleep(len(chunk) / self.rate)
+        except OSError:
+            return
+        if drop:
+            req.close_connection = True
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(payload, **kwargs):
+        server = FileServer(payload, **kwargs)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture
+def payload():
+    return os.urandom(3 * 1024 * 1024 + 12345)
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(downloader, "MIN_SEGMENT_SIZE", 512 * 1024)
+    monkeypatch.setattr(downloader, "RETRY_BACKOFF", 0)
+
+
+def _sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def test_ranged_download_is_split_and_verified(serve, payload, tmp_path):
+    server = serve(payload)
+
+    result = download([server.url], tmp_path / "bin", expected_sha256=_sha(payload), segments=4)
+
+    assert (tmp_path / "bin").read_bytes() == payload
+    assert result.sha256 == _sha(payload)
+    assert result.segments == 4
+    assert sum(1 for r in server.requests if r and not r.startswith("bytes=0-262143")) == 4
+    assert result.size == len(payload) and result.downloaded == len(payload)
+    assert result.throughput > 0
+    assert not (tmp_path / "bin.part").exists() and not (tmp_path / "bin.part.json").exists()
+
+
+def test_dropped_connections_resume_their_segment(serve, payload, tmp_path):
+    server = serve(payload, drops=3, drop_after=200_000)
+
+    result = download([server.url], tmp_path / "bin", expected_sha256=_sha(payload))
+
+    assert (tmp_path / "bin").read_bytes() == payload
+    assert result.downloaded == len(payload)  # nothing fetched twice
+    resumed_mid_segment = [r for r in server.requests if r and not r.startswith("bytes=0-")]
+    assert len(resumed_mid_segment) > 3
+
+
+def test_an_interrupted_download_resumes_on_the_next_call(serve, payload, tmp_path, monkeypatch):
+    server = serve(payload, rate=4 * 1024 * 1024)
+    monkeypatch.setattr(downloader, "STATE_SAVE_BYTES", 64 * 1024)
+
+    def interrupt(done, total):
+        if done > len(payload) // 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        download([server.url], tmp_path / "bin", progress=interrupt)
+    assert (tmp_path / "bin.part.json").exists()
+    assert not (tmp_path / "bin").exists()
+
+    result = download([server.url], tmp_path / "bin", expected_sha256=_sha(payload))
+
+    assert (tmp_path / "bin").read_bytes() == payload
+    assert result.resumed >= len(payload) // 2
+    assert result.downloaded + result.resumed == len(payload)
+
+
+posix_only = pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX owners and modes")
+
+
+def _interrupted(server, payload, dest, monkeypatch):
+    """Leave a half-finished download of ``payload`` at ``dest``."""
+    monkeypatch.setattr(downloader, "STATE_SAVE_BYTES", 64 * 1024)
+
+    def interrupt(done, total):
+        if done > len(payload) // 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        download([server.url], dest, progress=interrupt)
+
+
+@posix_only
+def test_progress_files_are_private(serve, payload, tmp_path, monkeypatch):
+    server = serve(payload, rate=4 * 1024 * 1024)
+    _interrupted(server, payload, tmp_path / "bin", monkeypatch)
+
+    for name in ("bin.part", "bin.part.json"):
+        assert (tmp_path / name).stat().st_mode & 0o777 == 0o600
+
+
+@posix_only
+@pytest.mark.parametrize("tamper", ["mode", "owner"])
+def test_a_partial_that_is_not_private_is_not_resumed(serve, payload, tmp_path, monkeypatch, tamper):
+    if tamper == "owner" and os.geteuid() != 0:
+        pytest.skip("changing a file's owner needs root")
+    server = serve(payload, rate=4 * 1024 * 1024)
+    _interrupted(server, payload, tmp_path / "bin", monkeypatch)
+    part = tmp_path / "bin.part"
+    if tamper == "mode":
+        part.chmod(0o666)
+    else:
+        os.chown(part, 65534, -1)
+
+    result = download([server.url], tmp_path / "bin", expected_sha256=_sha(payload))
+
+    assert result.resumed == 0
+    assert (tmp_path / "bin").read_bytes() == payload
+
+
+@posix_only
+def test_planted_links_are_not_followed(serve, payload, tmp_path):
+    server = serve(payload)
+    victim = tmp_path / "victim"
+    victim.write_bytes(b"keep me")
+    (tmp_path / "bin.part").symlink_to(victim)
+    (tmp_path / "bin.part.json").symlink_to(victim)
+
+    download([server.url], tmp_path / "bin", expected_sha256=_sha(payload))
+
+    assert victim.read_bytes() == b"keep me"
+    assert (tmp_path / "bin").read_bytes() == payload
+
+
+@posix_only
+def test_idle_partials_of_other_downloads_are_pruned(serve, payload, tmp_path):
+    server = serve(payload)
+    idle = time.time() - downloader.STALE_PARTIAL_SECONDS - 1
+    for name in ("client-1.0.zip.part", "client-1.0.zip.part.json", "client-1.1.zip.part"):
+        (tmp_path / name).write_bytes(b"x")
+        os.utime(tmp_path / name, (idle, idle))
+    (tmp_path / "client-1.1.zip.part.json").write_text("{}")  # still being written
+    (tmp_path / "notes.txt").write_text("kept")
+    os.utime(tmp_path / "notes.txt", (idle, idle))
+
+    download([server.url], tmp_path / "client-1.2.zip")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "client-1.1.zip.part", "client-1.1.zip.part.json", "client-1.2.zip", "notes.txt",
+    ]
+
+
+def test_private_dir_is_only_enterable_by_its_user(tmp_path):
+    fresh = downloader.private_dir(tmp_path / "a" / "downloads")
+    assert fresh.stat().st_mode & 0o777 == 0o700
+
+    loose = tmp_path / "loose"
+    loose.mkdir(mode=0o777)
+    loose.chmod(0o777)
+    assert downloader.private_dir(loose).stat().st_mode & 0o777 == 0o700
+
+    (tmp_path / "link").symlink_to(fresh)
+    with pytest.raises(DownloadError):
+        downloader.private_dir(tmp_path / "link")
+
+
+def test_the_fastest_mirror_wins(serve, payload, tmp_path):
+    slow = serve(payload, rate=256 * 1024)
+    fast = serve(payload)
+    dead = "http://127.0.0.1:9/file"
+
+    result = download([slow.url, dead, fast.url], tmp_path / "bin")
+
+    assert result.url == fast.url
+    assert result.race[dead] is None
+    assert result.race[fast.url] < result.race[slow.url]
+    assert (tmp_path / "bin").read_bytes() == payload
+
+
+def test_a_failing_mirror_hands_its_segments_to_another(serve, payload, tmp_path, monkeypatch):
+    flaky = serve(payload)
+    backup = serve(payload, rate=8 * 1024 * 1024)
+    result_box = {}
+
+    real_fetch = downloader._fetch
+
+    def fetch_after_outage(job, segment, sources, session):
+        flaky.fail = True  # the race winner breaks right after the race
+        result_box["sources"] = [p.url for p in sources]
+        return real_fetch(job, segment, sources, session)
+
+    monkeypatch.setattr(downloader, "_fetch", fetch_after_outage)
+    download([flaky.url, backup.url], tmp_path / "bin", expected_sha256=_sha(payload))
+
+    assert (tmp_path / "bin").read_bytes() == payload
+    assert set(result_box["sources"]) == {flaky.url, backup.url}
+    assert backup.sent >= len(payload)
+
+
+def test_a_checksum_mismatch_leaves_nothing_behind(serve, payload, tmp_path):
+    server = serve(payload)
+    with pytest.raises(ChecksumMismatch):
+        download([server.url], tmp_path / "bin", expected_sha256="0" * 64)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_servers_without_ranges_get_one_stream(serve, payload, tmp_path):
+    server = serve(payload, ranges=False, drops=1, drop_after=500_000)
+
+    result = download([server.url], tmp_path / "bin", expected_sha256=_sha(payload))
+
+    assert result.segments == 1
+    assert (tmp_path / "bin").read_bytes() == payload
+
+
+def test_no_answering_source_is_an_error(tmp_path):
+    with pytest.raises(DownloadError):
+        download(["http://127.0.0.1:9/file"], tmp_path / "bin")
+
+
+@pytest.mark.perf
+def test_parallel_segments_beat_one_throttled_connection(serve, tmp_path, record_property):
+    payload = os.urandom(8 * 1024 * 1024)
+    server = serve(payload, rate=4 * 1024 * 1024)
+
+    single = download([server.url], tmp_path / "one", segments=1)
+    parallel = download([server.url], tmp_path / "four", segments=4)
+
+    record_property("one_segment_mb_per_sec", round(single.throughput / 1e6, 1))
+    record_property("four_segments_mb_per_sec", round(parallel.throughput / 1e6, 1))
+    assert parallel.seconds < single.seconds / 2
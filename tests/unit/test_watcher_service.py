@@ -0,0 +1,66 @@
+"""Tests for frago.watcher.service — overlapping watches share one."""
+
+from pathlib import Path
+
+import pytest
+
+from frago.watcher import FileEvent, WatchdogObserverService, WatchTarget
+
+
+@pytest.fixture
+def service():
+    svc = WatchdogObserverService()
+    yield svc
+    svc.stop()
+
+
+def _target(path: Path, seen: list, *, recursive: bool = False) -> WatchTarget:
+    return WatchTarget(path=str(path), on_created=seen.append, recursive=recursive)
+
+
+class TestSharing:
+    def test_a_target_under_a_recursive_watch_joins_it(self, service, tmp_path):
+        (tmp_path / "projects").mkdir()
+        service.start()
+        service.add(_target(tmp_path, [], recursive=True))
+        service.add(_target(tmp_path / "projects", [], recursive=True))
+
+        assert service.watch_count == 1
+        assert list(service._watches) == [str(tmp_path)]
+
+    def test_a_recursive_target_takes_over_the_watches_below_it(self, service, tmp_path):
+        (tmp_path / "projects").mkdir()
+        service.start()
+        service.add(_target(tmp_path / "projects", [], recursive=True))
+        service.add(_target(tmp_path, [], recursive=False))
+        assert service.watch_count == 2
+
+        outer = _target(tmp_path, [], recursive=True)
+        service.add(outer)
+        assert service.watch_count == 1
+        assert service._watches[str(tmp_path)].is_recursive
+
+        # Once it goes, what shared its watch is watched as before.
+        service.remove(outer)
+        assert service.watch_count == 2
+        assert service._watches[str(tmp_path / "projects")].is_recursive
+        assert not service._watches[str(tmp_path)].is_recursive
+
+    def test_a_shared_watch_still_honours_each_targets_scope(self, service, tmp_path):
+        projects = tmp_path / "projects"
+        outer_seen: list[FileEvent] = []
+        top_seen: list[FileEvent] = []
+        inner_seen: list[FileEvent] = []
+        service.add(_target(tmp_path, outer_seen, recursive=True))
+        service.add(_target(tmp_path, top_seen))
+        service.add(_target(projects, inner_seen))
+        handler = service._handlers[str(tmp_path)]
+
+        handler._dispatch("created", str(tmp_path / "a.md"), False)
+        handler._dispatch("created", str(projects / "b.md"), False)
+        handler._dispatch("created", str(projects / "run" / "c.md"), False)
+        handler._dispatch("created", str(tmp_path / "projects-old" / "d.md"), False)
+
+        assert [Path(e.path).name for e in outer_seen] == ["a.md", "b.md", "c.md", "d.md"]
+        assert [Path(e.path).name for e in top_seen] == ["a.md"]
+        assert [Path(e.path).name for e in inner_seen] == ["b.md"]
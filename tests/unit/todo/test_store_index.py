@@ -0,0 +1,185 @@
+"""Tests for the todo index — queries without re-parsing the todo directory."""
+
+import json
+import os
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from frago.todo import store
+
+
+@pytest.fixture(autouse=True)
+def _isolate_todo_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("FRAGO_TODO_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Count todo files parsed; directory mtimes are trusted immediately."""
+    monkeypatch.setattr(store, "RACY_WINDOW_NS", 0)
+    loaded = []
+    real = store._load_file
+
+    def counting(path):
+        loaded.append(path.name)
+        return real(path)
+
+    monkeypatch.setattr(store, "_load_file", counting)
+    return loaded
+
+
+def _bump(path):
+    """Move a path's mtime forward; mtime granularity can be coarser than the test."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _hand_write(path, **data):
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+class TestIndex:
+    def test_queries_do_not_reparse_an_unchanged_directory(self, tmp_path, loads):
+        for i in range(5):
+            _hand_write(tmp_path / f"20260101-t{i}.json", title=f"t{i}", created="2026-01-01")
+        assert len(store.list_todos()) == 5
+        assert len(loads) == 5
+
+        store.list_todos()
+        store.next_todo()
+        store.resolve_id("20260101-t3")
+        assert len(loads) == 5
+
+    def test_added_and_removed_files_are_picked_up(self, tmp_path, loads):
+        _hand_write(tmp_path / "20260101-a.json", title="a")
+        assert [t.id for t in store.list_todos()] == ["20260101-a"]
+
+        _hand_write(tmp_path / "20260101-b.json", title="b", priority="high")
+        _bump(tmp_path)
+        assert store.next_todo().id == "20260101-b"
+        assert loads == ["20260101-a.json", "20260101-b.json"]
+
+        (tmp_path / "20260101-b.json").unlink()
+        _bump(tmp_path)
+        assert [t.id for t in store.list_todos()] == ["20260101-a"]
+
+    def test_in_place_edits_are_seen_by_get_and_reindex(self, tmp_path, loads):
+        todo = store.add("edit me by hand")
+        path = tmp_path / f"{todo.id}.json"
+        store.list_todos()
+
+        data = json.loads(path.read_text())
+        path.write_text(json.dumps({**data, "status": "done"}))
+        # The directory's mtime did not move; the file's did.
+        assert store.next_todo() is None
+        assert store.get(todo.id).status == "done"
+
+        path.write_text(json.dumps({**data, "priority": "high"}))
+        assert store.reindex() == 1
+        assert store.list_todos(priority="high")[0].id == todo.id
+
+    def test_store_writes_are_atomic_renames(self, tmp_path):
+        todo = store.add("atomic")
+        store.update(todo.id, summary="changed")
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".index", f"{todo.id}.json"]
+
+    def test_a_lost_or_corrupt_index_is_rebuilt(self, tmp_path, monkeypatch):
+        todo = store.add("survives")
+        monkeypatch.setattr(store, "_index_conn", None)
+        index = tmp_path / store.INDEX_DIRNAME / "todos.sqlite3"
+        index.write_bytes(b"not a database" * 100)
+
+        assert store.resolve_id(todo.id[:10]) == todo.id
+        assert [t.id for t in store.list_todos()] == [todo.id]
+
+    def test_prefix_resolution_ignores_neighbouring_ids(self):
+        a = store.add("alpha")
+        store.add("alphabet")
+        assert store.resolve_id(a.id) == a.id
+        with pytest.raises(ValueError, match="alphabet"):
+            store.resolve_id(a.id[:-1])
+        with pytest.raises(KeyError):
+            store.resolve_id(a.id + "z")
+
+
+class TestArchive:
+    def test_long_closed_todos_move_to_the_archive_once_a_day(self, tmp_path):
+        _hand_write(tmp_path / "20200101-old.json", title="old", status="done", done_at="2020-01-01")
+        _hand_write(tmp_path / "20200101-open.json", title="open", created="2020-01-01")
+        recent = store.add("recent", status="done")
+
+        assert not (tmp_path / "20200101-old.json").exists()
+        assert (tmp_path / "archive" / "20200101-old.json").exists()
+        assert {t.id for t in store.list_todos()} == {"20200101-open", recent.id}
+        assert "20200101-old" in {t.id for t in store.list_todos(archived=True)}
+        assert store.get("20200101-ol").title == "old"
+
+    def test_archive_completed_and_reopening(self, tmp_path):
+        todo = store.add("finished")
+        store.mark_done(todo.id)
+        assert store.archive_completed(older_than_days=0) == [todo.id]
+        assert store.list_todos() == []
+
+        # An archived id is never reused.
+        again = store.add("finished")
+        assert again.id == f"{todo.id}-2"
+
+        reopened = store.update(todo.id, status="doing")
+        assert reopened.status == "doing"
+        assert (tmp_path / f"{todo.id}.json").exists()
+        assert not (tmp_path / "archive" / f"{todo.id}.json").exists()
+        assert store.next_todo().id == todo.id
+
+    def test_remove_reaches_the_archive(self, tmp_path):
+        todo = store.add("gone", status="dropped")
+        store.archive_completed(older_than_days=0)
+        assert store.remove(todo.id) == todo.id
+        assert not (tmp_path / "archive" / f"{todo.id}.json").exists()
+        with pytest.raises(KeyError):
+            store.get(todo.id)
+
+
+class TestDue:
+    def test_due_is_validated_and_filterable(self):
+        soon = store.add("soon", due="2026-03-01")
+        store.add("later", due="2026-09-01")
+        store.add("whenever")
+
+        assert [t.id for t in store.list_todos(due_before="2026-06-30")] == [soon.id]
+        with pytest.raises(ValueError, match="due date"):
+            store.add("bad", due="next week")
+
+        updated = store.update(soon.id, due="2027-01-01")
+        assert updated.due == "2027-01-01"
+        assert store.list_todos(due_before="2026-06-30") == []
+
+
+@pytest.mark.perf
+def test_next_and_prefix_resolution_do_not_scale_with_history(tmp_path, monkeypatch, record_property):
+    """5k todos, all but 20 of them done long ago: per-query cost vs parsing every file."""
+    monkeypatch.setattr(store, "RACY_WINDOW_NS", 0)
+    closed = (date.today() - timedelta(days=store.ARCHIVE_AFTER_DAYS + 1)).isoformat()
+    for i in range(5000):
+        status = "todo" if i % 250 == 0 else "done"
+        _hand_write(tmp_path / f"20260101-task-{i:05d}-{status}.json", title=f"task {i}",
+                    status=status, created="2026-01-01", done_at=closed)
+
+    def timed(fn, n=1):
+        started = time.perf_counter()
+        for _ in range(n):
+            fn()
+        return (time.perf_counter() - started) / n
+
+    cold = timed(store.reindex)
+    nxt = timed(store.next_todo, 50)
+    resolve = timed(lambda: store.resolve_id("20260101-task-04217"), 50)
+
+    record_property("cold_index_ms", round(cold * 1000))
+    record_property("next_ms", round(nxt * 1000, 2))
+    record_property("prefix_resolve_ms", round(resolve * 1000, 2))
+    assert store.next_todo().id == "20260101-task-00000-todo"
+    assert nxt < cold / 20
+    assert resolve < cold / 20